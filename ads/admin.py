@@ -3,7 +3,14 @@ from django.utils.html import format_html
 
 from notifications.dispatchers import notify_ad_rejected
 
-from .models import AdCategory, Ad, AdComment, AdGalleryImage, AdsViewCount
+from .models import (
+    AdCategory,
+    Ad,
+    AdComment,
+    AdGalleryImage,
+    AdsViewCount,
+    PendingAssetDeletion,
+)
 
 
 class AdGalleryImageInline(admin.TabularInline):
@@ -332,3 +339,16 @@ class AdsViewCountAdmin(admin.ModelAdmin):
             'description': 'Aggregated view counts. Updated automatically when views are tracked.'
         }),
     )
+
+
+@admin.register(PendingAssetDeletion)
+class PendingAssetDeletionAdmin(admin.ModelAdmin):
+    """Read-only view of Cloudinary assets waiting for bulk deletion."""
+
+    list_display = ("public_id", "attempts", "last_attempt_at", "created_on")
+    list_filter = ("attempts",)
+    search_fields = ("public_id",)
+    readonly_fields = ("public_id", "attempts", "last_error", "last_attempt_at", "created_on")
+
+    def has_add_permission(self, request):
+        return False
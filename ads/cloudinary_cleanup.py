@@ -4,10 +4,17 @@ Cloudinary asset lifecycle helpers for advertisement images.
 
 from __future__ import annotations
 
+import hashlib
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+DELIVERY_URL_CACHE_SIZE = 4096
+# Cloudinary's Admin API accepts at most 100 public IDs per delete_resources call.
+DELETION_BATCH_SIZE = 100
+DELETION_MAX_ATTEMPTS = 5
+
 
 def get_public_id(image_value):
     """Extract a Cloudinary public_id from a field value."""
@@ -20,39 +27,116 @@ def get_public_id(image_value):
     return value or None
 
 
+def _config_fingerprint():
+    """
+    Identify the active Cloudinary config for cache keys.
+
+    Signed URLs embed a signature derived from the API secret, so the secret
+    (hashed, never stored) is part of the key whenever signing is enabled.
+    """
+    import cloudinary
+
+    config = cloudinary.config()
+    sign_url = bool(getattr(config, "sign_url", False))
+    secret_digest = ""
+    if sign_url:
+        secret = getattr(config, "api_secret", "") or ""
+        secret_digest = hashlib.sha256(secret.encode()).hexdigest()[:16]
+    return (
+        getattr(config, "cloud_name", None),
+        bool(getattr(config, "secure", False)),
+        getattr(config, "cname", None),
+        bool(getattr(config, "private_cdn", False)),
+        sign_url,
+        secret_digest,
+    )
+
+
+@lru_cache(maxsize=DELIVERY_URL_CACHE_SIZE)
+def _cached_delivery_url(public_id, width, height, crop, config_fingerprint):
+    """Build (and memoise) the delivery URL for one transformation."""
+    from cloudinary.utils import cloudinary_url
+
+    options = {
+        "fetch_format": "auto",
+        "quality": "auto",
+    }
+    if width is not None:
+        options["width"] = width
+    if height is not None:
+        options["height"] = height
+    if crop:
+        options["crop"] = crop
+    if config_fingerprint[4]:
+        options["sign_url"] = True
+    url, _ = cloudinary_url(public_id, **options)
+    return url
+
+
+def clear_delivery_url_cache():
+    """Drop all memoised delivery URLs (e.g. after reconfiguring Cloudinary)."""
+    _cached_delivery_url.cache_clear()
+
+
+def _fallback_url(image_value):
+    try:
+        fallback_url = getattr(image_value, "url", None)
+        if fallback_url:
+            return fallback_url
+    except Exception:
+        pass
+    return str(image_value) if image_value else ""
+
+
 def cloudinary_delivery_url(image_value, *, width=None, height=None, crop=None):
     """
     Build an optimized Cloudinary delivery URL (f_auto, q_auto).
     Falls back to the field URL when public_id cannot be resolved.
+
+    URLs are memoised per (public_id, width, height, crop) in a bounded LRU
+    cache; failures are never cached.
     """
     public_id = get_public_id(image_value)
     if not public_id:
         return ""
 
     try:
-        from cloudinary.utils import cloudinary_url
-
-        options = {
-            "fetch_format": "auto",
-            "quality": "auto",
-        }
-        if width is not None:
-            options["width"] = width
-        if height is not None:
-            options["height"] = height
-        if crop:
-            options["crop"] = crop
-        url, _ = cloudinary_url(public_id, **options)
-        return url
+        return _cached_delivery_url(
+            public_id,
+            width,
+            height,
+            crop or None,
+            _config_fingerprint(),
+        )
     except Exception as exc:
         logger.warning("Failed to build Cloudinary delivery URL for %s: %s", public_id, exc)
-        try:
-            fallback_url = getattr(image_value, "url", None)
-            if fallback_url:
-                return fallback_url
-        except Exception:
-            pass
-        return str(image_value) if image_value else ""
+        return _fallback_url(image_value)
+
+
+def resolve_delivery_urls(objects, *, field="image", width=None, height=None, crop=None):
+    """
+    Resolve delivery URLs for a page of objects in one pass.
+
+    Returns ``{obj.pk: url}``; objects without an image map to ``""``.
+    Repeated public IDs on the page are built only once.
+    """
+    urls = {}
+    by_public_id = {}
+    for obj in objects:
+        image_value = getattr(obj, field, None)
+        public_id = get_public_id(image_value)
+        if not public_id:
+            urls[obj.pk] = ""
+            continue
+        if public_id not in by_public_id:
+            by_public_id[public_id] = cloudinary_delivery_url(
+                image_value,
+                width=width,
+                height=height,
+                crop=crop,
+            )
+        urls[obj.pk] = by_public_id[public_id]
+    return urls
 
 
 def destroy_cloudinary_asset(image_value):
@@ -68,3 +152,99 @@ def destroy_cloudinary_asset(image_value):
         logger.info("Deleted Cloudinary asset: %s", public_id)
     except Exception as exc:
         logger.warning("Failed to delete Cloudinary asset %s: %s", public_id, exc)
+
+
+def enqueue_cloudinary_asset_deletion(image_value):
+    """
+    Queue a Cloudinary asset for deletion by ``process_asset_deletions``.
+
+    The row is written in the caller's transaction, so a rolled-back delete
+    never removes the asset.
+    """
+    public_id = get_public_id(image_value)
+    if not public_id:
+        return
+
+    from .models import PendingAssetDeletion
+
+    PendingAssetDeletion.objects.bulk_create(
+        [PendingAssetDeletion(public_id=public_id)],
+        ignore_conflicts=True,
+    )
+
+
+def process_pending_asset_deletions(
+    *,
+    batch_size=DELETION_BATCH_SIZE,
+    max_attempts=DELETION_MAX_ATTEMPTS,
+    limit=None,
+    dry_run=False,
+):
+    """
+    Drain the pending-deletion queue with bulk ``delete_resources`` calls.
+
+    Deleted and not-found assets are removed from the queue. Failed batches
+    keep their rows with an incremented attempt count and are retried on
+    the next run until ``max_attempts`` is reached.
+    """
+    from django.db.models import F
+    from django.utils import timezone
+
+    from .models import PendingAssetDeletion
+
+    batch_size = max(1, min(batch_size, DELETION_BATCH_SIZE))
+    summary = {"candidates": 0, "deleted": 0, "failed": 0, "batches": 0}
+
+    pending_ids = PendingAssetDeletion.objects.filter(
+        attempts__lt=max_attempts
+    ).values_list("id", flat=True)
+    if limit:
+        pending_ids = pending_ids[:limit]
+    pending_ids = list(pending_ids)
+    summary["candidates"] = len(pending_ids)
+    if dry_run or not pending_ids:
+        return summary
+
+    import cloudinary.api
+
+    for start in range(0, len(pending_ids), batch_size):
+        rows = list(
+            PendingAssetDeletion.objects.filter(id__in=pending_ids[start:start + batch_size])
+        )
+        if not rows:
+            continue
+        summary["batches"] += 1
+        public_ids = [row.public_id for row in rows]
+        now = timezone.now()
+
+        try:
+            response = cloudinary.api.delete_resources(public_ids)
+        except Exception as exc:
+            logger.warning("Bulk Cloudinary delete failed for %d assets: %s", len(rows), exc)
+            PendingAssetDeletion.objects.filter(id__in=[row.id for row in rows]).update(
+                attempts=F("attempts") + 1,
+                last_error=str(exc)[:1000],
+                last_attempt_at=now,
+            )
+            summary["failed"] += len(rows)
+            continue
+
+        results = (response or {}).get("deleted", {}) or {}
+        done_ids = []
+        for row in rows:
+            status = results.get(row.public_id)
+            if status in ("deleted", "not_found"):
+                done_ids.append(row.id)
+                continue
+            row.attempts += 1
+            row.last_error = f"Unexpected delete status: {status}"
+            row.last_attempt_at = now
+            row.save(update_fields=["attempts", "last_error", "last_attempt_at"])
+            summary["failed"] += 1
+
+        if done_ids:
+            PendingAssetDeletion.objects.filter(id__in=done_ids).delete()
+            summary["deleted"] += len(done_ids)
+            logger.info("Deleted %d Cloudinary assets", len(done_ids))
+
+    return summary
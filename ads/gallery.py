@@ -7,18 +7,25 @@ pages when ad.plan == 'pro' and at least one gallery image exists.
 
 from __future__ import annotations
 
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
 from PIL import Image
 
 from django.core.exceptions import ValidationError
 from django.db import transaction
 
-from .cloudinary_cleanup import cloudinary_delivery_url
+from .cloudinary_cleanup import cloudinary_delivery_url, destroy_cloudinary_asset
+
+logger = logging.getLogger(__name__)
 
 MAX_GALLERY_IMAGES = 10
 MAX_IMAGE_BYTES = 5 * 1024 * 1024
 DETAIL_LIGHTBOX_WIDTH = 1600
 DETAIL_THUMB_SIZE = 144
 DETAIL_PRIMARY_WIDTH = 1200
+GALLERY_UPLOAD_WORKERS = 4
 
 
 def _field_url(image_value, *, width=None, height=None, crop=None):
@@ -150,86 +157,210 @@ def validate_gallery_capacity(ad, *, additional_images=0):
         )
 
 
-def process_gallery_submission(ad, post_data, files):
-    """
-    Apply gallery deletes, reordering, and new uploads for an ad.
+@dataclass
+class GallerySubmission:
+    """Parsed gallery form data plus new images already uploaded to Cloudinary."""
 
-    POST fields:
-      - gallery_order: comma-separated existing AdGalleryImage IDs
-      - gallery_delete: comma-separated AdGalleryImage IDs to remove
-      - gallery_images: multiple file upload field
+    delete_ids: set = field(default_factory=set)
+    order_ids: list = field(default_factory=list)
+    uploads: list = field(default_factory=list)
+    errors: list = field(default_factory=list)
 
-    Returns a list of user-facing error strings (empty if successful).
-    """
-    from .models import AdGalleryImage
 
-    errors = []
+def _gallery_files(files):
+    if hasattr(files, "getlist"):
+        return files.getlist("gallery_images")
+    uploaded = (files or {}).get("gallery_images", [])
+    if isinstance(uploaded, list):
+        return uploaded
+    if uploaded:
+        return [uploaded]
+    return []
 
-    delete_raw = (post_data.get("gallery_delete") or "").strip()
-    delete_ids = {
-        int(value)
-        for value in delete_raw.split(",")
-        if value.strip().isdigit()
-    }
 
-    order_raw = (post_data.get("gallery_order") or "").strip()
-    order_ids = [
+def _parse_id_list(raw):
+    return [
         int(value)
-        for value in order_raw.split(",")
+        for value in (raw or "").strip().split(",")
         if value.strip().isdigit()
     ]
 
-    if hasattr(files, "getlist"):
-        new_files = files.getlist("gallery_images")
-    else:
-        uploaded = (files or {}).get("gallery_images", [])
-        if isinstance(uploaded, list):
-            new_files = uploaded
-        elif uploaded:
-            new_files = [uploaded]
-        else:
-            new_files = []
-
-    with transaction.atomic():
-        from .models import Ad
-
-        Ad.objects.select_for_update().get(pk=ad.pk)
-
-        existing_qs = ad.gallery_images.all()
-        existing_by_id = {item.id: item for item in existing_qs}
-
-        for image_id in delete_ids:
-            gallery_image = existing_by_id.pop(image_id, None)
-            if gallery_image is not None and gallery_image.ad_id == ad.pk:
-                gallery_image.delete()
-
-        remaining_count = ad.gallery_images.count()
-        if remaining_count + len(new_files) > MAX_GALLERY_IMAGES:
-            errors.append(f"حداکثر {MAX_GALLERY_IMAGES} تصویر گالری مجاز است.")
-            return errors
-
-        for uploaded in new_files:
-            try:
-                validate_uploaded_image(uploaded)
-            except ValidationError as error:
-                errors.append(error.messages[0] if error.messages else str(error))
-                return errors
 
-        valid_order_ids = [
-            image_id for image_id in order_ids if image_id in existing_by_id
-        ]
+def _upload_gallery_file(uploaded, options):
+    """Upload one gallery file the same way CloudinaryField.pre_save would."""
+    import cloudinary.uploader
+
+    if hasattr(uploaded, "seekable") and uploaded.seekable():
+        uploaded.seek(0)
+    return cloudinary.uploader.upload_resource(uploaded, **options)
 
-        for sort_order, image_id in enumerate(valid_order_ids):
-            AdGalleryImage.objects.filter(pk=image_id, ad=ad).update(sort_order=sort_order)
 
-        next_sort_order = len(valid_order_ids)
-        for uploaded in new_files:
-            validate_gallery_capacity(ad, additional_images=1)
-            AdGalleryImage.objects.create(
-                ad=ad,
-                image=uploaded,
-                sort_order=next_sort_order,
+def upload_gallery_files(ad, new_files):
+    """
+    Upload new gallery files concurrently on a bounded thread pool.
+
+    Returns CloudinaryResource values in the same order as ``new_files``.
+    If any upload fails, the ones that succeeded are destroyed and the
+    error is re-raised.
+    """
+    from .models import AdGalleryImage
+
+    if not new_files:
+        return []
+
+    image_field = AdGalleryImage._meta.get_field("image")
+    placeholder = AdGalleryImage(ad=ad)
+    options = {"type": image_field.type, "resource_type": image_field.resource_type}
+    options.update(
+        {
+            key: value(placeholder) if callable(value) else value
+            for key, value in image_field.options.items()
+        }
+    )
+
+    workers = min(GALLERY_UPLOAD_WORKERS, len(new_files))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ad-gallery-upload") as pool:
+        futures = [pool.submit(_upload_gallery_file, uploaded, options) for uploaded in new_files]
+        wait(futures)
+
+    failures = [future.exception() for future in futures if future.exception()]
+    if failures:
+        _discard_uploads(future.result() for future in futures if not future.exception())
+        raise failures[0]
+    return [future.result() for future in futures]
+
+
+def _discard_uploads(resources):
+    """Compensating delete for uploads that never made it into the DB."""
+    for resource in resources:
+        destroy_cloudinary_asset(resource)
+
+
+def discard_gallery_submission(submission):
+    """
+    Destroy a submission's uploads after the write that would store them failed.
+
+    Safe to call more than once: the uploads are cleared after discarding.
+    """
+    uploads, submission.uploads = submission.uploads, []
+    _discard_uploads(uploads)
+
+
+def prepare_gallery_submission(ad, post_data, files):
+    """
+    Parse and validate a gallery submission and upload new files.
+
+    Runs outside any row lock so slow Cloudinary I/O never blocks other
+    writers. ``ad`` may be unsaved (create flow). Validation and upload
+    problems are returned as ``errors`` on the submission.
+    """
+    submission = GallerySubmission(
+        delete_ids=set(_parse_id_list(post_data.get("gallery_delete"))),
+        order_ids=_parse_id_list(post_data.get("gallery_order")),
+    )
+    new_files = _gallery_files(files)
+    if not new_files:
+        return submission
+
+    # Early capacity check so we never upload files that cannot be stored;
+    # apply_gallery_submission re-checks under the row lock.
+    existing_ids = set()
+    if ad.pk:
+        existing_ids = set(ad.gallery_images.values_list("id", flat=True))
+    remaining_count = len(existing_ids - submission.delete_ids)
+    if remaining_count + len(new_files) > MAX_GALLERY_IMAGES:
+        submission.errors.append(f"حداکثر {MAX_GALLERY_IMAGES} تصویر گالری مجاز است.")
+        return submission
+
+    for uploaded in new_files:
+        try:
+            validate_uploaded_image(uploaded)
+        except ValidationError as error:
+            submission.errors.append(error.messages[0] if error.messages else str(error))
+            return submission
+
+    try:
+        submission.uploads = upload_gallery_files(ad, new_files)
+    except Exception as exc:
+        logger.warning("Gallery upload failed for ad %s: %s", ad.pk, exc)
+        submission.errors.append("بارگذاری تصاویر گالری ناموفق بود. لطفاً دوباره تلاش کنید.")
+    return submission
+
+
+def apply_gallery_submission(ad, submission):
+    """
+    Write a prepared submission: deletes, reordering and new rows in bulk.
+
+    The ad row lock is held only for these writes. If the DB phase fails,
+    the already-uploaded Cloudinary assets are destroyed.
+    """
+    from .models import Ad, AdGalleryImage
+
+    errors = list(submission.errors)
+    if errors:
+        return errors
+
+    try:
+        with transaction.atomic():
+            Ad.objects.select_for_update().get(pk=ad.pk)
+
+            existing_by_id = {item.id: item for item in ad.gallery_images.all()}
+
+            for image_id in submission.delete_ids:
+                gallery_image = existing_by_id.pop(image_id, None)
+                if gallery_image is not None and gallery_image.ad_id == ad.pk:
+                    gallery_image.delete()
+
+            if len(existing_by_id) + len(submission.uploads) > MAX_GALLERY_IMAGES:
+                discard_gallery_submission(submission)
+                errors.append(f"حداکثر {MAX_GALLERY_IMAGES} تصویر گالری مجاز است.")
+                return errors
+
+            valid_order_ids = [
+                image_id for image_id in submission.order_ids if image_id in existing_by_id
+            ]
+            reordered = []
+            for sort_order, image_id in enumerate(valid_order_ids):
+                gallery_image = existing_by_id[image_id]
+                if gallery_image.sort_order != sort_order:
+                    gallery_image.sort_order = sort_order
+                    reordered.append(gallery_image)
+            if reordered:
+                AdGalleryImage.objects.bulk_update(reordered, ["sort_order"])
+
+            AdGalleryImage.objects.bulk_create(
+                [
+                    AdGalleryImage(
+                        ad=ad,
+                        image=resource,
+                        sort_order=sort_order,
+                    )
+                    for sort_order, resource in enumerate(
+                        submission.uploads,
+                        start=len(valid_order_ids),
+                    )
+                ]
             )
-            next_sort_order += 1
+    except Exception:
+        discard_gallery_submission(submission)
+        raise
 
     return errors
+
+
+def process_gallery_submission(ad, post_data, files):
+    """
+    Apply gallery deletes, reordering, and new uploads for an ad.
+
+    POST fields:
+      - gallery_order: comma-separated existing AdGalleryImage IDs
+      - gallery_delete: comma-separated AdGalleryImage IDs to remove
+      - gallery_images: multiple file upload field
+
+    Uploads run concurrently before the ad row is locked; see
+    prepare_gallery_submission and apply_gallery_submission.
+
+    Returns a list of user-facing error strings (empty if successful).
+    """
+    submission = prepare_gallery_submission(ad, post_data, files)
+    return apply_gallery_submission(ad, submission)
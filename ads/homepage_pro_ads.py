@@ -2,15 +2,20 @@
 
 import hashlib
 
+from django.core.cache import cache
 from django.db.models import Q
 from django.utils import timezone
 
-from ads.models import Ad
+from ads.models import Ad, HomepageProRotation
 
 HOMEPAGE_PRO_ADS_LIMIT = 6
 HOMEPAGE_PRO_NEWEST_COUNT = 3
 HOMEPAGE_PRO_ROTATING_COUNT = 3
 HOMEPAGE_PRO_ROTATION_SECONDS = 12 * 3600
+# Per-process cache in front of HomepageProRotation; kept short so every
+# dyno picks up invalidations from the shared table within minutes.
+HOMEPAGE_PRO_CACHE_SECONDS = 300
+HOMEPAGE_PRO_CACHE_KEY = "homepage_pro_ads:rotation:{bucket}"
 
 
 def _visible_pro_ads_queryset():
@@ -36,31 +41,108 @@ def _rotation_score(ad_id, bucket):
     return int(digest, 16)
 
 
-def get_homepage_pro_ads():
+def current_rotation_bucket(now=None):
+    """Return the 12-hour rotation bucket for ``now`` (default: current time)."""
+    now = now or timezone.now()
+    return int(now.timestamp()) // HOMEPAGE_PRO_ROTATION_SECONDS
+
+
+def compute_homepage_rotation(bucket):
     """
-    Return up to six visible Pro ads for the homepage.
+    Select homepage Pro ad IDs for ``bucket`` from a full scan of visible ads.
 
-    - Six or fewer active Pro ads: return all, newest first.
+    - Six or fewer active Pro ads: all of them, newest first.
     - More than six: three newest plus three rotating picks from the rest.
-      Rotation bucket changes every 12 hours (stable across requests/dynos).
     """
-    base_qs = _visible_pro_ads_queryset()
-    ordered_ids = list(base_qs.values_list("id", flat=True))
-
-    if not ordered_ids:
-        return []
-
+    ordered_ids = list(_visible_pro_ads_queryset().values_list("id", flat=True))
     if len(ordered_ids) <= HOMEPAGE_PRO_ADS_LIMIT:
-        return list(base_qs.filter(id__in=ordered_ids))
+        return ordered_ids
 
     newest_ids = ordered_ids[:HOMEPAGE_PRO_NEWEST_COUNT]
     remaining_ids = ordered_ids[HOMEPAGE_PRO_NEWEST_COUNT:]
-    bucket = int(timezone.now().timestamp()) // HOMEPAGE_PRO_ROTATION_SECONDS
     rotating_ids = sorted(
         remaining_ids,
         key=lambda ad_id: _rotation_score(ad_id, bucket),
     )[:HOMEPAGE_PRO_ROTATING_COUNT]
-    selected_ids = newest_ids + rotating_ids
+    return newest_ids + rotating_ids
+
+
+def store_homepage_rotation(bucket, ad_ids):
+    """Persist the selection for ``bucket`` and prime the local cache."""
+    HomepageProRotation.objects.update_or_create(
+        bucket=bucket,
+        defaults={"ad_ids": list(ad_ids)},
+    )
+    cache.set(
+        HOMEPAGE_PRO_CACHE_KEY.format(bucket=bucket),
+        list(ad_ids),
+        HOMEPAGE_PRO_CACHE_SECONDS,
+    )
+    return list(ad_ids)
+
+
+def refresh_homepage_rotation(bucket):
+    """Recompute and store the selection for ``bucket``."""
+    return store_homepage_rotation(bucket, compute_homepage_rotation(bucket))
+
+
+def get_homepage_rotation_ids(bucket):
+    """Return stored IDs for ``bucket``: cache, then table, then compute."""
+    cache_key = HOMEPAGE_PRO_CACHE_KEY.format(bucket=bucket)
+    ad_ids = cache.get(cache_key)
+    if ad_ids is not None:
+        return ad_ids
+
+    stored = (
+        HomepageProRotation.objects.filter(bucket=bucket)
+        .values_list("ad_ids", flat=True)
+        .first()
+    )
+    if stored is not None:
+        cache.set(cache_key, stored, HOMEPAGE_PRO_CACHE_SECONDS)
+        return stored
+
+    return refresh_homepage_rotation(bucket)
+
+
+def invalidate_homepage_rotation():
+    """Drop stored selections for the current and future buckets."""
+    bucket = current_rotation_bucket()
+    HomepageProRotation.objects.filter(bucket__gte=bucket).delete()
+    cache.delete_many(
+        [
+            HOMEPAGE_PRO_CACHE_KEY.format(bucket=bucket),
+            HOMEPAGE_PRO_CACHE_KEY.format(bucket=bucket + 1),
+        ]
+    )
+
+
+def prune_homepage_rotations(before_bucket):
+    """Delete stored selections older than ``before_bucket``."""
+    deleted, _ = HomepageProRotation.objects.filter(bucket__lt=before_bucket).delete()
+    return deleted
+
 
-    ads_by_id = {ad.id: ad for ad in base_qs.filter(id__in=selected_ids)}
+def _fetch_selected_ads(selected_ids):
+    if not selected_ids:
+        return []
+    ads_by_id = {
+        ad.id: ad for ad in _visible_pro_ads_queryset().filter(id__in=selected_ids)
+    }
     return [ads_by_id[ad_id] for ad_id in selected_ids if ad_id in ads_by_id]
+
+
+def get_homepage_pro_ads():
+    """
+    Return up to six visible Pro ads for the homepage.
+
+    Reads the precomputed selection for the current 12-hour bucket (stable
+    across requests/dynos) and fetches just those ads. If a selected ad is
+    no longer visible, the bucket is recomputed once.
+    """
+    bucket = current_rotation_bucket()
+    selected_ids = get_homepage_rotation_ids(bucket)
+    ads = _fetch_selected_ads(selected_ids)
+    if len(ads) < len(selected_ids):
+        ads = _fetch_selected_ads(refresh_homepage_rotation(bucket))
+    return ads
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from ads.homepage_pro_ads import (
+    current_rotation_bucket,
+    prune_homepage_rotations,
+    refresh_homepage_rotation,
+)
+
+
+class Command(BaseCommand):
+    help = 'Precompute the homepage Pro ads rotation for the current and next 12-hour buckets.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--keep',
+            type=int,
+            default=2,
+            help='Past buckets to keep before pruning (default: 2).',
+        )
+
+    def handle(self, *args, **options):
+        bucket = current_rotation_bucket()
+        for target in (bucket, bucket + 1):
+            ad_ids = refresh_homepage_rotation(target)
+            self.stdout.write(
+                self.style.NOTICE(f'Bucket {target}: {len(ad_ids)} Pro ad(s) {ad_ids}')
+            )
+
+        pruned = prune_homepage_rotations(bucket - max(options['keep'], 0))
+        self.stdout.write(self.style.NOTICE(f'Pruned {pruned} old bucket(s).'))
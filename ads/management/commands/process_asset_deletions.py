@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand
+
+from ads.cloudinary_cleanup import (
+    DELETION_BATCH_SIZE,
+    DELETION_MAX_ATTEMPTS,
+    process_pending_asset_deletions,
+)
+
+
+class Command(BaseCommand):
+    help = 'Delete queued Cloudinary assets in bulk batches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report the queue size without deleting anything.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DELETION_BATCH_SIZE,
+            help=f'Public IDs per delete_resources call (max {DELETION_BATCH_SIZE}).',
+        )
+        parser.add_argument(
+            '--max-attempts',
+            type=int,
+            default=DELETION_MAX_ATTEMPTS,
+            help=f'Skip rows that already failed this many times (default: {DELETION_MAX_ATTEMPTS}).',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=None,
+            help='Process at most this many queued assets.',
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        summary = process_pending_asset_deletions(
+            batch_size=options['batch_size'],
+            max_attempts=options['max_attempts'],
+            limit=options['limit'],
+            dry_run=dry_run,
+        )
+
+        mode = 'DRY RUN' if dry_run else 'LIVE'
+        self.stdout.write(
+            self.style.NOTICE(
+                f'[{mode}] Cloudinary asset deletions: '
+                f'{summary["candidates"]} queued, '
+                f'{summary["deleted"]} deleted, '
+                f'{summary["failed"]} failed '
+                f'in {summary["batches"]} batch(es).'
+            )
+        )
@@ -0,0 +1,62 @@
+"""
+Reconcile Cloudinary assets against the public IDs referenced in the DB.
+
+Usage:
+    python manage.py reconcile_media --listing assets.jsonl --output-dir media-reports
+    python manage.py reconcile_media --listing assets.json --output-dir media-reports --prefix peyvand/
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from ads.media_manifest import MANIFEST_CHUNK_SIZE, reconcile_media
+
+
+class Command(BaseCommand):
+    help = 'Write orphaned (delete) and missing media reports from an exported Cloudinary listing'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--listing',
+            required=True,
+            help='Exported Cloudinary asset listing (JSON Lines or Admin API JSON).',
+        )
+        parser.add_argument(
+            '--output-dir',
+            required=True,
+            help='Directory for the sorted manifests and the two reports.',
+        )
+        parser.add_argument(
+            '--prefix',
+            default='',
+            help='Only reconcile public IDs starting with this folder prefix.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=MANIFEST_CHUNK_SIZE,
+            help=f'IDs held in memory per sort run (default: {MANIFEST_CHUNK_SIZE}).',
+        )
+
+    def handle(self, *args, **options):
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size must be at least 1.')
+        try:
+            summary = reconcile_media(
+                options['listing'],
+                options['output_dir'],
+                prefix=options['prefix'],
+                chunk_size=options['chunk_size'],
+            )
+        except (OSError, ValueError) as exc:
+            raise CommandError(f'Could not reconcile media: {exc}') from exc
+
+        self.stdout.write(
+            self.style.NOTICE(
+                f'Media reconciliation: {summary["referenced"]} referenced, '
+                f'{summary["assets"]} in Cloudinary, '
+                f'{summary["matched"]} matched, '
+                f'{summary["orphaned"]} orphaned, '
+                f'{summary["missing"]} missing.'
+            )
+        )
+        self.stdout.write(f'Delete report: {summary["delete_report"]}')
+        self.stdout.write(f'Missing report: {summary["missing_report"]}')
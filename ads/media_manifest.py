@@ -0,0 +1,276 @@
+"""
+Cloudinary media reconciliation.
+
+Streams every referenced public ID from the database into a sorted on-disk
+manifest, then merges it against an exported Cloudinary asset listing to
+find orphaned assets (safe to delete) and missing assets (referenced but
+absent from Cloudinary). Both inputs are sorted externally in fixed-size
+chunks, so memory use stays bounded regardless of library size.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import os
+import re
+import tempfile
+from typing import Iterable, Iterator
+
+from cloudinary.models import CloudinaryField
+from django.apps import apps
+
+MANIFEST_CHUNK_SIZE = 50_000
+QUERY_CHUNK_SIZE = 2_000
+PLACEHOLDER_VALUES = frozenset({"placeholder"})
+
+# Same layout CloudinaryField uses when storing a resource in the DB:
+# "<resource_type>/<type>/v<version>/<public_id>.<format>". The format is
+# only appended after a type or version prefix, so a bare value is the
+# public ID itself, dots included.
+_DB_VALUE_RE = re.compile(
+    r'^(?P<prefix>(?:(?P<resource_type>image|raw|video)/'
+    r'(?:upload|private|authenticated)/)?(?:v\d+/)?)(?P<public_id>.*)$'
+)
+_FORMAT_RE = re.compile(r'\.[^./]+$')
+
+
+def media_reference_fields() -> list:
+    """
+    ``(model, field names)`` for every concrete ``CloudinaryField`` in the project.
+
+    Discovered from the app registry rather than listed by hand, so a new
+    image field is never missing from the manifest (a missed field would put
+    its live assets in the delete report). Content AI featured uploads are
+    referenced through ``Post.featured_image``.
+    """
+    references = []
+    for model in apps.get_models():
+        if model._meta.proxy:
+            continue
+        field_names = tuple(
+            field.name
+            for field in model._meta.concrete_fields
+            if isinstance(field, CloudinaryField)
+        )
+        if field_names:
+            references.append((model, field_names))
+    return references
+
+
+def normalize_public_id(value) -> str:
+    """
+    Reduce a stored CloudinaryField value to the asset's public ID.
+
+    Drops the type/version prefix and, after such a prefix, the delivery
+    format. Raw resources keep their extension, which is part of the ID.
+    Listing IDs are already public IDs and are compared unchanged.
+    """
+    if not value:
+        return ""
+    raw = str(getattr(value, "public_id", None) or value).strip()
+    if not raw or raw in PLACEHOLDER_VALUES:
+        return ""
+    match = _DB_VALUE_RE.match(raw)
+    public_id = match.group("public_id")
+    if match.group("prefix") and match.group("resource_type") != "raw":
+        public_id = _FORMAT_RE.sub("", public_id)
+    return public_id
+
+
+def iter_referenced_public_ids() -> Iterator[str]:
+    """Yield referenced public IDs from every media model (unsorted, may repeat)."""
+    for model, field_names in media_reference_fields():
+        for field_name in field_names:
+            values = (
+                model.objects.exclude(**{f"{field_name}__isnull": True})
+                .exclude(**{field_name: ""})
+                .values_list(field_name, flat=True)
+                .iterator(chunk_size=QUERY_CHUNK_SIZE)
+            )
+            for value in values:
+                public_id = normalize_public_id(value)
+                if not public_id:
+                    continue
+                yield public_id
+                # CloudinaryField reads a bare "name.ext" value as public ID
+                # "name" plus a format, but uploads are always stored with a
+                # version. Without one the dot may belong to the ID, so
+                # reference that reading too rather than risk deleting it.
+                fmt = getattr(value, "format", None)
+                if fmt and not getattr(value, "version", None):
+                    yield f"{public_id}.{fmt}"
+
+
+def iter_listing_public_ids(path, *, prefix="") -> Iterator[str]:
+    """
+    Yield public IDs from an exported Cloudinary asset listing.
+
+    Accepts JSON Lines (one resource object or ID per line, streamed) or a
+    JSON document shaped like an Admin API ``resources`` response.
+    """
+    if _is_json_lines(path):
+        items = _iter_json_lines(path)
+    else:
+        with open(path, encoding="utf-8") as handle:
+            items = _listing_items(json.load(handle))
+
+    for item in items:
+        public_id = item.get("public_id", "") if isinstance(item, dict) else item
+        public_id = str(public_id or "").strip()
+        if public_id and public_id.startswith(prefix):
+            yield public_id
+
+
+def _listing_items(payload):
+    if isinstance(payload, dict) and "resources" in payload:
+        return payload["resources"]
+    if isinstance(payload, list):
+        return payload
+    return [payload]
+
+
+def _iter_json_lines(path):
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                yield from _listing_items(json.loads(line))
+
+
+def _is_json_lines(path) -> bool:
+    """True when the first non-empty line is a complete JSON value on its own."""
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                try:
+                    json.loads(line)
+                except ValueError:
+                    return False
+                return True
+    return False
+
+
+def write_sorted_manifest(public_ids: Iterable[str], path, *, chunk_size=MANIFEST_CHUNK_SIZE) -> int:
+    """
+    External-sort ``public_ids`` into ``path`` (one unique ID per line).
+
+    At most ``chunk_size`` IDs are held in memory; sorted runs are spilled
+    to temporary files and k-way merged. Returns the number of unique IDs.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    run_paths = []
+    try:
+        chunk = []
+        for public_id in public_ids:
+            chunk.append(public_id)
+            if len(chunk) >= chunk_size:
+                run_paths.append(_spill_run(chunk, directory))
+                chunk = []
+        if chunk or not run_paths:
+            run_paths.append(_spill_run(chunk, directory))
+
+        run_handles = [open(run_path, encoding="utf-8") for run_path in run_paths]
+        try:
+            count = 0
+            previous = None
+            with open(path, "w", encoding="utf-8") as output:
+                for public_id in heapq.merge(*(_iter_lines(handle) for handle in run_handles)):
+                    if public_id != previous:
+                        output.write(public_id + "\n")
+                        previous = public_id
+                        count += 1
+            return count
+        finally:
+            for handle in run_handles:
+                handle.close()
+    finally:
+        for run_path in run_paths:
+            os.remove(run_path)
+
+
+def _spill_run(chunk, directory) -> str:
+    chunk.sort()
+    handle, run_path = tempfile.mkstemp(prefix="media-run-", suffix=".txt", dir=directory)
+    with os.fdopen(handle, "w", encoding="utf-8") as run:
+        for public_id in chunk:
+            run.write(public_id + "\n")
+    return run_path
+
+
+def _iter_lines(handle) -> Iterator[str]:
+    for line in handle:
+        line = line.rstrip("\n")
+        if line:
+            yield line
+
+
+def diff_sorted_manifests(manifest_path, listing_path, *, delete_path, missing_path) -> dict:
+    """
+    Merge two sorted manifests and write the reconciliation reports.
+
+    ``delete_path`` receives IDs present in Cloudinary but unreferenced;
+    ``missing_path`` receives IDs referenced in the DB but absent from
+    Cloudinary. Returns counts for both.
+    """
+    summary = {"orphaned": 0, "missing": 0, "matched": 0}
+    with open(manifest_path, encoding="utf-8") as manifest, \
+            open(listing_path, encoding="utf-8") as listing, \
+            open(delete_path, "w", encoding="utf-8") as delete_report, \
+            open(missing_path, "w", encoding="utf-8") as missing_report:
+        referenced = _iter_lines(manifest)
+        stored = _iter_lines(listing)
+        ref = next(referenced, None)
+        asset = next(stored, None)
+        while ref is not None or asset is not None:
+            if asset is None or (ref is not None and ref < asset):
+                missing_report.write(ref + "\n")
+                summary["missing"] += 1
+                ref = next(referenced, None)
+            elif ref is None or asset < ref:
+                delete_report.write(asset + "\n")
+                summary["orphaned"] += 1
+                asset = next(stored, None)
+            else:
+                summary["matched"] += 1
+                ref = next(referenced, None)
+                asset = next(stored, None)
+    return summary
+
+
+def reconcile_media(listing_path, output_dir, *, prefix="", chunk_size=MANIFEST_CHUNK_SIZE) -> dict:
+    """
+    Build the DB manifest, sort the asset listing and write both reports.
+
+    Files written to ``output_dir``: ``referenced_manifest.txt``,
+    ``cloudinary_manifest.txt``, ``delete_report.txt`` and
+    ``missing_report.txt``.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, "referenced_manifest.txt")
+    listing_manifest_path = os.path.join(output_dir, "cloudinary_manifest.txt")
+    delete_path = os.path.join(output_dir, "delete_report.txt")
+    missing_path = os.path.join(output_dir, "missing_report.txt")
+
+    referenced = (
+        public_id for public_id in iter_referenced_public_ids()
+        if public_id.startswith(prefix)
+    )
+    summary = {
+        "referenced": write_sorted_manifest(referenced, manifest_path, chunk_size=chunk_size),
+        "assets": write_sorted_manifest(
+            iter_listing_public_ids(listing_path, prefix=prefix),
+            listing_manifest_path,
+            chunk_size=chunk_size,
+        ),
+    }
+    summary.update(
+        diff_sorted_manifests(
+            manifest_path,
+            listing_manifest_path,
+            delete_path=delete_path,
+            missing_path=missing_path,
+        )
+    )
+    summary["delete_report"] = delete_path
+    summary["missing_report"] = missing_path
+    return summary
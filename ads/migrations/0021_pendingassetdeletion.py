@@ -0,0 +1,29 @@
+# Generated by Django 4.2.18 on 2026-10-19 07:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ads', '0020_rename_ads_adgalle_ad_id_6f0a0d_idx_ads_adgalle_ad_id_dcfdf3_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingAssetDeletion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('public_id', models.CharField(max_length=255, unique=True)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_on', models.DateTimeField(auto_now_add=True)),
+                ('last_attempt_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Pending Asset Deletion',
+                'verbose_name_plural': 'Pending Asset Deletions',
+                'ordering': ['created_on', 'id'],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.18 on 2026-10-19 07:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ads', '0021_pendingassetdeletion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HomepageProRotation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket', models.PositiveIntegerField(unique=True)),
+                ('ad_ids', models.JSONField(default=list)),
+                ('computed_on', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Homepage Pro Rotation',
+                'verbose_name_plural': 'Homepage Pro Rotations',
+                'ordering': ['-bucket'],
+            },
+        ),
+    ]
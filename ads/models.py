@@ -4,6 +4,8 @@ from cloudinary.models import CloudinaryField
 from django.utils.text import slugify
 from django.utils import timezone
 
+from codestar.slugs import save_with_unique_slug
+
 
 class AdCategory(models.Model):
     """
@@ -214,13 +216,15 @@ class Ad(models.Model):
         Automatically generate a unique slug from the title if not set.
         """
         if not self.slug:
-            base_slug = slugify(self.title)
-            slug = base_slug
-            counter = 1
-            while Ad.objects.filter(slug=slug).exclude(pk=self.pk).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            self.slug = slug
+            base_slug = slugify(self.title) or "ad"
+            save_with_unique_slug(
+                self,
+                base_slug,
+                lambda: super(Ad, self).save(*args, **kwargs),
+                max_length=200,
+                first_suffix=1,
+            )
+            return
         super().save(*args, **kwargs)
 
     def is_currently_visible(self):
@@ -393,3 +397,48 @@ class AdsViewCount(models.Model):
     
     def __str__(self):
         return f"{self.ad.title}: {self.total_views} views"
+
+
+class PendingAssetDeletion(models.Model):
+    """
+    Cloudinary asset queued for deletion.
+
+    Rows are written by the ads delete signals and drained in batches by
+    the ``process_asset_deletions`` management command, so deleting an ad
+    never waits on Cloudinary round trips.
+    """
+
+    public_id = models.CharField(max_length=255, unique=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    created_on = models.DateTimeField(auto_now_add=True)
+    last_attempt_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["created_on", "id"]
+        verbose_name = "Pending Asset Deletion"
+        verbose_name_plural = "Pending Asset Deletions"
+
+    def __str__(self):
+        return f"{self.public_id} ({self.attempts} attempts)"
+
+
+class HomepageProRotation(models.Model):
+    """
+    Precomputed homepage Pro ad selection for one 12-hour rotation bucket.
+
+    Written by ``precompute_homepage_pro_ads`` (or lazily on a miss) so the
+    homepage reads a handful of IDs instead of scanning every Pro ad.
+    """
+
+    bucket = models.PositiveIntegerField(unique=True)
+    ad_ids = models.JSONField(default=list)
+    computed_on = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-bucket"]
+        verbose_name = "Homepage Pro Rotation"
+        verbose_name_plural = "Homepage Pro Rotations"
+
+    def __str__(self):
+        return f"Bucket {self.bucket}: {self.ad_ids}"
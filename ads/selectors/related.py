@@ -10,9 +10,8 @@ from ads.config.blog_category_mapping import BLOG_TO_AD_CATEGORY_SLUGS
 from ads.config.community_category_mapping import COMMUNITY_TO_AD_CATEGORY_SLUGS
 from ads.models import Ad
 from codestar.related.category_mapping import mapped_values_for_source
-from codestar.related.sources import related_content_source
+from codestar.related.sources import related_content_source, source_keywords
 from codestar.related.text_matching import (
-    extract_search_keywords,
     keyword_search_variants,
     score_token_overlap,
     tokenize_persian_text,
@@ -58,7 +57,7 @@ def get_related_ads(content: Any, *, limit: int = 3) -> list[Ad]:
     if len(results) >= limit:
         return results[:limit]
 
-    keywords = extract_search_keywords(source.title, source.body)
+    keywords = source_keywords(source)
     if not keywords:
         return results[:limit]
 
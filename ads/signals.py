@@ -1,7 +1,7 @@
 """
 Signals for ads app - admin notifications and Cloudinary cleanup.
 """
-from django.db.models.signals import post_save, pre_delete
+from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
 from django.core.mail import send_mail
 from django.contrib.sites.models import Site
@@ -12,20 +12,29 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-from .cloudinary_cleanup import destroy_cloudinary_asset
+from .cloudinary_cleanup import enqueue_cloudinary_asset_deletion
 from .models import Ad, AdGalleryImage
 
 
 @receiver(pre_delete, sender=AdGalleryImage)
 def delete_gallery_image_asset(sender, instance, **kwargs):
-    """Remove gallery image from Cloudinary when the row is deleted."""
-    destroy_cloudinary_asset(instance.image)
+    """Queue the gallery image for Cloudinary deletion when the row is deleted."""
+    enqueue_cloudinary_asset_deletion(instance.image)
 
 
 @receiver(pre_delete, sender=Ad)
 def delete_ad_primary_image_asset(sender, instance, **kwargs):
-    """Remove primary ad image from Cloudinary when the ad is deleted."""
-    destroy_cloudinary_asset(instance.image)
+    """Queue the primary ad image for Cloudinary deletion when the ad is deleted."""
+    enqueue_cloudinary_asset_deletion(instance.image)
+
+
+@receiver(post_save, sender=Ad)
+@receiver(post_delete, sender=Ad)
+def invalidate_homepage_pro_rotation(sender, instance, **kwargs):
+    """Recompute the homepage Pro ads selection after any ad change."""
+    from .homepage_pro_ads import invalidate_homepage_rotation
+
+    invalidate_homepage_rotation()
 
 
 @receiver(post_save, sender=Ad)
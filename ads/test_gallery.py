@@ -1,15 +1,25 @@
 import base64
+import threading
+from io import StringIO
 from unittest.mock import patch
 
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.db import connection
+from django.core.management import call_command
+from django.db import DatabaseError, connection
 from django.test import TestCase
 from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.datastructures import MultiValueDict
 
-from ads.cloudinary_cleanup import cloudinary_delivery_url, destroy_cloudinary_asset
+from ads.cloudinary_cleanup import (
+    clear_delivery_url_cache,
+    cloudinary_delivery_url,
+    destroy_cloudinary_asset,
+    enqueue_cloudinary_asset_deletion,
+    process_pending_asset_deletions,
+    resolve_delivery_urls,
+)
 from ads.gallery import (
     MAX_GALLERY_IMAGES,
     build_detail_slides,
@@ -18,7 +28,7 @@ from ads.gallery import (
     should_show_gallery_lightbox,
     validate_gallery_capacity,
 )
-from ads.models import Ad, AdGalleryImage
+from ads.models import Ad, AdGalleryImage, PendingAssetDeletion
 from ads.tests import AdsTestMixin
 
 MINIMAL_JPEG = base64.b64decode(
@@ -108,15 +118,128 @@ class AdGalleryFormTests(AdGalleryTestMixin, TestCase):
             content_type="image/png",
         )
 
-    def test_process_gallery_submission_stores_images_for_free_ad(self):
+    def _upload_result(self, file, **kwargs):
+        return {
+            "public_id": f"test/{getattr(file, 'name', 'upload')}",
+            "resource_type": "image",
+            "version": 1,
+            "type": "upload",
+            "format": "png",
+        }
+
+    @patch("cloudinary.uploader.upload")
+    def test_process_gallery_submission_stores_images_for_free_ad(self, mock_upload):
+        mock_upload.side_effect = self._upload_result
         ad = self._create_ad("free-store", plan="free")
         files = MultiValueDict({"gallery_images": [self._image_file("g1.png"), self._image_file("g2.png")]})
-        with patch("ads.models.AdGalleryImage.objects.create") as mock_create:
-            errors = process_gallery_submission(ad, {}, files)
+        errors = process_gallery_submission(ad, {}, files)
         self.assertEqual(errors, [])
-        self.assertEqual(mock_create.call_count, 2)
+        self.assertEqual(mock_upload.call_count, 2)
+        self.assertEqual(
+            [(str(item.image.public_id), item.sort_order) for item in ad.gallery_images.all()],
+            [("test/g1.png", 0), ("test/g2.png", 1)],
+        )
         self.assertFalse(should_show_gallery_lightbox(ad))
 
+    @patch("cloudinary.uploader.upload")
+    def test_uploads_run_concurrently_before_row_lock(self, mock_upload):
+        ad = self._create_ad("concurrent-upload", plan="pro")
+        existing = self._add_gallery_image(ad, 0)
+        events = []
+        barrier = threading.Barrier(2, timeout=5)
+
+        def upload(file, **kwargs):
+            # Both uploads must be in flight at once to pass the barrier.
+            barrier.wait()
+            events.append("upload")
+            return self._upload_result(file)
+
+        mock_upload.side_effect = upload
+        original_lock = Ad.objects.select_for_update
+
+        def lock(*args, **kwargs):
+            events.append("lock")
+            return original_lock(*args, **kwargs)
+
+        files = MultiValueDict({"gallery_images": [self._image_file("c1.png"), self._image_file("c2.png")]})
+        with patch.object(Ad.objects, "select_for_update", side_effect=lock):
+            errors = process_gallery_submission(ad, {"gallery_order": str(existing.pk)}, files)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(events, ["upload", "upload", "lock"])
+        self.assertEqual(
+            list(ad.gallery_images.values_list("sort_order", flat=True)),
+            [0, 1, 2],
+        )
+
+    @patch("cloudinary.uploader.destroy")
+    @patch("cloudinary.uploader.upload")
+    def test_failed_upload_discards_successful_ones(self, mock_upload, mock_destroy):
+        def upload(file, **kwargs):
+            if file.name == "bad.png":
+                raise Exception("timeout")
+            return self._upload_result(file)
+
+        mock_upload.side_effect = upload
+        ad = self._create_ad("failed-upload", plan="pro")
+        files = MultiValueDict({"gallery_images": [self._image_file("ok.png"), self._image_file("bad.png")]})
+        errors = process_gallery_submission(ad, {}, files)
+        self.assertEqual(len(errors), 1)
+        mock_destroy.assert_called_once_with("test/ok.png")
+        self.assertFalse(ad.gallery_images.exists())
+
+    @patch("cloudinary.uploader.destroy")
+    @patch("cloudinary.uploader.upload")
+    def test_db_failure_destroys_uploaded_assets(self, mock_upload, mock_destroy):
+        mock_upload.side_effect = self._upload_result
+        ad = self._create_ad("db-failure", plan="pro")
+        files = MultiValueDict({"gallery_images": [self._image_file("d1.png"), self._image_file("d2.png")]})
+        with patch(
+            "ads.models.AdGalleryImage.objects.bulk_create",
+            side_effect=DatabaseError("write failed"),
+        ):
+            with self.assertRaises(DatabaseError):
+                process_gallery_submission(ad, {}, files)
+        self.assertEqual(
+            sorted(call.args[0] for call in mock_destroy.call_args_list),
+            ["test/d1.png", "test/d2.png"],
+        )
+
+    @patch("cloudinary.uploader.destroy")
+    @patch("cloudinary.uploader.upload")
+    def test_edit_view_discards_uploads_when_ad_save_fails(self, mock_upload, mock_destroy):
+        mock_upload.side_effect = self._upload_result
+        ad = self._create_ad("save-failure", plan="pro")
+        self.client.login(username="adowner", password="password123")
+        with patch("ads.models.Ad.save", side_effect=DatabaseError("write failed")):
+            with self.assertRaises(DatabaseError):
+                self.client.post(
+                    reverse("ads:edit_ad", kwargs={"slug": ad.slug}),
+                    {
+                        "title": ad.title,
+                        "category": self.category.pk,
+                        "target_url": "https://example.com",
+                        "city": "Tehran",
+                        "address": "Test address",
+                        # The form only validates with a fresh primary upload,
+                        # which is what gets the view to Ad.save().
+                        "image": self._image_file("primary.png"),
+                        "gallery_images": [
+                            self._image_file("s1.png"),
+                            self._image_file("s2.png"),
+                        ],
+                    },
+                )
+        self.assertEqual(
+            sorted(
+                call.args[0]
+                for call in mock_destroy.call_args_list
+                if call.args[0] != "test/primary.png"
+            ),
+            ["test/s1.png", "test/s2.png"],
+        )
+        self.assertFalse(ad.gallery_images.exists())
+
     def test_process_gallery_submission_enforces_max_limit(self):
         ad = self._create_ad("max-gallery", plan="free")
         for index in range(MAX_GALLERY_IMAGES):
@@ -210,6 +333,10 @@ class AdGalleryFormTests(AdGalleryTestMixin, TestCase):
 
 
 class AdGalleryPerformanceAndCleanupTests(AdGalleryTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        clear_delivery_url_cache()
+
     def _prefetched_ad(self, ad):
         return (
             Ad.objects.select_related("category", "owner")
@@ -240,20 +367,33 @@ class AdGalleryPerformanceAndCleanupTests(AdGalleryTestMixin, TestCase):
         self.assertEqual(len(one_image_queries.captured_queries), 0)
 
     @patch("cloudinary.uploader.destroy")
-    def test_deleting_gallery_image_destroys_cloudinary_asset(self, mock_destroy):
+    def test_deleting_gallery_image_queues_cloudinary_asset(self, mock_destroy):
         ad = self._create_ad("delete-gallery", plan="pro")
         gallery_image = self._add_gallery_image(ad)
         gallery_image.delete()
-        mock_destroy.assert_called_once()
+        mock_destroy.assert_not_called()
+        self.assertTrue(
+            PendingAssetDeletion.objects.filter(public_id="test/ad-gallery-delete-gallery-0").exists()
+        )
 
     @patch("cloudinary.uploader.destroy")
-    def test_deleting_ad_destroys_primary_image_asset(self, mock_destroy):
+    def test_deleting_ad_queues_primary_and_gallery_assets(self, mock_destroy):
         ad = self._create_ad("delete-ad", plan="pro", image="test/primary-image")
         self._add_gallery_image(ad)
         ad_id = ad.pk
         ad.delete()
         self.assertFalse(Ad.objects.filter(pk=ad_id).exists())
-        self.assertGreaterEqual(mock_destroy.call_count, 2)
+        mock_destroy.assert_not_called()
+        self.assertEqual(
+            set(PendingAssetDeletion.objects.values_list("public_id", flat=True)),
+            {"test/primary-image", "test/ad-gallery-delete-ad-0"},
+        )
+
+    def test_enqueue_ignores_duplicate_public_ids(self):
+        enqueue_cloudinary_asset_deletion("test/duplicate")
+        enqueue_cloudinary_asset_deletion("test/duplicate")
+        enqueue_cloudinary_asset_deletion("")
+        self.assertEqual(PendingAssetDeletion.objects.count(), 1)
 
     def test_delivery_url_uses_auto_format_and_quality(self):
         url = cloudinary_delivery_url("test/sample-image", width=800, crop="limit")
@@ -269,3 +409,137 @@ class AdGalleryPerformanceAndCleanupTests(AdGalleryTestMixin, TestCase):
     def test_destroy_cloudinary_asset_handles_public_id_strings(self, mock_destroy):
         destroy_cloudinary_asset("test/sample-image")
         mock_destroy.assert_called_once_with("test/sample-image")
+
+
+class DeliveryUrlCacheTests(AdGalleryTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        clear_delivery_url_cache()
+        self.addCleanup(clear_delivery_url_cache)
+
+    def test_repeated_transformations_are_built_once(self):
+        with patch(
+            "cloudinary.utils.cloudinary_url",
+            return_value=("https://cdn/test", {}),
+        ) as mock_url:
+            for _ in range(3):
+                cloudinary_delivery_url("test/cached", width=144, height=144, crop="fill")
+            cloudinary_delivery_url("test/cached", width=1600, crop="limit")
+        self.assertEqual(mock_url.call_count, 2)
+
+    def test_failures_are_not_cached(self):
+        with patch("cloudinary.utils.cloudinary_url", side_effect=ValueError("boom")):
+            self.assertEqual(cloudinary_delivery_url("test/flaky", width=10), "test/flaky")
+        url = cloudinary_delivery_url("test/flaky", width=10)
+        self.assertIn("res.cloudinary.com", url)
+
+    def test_signed_urls_track_signing_config(self):
+        import cloudinary
+
+        unsigned = cloudinary_delivery_url("test/signed", width=300)
+        cloudinary.config(sign_url=True)
+        self.addCleanup(cloudinary.config, sign_url=False)
+        signed = cloudinary_delivery_url("test/signed", width=300)
+        self.assertNotIn("/s--", unsigned)
+        self.assertIn("/s--", signed)
+
+        cloudinary.config(api_secret="rotated")
+        self.addCleanup(cloudinary.config, api_secret="test")
+        self.assertNotEqual(cloudinary_delivery_url("test/signed", width=300), signed)
+
+    def test_resolve_delivery_urls_maps_each_ad(self):
+        first = self._create_ad("bulk-one", image="test/shared")
+        second = self._create_ad("bulk-two", image="test/shared")
+        third = self._create_ad("bulk-three", image="test/other")
+        with patch(
+            "ads.cloudinary_cleanup.cloudinary_delivery_url",
+            side_effect=lambda value, **kwargs: f"url:{value}",
+        ) as mock_url:
+            urls = resolve_delivery_urls([first, second, third], width=600)
+        self.assertEqual(mock_url.call_count, 2)
+        self.assertEqual(urls[first.pk], urls[second.pk])
+        self.assertNotEqual(urls[first.pk], urls[third.pk])
+
+    def test_category_page_benchmark_renders_39_ads(self):
+        """A full 39-ad page builds each card URL once and reuses it after."""
+        for index in range(39):
+            self._create_ad(f"bench-{index}", image=f"test/bench-{index}")
+        url = reverse("ads:ads_by_category", args=[self.category.slug])
+
+        from cloudinary.utils import cloudinary_url
+
+        with patch("cloudinary.utils.cloudinary_url", wraps=cloudinary_url) as mock_url:
+            first = self.client.get(url)
+            cold_calls = mock_url.call_count
+            mock_url.reset_mock()
+            second = self.client.get(url)
+            warm_calls = mock_url.call_count
+
+        self.assertEqual(len(first.context["ads"]), 39)
+        self.assertEqual(len(first.context["ad_image_urls"]), 39)
+        self.assertEqual(cold_calls, 39)
+        self.assertEqual(warm_calls, 0)
+        self.assertContains(second, "c_limit,f_auto,q_auto,w_600", count=39)
+
+
+class PendingAssetDeletionQueueTests(TestCase):
+    def _queue(self, *public_ids):
+        for public_id in public_ids:
+            enqueue_cloudinary_asset_deletion(public_id)
+
+    @patch("cloudinary.api.delete_resources")
+    def test_drains_queue_in_batches(self, mock_delete):
+        public_ids = [f"test/asset-{index}" for index in range(5)]
+        self._queue(*public_ids)
+        mock_delete.side_effect = lambda ids, **kwargs: {
+            "deleted": {public_id: "deleted" for public_id in ids}
+        }
+
+        summary = process_pending_asset_deletions(batch_size=2)
+
+        self.assertEqual(mock_delete.call_count, 3)
+        self.assertEqual(summary["deleted"], 5)
+        self.assertEqual(summary["batches"], 3)
+        self.assertFalse(PendingAssetDeletion.objects.exists())
+
+    @patch("cloudinary.api.delete_resources")
+    def test_not_found_assets_leave_the_queue(self, mock_delete):
+        self._queue("test/gone")
+        mock_delete.return_value = {"deleted": {"test/gone": "not_found"}}
+        process_pending_asset_deletions()
+        self.assertFalse(PendingAssetDeletion.objects.exists())
+
+    @patch("cloudinary.api.delete_resources", side_effect=Exception("503"))
+    def test_failed_batches_are_retried_until_max_attempts(self, mock_delete):
+        self._queue("test/retry")
+
+        for _ in range(2):
+            summary = process_pending_asset_deletions(max_attempts=2)
+            self.assertEqual(summary["failed"], 1)
+        row = PendingAssetDeletion.objects.get()
+        self.assertEqual(row.attempts, 2)
+        self.assertIn("503", row.last_error)
+
+        summary = process_pending_asset_deletions(max_attempts=2)
+        self.assertEqual(summary["candidates"], 0)
+        self.assertEqual(mock_delete.call_count, 2)
+
+    @patch("cloudinary.api.delete_resources")
+    def test_unexpected_status_keeps_row_for_retry(self, mock_delete):
+        self._queue("test/kept", "test/removed")
+        mock_delete.return_value = {
+            "deleted": {"test/removed": "deleted", "test/kept": "rate_limited"}
+        }
+        summary = process_pending_asset_deletions()
+        self.assertEqual(summary["deleted"], 1)
+        self.assertEqual(summary["failed"], 1)
+        self.assertEqual(PendingAssetDeletion.objects.get().public_id, "test/kept")
+
+    @patch("cloudinary.api.delete_resources")
+    def test_command_dry_run_does_not_call_cloudinary(self, mock_delete):
+        self._queue("test/dry")
+        out = StringIO()
+        call_command("process_asset_deletions", "--dry-run", stdout=out)
+        mock_delete.assert_not_called()
+        self.assertIn("[DRY RUN]", out.getvalue())
+        self.assertIn("1 queued", out.getvalue())
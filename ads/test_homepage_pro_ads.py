@@ -1,14 +1,20 @@
 from datetime import timedelta
+from io import StringIO
 from unittest.mock import patch
 
+from django.core.cache import cache
+from django.core.management import call_command
 from django.test import TestCase
 from django.urls import reverse
 from django.utils import timezone
 
 from ads.homepage_pro_ads import (
     HOMEPAGE_PRO_ROTATION_SECONDS,
+    compute_homepage_rotation,
+    current_rotation_bucket,
     get_homepage_pro_ads,
 )
+from ads.models import Ad, HomepageProRotation
 from ads.tests import AdsTestMixin
 
 
@@ -115,3 +121,71 @@ class HomepageProAdsTemplateTests(AdsTestMixin, TestCase):
         self.assertEqual(content.count('class="homepage-pro-ads-section"'), 2)
         self.assertIn('class="d-md-none"', content)
         self.assertIn('class="d-none d-md-block"', content)
+
+
+class HomepageProRotationStoreTests(AdsTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def _create_pro_ads(self, count):
+        return [self._create_ad(f"stored-{index}", plan="pro") for index in range(count)]
+
+    def test_request_path_reads_stored_ids_with_single_query(self):
+        self._create_pro_ads(8)
+        first = [ad.id for ad in get_homepage_pro_ads()]
+
+        with self.assertNumQueries(1):
+            second = [ad.id for ad in get_homepage_pro_ads()]
+        self.assertEqual(first, second)
+
+    def test_stored_selection_is_shared_when_local_cache_is_cold(self):
+        ads = self._create_pro_ads(8)
+        bucket = current_rotation_bucket()
+        chosen = [ad.id for ad in ads[:6]]
+        HomepageProRotation.objects.create(bucket=bucket, ad_ids=chosen)
+
+        self.assertEqual([ad.id for ad in get_homepage_pro_ads()], chosen)
+
+    def test_hidden_selected_ad_triggers_recompute(self):
+        self._create_pro_ads(7)
+        get_homepage_pro_ads()
+        bucket = current_rotation_bucket()
+        stored_ids = HomepageProRotation.objects.get(bucket=bucket).ad_ids
+
+        Ad.objects.filter(pk=stored_ids[0]).update(is_active=False)
+        result = [ad.id for ad in get_homepage_pro_ads()]
+
+        self.assertEqual(len(result), 6)
+        self.assertNotIn(stored_ids[0], result)
+        self.assertEqual(HomepageProRotation.objects.get(bucket=bucket).ad_ids, result)
+
+    def test_saving_an_ad_invalidates_the_current_bucket(self):
+        self._create_pro_ads(2)
+        get_homepage_pro_ads()
+        newest = self._create_ad("stored-new", plan="pro")
+        self.assertFalse(
+            HomepageProRotation.objects.filter(bucket=current_rotation_bucket()).exists()
+        )
+        self.assertEqual(get_homepage_pro_ads()[0].id, newest.id)
+
+    def test_command_precomputes_current_and_next_bucket(self):
+        self._create_pro_ads(8)
+        bucket = current_rotation_bucket()
+        HomepageProRotation.objects.create(bucket=bucket - 5, ad_ids=[1])
+
+        out = StringIO()
+        call_command("precompute_homepage_pro_ads", stdout=out)
+
+        self.assertEqual(
+            set(HomepageProRotation.objects.values_list("bucket", flat=True)),
+            {bucket, bucket + 1},
+        )
+        for rotation in HomepageProRotation.objects.all():
+            self.assertEqual(len(rotation.ad_ids), 6)
+            self.assertEqual(
+                rotation.ad_ids,
+                compute_homepage_rotation(rotation.bucket),
+            )
+        self.assertIn("Pruned 1", out.getvalue())
@@ -0,0 +1,203 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from ads.models import Ad, AdCategory, AdGalleryImage
+from blog.models import Category, Post
+from ads.media_manifest import (
+    media_reference_fields,
+    normalize_public_id,
+    reconcile_media,
+    write_sorted_manifest,
+)
+from related_links.models import RelatedLink, UsefulLinkCategory, UsefulLinkResourceType
+
+User = get_user_model()
+
+
+def _read_lines(path):
+    with open(path, encoding='utf-8') as handle:
+        return [line.rstrip('\n') for line in handle if line.strip()]
+
+
+class MediaManifestTests(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_normalize_public_id_strips_version_format_and_placeholder(self):
+        self.assertEqual(normalize_public_id('v1712/peyvand/post.jpg'), 'peyvand/post')
+        self.assertEqual(
+            normalize_public_id('image/upload/v9/ads/banner.png'),
+            'ads/banner',
+        )
+        self.assertEqual(normalize_public_id('ads/plain'), 'ads/plain')
+        self.assertEqual(normalize_public_id('ads/spring.sale'), 'ads/spring.sale')
+        self.assertEqual(
+            normalize_public_id('raw/upload/v3/docs/terms.pdf'),
+            'docs/terms.pdf',
+        )
+        self.assertEqual(normalize_public_id('placeholder'), '')
+        self.assertEqual(normalize_public_id(None), '')
+
+    def test_reference_fields_cover_every_cloudinary_field(self):
+        fields = {
+            model._meta.label: names for model, names in media_reference_fields()
+        }
+        self.assertEqual(
+            fields['blog.Post'],
+            ('featured_image', 'extra_image_1', 'extra_image_2'),
+        )
+        self.assertEqual(fields['related_links.RelatedLink'], ('cover_image',))
+        self.assertEqual(fields['askme.Moderator'], ('profile_image',))
+
+    def test_write_sorted_manifest_merges_small_runs_and_dedupes(self):
+        path = os.path.join(self.tmp.name, 'manifest.txt')
+        ids = ['c', 'a', 'b', 'a', 'e', 'd', 'c']
+        count = write_sorted_manifest(iter(ids), path, chunk_size=2)
+        self.assertEqual(count, 5)
+        self.assertEqual(_read_lines(path), ['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(os.listdir(self.tmp.name), ['manifest.txt'])
+
+
+class ReconcileMediaTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        author = User.objects.create_user(username='mediauser', password='password123')
+        blog_category = Category.objects.create(name='Media blog', slug='media-blog')
+        Post.objects.create(
+            title='Media post',
+            slug='media-post',
+            author=author,
+            category=blog_category,
+            content='Body',
+            featured_image='v1/blog/featured.jpg',
+            extra_image_1='blog/extra',
+        )
+        Post.objects.create(
+            title='Placeholder post',
+            slug='placeholder-post',
+            author=author,
+            category=blog_category,
+            content='Body',
+        )
+        category = AdCategory.objects.create(name='Media', slug='media')
+        ad = Ad.objects.create(
+            title='Media ad',
+            slug='media-ad',
+            category=category,
+            owner=author,
+            image='ads/primary',
+            target_url='https://example.com',
+        )
+        AdGalleryImage.objects.create(ad=ad, image='ads/gallery-missing', sort_order=0)
+        AdGalleryImage.objects.create(
+            ad=ad, image='image/upload/v3/ads/spring.sale.png', sort_order=1
+        )
+        RelatedLink.objects.create(
+            title='Media link',
+            category=UsefulLinkCategory.objects.create(
+                name_en='Media', name_fa='رسانه', slug='media-links', icon='bi-image'
+            ),
+            resource_type=UsefulLinkResourceType.objects.create(
+                name_en='Site', name_fa='سایت', slug='media-site', icon='bi-globe'
+            ),
+            url='https://example.com/link',
+            cover_image='links/cover',
+        )
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.output_dir = os.path.join(self.tmp.name, 'reports')
+
+    def _write_listing(self, name, content):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'w', encoding='utf-8') as handle:
+            handle.write(content)
+        return path
+
+    def test_reports_orphaned_and_missing_assets_from_json_lines(self):
+        listing = self._write_listing(
+            'assets.jsonl',
+            '\n'.join(
+                json.dumps({'public_id': public_id})
+                for public_id in [
+                    'blog/featured',
+                    'ads/orphan',
+                    'blog/extra',
+                    'ads/primary',
+                    'ads/spring.sale',
+                    'links/cover',
+                    'editorial/featured-preview/unused',
+                ]
+            ),
+        )
+        summary = reconcile_media(listing, self.output_dir, chunk_size=2)
+
+        self.assertEqual(summary['referenced'], 6)
+        self.assertEqual(summary['matched'], 5)
+        self.assertEqual(
+            _read_lines(summary['delete_report']),
+            ['ads/orphan', 'editorial/featured-preview/unused'],
+        )
+        self.assertEqual(_read_lines(summary['missing_report']), ['ads/gallery-missing'])
+
+    def test_accepts_admin_api_json_document_and_prefix(self):
+        listing = self._write_listing(
+            'assets.json',
+            json.dumps(
+                {
+                    'resources': [
+                        {'public_id': 'ads/primary'},
+                        {'public_id': 'ads/spring.sale'},
+                        {'public_id': 'ads/stale'},
+                        {'public_id': 'blog/featured'},
+                    ]
+                },
+                indent=2,
+            ),
+        )
+        summary = reconcile_media(listing, self.output_dir, prefix='ads/')
+        self.assertEqual(_read_lines(summary['delete_report']), ['ads/stale'])
+        self.assertEqual(_read_lines(summary['missing_report']), ['ads/gallery-missing'])
+
+    def test_bare_dotted_value_is_never_reported_for_deletion(self):
+        AdGalleryImage.objects.create(
+            ad=Ad.objects.get(slug='media-ad'),
+            image='ads/legacy.v2',
+            sort_order=2,
+        )
+        listing = self._write_listing('assets.jsonl', '"ads/legacy.v2"\n')
+        summary = reconcile_media(listing, self.output_dir, prefix='ads/legacy')
+        self.assertEqual(_read_lines(summary['delete_report']), [])
+
+    def test_dotted_listing_ids_are_reported_unchanged(self):
+        listing = self._write_listing(
+            'assets.jsonl',
+            '"ads/primary"\n"ads/primary.old"\n"ads/spring.sale"\n',
+        )
+        summary = reconcile_media(listing, self.output_dir, prefix='ads/')
+        self.assertEqual(_read_lines(summary['delete_report']), ['ads/primary.old'])
+        self.assertEqual(summary['matched'], 2)
+
+    def test_command_prints_summary(self):
+        listing = self._write_listing(
+            'assets.jsonl',
+            '"ads/primary"\n"ads/orphan"\n"ads/spring.sale"\n"links/cover"\n',
+        )
+        out = StringIO()
+        call_command(
+            'reconcile_media',
+            '--listing', listing,
+            '--output-dir', self.output_dir,
+            stdout=out,
+        )
+        self.assertIn('1 orphaned', out.getvalue())
+        self.assertIn('3 missing', out.getvalue())
+        self.assertTrue(os.path.exists(os.path.join(self.output_dir, 'delete_report.txt')))
@@ -11,11 +11,18 @@ from notifications.dispatchers import notify_ad_favorited
 
 from .models import AdCategory, Ad, FavoriteAd, AdComment
 from .forms import AdForm, AdCommentForm, AdFilterForm, ProRequestForm
-from .gallery import get_detail_image_context, process_gallery_submission
+from .cloudinary_cleanup import resolve_delivery_urls
+from .gallery import (
+    apply_gallery_submission,
+    discard_gallery_submission,
+    get_detail_image_context,
+    prepare_gallery_submission,
+)
 from .signals import notify_admin_pro_request
 from ads.selectors.visibility import list_visible_ads as _visible_ads_queryset
 
 SOCIAL_URL_FIELDS = ('instagram_url', 'telegram_url', 'website_url')
+LISTING_CARD_IMAGE_WIDTH = 600
 
 
 def pro_ads_landing(request):
@@ -195,6 +202,13 @@ def ad_list_by_category(request, category_slug):
             "selected_city": selected_city,
             "sort_order": sort_order,
         }
+
+    # Resolve all card image URLs for the page in one pass
+    context["ad_image_urls"] = resolve_delivery_urls(
+        context["ads"],
+        width=LISTING_CARD_IMAGE_WIDTH,
+        crop="limit",
+    )
     
     return render(request, "ads/ads_by_category.html", context)
 
@@ -352,14 +366,23 @@ def create_ad(request):
     if request.method == 'POST':
         form = AdForm(request.POST, request.FILES)
         if form.is_valid():
-            with transaction.atomic():
-                ad = form.save(commit=False)
-                ad.owner = request.user
-                ad.is_approved = False  # Require admin approval
-                ad.url_approved = False  # Require URL approval
-                ad.is_active = True
-                ad.save()
-                gallery_errors = process_gallery_submission(ad, request.POST, request.FILES)
+            # Gallery uploads run before the transaction so no lock waits on Cloudinary
+            gallery_submission = prepare_gallery_submission(
+                form.instance, request.POST, request.FILES
+            )
+            try:
+                with transaction.atomic():
+                    ad = form.save(commit=False)
+                    ad.owner = request.user
+                    ad.is_approved = False  # Require admin approval
+                    ad.url_approved = False  # Require URL approval
+                    ad.is_active = True
+                    ad.save()
+                    gallery_errors = apply_gallery_submission(ad, gallery_submission)
+            except Exception:
+                # The gallery rows were never stored; drop the uploads made above
+                discard_gallery_submission(gallery_submission)
+                raise
             if gallery_errors:
                 for error in gallery_errors:
                     messages.error(request, error)
@@ -411,20 +434,25 @@ def edit_ad(request, slug):
         }
         form = AdForm(request.POST, request.FILES, instance=ad)
         if form.is_valid():
-            with transaction.atomic():
-                ad = form.save(commit=False)
-                social_urls_changed = any(
-                    getattr(ad, field) != original_social_urls[field]
-                    for field in SOCIAL_URL_FIELDS
-                )
-                if social_urls_changed:
-                    ad.social_urls_approved = False
-                approval_reset = ad.is_approved
-                if approval_reset:
-                    ad.is_approved = False
-                    ad.url_approved = False
-                ad.save()
-                gallery_errors = process_gallery_submission(ad, request.POST, request.FILES)
+            gallery_submission = prepare_gallery_submission(ad, request.POST, request.FILES)
+            try:
+                with transaction.atomic():
+                    ad = form.save(commit=False)
+                    social_urls_changed = any(
+                        getattr(ad, field) != original_social_urls[field]
+                        for field in SOCIAL_URL_FIELDS
+                    )
+                    if social_urls_changed:
+                        ad.social_urls_approved = False
+                    approval_reset = ad.is_approved
+                    if approval_reset:
+                        ad.is_approved = False
+                        ad.url_approved = False
+                    ad.save()
+                    gallery_errors = apply_gallery_submission(ad, gallery_submission)
+            except Exception:
+                discard_gallery_submission(gallery_submission)
+                raise
             if gallery_errors:
                 for error in gallery_errors:
                     messages.error(request, error)
@@ -9,6 +9,8 @@ from django.utils.text import slugify
 from django.urls import reverse
 from cloudinary.models import CloudinaryField
 
+from codestar.slugs import save_with_unique_slug
+
 
 class Moderator(models.Model):
     """
@@ -133,17 +135,18 @@ class Moderator(models.Model):
             # Generate slug from complete_name, or fallback to username
             base_slug = slugify(self.get_display_name())
             if not base_slug:
-                base_slug = slugify(self.user.username)
-            
+                base_slug = slugify(self.user.username) or "moderator"
+
             # Ensure uniqueness
-            slug = base_slug
-            counter = 1
-            while Moderator.objects.filter(slug=slug).exclude(pk=self.pk).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            
-            self.slug = slug
-        
+            save_with_unique_slug(
+                self,
+                base_slug,
+                lambda: super(Moderator, self).save(*args, **kwargs),
+                max_length=self._meta.get_field('slug').max_length,
+                first_suffix=1,
+            )
+            return
+
         super().save(*args, **kwargs)
 
 
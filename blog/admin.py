@@ -6,6 +6,7 @@ from django.http import JsonResponse
 from django.urls import path, reverse
 from django.utils.html import format_html
 import json
+from collections import Counter
 
 from content_ai.admin_editorial import (
     categories_for_assistant,
@@ -27,7 +28,8 @@ from content_ai.providers.exceptions import (
 )
 from content_ai.serializers import serialize_error
 
-from .models import Post, Comment, Category, UserProfile, PostViewCount
+from .models import Post, Comment, Category, UserProfile, PostViewCount, UserTrust
+from .utils import adjust_approved_contribution_count, record_comment_approval_change
 
 
 @admin.register(Category)
@@ -593,35 +595,46 @@ class CommentAdmin(admin.ModelAdmin):
         return '-'
     reviewed_info.short_description = 'Reviewed By'
     
-    def approve_comments(self, request, queryset):
-        """Bulk approve action."""
+    def _set_approved(self, request, queryset, approved):
+        """Bulk-update approval and move each affected author's trust count."""
         from django.utils import timezone
+        flipped = Counter(
+            queryset.exclude(approved=approved).values_list('author_id', flat=True)
+        )
         updated = queryset.update(
-            approved=True,
+            approved=approved,
             reviewed_by=request.user,
             reviewed_at=timezone.now()
         )
+        delta = 1 if approved else -1
+        for author_id, count in flipped.items():
+            adjust_approved_contribution_count(
+                author_id, UserTrust.COMMENTS, delta * count
+            )
+        return updated
+    
+    def approve_comments(self, request, queryset):
+        """Bulk approve action."""
+        updated = self._set_approved(request, queryset, True)
         self.message_user(request, f"{updated} comment(s) approved.")
     approve_comments.short_description = 'Approve selected comments'
     
     def reject_comments(self, request, queryset):
         """Bulk reject action."""
-        from django.utils import timezone
-        updated = queryset.update(
-            approved=False,
-            reviewed_by=request.user,
-            reviewed_at=timezone.now()
-        )
+        updated = self._set_approved(request, queryset, False)
         self.message_user(request, f"{updated} comment(s) rejected.")
     reject_comments.short_description = 'Reject selected comments'
     
     def save_model(self, request, obj, form, change):
         """Track who reviewed the comment."""
         from django.utils import timezone
+        was_approved = change and obj.approved
         if change and 'approved' in form.changed_data:
             obj.reviewed_by = request.user
             obj.reviewed_at = timezone.now()
+            was_approved = not obj.approved
         super().save_model(request, obj, form, change)
+        record_comment_approval_change(obj, was_approved)
 
 
 # PageView model removed from admin to keep admin fast
@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('blog', '0035_alter_post_title_non_unique'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserTrust',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='trust', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('approved_comment_count', models.PositiveIntegerField(blank=True, help_text='Approved blog comments by this user (NULL = not yet counted)', null=True)),
+                ('approved_reply_count', models.PositiveIntegerField(blank=True, help_text='Approved community replies by this user (NULL = not yet counted)', null=True)),
+                ('updated_on', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'User Trust',
+                'verbose_name_plural': 'User Trust',
+            },
+        ),
+    ]
@@ -3,6 +3,8 @@ from django.contrib.auth.models import User
 from cloudinary.models import CloudinaryField
 from django.utils import timezone
 
+from codestar.slugs import save_with_unique_slug
+
 
 # Create your models here.
 STATUS = ((0, "Draft"), (1, "Published"))
@@ -63,6 +65,43 @@ class UserProfile(models.Model):
         super().save(*args, **kwargs)
 
 
+class UserTrust(models.Model):
+    """
+    Approved contribution counts per surface, used for auto-approval.
+
+    Counts are adjusted in place when a comment or reply is approved,
+    unapproved or deleted. A NULL count has not been computed yet and is
+    filled from a one-off COUNT on the next lookup.
+    """
+    COMMENTS = 'approved_comment_count'
+    REPLIES = 'approved_reply_count'
+
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='trust',
+    )
+    approved_comment_count = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="Approved blog comments by this user (NULL = not yet counted)"
+    )
+    approved_reply_count = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="Approved community replies by this user (NULL = not yet counted)"
+    )
+    updated_on = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "User Trust"
+        verbose_name_plural = "User Trust"
+
+    def __str__(self):
+        return f"{self.user.username} trust"
+
+
 class Category(models.Model):
     """
     A model representing a blog post category.
@@ -193,56 +232,36 @@ class Post(models.Model):
         Note: We don't auto-update slug when title changes to preserve existing URLs.
         """
         # Only generate slug if it's empty (for new posts)
-        # Wrap in try-except to ensure save() never fails
-        try:
-            if not self.slug and self.title:
-                try:
-                    # Import here to avoid circular import (utils.py imports from models.py)
-                    from .utils import generate_slug_from_persian
-                    
-                    # Generate base slug from title (handles Persian text)
-                    base_slug = generate_slug_from_persian(self.title)
-                    
-                    # Ensure slug is never empty (fallback)
-                    if not base_slug:
-                        from django.utils.text import slugify
-                        base_slug = slugify(self.title, allow_unicode=True) or f"post-{timezone.now().strftime('%Y%m%d%H%M%S')}"
-                    
-                    self.slug = self._allocate_unique_slug(base_slug)
-                except Exception:
-                    # If slug generation fails, use timestamp-based fallback
-                    if not self.slug:
-                        self.slug = self._allocate_unique_slug(
-                            f"post-{timezone.now().strftime('%Y%m%d%H%M%S')}"
-                        )
-        except Exception:
-            # If anything fails, ensure we have a slug before saving
-            if not self.slug:
-                self.slug = self._allocate_unique_slug(
-                    f"post-{timezone.now().strftime('%Y%m%d%H%M%S')}"
-                )
-        
+        # Wrap in try-except to ensure slug generation never breaks save()
+        if not self.slug and self.title:
+            try:
+                # Import here to avoid circular import (utils.py imports from models.py)
+                from .utils import generate_slug_from_persian
+
+                # Generate base slug from title (handles Persian text)
+                base_slug = generate_slug_from_persian(self.title)
+
+                # Ensure slug is never empty (fallback)
+                if not base_slug:
+                    from django.utils.text import slugify
+                    base_slug = slugify(self.title, allow_unicode=True)
+            except Exception:
+                base_slug = ''
+            base_slug = base_slug.strip('-') or (
+                f"post-{timezone.now().strftime('%Y%m%d%H%M%S')}"
+            )
+            # Titles may repeat; the shared allocator picks the next free suffix
+            save_with_unique_slug(
+                self,
+                base_slug,
+                lambda: super(Post, self).save(*args, **kwargs),
+                max_length=200,
+            )
+            return
+
         # Save the object - let Django handle any errors naturally
         super().save(*args, **kwargs)
 
-    def _allocate_unique_slug(self, base_slug: str) -> str:
-        """Keep slug unique when titles are allowed to repeat."""
-        candidate = (base_slug or '').strip('-')[:200] or (
-            f"post-{timezone.now().strftime('%Y%m%d%H%M%S')}"
-        )
-        qs = Post.objects.all()
-        if self.pk:
-            qs = qs.exclude(pk=self.pk)
-        if not qs.filter(slug=candidate).exists():
-            return candidate
-        for index in range(2, 1000):
-            suffix = f'-{index}'
-            trimmed = candidate[: max(1, 200 - len(suffix))].rstrip('-')
-            next_slug = f'{trimmed}{suffix}'
-            if not qs.filter(slug=next_slug).exists():
-                return next_slug
-        return f"{candidate[:180]}-{timezone.now().strftime('%Y%m%d%H%M%S')}"
-
     def favorite_count(self):
         """Returns the number of users who have favorited this post."""
         return Favorite.objects.filter(post=self).count()
@@ -1,4 +1,5 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.contrib.auth.models import User
 from allauth.account.signals import email_confirmed, user_signed_up
@@ -9,7 +10,7 @@ from django.template.loader import render_to_string
 from django.contrib.sites.models import Site
 from django.conf import settings
 from django.urls import reverse
-from .models import UserProfile, Post
+from .models import UserProfile, Post, Comment, UserTrust
 import logging
 
 logger = logging.getLogger(__name__)
@@ -332,6 +333,31 @@ def handle_social_account_added(request, sociallogin, **kwargs):
                 send_welcome_email_to_user(user)
 
 
+@receiver(post_delete, sender=Comment)
+def decrement_trust_on_comment_delete(sender, instance, **kwargs):
+    """Drop a deleted approved comment from its author's trust count."""
+    if not instance.approved:
+        return
+    from .utils import adjust_approved_contribution_count
+
+    adjust_approved_contribution_count(instance.author_id, UserTrust.COMMENTS, -1)
+
+
+@receiver(post_save, sender=Post)
+def sync_post_title_suggestion(sender, instance, **kwargs):
+    """Keep the in-process search suggestion index in step with publishing."""
+    from codestar.suggestions import sync_post_suggestion
+
+    transaction.on_commit(lambda: sync_post_suggestion(instance))
+
+
+@receiver(post_delete, sender=Post)
+def drop_post_title_suggestion(sender, instance, **kwargs):
+    from codestar.suggestions import SUGGESTION_KIND_POST, drop_suggestion
+
+    drop_suggestion(SUGGESTION_KIND_POST, instance.pk)
+
+
 # Admin Notification Signals
 @receiver(post_save, sender=Post)
 def notify_admin_new_post(sender, instance, created, **kwargs):
@@ -1,6 +1,12 @@
+from django.contrib.auth.models import User
 from django.test import TestCase
 
-from blog.utils import html_to_plain_text
+from blog.models import Category, Comment, Post, UserTrust
+from blog.utils import (
+    html_to_plain_text,
+    is_trusted_commenter,
+    record_comment_approval_change,
+)
 
 
 class HtmlToPlainTextTests(TestCase):
@@ -21,3 +27,47 @@ class HtmlToPlainTextTests(TestCase):
             html_to_plain_text('<p>به دنبال <strong>مالیات</strong> هستم.</p>'),
             'به دنبال مالیات هستم.',
         )
+
+
+class TrustedCommenterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='commenter', password='pass12345')
+        category = Category.objects.create(name='عمومی', slug='general-trust')
+        cls.post = Post.objects.create(
+            title='پست',
+            slug='post-trust',
+            author=cls.user,
+            category=category,
+            content='متن',
+        )
+
+    def _comment(self, approved=True):
+        return Comment.objects.create(
+            post=self.post, author=self.user, body='نظر', approved=approved
+        )
+
+    def test_first_lookup_counts_existing_comments(self):
+        for _ in range(5):
+            self._comment()
+        self.assertTrue(is_trusted_commenter(self.user))
+        self.assertEqual(UserTrust.objects.get(user=self.user).approved_comment_count, 5)
+
+    def test_later_lookups_use_stored_count(self):
+        self.assertFalse(is_trusted_commenter(self.user))
+        with self.assertNumQueries(1):
+            self.assertFalse(is_trusted_commenter(self.user))
+
+    def test_approval_changes_and_deletes_adjust_count(self):
+        is_trusted_commenter(self.user)
+        comment = self._comment(approved=False)
+
+        comment.approved = True
+        comment.save()
+        record_comment_approval_change(comment, was_approved=False)
+        trust = UserTrust.objects.get(user=self.user)
+        self.assertEqual(trust.approved_comment_count, 1)
+
+        comment.delete()
+        trust.refresh_from_db()
+        self.assertEqual(trust.approved_comment_count, 0)
@@ -1,4 +1,5 @@
-from django.db.models import Count, Q
+from django.db.models import Count, F, Q, Value
+from django.db.models.functions import Greatest
 from django.shortcuts import (
     render,
     get_object_or_404,
@@ -21,7 +22,7 @@ from django.core.cache import cache
 import bleach
 import unicodedata
 
-from .models import Post, Comment, Favorite, Category, Like, PageView
+from .models import Post, Comment, Favorite, Category, Like, PageView, UserTrust
 
 # Bot detection patterns
 BOT_PATTERNS = [
@@ -584,6 +585,57 @@ def sanitize_html(content):
 
 
 # Comment Moderation Utilities
+def get_approved_contribution_count(user, field, recount):
+    """
+    Return a user's approved contribution count from their UserTrust row.
+
+    Args:
+        user: User instance
+        field: UserTrust.COMMENTS or UserTrust.REPLIES
+        recount: Callable returning the real count; only called the first
+            time the field is read for this user
+
+    Returns:
+        int: Approved contribution count (0 for anonymous users)
+    """
+    if not user or not user.is_authenticated:
+        return 0
+
+    trust, _ = UserTrust.objects.get_or_create(user=user)
+    count = getattr(trust, field)
+    if count is None:
+        count = recount()
+        UserTrust.objects.filter(
+            pk=user.pk, **{f'{field}__isnull': True}
+        ).update(**{field: count})
+    return count
+
+
+def adjust_approved_contribution_count(user_id, field, delta):
+    """
+    Add ``delta`` to a user's approved contribution count in one UPDATE.
+
+    Rows that were never counted are left alone; the next lookup recounts
+    them, which already includes this change.
+    """
+    if not user_id or not delta:
+        return
+    UserTrust.objects.filter(
+        pk=user_id, **{f'{field}__isnull': False}
+    ).update(**{
+        field: Greatest(F(field) + delta, Value(0)),
+        'updated_on': timezone.now(),
+    })
+
+
+def record_comment_approval_change(comment, was_approved):
+    """Move the author's approved comment count after a comment is saved."""
+    delta = int(bool(comment.approved)) - int(bool(was_approved))
+    adjust_approved_contribution_count(
+        comment.author_id, UserTrust.COMMENTS, delta
+    )
+
+
 def is_trusted_commenter(user):
     """
     Check if user has 5+ approved comments (trusted commenter).
@@ -594,14 +646,11 @@ def is_trusted_commenter(user):
     Returns:
         bool: True if user has 5 or more approved comments
     """
-    if not user or not user.is_authenticated:
-        return False
-    
-    approved_count = Comment.objects.filter(
-        author=user,
-        approved=True
-    ).count()
-    
+    approved_count = get_approved_contribution_count(
+        user,
+        UserTrust.COMMENTS,
+        lambda: Comment.objects.filter(author=user, approved=True).count(),
+    )
     return approved_count >= 5
 
 
@@ -18,10 +18,11 @@ import json
 from .models import Post, Comment, Favorite, Category, Like
 from .forms import CommentForm, PostForm
 from related_links.selectors.related import get_related_links
-from community.selectors.discussions import list_latest_discussions
+from community.selectors.discussions import list_hot_discussions
 from .utils import (
     track_page_view,
     determine_comment_approval,
+    record_comment_approval_change,
     get_category_overview_rows,
     get_community_statistics,
     get_upcoming_events,
@@ -220,7 +221,7 @@ class PostList(generic.ListView):
             context['homepage_pro_ads'] = []
 
         try:
-            context['latest_discussions'] = list(list_latest_discussions()[:5])
+            context['latest_discussions'] = list(list_hot_discussions()[:5])
         except Exception:
             context['latest_discussions'] = []
 
@@ -353,6 +354,7 @@ def post_detail(request, slug):
             comment.moderation_reason = moderation_reason
             
             comment.save()
+            record_comment_approval_change(comment, was_approved=False)
 
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                 return JsonResponse({
@@ -480,6 +482,7 @@ def comment_edit(request, slug, comment_id):
                     comment.body = new_body
                     
                     # Re-check approval if comment was previously approved
+                    was_approved = comment.approved
                     if comment.approved:
                         approved, moderation_reason = determine_comment_approval(
                             request.user, new_body
@@ -491,6 +494,7 @@ def comment_edit(request, slug, comment_id):
                             comment.reviewed_at = None
                     
                     comment.save()
+                    record_comment_approval_change(comment, was_approved)
                     return JsonResponse({
                         'status': 'success',
                         'body': comment.body,
@@ -508,6 +512,7 @@ def comment_edit(request, slug, comment_id):
                     new_body = comment.body
                     
                     # Re-check approval if comment was previously approved
+                    was_approved = comment.approved
                     if comment.approved:
                         approved, moderation_reason = determine_comment_approval(
                             request.user, new_body
@@ -519,6 +524,7 @@ def comment_edit(request, slug, comment_id):
                             comment.reviewed_at = None
                     
                     comment.save()
+                    record_comment_approval_change(comment, was_approved)
                     return redirect('post_detail', slug=slug)
         else:
             form = CommentForm(instance=comment)
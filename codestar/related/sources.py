@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Any
 
 
@@ -14,6 +14,7 @@ class RelatedContentSource:
     title: str
     body: str
     namespace: str
+    keywords: tuple[str, ...] | None = None
 
 
 def related_content_source(obj: Any) -> RelatedContentSource:
@@ -55,3 +56,32 @@ def related_content_source(obj: Any) -> RelatedContentSource:
         body=body,
         namespace=namespace,
     )
+
+
+def prepare_related_source(obj: Any) -> RelatedContentSource:
+    """
+    Build a source with its search keywords tokenised once.
+
+    Pass the result to several related selectors so each reuses the same
+    keywords instead of re-normalising the title and body.
+    """
+    source = related_content_source(obj)
+    if source.keywords is not None:
+        return source
+
+    from codestar.related.text_matching import extract_search_keywords
+
+    return replace(
+        source,
+        keywords=tuple(extract_search_keywords(source.title, source.body)),
+    )
+
+
+def source_keywords(source: RelatedContentSource) -> list[str]:
+    """Return precomputed keywords for ``source``, tokenising if absent."""
+    if source.keywords is not None:
+        return list(source.keywords)
+
+    from codestar.related.text_matching import extract_search_keywords
+
+    return extract_search_keywords(source.title, source.body)
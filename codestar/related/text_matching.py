@@ -64,6 +64,11 @@ def normalize_persian_text(text: str) -> str:
     return normalized.casefold().strip()
 
 
+def split_normalized_words(text: str) -> list[str]:
+    """Return every normalized word in order, keeping stop words and short words."""
+    return [word for word in _TOKEN_SPLIT_RE.split(normalize_persian_text(text)) if word]
+
+
 def tokenize_persian_text(text: str) -> list[str]:
     """Return normalized, de-duplicated tokens from text."""
     tokens: list[str] = []
@@ -120,6 +120,85 @@ OPENAI_IMAGE_QUALITY = os.environ.get('OPENAI_IMAGE_QUALITY', 'low')
 OPENAI_IMAGE_TIMEOUT = float(os.environ.get('OPENAI_IMAGE_TIMEOUT', '90'))
 # Text Responses API timeout (seconds). Kept below Heroku's ~30s router limit.
 OPENAI_TEXT_TIMEOUT = int(os.environ.get('OPENAI_TEXT_TIMEOUT', '27'))
+# Run workspace drafts / featured images through the AIJob queue instead of
+# inline in the request. Needs a `run_ai_jobs` worker dyno (see Procfile).
+CONTENT_AI_BACKGROUND_JOBS = os.environ.get(
+    'CONTENT_AI_BACKGROUND_JOBS', 'False'
+).lower() in ('true', '1', 'yes')
+# Circuit breaker and rate-limit state must be shared by every web and
+# worker process and counted with an atomic incr, so it lives in Redis
+# (Heroku Redis sets REDIS_URL). The default LocMem cache is per process and
+# the database cache's incr is not atomic; enabling either feature without
+# REDIS_URL fails the content_ai.E001/E002 system checks unless
+# CONTENT_AI_ALLOW_PROCESS_LOCAL_CACHE is set (single-process development).
+REDIS_URL = os.environ.get('REDIS_URL', '')
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+}
+if REDIS_URL:
+    CACHES['provider_state'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+        # Heroku Redis serves TLS with a self-signed certificate.
+        'OPTIONS': (
+            {'ssl_cert_reqs': None} if REDIS_URL.startswith('rediss://') else {}
+        ),
+    }
+CONTENT_AI_CIRCUIT_BREAKER_CACHE = 'provider_state' if REDIS_URL else 'default'
+CONTENT_AI_RATE_LIMIT_CACHE = CONTENT_AI_CIRCUIT_BREAKER_CACHE
+CONTENT_AI_ALLOW_PROCESS_LOCAL_CACHE = os.environ.get(
+    'CONTENT_AI_ALLOW_PROCESS_LOCAL_CACHE', 'False'
+).lower() in ('true', '1', 'yes')
+# Per-provider circuit breaker and retries/ordered failover applied by
+# ProviderManager to every generation, e.g. CONTENT_AI_PROVIDER_FALLBACKS=mock.
+CONTENT_AI_CIRCUIT_BREAKER_ENABLED = os.environ.get(
+    'CONTENT_AI_CIRCUIT_BREAKER_ENABLED', 'False'
+).lower() in ('true', '1', 'yes')
+CONTENT_AI_PROVIDER_FALLBACKS = [
+    name.strip()
+    for name in os.environ.get('CONTENT_AI_PROVIDER_FALLBACKS', '').split(',')
+    if name.strip()
+]
+CONTENT_AI_PROVIDER_MAX_RETRIES = int(
+    os.environ.get('CONTENT_AI_PROVIDER_MAX_RETRIES', '0')
+)
+# Retries and failover stop once this many seconds have passed; stays
+# below Heroku's 30s router limit, like OPENAI_TEXT_TIMEOUT.
+CONTENT_AI_PROVIDER_DEADLINE = float(
+    os.environ.get('CONTENT_AI_PROVIDER_DEADLINE', OPENAI_TEXT_TIMEOUT)
+)
+# Per-minute request/token budgets in front of provider calls, shared
+# through CONTENT_AI_RATE_LIMIT_CACHE (content_ai.providers.scheduler).
+# Editor calls queue briefly when over budget; batch calls are shed early
+# to leave them headroom.
+CONTENT_AI_RATE_LIMIT_ENABLED = os.environ.get(
+    'CONTENT_AI_RATE_LIMIT_ENABLED', 'False'
+).lower() in ('true', '1', 'yes')
+CONTENT_AI_PROVIDER_RATE_LIMITS = {
+    'openai': {
+        'rpm': int(os.environ.get('OPENAI_RPM_LIMIT', '500')),
+        'tpm': int(os.environ.get('OPENAI_TPM_LIMIT', '200000')),
+    },
+}
+# Per-call token/latency/cost metrics (content_ai.telemetry.generation_metrics),
+# written in batches to GenerationMetric and shown on /content-ai/metrics/.
+CONTENT_AI_METRICS_ENABLED = os.environ.get(
+    'CONTENT_AI_METRICS_ENABLED', 'False'
+).lower() in ('true', '1', 'yes')
+# USD per million tokens; keys match model names or their prefixes.
+CONTENT_AI_MODEL_PRICES = {
+    'gpt-4o-mini': {'input': 0.15, 'output': 0.60},
+    'gpt-4o': {'input': 2.50, 'output': 10.00},
+    'gpt-4.1-mini': {'input': 0.40, 'output': 1.60},
+    'gpt-4.1': {'input': 2.00, 'output': 8.00},
+}
+
+# Read and validate prompt modules once at startup (content_ai.prompts.cache).
+CONTENT_AI_PREWARM_PROMPTS = os.environ.get(
+    'CONTENT_AI_PREWARM_PROMPTS', 'True'
+).lower() in ('true', '1', 'yes')
 
 # django-simple-captcha (signup CAPTCHA) tuning:
 # Make the captcha clearer by using only numbers, fewer characters, bigger font,
@@ -148,6 +227,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'content_ai.middleware.GenerationMetricsMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'allauth.account.middleware.AccountMiddleware',
@@ -589,8 +669,11 @@ COMMUNITY_TRUST_REPLY_COUNT = 5
 COMMUNITY_RATE_LIMIT_DISCUSSIONS_USER = '5/h'
 COMMUNITY_RATE_LIMIT_REPLIES_USER = '20/h'
 COMMUNITY_LIST_PAGE_SIZE = 12
+COMMUNITY_REPLY_PAGE_SIZE = 50
 COMMUNITY_SEARCH_CONFIG = 'simple'
 COMMUNITY_SEARCH_MIN_RANK = 0.01
+COMMUNITY_SEARCH_MAX_RESULTS = 200
+COMMUNITY_HOT_HALF_LIFE_HOURS = 12
 
 # TEMP: Allow all hosts to debug Bad Request (400) behind Cloudflare
 # This is a temporary debug setting to eliminate 400 errors.
@@ -0,0 +1,98 @@
+"""Shared unique-slug allocation for models whose titles may repeat."""
+
+import re
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+
+SLUG_RESERVE_ATTEMPTS = 5
+
+
+def _fit(base_slug: str, suffix: str, max_length: int) -> str:
+    trimmed = base_slug[: max(1, max_length - len(suffix))].rstrip('-')
+    return f'{trimmed}{suffix}'
+
+
+def allocate_unique_slug(
+    queryset,
+    base_slug: str,
+    *,
+    field: str = 'slug',
+    max_length: int = 200,
+    first_suffix: int = 2,
+) -> str:
+    """
+    Return ``base_slug`` or the next free ``base_slug-N`` in one query.
+
+    All taken slugs of the form ``base`` / ``base-<digits>`` are fetched with
+    a single prefix + regex lookup and the next suffix is one past the
+    highest in use, so heavily repeated titles never probe row by row.
+    ``queryset`` should already exclude the instance being saved.
+    """
+    base_slug = (base_slug or '').strip('-')[:max_length]
+    if not base_slug:
+        raise ValueError('base_slug must not be empty.')
+
+    numbered = rf'^{re.escape(base_slug)}-[0-9]+$'
+    taken = queryset.filter(
+        Q(**{field: base_slug})
+        | Q(**{f'{field}__startswith': f'{base_slug}-', f'{field}__regex': numbered})
+    ).values_list(field, flat=True)
+
+    base_taken = False
+    highest = first_suffix - 1
+    prefix_length = len(base_slug) + 1
+    for slug in taken:
+        if slug == base_slug:
+            base_taken = True
+        else:
+            highest = max(highest, int(slug[prefix_length:]))
+
+    if not base_taken:
+        return base_slug
+
+    index = highest + 1
+    candidate = _fit(base_slug, f'-{index}', max_length)
+    # Only a base at max_length gets trimmed; its trimmed form may collide.
+    while candidate != f'{base_slug}-{index}' and queryset.filter(**{field: candidate}).exists():
+        index += 1
+        candidate = _fit(base_slug, f'-{index}', max_length)
+    return candidate
+
+
+def save_with_unique_slug(
+    instance,
+    base_slug: str,
+    save,
+    *,
+    field: str = 'slug',
+    max_length: int = 200,
+    first_suffix: int = 2,
+    attempts: int = SLUG_RESERVE_ATTEMPTS,
+):
+    """
+    Allocate a slug for ``instance`` and reserve it by calling ``save()``.
+
+    The save runs in a savepoint; if a concurrent writer claimed the same
+    slug first (unique constraint), the slug is reallocated and the save
+    retried. Other integrity errors are re-raised unchanged.
+    """
+    model = type(instance)
+    for attempt in range(attempts):
+        queryset = model._default_manager.all()
+        if instance.pk:
+            queryset = queryset.exclude(pk=instance.pk)
+        slug = allocate_unique_slug(
+            queryset,
+            base_slug,
+            field=field,
+            max_length=max_length,
+            first_suffix=first_suffix,
+        )
+        setattr(instance, field, slug)
+        try:
+            with transaction.atomic():
+                return save()
+        except IntegrityError:
+            if attempt + 1 >= attempts or not queryset.filter(**{field: slug}).exists():
+                raise
@@ -0,0 +1,237 @@
+"""
+In-memory search-as-you-type suggestions for community and blog titles.
+
+Every title word is stored in one sorted posting list of ``(word, key)``
+pairs, so a prefix lookup is two bisects plus a slice. The index is loaded
+once per process with two narrow queries and then kept current by
+the Discussion and Post save/delete signals. Other worker processes only
+see those updates after their own periodic rebuild.
+"""
+
+import threading
+import time
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+
+from django.urls import reverse
+
+from codestar.related.text_matching import split_normalized_words
+
+SUGGESTION_KIND_DISCUSSION = 'discussion'
+SUGGESTION_KIND_POST = 'post'
+SUGGESTION_KINDS = (SUGGESTION_KIND_DISCUSSION, SUGGESTION_KIND_POST)
+
+SUGGESTION_MIN_QUERY_LENGTH = 2
+SUGGESTION_DEFAULT_LIMIT = 8
+# Bounds how long another process's incremental updates stay invisible here.
+SUGGESTION_REBUILD_SECONDS = 600
+
+_PREFIX_UPPER_BOUND = '\U0010ffff'
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    kind: str
+    pk: int
+    title: str
+    url: str
+    rank: float
+    words: tuple[str, ...]
+
+    @property
+    def key(self) -> tuple[str, int]:
+        return (self.kind, self.pk)
+
+
+def make_suggestion(kind: str, pk: int, title: str, url: str, ranked_at) -> Suggestion:
+    """Build a suggestion; newer ``ranked_at`` values sort first."""
+    return Suggestion(
+        kind=kind,
+        pk=pk,
+        title=title,
+        url=url,
+        rank=ranked_at.timestamp() if ranked_at else 0.0,
+        words=tuple(dict.fromkeys(split_normalized_words(title))),
+    )
+
+
+class PrefixSuggestionIndex:
+    """Thread-safe word-prefix index over suggestion titles."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._postings: list[tuple[str, tuple[str, int]]] = []
+        self._entries: dict[tuple[str, int], Suggestion] = {}
+        self.built_at: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop everything; the next lookup reloads from the database."""
+        with self._lock:
+            self._entries = {}
+            self._postings = []
+            self.built_at = None
+
+    def replace_all(self, suggestions) -> None:
+        entries = {suggestion.key: suggestion for suggestion in suggestions}
+        postings = sorted(
+            (word, key)
+            for key, suggestion in entries.items()
+            for word in suggestion.words
+        )
+        with self._lock:
+            self._entries = entries
+            self._postings = postings
+            self.built_at = time.monotonic()
+
+    def upsert(self, suggestion: Suggestion) -> None:
+        with self._lock:
+            self._remove_locked(suggestion.key)
+            self._entries[suggestion.key] = suggestion
+            for word in suggestion.words:
+                insort(self._postings, (word, suggestion.key))
+
+    def remove(self, kind: str, pk: int) -> None:
+        with self._lock:
+            self._remove_locked((kind, pk))
+
+    def _remove_locked(self, key) -> None:
+        existing = self._entries.pop(key, None)
+        if existing is None:
+            return
+        for word in existing.words:
+            index = bisect_left(self._postings, (word, key))
+            if index < len(self._postings) and self._postings[index] == (word, key):
+                del self._postings[index]
+
+    def _keys_with_prefix(self, prefix: str) -> set:
+        start = bisect_left(self._postings, (prefix,))
+        end = bisect_left(self._postings, (prefix + _PREFIX_UPPER_BOUND,))
+        return {key for _, key in self._postings[start:end]}
+
+    def search(self, query: str, *, limit: int, kinds=None) -> list[Suggestion]:
+        """
+        Return titles containing a word starting with every query word.
+
+        Titles that start with the whole query come first, then newest.
+        """
+        words = split_normalized_words(query)
+        if not words:
+            return []
+        with self._lock:
+            candidates = None
+            for word in dict.fromkeys(words):
+                keys = self._keys_with_prefix(word)
+                candidates = keys if candidates is None else candidates & keys
+                if not candidates:
+                    return []
+            matches = [
+                self._entries[key]
+                for key in candidates
+                if kinds is None or key[0] in kinds
+            ]
+
+        query_text = ' '.join(words)
+        matches.sort(
+            key=lambda item: (
+                not ' '.join(item.words).startswith(query_text),
+                -item.rank,
+            )
+        )
+        return matches[:limit]
+
+
+title_suggestions = PrefixSuggestionIndex()
+
+
+def discussion_suggestion(discussion) -> Suggestion:
+    return make_suggestion(
+        SUGGESTION_KIND_DISCUSSION,
+        discussion.pk,
+        discussion.title,
+        reverse('community:discussion_detail', args=[discussion.slug]),
+        discussion.last_activity_at,
+    )
+
+
+def post_suggestion(post) -> Suggestion:
+    return make_suggestion(
+        SUGGESTION_KIND_POST,
+        post.pk,
+        post.title,
+        reverse('post_detail', args=[post.slug]),
+        post.created_on,
+    )
+
+
+def _load_suggestions() -> list[Suggestion]:
+    from blog.models import Post
+    from community.models import Discussion
+    from community.selectors.discussions import PUBLIC_DISCUSSION_STATUSES
+
+    discussions = Discussion.objects.filter(
+        is_deleted=False,
+        status__in=PUBLIC_DISCUSSION_STATUSES,
+    ).only('pk', 'title', 'slug', 'last_activity_at')
+    posts = (
+        Post.objects.filter(status=1, is_deleted=False)
+        .exclude(slug='')
+        .exclude(slug__isnull=True)
+        .only('pk', 'title', 'slug', 'created_on')
+    )
+    return [discussion_suggestion(item) for item in discussions] + [
+        post_suggestion(item) for item in posts
+    ]
+
+
+def rebuild_title_suggestions() -> int:
+    """Reload the whole index from the database; returns the entry count."""
+    title_suggestions.replace_all(_load_suggestions())
+    return len(title_suggestions)
+
+
+def _ensure_fresh() -> None:
+    built_at = title_suggestions.built_at
+    if built_at is None or time.monotonic() - built_at > SUGGESTION_REBUILD_SECONDS:
+        rebuild_title_suggestions()
+
+
+def suggest_titles(
+    query: str,
+    *,
+    limit: int = SUGGESTION_DEFAULT_LIMIT,
+    kinds=None,
+) -> list[Suggestion]:
+    """Return title suggestions for a partially typed query."""
+    if len((query or '').strip()) < SUGGESTION_MIN_QUERY_LENGTH:
+        return []
+    _ensure_fresh()
+    return title_suggestions.search(query, limit=limit, kinds=kinds)
+
+
+def sync_discussion_suggestion(discussion) -> None:
+    """Add, refresh or drop one discussion after it was saved."""
+    if title_suggestions.built_at is None:
+        return
+    from community.selectors.discussions import PUBLIC_DISCUSSION_STATUSES
+
+    if discussion.is_deleted or discussion.status not in PUBLIC_DISCUSSION_STATUSES:
+        title_suggestions.remove(SUGGESTION_KIND_DISCUSSION, discussion.pk)
+    else:
+        title_suggestions.upsert(discussion_suggestion(discussion))
+
+
+def sync_post_suggestion(post) -> None:
+    """Add, refresh or drop one blog post after it was saved."""
+    if title_suggestions.built_at is None:
+        return
+    if post.status != 1 or post.is_deleted or not post.slug:
+        title_suggestions.remove(SUGGESTION_KIND_POST, post.pk)
+    else:
+        title_suggestions.upsert(post_suggestion(post))
+
+
+def drop_suggestion(kind: str, pk: int) -> None:
+    title_suggestions.remove(kind, pk)
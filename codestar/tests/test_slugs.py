@@ -0,0 +1,116 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from ads.models import Ad, AdCategory
+from askme.models import Moderator
+from blog.models import Category, Post
+from codestar.slugs import allocate_unique_slug
+from community.models import CommunityCategory, Discussion
+from community.services.discussions import create_discussion
+
+User = get_user_model()
+
+
+class AllocateUniqueSlugTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='sluguser', password='password123')
+        cls.category = CommunityCategory.objects.create(name='اسلاگ', slug='slug-category')
+
+    def _discussion(self, slug):
+        return Discussion.objects.create(
+            author=self.author,
+            category=self.category,
+            title=slug,
+            slug=slug,
+            body='متن',
+            last_activity_at=timezone.now(),
+        )
+
+    def test_returns_base_when_free(self):
+        self.assertEqual(allocate_unique_slug(Discussion.objects.all(), 'سؤال-تازه'), 'سؤال-تازه')
+
+    def test_next_suffix_is_found_with_one_query(self):
+        for slug in ['اقامت', 'اقامت-2', 'اقامت-3', 'اقامت-7', 'اقامت-کار', 'اقامت-کار-9']:
+            self._discussion(slug)
+
+        with self.assertNumQueries(1):
+            slug = allocate_unique_slug(Discussion.objects.all(), 'اقامت')
+        self.assertEqual(slug, 'اقامت-8')
+
+    def test_free_base_wins_over_numbered_variants(self):
+        self._discussion('visa-5')
+        self.assertEqual(allocate_unique_slug(Discussion.objects.all(), 'visa'), 'visa')
+
+    def test_first_suffix_and_max_length_are_respected(self):
+        self._discussion('a' * 20)
+        slug = allocate_unique_slug(
+            Discussion.objects.all(),
+            'a' * 20,
+            max_length=20,
+            first_suffix=1,
+        )
+        self.assertEqual(slug, 'a' * 18 + '-1')
+
+    def test_create_discussion_retries_when_slug_is_claimed_concurrently(self):
+        self._discussion('race')
+        with patch(
+            'codestar.slugs.allocate_unique_slug',
+            side_effect=['race', 'race-2'],
+        ) as mock_allocate:
+            discussion = create_discussion(
+                author=self.author,
+                category=self.category,
+                title='race',
+                body='متن',
+            )
+        self.assertEqual(mock_allocate.call_count, 2)
+        self.assertEqual(discussion.slug, 'race-2')
+
+
+class ModelSlugAllocationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='modelslugs', password='password123')
+
+    def test_posts_with_repeated_persian_titles(self):
+        category = Category.objects.create(name='Slugs', slug='slugs')
+        slugs = [
+            Post.objects.create(
+                title='زندگی در سوئد',
+                author=self.author,
+                category=category,
+                content='متن',
+            ).slug
+            for _ in range(3)
+        ]
+        self.assertEqual(slugs, ['زندگی-در-سوئد', 'زندگی-در-سوئد-2', 'زندگی-در-سوئد-3'])
+
+    def test_ads_keep_one_based_suffixes(self):
+        category = AdCategory.objects.create(name='Slugs', slug='slugs')
+        slugs = [
+            Ad.objects.create(
+                title='Bike for sale',
+                category=category,
+                image='test/ad',
+                target_url='https://example.com',
+            ).slug
+            for _ in range(3)
+        ]
+        self.assertEqual(slugs, ['bike-for-sale', 'bike-for-sale-1', 'bike-for-sale-2'])
+
+    def test_moderators_keep_one_based_suffixes(self):
+        slugs = []
+        for index in range(2):
+            user = User.objects.create_user(username=f'expert{index}', password='password123')
+            slugs.append(
+                Moderator.objects.create(
+                    user=user,
+                    expert_title='Lawyer',
+                    complete_name='Sara Lawyer',
+                ).slug
+            )
+        self.assertEqual(slugs, ['sara-lawyer', 'sara-lawyer-1'])
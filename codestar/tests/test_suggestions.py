@@ -0,0 +1,148 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from blog.models import Category, Post
+from codestar.suggestions import (
+    SUGGESTION_KIND_DISCUSSION,
+    SUGGESTION_KIND_POST,
+    PrefixSuggestionIndex,
+    make_suggestion,
+    suggest_titles,
+    title_suggestions,
+)
+from community.models import CommunityCategory
+from community.services.discussions import create_discussion, hide_discussion
+
+User = get_user_model()
+
+
+class PrefixSuggestionIndexTests(SimpleTestCase):
+    def _suggestion(self, pk, title, hours_ago=0):
+        return make_suggestion(
+            SUGGESTION_KIND_DISCUSSION,
+            pk,
+            title,
+            f'/d/{pk}/',
+            timezone.now() - timezone.timedelta(hours=hours_ago),
+        )
+
+    def test_matches_prefix_of_any_word_with_normalized_letters(self):
+        index = PrefixSuggestionIndex()
+        index.replace_all([
+            self._suggestion(1, 'ویزای کار در سوئد'),
+            self._suggestion(2, 'اجاره خانه'),
+        ])
+        # Arabic kaf is normalized to its Persian form.
+        titles = [item.title for item in index.search('كا', limit=5)]
+        self.assertEqual(titles, ['ویزای کار در سوئد'])
+
+    def test_every_query_word_must_match(self):
+        index = PrefixSuggestionIndex()
+        index.replace_all([
+            self._suggestion(1, 'ویزای کار'),
+            self._suggestion(2, 'ویزای تحصیلی'),
+        ])
+        titles = [item.title for item in index.search('ویزای تح', limit=5)]
+        self.assertEqual(titles, ['ویزای تحصیلی'])
+
+    def test_title_prefix_matches_rank_before_newer_matches(self):
+        index = PrefixSuggestionIndex()
+        index.replace_all([
+            self._suggestion(1, 'کار در سوئد', hours_ago=10),
+            self._suggestion(2, 'پیدا کردن کار', hours_ago=1),
+        ])
+        titles = [item.title for item in index.search('کار', limit=5)]
+        self.assertEqual(titles, ['کار در سوئد', 'پیدا کردن کار'])
+
+    def test_upsert_replaces_and_remove_drops(self):
+        index = PrefixSuggestionIndex()
+        index.replace_all([self._suggestion(1, 'مالیات')])
+        index.upsert(self._suggestion(1, 'بیمه'))
+        self.assertEqual(index.search('مالیات', limit=5), [])
+        self.assertEqual(len(index.search('بیمه', limit=5)), 1)
+
+        index.remove(SUGGESTION_KIND_DISCUSSION, 1)
+        self.assertEqual(index.search('بیمه', limit=5), [])
+        self.assertEqual(len(index), 0)
+
+
+class TitleSuggestionServiceTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='suggestuser', password='password123')
+        cls.community_category = CommunityCategory.objects.create(name='کار', slug='work')
+        cls.blog_category = Category.objects.create(name='مهاجرت', slug='migration')
+        cls.discussion = create_discussion(
+            author=cls.author,
+            category=cls.community_category,
+            title='کار پاره وقت',
+            body='متن',
+        )
+        Post.objects.create(
+            title='کارت اقامت',
+            slug='residence-card',
+            author=cls.author,
+            category=cls.blog_category,
+            content='متن',
+            status=1,
+        )
+        Post.objects.create(
+            title='کارآموزی',
+            slug='draft-internship',
+            author=cls.author,
+            category=cls.blog_category,
+            content='متن',
+            status=0,
+        )
+
+    def setUp(self):
+        title_suggestions.clear()
+        cache.clear()
+
+    def test_first_lookup_loads_public_titles(self):
+        results = suggest_titles('کار')
+        self.assertEqual(
+            {(item.kind, item.title) for item in results},
+            {
+                (SUGGESTION_KIND_DISCUSSION, 'کار پاره وقت'),
+                (SUGGESTION_KIND_POST, 'کارت اقامت'),
+            },
+        )
+        with self.assertNumQueries(0):
+            suggest_titles('کارت')
+
+    def test_publish_and_hide_update_loaded_index(self):
+        suggest_titles('کار')
+        with self.captureOnCommitCallbacks(execute=True):
+            create_discussion(
+                author=self.author,
+                category=self.community_category,
+                title='کاریابی',
+                body='متن',
+            )
+        self.assertIn('کاریابی', [item.title for item in suggest_titles('کاری')])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            hide_discussion(self.discussion)
+        self.assertNotIn('کار پاره وقت', [item.title for item in suggest_titles('کار')])
+
+    def test_short_query_returns_nothing(self):
+        self.assertEqual(suggest_titles('ک'), [])
+
+    def test_endpoint_returns_json_filtered_by_kind(self):
+        response = self.client.get(
+            reverse('search_suggestions'),
+            {'q': 'کار', 'kind': SUGGESTION_KIND_POST},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()['results'],
+            [{
+                'kind': SUGGESTION_KIND_POST,
+                'title': 'کارت اقامت',
+                'url': reverse('post_detail', args=['residence-card']),
+            }],
+        )
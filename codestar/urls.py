@@ -28,6 +28,7 @@ from blog.views_robots import robots_txt
 from codestar.views_db_health import db_health_dashboard
 from codestar.admin_incoming import admin_incoming_items
 from codestar.views_analytics import analytics_dashboard
+from codestar.views_suggestions import search_suggestions
 
 # Admin index override with stats
 # Using Django's AppConfig ready() signal would be better, but for now using simple override
@@ -108,6 +109,8 @@ urlpatterns = [
     path("admin/incoming/", admin_incoming_items, name="admin_incoming_items"),
     # Analytics Dashboard (staff-only)
     path("dashboard/analytics/", analytics_dashboard, name="analytics_dashboard"),
+    # Search-as-you-type titles for the blog and community search boxes
+    path("search/suggest/", search_suggestions, name="search_suggestions"),
     # Custom account URLs (must come before allauth.urls to avoid conflicts)
     path("accounts/", include("accounts.urls")),
     path("accounts/", include("allauth.urls")),
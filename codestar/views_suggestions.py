@@ -0,0 +1,32 @@
+from django.http import JsonResponse
+from django.views.decorators.cache import cache_page
+from django.views.decorators.http import require_http_methods
+
+from codestar.suggestions import SUGGESTION_KINDS, suggest_titles
+
+SUGGESTION_RESPONSE_CACHE_SECONDS = 60
+
+
+@require_http_methods(['GET'])
+@cache_page(SUGGESTION_RESPONSE_CACHE_SECONDS)
+def search_suggestions(request):
+    """
+    Typeahead JSON for the blog and community search boxes.
+
+    GET ``q`` is the partial query; optional ``kind`` narrows results to
+    ``discussion`` or ``post``.
+    """
+    query = request.GET.get('q', '').strip()
+    kind = request.GET.get('kind', '').strip()
+    kinds = (kind,) if kind in SUGGESTION_KINDS else None
+
+    suggestions = suggest_titles(query, kinds=kinds)
+    return JsonResponse(
+        {
+            'query': query,
+            'results': [
+                {'kind': item.kind, 'title': item.title, 'url': item.url}
+                for item in suggestions
+            ],
+        }
+    )
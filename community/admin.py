@@ -1,13 +1,31 @@
 from django.contrib import admin
+from django.db import transaction
+from django.utils import timezone
 
+from community.constants import DiscussionStatus
 from community.models import CommunityCategory, Discussion, Reply
+from community.services.counters import (
+    apply_category_discussion_delta,
+    apply_discussion_visibility_change,
+    apply_reply_saved,
+    is_public_discussion,
+)
+from community.services.discussions import hide_discussion, unhide_discussion
 
 
 @admin.register(CommunityCategory)
 class CommunityCategoryAdmin(admin.ModelAdmin):
-    list_display = ('name', 'slug', 'display_order', 'is_active', 'created_on')
+    list_display = (
+        'name',
+        'slug',
+        'display_order',
+        'is_active',
+        'public_discussion_count',
+        'created_on',
+    )
     list_filter = ('is_active',)
     search_fields = ('name', 'slug')
+    readonly_fields = ('public_discussion_count',)
     ordering = ('display_order', 'name')
     prepopulated_fields = {'slug': ('name',)}
 
@@ -36,6 +54,54 @@ class DiscussionAdmin(admin.ModelAdmin):
     )
     raw_id_fields = ('author', 'deleted_by', 'closed_by')
     date_hierarchy = 'created_on'
+    actions = ('hide_discussions', 'unhide_discussions')
+
+    def save_model(self, request, obj, form, change):
+        """
+        Move category public_discussion_count by the stored row's change.
+
+        Deletes need no override: the post_delete receiver decrements the
+        count for each deleted public discussion, including bulk deletes.
+        """
+        with transaction.atomic():
+            previous = None
+            if change:
+                previous = Discussion.objects.select_for_update().get(pk=obj.pk)
+            super().save_model(request, obj, form, change)
+            if previous is None:
+                apply_category_discussion_delta(
+                    obj.category_id,
+                    int(is_public_discussion(obj)),
+                )
+            else:
+                apply_discussion_visibility_change(
+                    obj,
+                    was_public=is_public_discussion(previous),
+                    previous_category_id=previous.category_id,
+                )
+
+    def hide_discussions(self, request, queryset):
+        """Bulk hide through the service so category counts stay exact."""
+        hidden = 0
+        for discussion in queryset.filter(is_deleted=False).exclude(
+            status=DiscussionStatus.HIDDEN
+        ):
+            hide_discussion(discussion)
+            hidden += 1
+        self.message_user(request, f'{hidden} discussion(s) hidden.')
+    hide_discussions.short_description = 'Hide selected discussions'
+
+    def unhide_discussions(self, request, queryset):
+        """Bulk unhide through the service so category counts stay exact."""
+        shown = 0
+        for discussion in queryset.filter(
+            is_deleted=False,
+            status=DiscussionStatus.HIDDEN,
+        ):
+            unhide_discussion(discussion)
+            shown += 1
+        self.message_user(request, f'{shown} discussion(s) made public again.')
+    unhide_discussions.short_description = 'Unhide selected discussions'
 
 
 @admin.register(Reply)
@@ -52,3 +118,15 @@ class ReplyAdmin(admin.ModelAdmin):
     readonly_fields = ('created_on', 'updated_on', 'reviewed_at')
     raw_id_fields = ('discussion', 'author', 'reviewed_by')
     date_hierarchy = 'created_on'
+
+    def save_model(self, request, obj, form, change):
+        """Track who reviewed the reply and keep the reply counters in step."""
+        with transaction.atomic():
+            previous = None
+            if change:
+                previous = Reply.objects.select_for_update().get(pk=obj.pk)
+                if 'approved' in form.changed_data:
+                    obj.reviewed_by = request.user
+                    obj.reviewed_at = timezone.now()
+            super().save_model(request, obj, form, change)
+            apply_reply_saved(obj, previous)
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from community.services.hot import recompute_hot_scores
+
+
+class Command(BaseCommand):
+    help = 'Rebuild discussion hot_score from creation time and approved replies.'
+
+    def handle(self, *args, **options):
+        updated = recompute_hot_scores()
+        self.stdout.write(
+            self.style.NOTICE(f'Hot scores: {updated} discussions recomputed.')
+        )
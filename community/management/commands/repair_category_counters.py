@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from community.services.counters import repair_category_counters
+
+
+class Command(BaseCommand):
+    help = 'Recount category public_discussion_count and repair drift.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report drifted categories without fixing them.',
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        summary = repair_category_counters(dry_run=dry_run)
+
+        for item in summary['drift']:
+            self.stdout.write(
+                f'  {item.slug} (#{item.category_id}): '
+                f'public_discussion_count {item.stored_discussion_count} -> '
+                f'{item.actual_discussion_count}'
+            )
+
+        mode = 'DRY RUN' if dry_run else 'LIVE'
+        self.stdout.write(
+            self.style.NOTICE(
+                f'[{mode}] Category counters: '
+                f'{summary["checked"]} checked, '
+                f'{summary["drifted"]} drifted, '
+                f'{summary["repaired"]} repaired.'
+            )
+        )
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from community.services.counters import repair_discussion_counters
+
+
+class Command(BaseCommand):
+    help = 'Recount discussion reply_count/last_activity_at and repair drift.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report drifted discussions without fixing them.',
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        summary = repair_discussion_counters(dry_run=dry_run)
+
+        for item in summary['drift']:
+            self.stdout.write(
+                f'  {item.slug} (#{item.discussion_id}): '
+                f'reply_count {item.stored_reply_count} -> {item.actual_reply_count}, '
+                f'last_activity_at {item.stored_last_activity_at:%Y-%m-%d %H:%M:%S} -> '
+                f'{item.actual_last_activity_at:%Y-%m-%d %H:%M:%S}'
+            )
+
+        mode = 'DRY RUN' if dry_run else 'LIVE'
+        self.stdout.write(
+            self.style.NOTICE(
+                f'[{mode}] Discussion counters: '
+                f'{summary["checked"]} checked, '
+                f'{summary["drifted"]} drifted, '
+                f'{summary["repaired"]} repaired.'
+            )
+        )
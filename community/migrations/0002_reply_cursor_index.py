@@ -0,0 +1,21 @@
+# Generated by Django 4.2.18 on 2026-10-19 08:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='reply',
+            name='community_r_discuss_58bd35_idx',
+        ),
+        migrations.AddIndex(
+            model_name='reply',
+            index=models.Index(fields=['discussion', 'approved', 'created_on', 'id'], name='community_r_discuss_feb4d9_idx'),
+        ),
+    ]
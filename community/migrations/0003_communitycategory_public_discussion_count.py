@@ -0,0 +1,36 @@
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def populate_public_discussion_count(apps, schema_editor):
+    CommunityCategory = apps.get_model('community', 'CommunityCategory')
+    rows = CommunityCategory.objects.annotate(
+        actual=Count(
+            'discussions',
+            filter=Q(
+                discussions__is_deleted=False,
+                discussions__status__in=('open', 'closed'),
+            ),
+        ),
+    ).values_list('pk', 'actual')
+    for pk, actual in rows:
+        CommunityCategory.objects.filter(pk=pk).update(public_discussion_count=actual)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0002_reply_cursor_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='communitycategory',
+            name='public_discussion_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(
+            populate_public_discussion_count,
+            migrations.RunPython.noop,
+        ),
+    ]
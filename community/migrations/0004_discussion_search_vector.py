@@ -0,0 +1,83 @@
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+SEARCH_INDEX_NAME = 'community_discussion_search_gin'
+
+# Mirrors codestar.related.text_matching.normalize_persian_text: Arabic
+# yeh/kaf/teh marbuta become Persian letters, ZWNJ becomes a space and
+# tatweel is dropped.
+FORWARD_SQL = """
+CREATE OR REPLACE FUNCTION community_discussion_search_vector(title text, body text)
+RETURNS tsvector AS $$
+    SELECT
+        setweight(to_tsvector(%(config)s, translate(coalesce(title, ''), E'\\u064A\\u0643\\u0629\\u200C\\u0640', E'\\u06CC\\u06A9\\u0647 ')), 'A')
+        || setweight(to_tsvector(%(config)s, translate(coalesce(body, ''), E'\\u064A\\u0643\\u0629\\u200C\\u0640', E'\\u06CC\\u06A9\\u0647 ')), 'B')
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION community_discussion_search_vector_trigger()
+RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT'
+        OR NEW.search_vector IS NULL
+        OR NEW.title IS DISTINCT FROM OLD.title
+        OR NEW.body IS DISTINCT FROM OLD.body
+    THEN
+        NEW.search_vector := community_discussion_search_vector(NEW.title, NEW.body);
+    END IF;
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS community_discussion_search_vector_update ON community_discussion;
+CREATE TRIGGER community_discussion_search_vector_update
+    BEFORE INSERT OR UPDATE ON community_discussion
+    FOR EACH ROW EXECUTE FUNCTION community_discussion_search_vector_trigger();
+
+UPDATE community_discussion
+SET search_vector = community_discussion_search_vector(title, body);
+
+CREATE INDEX IF NOT EXISTS {index} ON community_discussion USING gin (search_vector);
+"""
+
+REVERSE_SQL = """
+DROP INDEX IF EXISTS {index};
+DROP TRIGGER IF EXISTS community_discussion_search_vector_update ON community_discussion;
+DROP FUNCTION IF EXISTS community_discussion_search_vector_trigger();
+DROP FUNCTION IF EXISTS community_discussion_search_vector(text, text);
+"""
+
+
+def install_search_trigger(apps, schema_editor):
+    # tsvector, triggers and GIN are PostgreSQL-only; SQLite keeps NULLs.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    config = getattr(settings, 'COMMUNITY_SEARCH_CONFIG', 'simple')
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            FORWARD_SQL.format(index=SEARCH_INDEX_NAME),
+            {'config': config},
+        )
+
+
+def remove_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(REVERSE_SQL.format(index=SEARCH_INDEX_NAME))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0003_communitycategory_public_discussion_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='discussion',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(install_search_trigger, remove_search_trigger),
+    ]
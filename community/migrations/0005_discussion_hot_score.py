@@ -0,0 +1,62 @@
+import math
+from collections import defaultdict
+from datetime import datetime, timezone as dt_timezone
+
+from django.db import migrations, models
+
+# Frozen copies of community.services.hot as of this migration, so later
+# changes to that module cannot alter this backfill. A deployment with a
+# different COMMUNITY_HOT_HALF_LIFE_HOURS can rebuild scores afterwards
+# with the recompute_hot_scores command.
+HOT_SCORE_EPOCH = datetime(2026, 1, 1, tzinfo=dt_timezone.utc)
+HOT_HALF_LIFE_HOURS = 12
+
+
+def hot_event_weight(at):
+    elapsed_hours = (at - HOT_SCORE_EPOCH).total_seconds() / 3600
+    return elapsed_hours / HOT_HALF_LIFE_HOURS * math.log(2)
+
+
+def combine_hot_weights(weights):
+    weights = list(weights)
+    if not weights:
+        return 0.0
+    peak = max(weights)
+    return peak + math.log(sum(math.exp(weight - peak) for weight in weights))
+
+
+def populate_hot_scores(apps, schema_editor):
+    Discussion = apps.get_model('community', 'Discussion')
+    Reply = apps.get_model('community', 'Reply')
+
+    reply_weights = defaultdict(list)
+    for discussion_id, created_on in Reply.objects.filter(approved=True).values_list(
+        'discussion_id', 'created_on'
+    ):
+        reply_weights[discussion_id].append(hot_event_weight(created_on))
+
+    for pk, created_on in Discussion.objects.values_list('pk', 'created_on'):
+        score = combine_hot_weights(
+            [hot_event_weight(created_on)] + reply_weights.get(pk, [])
+        )
+        Discussion.objects.filter(pk=pk).update(hot_score=score)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0004_discussion_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='discussion',
+            name='hot_score',
+            field=models.FloatField(default=0.0),
+        ),
+        migrations.AddIndex(
+            model_name='discussion',
+            index=models.Index(fields=['is_deleted', 'status', '-hot_score'], name='community_d_is_dele_4708ce_idx'),
+        ),
+        migrations.RunPython(populate_hot_scores, migrations.RunPython.noop),
+    ]
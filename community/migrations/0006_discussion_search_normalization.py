@@ -0,0 +1,71 @@
+from django.conf import settings
+from django.db import migrations
+
+# Applies the same steps as codestar.related.text_matching.normalize_persian_text
+# before indexing: NFKC (folds Arabic presentation forms), Arabic yeh/kaf/teh
+# marbuta to Persian letters, ZWNJ to a space, tatweel dropped, lowercase.
+# PostgreSQL < 13 has no normalize(); there the NFKC step is skipped.
+NORMALIZE_SQL = """
+CREATE OR REPLACE FUNCTION community_search_normalize(value text)
+RETURNS text AS $$
+    SELECT lower(translate({nfkc}, E'\\u064A\\u0643\\u0629\\u200C\\u0640', E'\\u06CC\\u06A9\\u0647 '))
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION community_discussion_search_vector(title text, body text)
+RETURNS tsvector AS $$
+    SELECT
+        setweight(to_tsvector(%(config)s, community_search_normalize(title)), 'A')
+        || setweight(to_tsvector(%(config)s, community_search_normalize(body)), 'B')
+$$ LANGUAGE sql IMMUTABLE;
+
+UPDATE community_discussion
+SET search_vector = community_discussion_search_vector(title, body);
+"""
+
+# Function body installed by 0004.
+PREVIOUS_SQL = """
+CREATE OR REPLACE FUNCTION community_discussion_search_vector(title text, body text)
+RETURNS tsvector AS $$
+    SELECT
+        setweight(to_tsvector(%(config)s, translate(coalesce(title, ''), E'\\u064A\\u0643\\u0629\\u200C\\u0640', E'\\u06CC\\u06A9\\u0647 ')), 'A')
+        || setweight(to_tsvector(%(config)s, translate(coalesce(body, ''), E'\\u064A\\u0643\\u0629\\u200C\\u0640', E'\\u06CC\\u06A9\\u0647 ')), 'B')
+$$ LANGUAGE sql IMMUTABLE;
+
+DROP FUNCTION IF EXISTS community_search_normalize(text);
+
+UPDATE community_discussion
+SET search_vector = community_discussion_search_vector(title, body);
+"""
+
+
+def _config():
+    return getattr(settings, 'COMMUNITY_SEARCH_CONFIG', 'simple')
+
+
+def normalize_search_vectors(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql':
+        return
+    nfkc = "coalesce(value, '')"
+    if connection.pg_version >= 130000:
+        nfkc = f'normalize({nfkc}, NFKC)'
+    with connection.cursor() as cursor:
+        cursor.execute(NORMALIZE_SQL.format(nfkc=nfkc), {'config': _config()})
+
+
+def restore_search_vectors(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(PREVIOUS_SQL, {'config': _config()})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0005_discussion_hot_score'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_search_vectors, restore_search_vectors),
+    ]
@@ -1,4 +1,5 @@
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.db.models import Q
 
@@ -30,6 +31,8 @@ class Discussion(models.Model):
     )
     reply_count = models.PositiveIntegerField(default=0)
     last_activity_at = models.DateTimeField()
+    # Log of time-weighted activity; see community.services.hot.
+    hot_score = models.FloatField(default=0.0)
     is_deleted = models.BooleanField(default=False)
     deleted_at = models.DateTimeField(null=True, blank=True)
     deleted_by = models.ForeignKey(
@@ -49,6 +52,10 @@ class Discussion(models.Model):
     )
     created_on = models.DateTimeField(auto_now_add=True)
     updated_on = models.DateTimeField(auto_now=True)
+    # Filled by a PostgreSQL trigger (migrations 0004 and 0006) from
+    # normalized title/body and GIN-indexed there; always NULL on SQLite,
+    # where search falls back to icontains.
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
         verbose_name = 'Discussion'
@@ -61,6 +68,7 @@ class Discussion(models.Model):
             ),
             models.Index(fields=['author', '-created_on']),
             models.Index(fields=['is_deleted', '-created_on']),
+            models.Index(fields=['is_deleted', 'status', '-hot_score']),
         ]
         constraints = [
             models.CheckConstraint(
@@ -43,7 +43,7 @@ class Reply(models.Model):
         verbose_name_plural = 'Replies'
         ordering = ['created_on']
         indexes = [
-            models.Index(fields=['discussion', 'approved', 'created_on']),
+            models.Index(fields=['discussion', 'approved', 'created_on', 'id']),
             models.Index(fields=['approved', '-created_on']),
             models.Index(fields=['author', 'approved']),
             models.Index(fields=['moderation_reason', 'approved']),
@@ -14,6 +14,7 @@ from community.selectors.discussions import (
     list_discussions,
     list_discussions_by_author,
     list_discussions_by_category,
+    list_hot_discussions,
     list_latest_discussions,
     list_open_discussions,
     list_pending_discussions,
@@ -22,6 +23,7 @@ from community.selectors.replies import (
     count_public_replies,
     list_pending_replies,
     list_public_replies,
+    list_public_replies_page,
     list_replies,
     list_replies_by_author,
 )
@@ -40,11 +42,13 @@ __all__ = [
     'list_discussions',
     'list_discussions_by_author',
     'list_discussions_by_category',
+    'list_hot_discussions',
     'list_latest_discussions',
     'list_open_discussions',
     'list_pending_discussions',
     'list_pending_replies',
     'list_public_replies',
+    'list_public_replies_page',
     'list_replies',
     'list_replies_by_author',
     'search_discussions',
@@ -1,7 +1,6 @@
-from django.db.models import Count, Q, QuerySet
+from django.db.models import F, QuerySet
 
 from community.models import CommunityCategory
-from community.selectors.discussions import PUBLIC_DISCUSSION_STATUSES
 
 
 def _category_queryset() -> QuerySet[CommunityCategory]:
@@ -23,13 +22,9 @@ def list_active_categories() -> QuerySet[CommunityCategory]:
 
 
 def list_active_categories_with_discussion_counts() -> QuerySet[CommunityCategory]:
-    """Return active categories annotated with public discussion counts."""
-    public_discussions = Q(
-        discussions__is_deleted=False,
-        discussions__status__in=PUBLIC_DISCUSSION_STATUSES,
-    )
+    """Return active categories with their stored public discussion counts."""
     return list_active_categories().annotate(
-        discussion_count=Count('discussions', filter=public_discussions),
+        discussion_count=F('public_discussion_count'),
     )
 
 
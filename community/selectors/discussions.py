@@ -11,12 +11,14 @@ PUBLIC_DISCUSSION_STATUSES = (
 
 
 def _public_discussions_queryset() -> QuerySet[Discussion]:
+    # search_vector is only read inside SQL by search; never load it.
     return (
         Discussion.objects.filter(
             is_deleted=False,
             status__in=PUBLIC_DISCUSSION_STATUSES,
         )
         .select_related('author', 'category')
+        .defer('search_vector')
     )
 
 
@@ -30,6 +32,11 @@ def list_latest_discussions() -> QuerySet[Discussion]:
     return _public_discussions_queryset().order_by('-created_on')
 
 
+def list_hot_discussions() -> QuerySet[Discussion]:
+    """Return public discussions by time-decayed reply activity, hottest first."""
+    return _public_discussions_queryset().order_by('-hot_score')
+
+
 def list_active_discussions() -> QuerySet[Discussion]:
     """Return public discussions with recent activity first."""
     return list_discussions()
@@ -0,0 +1,43 @@
+"""Related-content sidebar for discussion detail pages."""
+
+from django.core.cache import cache
+
+from ads.selectors.related import get_related_ads
+from codestar.related.sources import prepare_related_source
+from community.models import Discussion
+from experts.selectors.related import get_related_experts
+from related_links.selectors.related import get_related_links
+
+# Keyed on updated_on, so edits invalidate implicitly; the TTL bounds how long
+# a since-hidden ad, expert or link can linger in the sidebar.
+RELATED_SIDEBAR_CACHE_SECONDS = 900
+RELATED_SIDEBAR_CACHE_KEY = 'community:related_sidebar:{pk}:{version}:{limit}'
+
+
+def _sidebar_cache_key(discussion: Discussion, limit: int) -> str:
+    version = int(discussion.updated_on.timestamp() * 1_000_000)
+    return RELATED_SIDEBAR_CACHE_KEY.format(
+        pk=discussion.pk,
+        version=version,
+        limit=limit,
+    )
+
+
+def compute_related_sidebar(discussion: Discussion, *, limit: int = 3) -> dict:
+    """Run the ads, experts and links selectors over one tokenised source."""
+    source = prepare_related_source(discussion)
+    return {
+        'related_ads': get_related_ads(source, limit=limit),
+        'related_experts': get_related_experts(source, limit=limit),
+        'related_useful_links': get_related_links(source, limit=limit),
+    }
+
+
+def get_related_sidebar(discussion: Discussion, *, limit: int = 3) -> dict:
+    """Return the cached related sidebar for ``discussion``."""
+    key = _sidebar_cache_key(discussion, limit)
+    sidebar = cache.get(key)
+    if sidebar is None:
+        sidebar = compute_related_sidebar(discussion, limit=limit)
+        cache.set(key, sidebar, RELATED_SIDEBAR_CACHE_SECONDS)
+    return sidebar
@@ -1,8 +1,18 @@
-from django.db.models import QuerySet
+import base64
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.db.models import Q, QuerySet
 
 from community.models import Reply
 
 
+@dataclass(frozen=True)
+class ReplyPage:
+    replies: list[Reply]
+    next_cursor: str | None
+
+
 def _reply_queryset() -> QuerySet[Reply]:
     return Reply.objects.select_related('author', 'discussion', 'reviewed_by')
 
@@ -26,6 +36,56 @@ def count_public_replies(discussion) -> int:
     return list_public_replies(discussion).count()
 
 
+def encode_reply_cursor(reply: Reply) -> str:
+    """Return an opaque cursor pointing just past ``reply``."""
+    raw = f'{reply.created_on.isoformat()}|{reply.pk}'
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_reply_cursor(cursor: str) -> tuple[datetime, int]:
+    """Parse a cursor from encode_reply_cursor; raise ValueError if malformed."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        created_on, pk = raw.rsplit('|', 1)
+        return datetime.fromisoformat(created_on), int(pk)
+    except (TypeError, UnicodeError, ValueError) as exc:
+        raise ValueError('Invalid reply cursor.') from exc
+
+
+def list_public_replies_page(
+    discussion,
+    *,
+    cursor: str | None = None,
+    limit: int = 50,
+) -> ReplyPage:
+    """
+    Return one page of approved replies ordered by (created_on, id).
+
+    Keyset pagination over the (discussion, approved, created_on, id) index,
+    so later pages cost the same as the first. The discussion join is skipped
+    and the caller's instance attached, since the parent is already loaded.
+    """
+    queryset = Reply.objects.select_related('author').filter(
+        discussion=discussion,
+        approved=True,
+    )
+    if cursor:
+        created_on, pk = decode_reply_cursor(cursor)
+        queryset = queryset.filter(
+            Q(created_on__gt=created_on) | Q(created_on=created_on, pk__gt=pk)
+        )
+    replies = list(queryset.order_by('created_on', 'pk')[: limit + 1])
+
+    next_cursor = None
+    if len(replies) > limit:
+        replies = replies[:limit]
+        next_cursor = encode_reply_cursor(replies[-1])
+    for reply in replies:
+        reply.discussion = discussion
+    return ReplyPage(replies=replies, next_cursor=next_cursor)
+
+
 def list_pending_replies() -> QuerySet[Reply]:
     """Return replies awaiting moderation, newest first."""
     return (
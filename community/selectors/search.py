@@ -1,18 +1,69 @@
+import time
+from collections import deque
+
 from django.conf import settings
 from django.db import connection
-from django.db.models import Q, QuerySet
-from django.db.models.functions import Coalesce
+from django.db.models import F, Q
 
+from codestar.related.text_matching import split_normalized_words
 from community.models import Discussion
 from community.selectors.discussions import _public_discussions_queryset
 
+# Per-process window of recent search timings for the community health view.
+_SEARCH_LATENCY_WINDOW = 200
+_recent_search_latencies_ms = deque(maxlen=_SEARCH_LATENCY_WINDOW)
+
+
+def _prefix_tsquery(query: str) -> str:
+    """Build a raw tsquery matching every query word as a prefix."""
+    return ' & '.join(f'{word}:*' for word in split_normalized_words(query))
+
+
+def _search_queryset(queryset, query: str):
+    if connection.vendor == 'postgresql':
+        from django.contrib.postgres.search import SearchQuery, SearchRank
+
+        raw_query = _prefix_tsquery(query)
+        if not raw_query:
+            return queryset.none()
+        search_config = getattr(settings, 'COMMUNITY_SEARCH_CONFIG', 'simple')
+        min_rank = getattr(settings, 'COMMUNITY_SEARCH_MIN_RANK', 0.01)
+        search_query = SearchQuery(raw_query, config=search_config, search_type='raw')
+        return (
+            queryset.filter(search_vector=search_query)
+            .annotate(rank=SearchRank(F('search_vector'), search_query))
+            .filter(rank__gte=min_rank)
+            .order_by('-rank', '-last_activity_at')
+        )
+
+    return (
+        queryset.filter(Q(title__icontains=query) | Q(body__icontains=query))
+        .order_by('-last_activity_at')
+    )
+
+
+def search_result_limit() -> int:
+    """Most matches a text search returns (``COMMUNITY_SEARCH_MAX_RESULTS``)."""
+    return getattr(settings, 'COMMUNITY_SEARCH_MAX_RESULTS', 200)
+
 
 def search_discussions(
     query: str,
     *,
     category=None,
-) -> QuerySet[Discussion]:
-    """Search public discussions by title and body."""
+):
+    """
+    Search public discussions by title and body in one query.
+
+    PostgreSQL matches the trigger-maintained, GIN-indexed ``search_vector``
+    with every query word as a prefix. The trigger and the query apply the
+    same ``normalize_persian_text`` steps, so Arabic-form and ZWNJ variants
+    match. SQLite falls back to ``icontains``.
+    Text searches return at most ``search_result_limit()`` matches, best
+    first, as a list so pagination does not re-run the search. An empty
+    query returns the uncapped queryset, newest activity first, for normal
+    pagination.
+    """
     queryset = _public_discussions_queryset()
     cleaned_query = (query or '').strip()
 
@@ -22,32 +73,25 @@ def search_discussions(
     if not cleaned_query:
         return queryset.order_by('-last_activity_at')
 
-    fallback_queryset = queryset
+    queryset = _search_queryset(queryset, cleaned_query)
+    started = time.perf_counter()
+    results = list(queryset[:search_result_limit()])
+    _recent_search_latencies_ms.append((time.perf_counter() - started) * 1000)
+    return results
 
-    if connection.vendor == 'postgresql':
-        from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
 
-        search_config = getattr(settings, 'COMMUNITY_SEARCH_CONFIG', 'simple')
-        min_rank = getattr(settings, 'COMMUNITY_SEARCH_MIN_RANK', 0.01)
-        vector = (
-            SearchVector('title', weight='A', config=search_config)
-            + SearchVector('body', weight='B', config=search_config)
-        )
-        search_query = SearchQuery(cleaned_query, config=search_config)
-        fts_queryset = (
-            fallback_queryset.annotate(
-                rank=Coalesce(SearchRank(vector, search_query), 0.0),
-            )
-            .filter(rank__gte=min_rank)
-            .order_by('-rank', '-last_activity_at')
-        )
-        if fts_queryset.exists():
-            return fts_queryset
+def get_search_latency_stats() -> dict:
+    """Summarise recent search timings in this process (milliseconds)."""
+    samples = sorted(_recent_search_latencies_ms)
+    if not samples:
+        return {'samples': 0, 'p50_ms': None, 'p95_ms': None, 'max_ms': None}
 
-    return (
-        fallback_queryset.filter(
-            Q(title__icontains=cleaned_query)
-            | Q(body__icontains=cleaned_query),
-        )
-        .order_by('-last_activity_at')
-    )
+    def percentile(fraction):
+        return round(samples[min(len(samples) - 1, int(len(samples) * fraction))], 2)
+
+    return {
+        'samples': len(samples),
+        'p50_ms': percentile(0.5),
+        'p95_ms': percentile(0.95),
+        'max_ms': round(samples[-1], 2),
+    }
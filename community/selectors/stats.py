@@ -1,10 +1,12 @@
-from django.contrib.auth import get_user_model
-from django.db.models import Q
+from django.core.cache import cache
 
 from community.models import CommunityCategory, Discussion, Reply
 from community.selectors.discussions import PUBLIC_DISCUSSION_STATUSES
 
-User = get_user_model()
+# Invalidated by community signals on every discussion/reply/category change;
+# the TTL bounds staleness for other processes sharing no cache backend.
+COMMUNITY_HOME_STATS_CACHE_KEY = 'community:home_stats'
+COMMUNITY_HOME_STATS_CACHE_SECONDS = 300
 
 
 def _public_discussion_filter(prefix=''):
@@ -16,7 +18,26 @@ def _public_discussion_filter(prefix=''):
     }
 
 
-def get_community_home_stats():
+def _count_active_members():
+    """
+    Distinct authors of public discussions or approved public replies.
+
+    A UNION of the two author-id sets replaces the old OR-join across users,
+    discussions and replies, whose row count grew with the product of both.
+    """
+    discussion_authors = Discussion.objects.filter(
+        author__isnull=False,
+        **_public_discussion_filter(),
+    ).order_by().values('author_id')
+    reply_authors = Reply.objects.filter(
+        approved=True,
+        author__isnull=False,
+        **_public_discussion_filter('discussion'),
+    ).order_by().values('author_id')
+    return discussion_authors.union(reply_authors).count()
+
+
+def compute_community_home_stats():
     """
     Compact homepage counts using the same visibility rules as public pages.
     """
@@ -31,17 +52,7 @@ def get_community_home_stats():
 
     total_categories = CommunityCategory.objects.filter(is_active=True).count()
 
-    active_members = User.objects.filter(
-        Q(
-            community_discussions__is_deleted=False,
-            community_discussions__status__in=PUBLIC_DISCUSSION_STATUSES,
-        )
-        | Q(
-            community_replies__approved=True,
-            community_replies__discussion__is_deleted=False,
-            community_replies__discussion__status__in=PUBLIC_DISCUSSION_STATUSES,
-        )
-    ).distinct().count()
+    active_members = _count_active_members()
 
     return {
         'total_discussions': total_discussions,
@@ -49,3 +60,21 @@ def get_community_home_stats():
         'active_members': active_members,
         'categories': total_categories,
     }
+
+
+def get_community_home_stats():
+    """Return cached homepage counts, recomputing on a miss."""
+    stats = cache.get(COMMUNITY_HOME_STATS_CACHE_KEY)
+    if stats is None:
+        stats = compute_community_home_stats()
+        cache.set(
+            COMMUNITY_HOME_STATS_CACHE_KEY,
+            stats,
+            COMMUNITY_HOME_STATS_CACHE_SECONDS,
+        )
+    return stats
+
+
+def invalidate_community_home_stats():
+    """Drop cached homepage counts so the next render recomputes them."""
+    cache.delete(COMMUNITY_HOME_STATS_CACHE_KEY)
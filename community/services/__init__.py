@@ -1,12 +1,18 @@
 """Community write operations and business logic."""
 
-from community.services.counters import recalculate_discussion_stats
+from community.services.counters import (
+    recalculate_discussion_stats,
+    repair_category_counters,
+    repair_discussion_counters,
+)
 from community.services.discussions import (
     close_discussion,
     create_discussion,
+    hide_discussion,
     reopen_discussion,
     restore_discussion,
     soft_delete_discussion,
+    unhide_discussion,
     update_discussion,
 )
 from community.services.moderation import should_auto_approve_reply
@@ -23,12 +29,16 @@ __all__ = [
     'create_discussion',
     'create_reply',
     'edit_reply',
+    'hide_discussion',
     'recalculate_discussion_stats',
+    'repair_category_counters',
+    'repair_discussion_counters',
     'reject_reply',
     'reopen_discussion',
     'restore_discussion',
     'should_auto_approve_reply',
     'soft_delete_discussion',
+    'unhide_discussion',
     'update_discussion',
 ]
 
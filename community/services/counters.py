@@ -1,7 +1,30 @@
-from django.db import connections
-from django.db.models import Max
+from dataclasses import dataclass
 
-from community.models import Discussion, Reply
+from django.db import connections, transaction
+from django.db.models import (
+    Case,
+    Count,
+    DateTimeField,
+    F,
+    Max,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from blog.models import UserTrust
+from blog.utils import adjust_approved_contribution_count
+from community.models import CommunityCategory, Discussion, Reply
+from community.selectors.discussions import PUBLIC_DISCUSSION_STATUSES
+from community.services.hot import compute_hot_score, hot_score_with_event
+
+# create_discussion stamps last_activity_at just before auto_now_add fills
+# created_on, so reply-less threads differ by microseconds; ignore that.
+LAST_ACTIVITY_TOLERANCE = timezone.timedelta(seconds=1)
 
 
 def recalculate_discussion_stats(discussion: Discussion) -> Discussion:
@@ -30,3 +53,271 @@ def recalculate_discussion_stats(discussion: Discussion) -> Discussion:
     discussion.last_activity_at = last_activity_at
     discussion.save(update_fields=['reply_count', 'last_activity_at', 'updated_on'])
     return discussion
+
+
+def apply_reply_approved(reply: Reply) -> None:
+    """
+    Count a newly approved reply against its discussion and its author.
+
+    The row is only write-locked for the statement itself, so concurrent
+    replies on a long thread no longer queue behind a full recount. The
+    reply is folded into hot_score in the same statement.
+    """
+    adjust_approved_contribution_count(reply.author_id, UserTrust.REPLIES, 1)
+    Discussion.objects.filter(pk=reply.discussion_id).update(
+        reply_count=F('reply_count') + 1,
+        hot_score=hot_score_with_event(reply.created_on),
+        last_activity_at=Greatest(
+            F('last_activity_at'),
+            Value(reply.created_on, output_field=DateTimeField()),
+        ),
+        updated_on=timezone.now(),
+    )
+
+
+def apply_reply_unapproved(reply: Reply) -> None:
+    """
+    Remove a reply that is no longer approved (or deleted) from the counters
+    and from its author's trust count.
+
+    Call after the reply has been saved as unapproved or deleted.
+    last_activity_at is only recomputed when this reply was the latest
+    activity; the MAX lookup is served by the (discussion, approved,
+    created_on) index. hot_score cannot subtract an event in log space, so
+    it is rebuilt from the thread's remaining approved replies while the
+    discussion row is locked; a concurrent approval's log-add UPDATE then
+    waits and lands on top of the rebuilt score instead of being lost.
+    """
+    latest_approved = (
+        Reply.objects.filter(discussion=OuterRef('pk'), approved=True)
+        .order_by('-created_on')
+        .values('created_on')[:1]
+    )
+    adjust_approved_contribution_count(reply.author_id, UserTrust.REPLIES, -1)
+    discussions = Discussion.objects.filter(pk=reply.discussion_id)
+    with transaction.atomic():
+        created_on = (
+            discussions.select_for_update()
+            .values_list('created_on', flat=True)
+            .first()
+        )
+        if created_on is None:
+            return
+        discussions.update(
+            hot_score=compute_hot_score(reply.discussion_id, created_on),
+            reply_count=Case(
+                When(reply_count__gt=0, then=F('reply_count') - 1),
+                default=Value(0),
+            ),
+            last_activity_at=Case(
+                When(
+                    last_activity_at__lte=reply.created_on,
+                    then=Coalesce(Subquery(latest_approved), F('created_on')),
+                ),
+                default=F('last_activity_at'),
+            ),
+            updated_on=timezone.now(),
+        )
+
+
+def apply_reply_saved(reply: Reply, previous: Reply | None) -> None:
+    """
+    Update counters after ``reply`` was saved over ``previous``.
+
+    ``previous`` is the stored row read (and locked) before the save, or
+    None for a new reply. Used by paths that save a reply directly, such as
+    the admin, where approval, discussion or author may all have changed.
+    """
+    was_counted = previous is not None and previous.approved
+    moved = previous is not None and (
+        previous.discussion_id != reply.discussion_id
+        or previous.author_id != reply.author_id
+    )
+    if was_counted and (moved or not reply.approved):
+        apply_reply_unapproved(previous)
+    if reply.approved and (moved or not was_counted):
+        apply_reply_approved(reply)
+
+
+def is_public_discussion(discussion: Discussion) -> bool:
+    """Whether the discussion counts towards its category's public count."""
+    return (
+        not discussion.is_deleted
+        and discussion.status in PUBLIC_DISCUSSION_STATUSES
+    )
+
+
+def apply_category_discussion_delta(category_id, delta: int) -> None:
+    """Move a category's public_discussion_count by ``delta`` in one UPDATE."""
+    if not category_id or not delta:
+        return
+    CommunityCategory.objects.filter(pk=category_id).update(
+        public_discussion_count=Greatest(
+            F('public_discussion_count') + delta,
+            Value(0),
+        ),
+    )
+
+
+def apply_discussion_visibility_change(
+    discussion: Discussion,
+    *,
+    was_public: bool,
+    previous_category_id=None,
+) -> None:
+    """
+    Update category counts after a discussion was saved.
+
+    ``previous_category_id`` is the category before the save when it may
+    have changed; it defaults to the current category.
+    """
+    if previous_category_id is None:
+        previous_category_id = discussion.category_id
+    now_public = is_public_discussion(discussion)
+    if previous_category_id == discussion.category_id:
+        apply_category_discussion_delta(
+            discussion.category_id,
+            int(now_public) - int(was_public),
+        )
+        return
+    if was_public:
+        apply_category_discussion_delta(previous_category_id, -1)
+    if now_public:
+        apply_category_discussion_delta(discussion.category_id, 1)
+
+
+@dataclass(frozen=True)
+class DiscussionCounterDrift:
+    discussion_id: int
+    slug: str
+    stored_reply_count: int
+    actual_reply_count: int
+    stored_last_activity_at: object
+    actual_last_activity_at: object
+
+
+def find_discussion_counter_drift(queryset=None) -> list[DiscussionCounterDrift]:
+    """Compare stored counters against a full recount in one aggregate query."""
+    if queryset is None:
+        queryset = Discussion.objects.all()
+    rows = (
+        queryset.annotate(
+            actual_reply_count=Count('replies', filter=Q(replies__approved=True)),
+            actual_last_reply_at=Max(
+                'replies__created_on',
+                filter=Q(replies__approved=True),
+            ),
+        )
+        .values_list(
+            'pk',
+            'slug',
+            'reply_count',
+            'actual_reply_count',
+            'last_activity_at',
+            'actual_last_reply_at',
+            'created_on',
+        )
+        .order_by('pk')
+    )
+    drift = []
+    for pk, slug, stored_count, actual_count, stored_at, last_reply_at, created_on in rows:
+        actual_at = last_reply_at or created_on
+        activity_drifted = abs(stored_at - actual_at) > LAST_ACTIVITY_TOLERANCE
+        if stored_count != actual_count or activity_drifted:
+            drift.append(
+                DiscussionCounterDrift(
+                    discussion_id=pk,
+                    slug=slug,
+                    stored_reply_count=stored_count,
+                    actual_reply_count=actual_count,
+                    stored_last_activity_at=stored_at,
+                    actual_last_activity_at=actual_at,
+                )
+            )
+    return drift
+
+
+def repair_discussion_counters(*, dry_run: bool = False) -> dict:
+    """Find drifted discussions and recompute them unless ``dry_run``."""
+    drift = find_discussion_counter_drift()
+    repaired = 0
+    if not dry_run:
+        for item in drift:
+            with transaction.atomic():
+                recalculate_discussion_stats(Discussion(pk=item.discussion_id))
+            repaired += 1
+    return {
+        'checked': Discussion.objects.count(),
+        'drifted': len(drift),
+        'repaired': repaired,
+        'drift': drift,
+    }
+
+
+@dataclass(frozen=True)
+class CategoryCounterDrift:
+    category_id: int
+    slug: str
+    stored_discussion_count: int
+    actual_discussion_count: int
+
+
+def find_category_counter_drift() -> list[CategoryCounterDrift]:
+    """Compare public_discussion_count against a recount in one aggregate query."""
+    rows = (
+        CommunityCategory.objects.annotate(
+            actual_discussion_count=Count(
+                'discussions',
+                filter=Q(
+                    discussions__is_deleted=False,
+                    discussions__status__in=PUBLIC_DISCUSSION_STATUSES,
+                ),
+            ),
+        )
+        .values_list(
+            'pk',
+            'slug',
+            'public_discussion_count',
+            'actual_discussion_count',
+        )
+        .order_by('pk')
+    )
+    return [
+        CategoryCounterDrift(
+            category_id=pk,
+            slug=slug,
+            stored_discussion_count=stored,
+            actual_discussion_count=actual,
+        )
+        for pk, slug, stored, actual in rows
+        if stored != actual
+    ]
+
+
+def repair_category_counters(*, dry_run: bool = False) -> dict:
+    """Find categories with a drifted public_discussion_count and fix them."""
+    drift = find_category_counter_drift()
+    repaired = 0
+    if not dry_run:
+        actual_count = (
+            Discussion.objects.filter(
+                category=OuterRef('pk'),
+                is_deleted=False,
+                status__in=PUBLIC_DISCUSSION_STATUSES,
+            )
+            .order_by()
+            .values('category')
+            .annotate(total=Count('pk'))
+            .values('total')
+        )
+        repaired = CommunityCategory.objects.filter(
+            pk__in=[item.category_id for item in drift],
+        ).update(
+            public_discussion_count=Coalesce(Subquery(actual_count), Value(0)),
+        )
+    return {
+        'checked': CommunityCategory.objects.count(),
+        'drifted': len(drift),
+        'repaired': repaired,
+        'drift': drift,
+    }
@@ -2,6 +2,7 @@ from django.db import IntegrityError, transaction
 from django.utils import timezone
 
 from blog.utils import generate_slug_from_persian
+from codestar.slugs import save_with_unique_slug
 from community.constants import DiscussionStatus
 from community.exceptions import (
     DiscussionDeletedError,
@@ -10,6 +11,12 @@ from community.exceptions import (
     ValidationError,
 )
 from community.models import CommunityCategory, Discussion
+from community.services.counters import (
+    apply_category_discussion_delta,
+    apply_discussion_visibility_change,
+    is_public_discussion,
+)
+from community.services.hot import hot_event_weight
 
 
 def _validate_non_empty(value: str, field_name: str) -> str:
@@ -33,17 +40,48 @@ def _validate_discussion_not_deleted(discussion: Discussion) -> None:
         )
 
 
-def _generate_unique_discussion_slug(title: str) -> str:
+# Stored fields that decide whether a discussion is public, plus the
+# fields the status transitions below write.
+_STATE_FIELDS = (
+    'status',
+    'is_deleted',
+    'category_id',
+    'closed_at',
+    'closed_by_id',
+    'deleted_at',
+    'deleted_by_id',
+)
+
+
+def _lock_stored_state(discussion: Discussion) -> bool:
+    """
+    Lock the discussion row, copy its stored state onto ``discussion`` and
+    return whether it is public.
+
+    Transitions and category count deltas follow the locked row rather than
+    the caller's copy, so two moderators hiding the same discussion cannot
+    both decrement the category count. Call inside transaction.atomic().
+    """
+    stored = (
+        Discussion.objects.select_for_update()
+        .values(*_STATE_FIELDS)
+        .get(pk=discussion.pk)
+    )
+    for name, value in stored.items():
+        setattr(discussion, name, value)
+    return is_public_discussion(discussion)
+
+
+def _save_with_category_count(discussion: Discussion, *, was_public: bool, update_fields) -> None:
+    discussion.save(update_fields=update_fields)
+    apply_discussion_visibility_change(discussion, was_public=was_public)
+
+
+def _discussion_base_slug(title: str) -> str:
     base_slug = generate_slug_from_persian(title)
     if not base_slug:
         base_slug = f'discussion-{timezone.now().strftime("%Y%m%d%H%M%S")}'
-
-    slug = base_slug
-    counter = 2
-    while Discussion.objects.filter(slug=slug).exists():
-        slug = f'{base_slug}-{counter}'
-        counter += 1
-    return slug
+    return base_slug
 
 
 def create_discussion(*, author, category: CommunityCategory, title: str, body: str) -> Discussion:
@@ -53,28 +91,31 @@ def create_discussion(*, author, category: CommunityCategory, title: str, body:
     body = _validate_non_empty(body, 'body')
 
     now = timezone.now()
+    discussion = Discussion(
+        author=author,
+        category=category,
+        title=title,
+        body=body,
+        status=DiscussionStatus.OPEN,
+        reply_count=0,
+        last_activity_at=now,
+        hot_score=hot_event_weight(now),
+    )
 
     with transaction.atomic():
-        last_error = None
-        for _ in range(5):
-            slug = _generate_unique_discussion_slug(title)
-            try:
-                discussion = Discussion.objects.create(
-                    author=author,
-                    category=category,
-                    title=title,
-                    slug=slug,
-                    body=body,
-                    status=DiscussionStatus.OPEN,
-                    reply_count=0,
-                    last_activity_at=now,
-                )
-                return discussion
-            except IntegrityError as exc:
-                last_error = exc
-        raise ValidationError(
-            'Unable to create discussion due to slug conflict.'
-        ) from last_error
+        try:
+            save_with_unique_slug(
+                discussion,
+                _discussion_base_slug(title),
+                lambda: discussion.save(force_insert=True),
+                max_length=Discussion._meta.get_field('slug').max_length,
+            )
+        except IntegrityError as exc:
+            raise ValidationError(
+                'Unable to create discussion due to slug conflict.'
+            ) from exc
+        apply_category_discussion_delta(category.pk, 1)
+        return discussion
 
 
 def update_discussion(
@@ -88,98 +129,163 @@ def update_discussion(
     _validate_discussion_not_deleted(discussion)
 
     update_fields = ['updated_on']
-
     if title is not None:
-        discussion.title = _validate_non_empty(title, 'title')
+        title = _validate_non_empty(title, 'title')
         update_fields.append('title')
-
     if body is not None:
-        discussion.body = _validate_non_empty(body, 'body')
+        body = _validate_non_empty(body, 'body')
         update_fields.append('body')
-
     if category is not None:
         _validate_category(category)
-        discussion.category = category
         update_fields.append('category')
 
     if len(update_fields) == 1:
         return discussion
 
-    discussion.save(update_fields=update_fields)
+    with transaction.atomic():
+        was_public = _lock_stored_state(discussion)
+        _validate_discussion_not_deleted(discussion)
+        previous_category_id = discussion.category_id
+        if title is not None:
+            discussion.title = title
+        if body is not None:
+            discussion.body = body
+        if category is not None:
+            discussion.category = category
+        discussion.save(update_fields=update_fields)
+        apply_discussion_visibility_change(
+            discussion,
+            was_public=was_public,
+            previous_category_id=previous_category_id,
+        )
     return discussion
 
 
 def close_discussion(discussion: Discussion, *, closed_by) -> Discussion:
     """Close an open discussion to prevent new replies."""
-    _validate_discussion_not_deleted(discussion)
-
-    if discussion.status == DiscussionStatus.CLOSED:
-        return discussion
-
-    if discussion.status != DiscussionStatus.OPEN:
-        raise InvalidDiscussionStateError(
-            f'Discussion "{discussion.slug}" cannot be closed from status '
-            f'"{discussion.status}".'
+    with transaction.atomic():
+        was_public = _lock_stored_state(discussion)
+        _validate_discussion_not_deleted(discussion)
+
+        if discussion.status == DiscussionStatus.CLOSED:
+            return discussion
+
+        if discussion.status != DiscussionStatus.OPEN:
+            raise InvalidDiscussionStateError(
+                f'Discussion "{discussion.slug}" cannot be closed from status '
+                f'"{discussion.status}".'
+            )
+
+        discussion.status = DiscussionStatus.CLOSED
+        discussion.closed_at = timezone.now()
+        discussion.closed_by = closed_by
+        _save_with_category_count(
+            discussion,
+            was_public=was_public,
+            update_fields=['status', 'closed_at', 'closed_by', 'updated_on'],
         )
-
-    discussion.status = DiscussionStatus.CLOSED
-    discussion.closed_at = timezone.now()
-    discussion.closed_by = closed_by
-    discussion.save(
-        update_fields=['status', 'closed_at', 'closed_by', 'updated_on'],
-    )
     return discussion
 
 
 def reopen_discussion(discussion: Discussion, *, reopened_by=None) -> Discussion:
     """Reopen a closed discussion. Reserved for internal/staff workflows."""
-    _validate_discussion_not_deleted(discussion)
+    with transaction.atomic():
+        was_public = _lock_stored_state(discussion)
+        _validate_discussion_not_deleted(discussion)
+
+        if discussion.status == DiscussionStatus.OPEN:
+            return discussion
+
+        if discussion.status != DiscussionStatus.CLOSED:
+            raise InvalidDiscussionStateError(
+                f'Discussion "{discussion.slug}" cannot be reopened from status '
+                f'"{discussion.status}".'
+            )
+
+        discussion.status = DiscussionStatus.OPEN
+        discussion.closed_at = None
+        discussion.closed_by = None
+        _save_with_category_count(
+            discussion,
+            was_public=was_public,
+            update_fields=['status', 'closed_at', 'closed_by', 'updated_on'],
+        )
+    return discussion
 
-    if discussion.status == DiscussionStatus.OPEN:
-        return discussion
 
-    if discussion.status != DiscussionStatus.CLOSED:
-        raise InvalidDiscussionStateError(
-            f'Discussion "{discussion.slug}" cannot be reopened from status '
-            f'"{discussion.status}".'
+def hide_discussion(discussion: Discussion) -> Discussion:
+    """Hide a discussion from public listings (also the moderation queue)."""
+    with transaction.atomic():
+        was_public = _lock_stored_state(discussion)
+        _validate_discussion_not_deleted(discussion)
+
+        if discussion.status == DiscussionStatus.HIDDEN:
+            return discussion
+
+        discussion.status = DiscussionStatus.HIDDEN
+        _save_with_category_count(
+            discussion,
+            was_public=was_public,
+            update_fields=['status', 'updated_on'],
         )
+    return discussion
 
-    discussion.status = DiscussionStatus.OPEN
-    discussion.closed_at = None
-    discussion.closed_by = None
-    discussion.save(
-        update_fields=['status', 'closed_at', 'closed_by', 'updated_on'],
-    )
+
+def unhide_discussion(discussion: Discussion) -> Discussion:
+    """Make a hidden discussion public again as an open thread."""
+    with transaction.atomic():
+        was_public = _lock_stored_state(discussion)
+        _validate_discussion_not_deleted(discussion)
+
+        if discussion.status != DiscussionStatus.HIDDEN:
+            raise InvalidDiscussionStateError(
+                f'Discussion "{discussion.slug}" is not hidden.'
+            )
+
+        discussion.status = DiscussionStatus.OPEN
+        _save_with_category_count(
+            discussion,
+            was_public=was_public,
+            update_fields=['status', 'updated_on'],
+        )
     return discussion
 
 
 def soft_delete_discussion(discussion: Discussion, *, deleted_by) -> Discussion:
     """Soft-delete a discussion while preserving replies for audit/knowledge."""
-    if discussion.is_deleted:
-        raise InvalidDiscussionStateError(
-            f'Discussion "{discussion.slug}" is already deleted.'
+    with transaction.atomic():
+        was_public = _lock_stored_state(discussion)
+        if discussion.is_deleted:
+            raise InvalidDiscussionStateError(
+                f'Discussion "{discussion.slug}" is already deleted.'
+            )
+
+        discussion.is_deleted = True
+        discussion.deleted_at = timezone.now()
+        discussion.deleted_by = deleted_by
+        _save_with_category_count(
+            discussion,
+            was_public=was_public,
+            update_fields=['is_deleted', 'deleted_at', 'deleted_by', 'updated_on'],
         )
-
-    discussion.is_deleted = True
-    discussion.deleted_at = timezone.now()
-    discussion.deleted_by = deleted_by
-    discussion.save(
-        update_fields=['is_deleted', 'deleted_at', 'deleted_by', 'updated_on'],
-    )
     return discussion
 
 
 def restore_discussion(discussion: Discussion) -> Discussion:
     """Restore a soft-deleted discussion."""
-    if not discussion.is_deleted:
-        raise InvalidDiscussionStateError(
-            f'Discussion "{discussion.slug}" is not deleted.'
+    with transaction.atomic():
+        was_public = _lock_stored_state(discussion)
+        if not discussion.is_deleted:
+            raise InvalidDiscussionStateError(
+                f'Discussion "{discussion.slug}" is not deleted.'
+            )
+
+        discussion.is_deleted = False
+        discussion.deleted_at = None
+        discussion.deleted_by = None
+        _save_with_category_count(
+            discussion,
+            was_public=was_public,
+            update_fields=['is_deleted', 'deleted_at', 'deleted_by', 'updated_on'],
         )
-
-    discussion.is_deleted = False
-    discussion.deleted_at = None
-    discussion.deleted_by = None
-    discussion.save(
-        update_fields=['is_deleted', 'deleted_at', 'deleted_by', 'updated_on'],
-    )
     return discussion
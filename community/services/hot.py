@@ -0,0 +1,91 @@
+"""
+Time-decayed "hot" ranking for discussions.
+
+Each event (the discussion being created, each approved reply) weighs
+``2 ** ((event_time - HOT_SCORE_EPOCH) / half_life)``. The stored
+``hot_score`` is the natural log of the summed weights. Every score would
+decay by the same factor as time passes, so ordering by the stored value
+always equals ordering by the decayed score. New replies only need one
+log-add-exp UPDATE, and stored scores never have to be aged.
+"""
+
+import math
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.db.models import F, Value
+from django.db.models.functions import Abs, Exp, Greatest, Ln
+
+from community.models import Discussion, Reply
+
+HOT_SCORE_EPOCH = datetime(2026, 1, 1, tzinfo=dt_timezone.utc)
+HOT_SCORE_BATCH_SIZE = 500
+
+
+def hot_event_weight(at) -> float:
+    """Log-weight of one activity event at ``at``."""
+    half_life_hours = getattr(settings, 'COMMUNITY_HOT_HALF_LIFE_HOURS', 12)
+    elapsed_hours = (at - HOT_SCORE_EPOCH).total_seconds() / 3600
+    return elapsed_hours / half_life_hours * math.log(2)
+
+
+def combine_hot_weights(weights) -> float:
+    """Numerically stable log(sum(exp(w))) of event log-weights."""
+    weights = list(weights)
+    if not weights:
+        return 0.0
+    peak = max(weights)
+    return peak + math.log(sum(math.exp(weight - peak) for weight in weights))
+
+
+def hot_score_with_event(at):
+    """Expression adding one event at ``at`` to the stored hot_score."""
+    weight = Value(hot_event_weight(at))
+    return Greatest(F('hot_score'), weight) + Ln(
+        Value(1.0) + Exp(Value(0.0) - Abs(F('hot_score') - weight))
+    )
+
+
+def compute_hot_score(discussion_id, created_on) -> float:
+    """Recompute one discussion's score from its creation and approved replies."""
+    reply_times = Reply.objects.filter(
+        discussion_id=discussion_id,
+        approved=True,
+    ).values_list('created_on', flat=True)
+    return combine_hot_weights(
+        [hot_event_weight(created_on)]
+        + [hot_event_weight(reply_at) for reply_at in reply_times]
+    )
+
+
+def recompute_hot_scores() -> int:
+    """
+    Rebuild hot_score for every discussion from its activity history.
+
+    Decay needs no refresh; this repairs scores after direct database
+    edits or a half-life change. Returns the number of discussions updated.
+    """
+    created = dict(Discussion.objects.values_list('pk', 'created_on'))
+    weights = {
+        pk: [hot_event_weight(created_on)]
+        for pk, created_on in created.items()
+    }
+    reply_times = (
+        Reply.objects.filter(approved=True)
+        .values_list('discussion_id', 'created_on')
+        .iterator(chunk_size=2000)
+    )
+    for discussion_id, created_on in reply_times:
+        if discussion_id in weights:
+            weights[discussion_id].append(hot_event_weight(created_on))
+
+    discussions = [
+        Discussion(pk=pk, hot_score=combine_hot_weights(event_weights))
+        for pk, event_weights in weights.items()
+    ]
+    Discussion.objects.bulk_update(
+        discussions,
+        ['hot_score'],
+        batch_size=HOT_SCORE_BATCH_SIZE,
+    )
+    return len(discussions)
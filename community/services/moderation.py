@@ -1,7 +1,8 @@
 from django.conf import settings
 from django.contrib.auth import get_user_model
 
-from blog.utils import contains_link
+from blog.models import UserTrust
+from blog.utils import contains_link, get_approved_contribution_count
 from community.constants import ModerationReason
 from community.models import Reply
 
@@ -9,9 +10,11 @@ User = get_user_model()
 
 
 def _approved_reply_count(user) -> int:
-    if user is None or not getattr(user, 'is_authenticated', False):
-        return 0
-    return Reply.objects.filter(author=user, approved=True).count()
+    return get_approved_contribution_count(
+        user,
+        UserTrust.REPLIES,
+        lambda: Reply.objects.filter(author=user, approved=True).count(),
+    )
 
 
 def should_auto_approve_reply(user, body: str) -> tuple[bool, str | None]:
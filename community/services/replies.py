@@ -11,7 +11,10 @@ from community.exceptions import (
     ValidationError,
 )
 from community.models import Discussion, Reply
-from community.services.counters import recalculate_discussion_stats
+from community.services.counters import (
+    apply_reply_approved,
+    apply_reply_unapproved,
+)
 from community.services.moderation import should_auto_approve_reply
 
 
@@ -41,13 +44,28 @@ def _validate_reply_target(discussion: Discussion) -> None:
         )
 
 
+def _lock_stored_approval(reply: Reply) -> bool:
+    """
+    Lock the reply row and return its stored approval.
+
+    Counter deltas follow the row's actual transition rather than the
+    in-memory instance, so two moderators approving the same pending reply
+    cannot both count it.
+    """
+    return (
+        Reply.objects.select_for_update()
+        .values_list('approved', flat=True)
+        .get(pk=reply.pk)
+    )
+
+
 def _apply_moderation_decision(reply: Reply, *, approved: bool, reason: str | None) -> None:
     reply.approved = approved
     reply.moderation_reason = None if approved else reason
 
 
 def create_reply(*, discussion: Discussion, author, body: str) -> Reply:
-    """Create a reply and refresh discussion stats when auto-approved."""
+    """Create a reply and bump discussion stats when auto-approved."""
     if author is None or not getattr(author, 'is_authenticated', False):
         raise ValidationError('author must be an authenticated user.')
 
@@ -64,7 +82,7 @@ def create_reply(*, discussion: Discussion, author, body: str) -> Reply:
             moderation_reason=moderation_reason,
         )
         if approved:
-            recalculate_discussion_stats(discussion)
+            apply_reply_approved(reply)
 
     return reply
 
@@ -77,25 +95,30 @@ def edit_reply(*, reply: Reply, author, body: str) -> Reply:
     _validate_reply_target(reply.discussion)
     body = _validate_non_empty(body, 'body')
     approved, moderation_reason = should_auto_approve_reply(author, body)
-    was_approved = reply.approved
 
     with transaction.atomic():
+        was_approved = _lock_stored_approval(reply)
         reply.body = body
         _apply_moderation_decision(reply, approved=approved, reason=moderation_reason)
         reply.save(update_fields=['body', 'approved', 'moderation_reason', 'updated_on'])
-        if was_approved or approved:
-            recalculate_discussion_stats(reply.discussion)
+        if approved and not was_approved:
+            apply_reply_approved(reply)
+        elif was_approved and not approved:
+            apply_reply_unapproved(reply)
 
     return reply
 
 
 def approve_reply(*, reply: Reply, reviewer) -> Reply:
-    """Approve a pending reply and refresh discussion stats."""
+    """Approve a pending reply and bump discussion stats."""
     if reply.approved:
         return reply
 
     now = timezone.now()
     with transaction.atomic():
+        if _lock_stored_approval(reply):
+            reply.approved = True
+            return reply
         reply.approved = True
         reply.moderation_reason = None
         reply.reviewed_by = reviewer
@@ -109,7 +132,7 @@ def approve_reply(*, reply: Reply, reviewer) -> Reply:
                 'updated_on',
             ],
         )
-        recalculate_discussion_stats(reply.discussion)
+        apply_reply_approved(reply)
 
     return reply
 
@@ -120,7 +143,7 @@ def reject_reply(
     reviewer,
     reason: str = ModerationReason.MANUAL_REVIEW,
 ) -> Reply:
-    """Reject or unapprove a reply and refresh discussion stats."""
+    """Reject or unapprove a reply and decrement discussion stats if it was counted."""
     valid_reasons = {choice.value for choice in ModerationReason}
     if reason not in valid_reasons:
         raise ReplyModerationError(f'Invalid moderation reason: {reason}')
@@ -128,6 +151,7 @@ def reject_reply(
     now = timezone.now()
 
     with transaction.atomic():
+        was_approved = _lock_stored_approval(reply)
         reply.approved = False
         reply.moderation_reason = reason
         reply.reviewed_by = reviewer
@@ -141,6 +165,7 @@ def reject_reply(
                 'updated_on',
             ],
         )
-        recalculate_discussion_stats(reply.discussion)
+        if was_approved:
+            apply_reply_unapproved(reply)
 
     return reply
@@ -1,7 +1,8 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from community.models import Reply
+from community.models import CommunityCategory, Discussion, Reply
 
 
 @receiver(post_save, sender=Reply)
@@ -11,3 +12,49 @@ def notify_discussion_author_on_reply(sender, instance, created, **kwargs):
     from notifications.dispatchers import notify_community_reply
 
     notify_community_reply(instance)
+
+
+@receiver(post_delete, sender=Reply)
+def decrement_discussion_stats_on_reply_delete(sender, instance, **kwargs):
+    if not instance.approved:
+        return
+    from community.services.counters import apply_reply_unapproved
+
+    apply_reply_unapproved(instance)
+
+
+@receiver(post_delete, sender=Discussion)
+def decrement_category_count_on_discussion_delete(sender, instance, **kwargs):
+    from community.services.counters import (
+        apply_category_discussion_delta,
+        is_public_discussion,
+    )
+
+    if is_public_discussion(instance):
+        apply_category_discussion_delta(instance.category_id, -1)
+
+
+@receiver(post_save, sender=Discussion)
+def sync_discussion_title_suggestion(sender, instance, **kwargs):
+    from codestar.suggestions import sync_discussion_suggestion
+
+    transaction.on_commit(lambda: sync_discussion_suggestion(instance))
+
+
+@receiver(post_delete, sender=Discussion)
+def drop_discussion_title_suggestion(sender, instance, **kwargs):
+    from codestar.suggestions import SUGGESTION_KIND_DISCUSSION, drop_suggestion
+
+    drop_suggestion(SUGGESTION_KIND_DISCUSSION, instance.pk)
+
+
+@receiver(post_save, sender=Discussion)
+@receiver(post_delete, sender=Discussion)
+@receiver(post_save, sender=Reply)
+@receiver(post_delete, sender=Reply)
+@receiver(post_save, sender=CommunityCategory)
+@receiver(post_delete, sender=CommunityCategory)
+def invalidate_community_home_stats_cache(sender, instance, **kwargs):
+    from community.selectors.stats import invalidate_community_home_stats
+
+    invalidate_community_home_stats()
@@ -0,0 +1,29 @@
+document.addEventListener('DOMContentLoaded', () => {
+  const button = document.querySelector('[data-load-more-replies]');
+  const list = document.querySelector('[data-reply-list]');
+  if (!button || !list) return;
+
+  button.addEventListener('click', async () => {
+    button.disabled = true;
+    try {
+      const url = new URL(button.dataset.url, window.location.origin);
+      url.searchParams.set('cursor', button.dataset.cursor);
+      const response = await fetch(url, {
+        headers: { Accept: 'application/json' },
+        credentials: 'same-origin',
+      });
+      if (!response.ok) throw new Error(`HTTP ${response.status}`);
+
+      const data = await response.json();
+      list.insertAdjacentHTML('beforeend', data.html);
+      if (data.next_cursor) {
+        button.dataset.cursor = data.next_cursor;
+        button.disabled = false;
+      } else {
+        button.parentElement.remove();
+      }
+    } catch (error) {
+      button.disabled = false;
+    }
+  });
+});
@@ -17,4 +17,7 @@ class CommunityHealthEndpointTests(TestCase):
     def test_health_endpoint_returns_ok(self):
         response = self.client.get(reverse('community:health'))
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.json(), {'status': 'ok', 'app': 'community'})
+        payload = response.json()
+        self.assertEqual(payload['status'], 'ok')
+        self.assertEqual(payload['app'], 'community')
+        self.assertIn('p95_ms', payload['search_latency'])
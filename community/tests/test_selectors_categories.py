@@ -1,7 +1,6 @@
 from django.contrib.auth import get_user_model
 from django.test import TestCase
 
-from community.constants import DiscussionStatus
 from community.models import CommunityCategory
 from community.selectors.categories import (
     category_exists,
@@ -10,7 +9,7 @@ from community.selectors.categories import (
     list_active_categories_with_discussion_counts,
     list_categories,
 )
-from community.services.discussions import create_discussion
+from community.services.discussions import create_discussion, hide_discussion
 
 User = get_user_model()
 
@@ -101,8 +100,7 @@ class CategoryDiscussionCountSelectorTests(TestCase):
             title='بحث مخفی',
             body='متن',
         )
-        hidden.status = DiscussionStatus.HIDDEN
-        hidden.save(update_fields=['status'])
+        hide_discussion(hidden)
 
     def test_list_active_categories_with_discussion_counts(self):
         categories = {
@@ -113,3 +111,7 @@ class CategoryDiscussionCountSelectorTests(TestCase):
         self.assertEqual(categories['immigration'], 2)
         self.assertEqual(categories['work-study'], 1)
         self.assertNotIn('inactive', categories)
+
+    def test_discussion_counts_read_only_category_rows(self):
+        with self.assertNumQueries(1):
+            list(list_active_categories_with_discussion_counts())
@@ -0,0 +1,78 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from codestar.related import text_matching
+from codestar.related.sources import prepare_related_source, source_keywords
+from community.models import CommunityCategory
+from community.selectors.related import compute_related_sidebar, get_related_sidebar
+from community.services.discussions import create_discussion, update_discussion
+
+User = get_user_model()
+
+
+class RelatedSidebarSelectorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(
+            username='sidebarauthor',
+            password='password123',
+        )
+        cls.category = CommunityCategory.objects.create(
+            name='مهاجرت',
+            slug='immigration-residency',
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.discussion = create_discussion(
+            author=self.author,
+            category=self.category,
+            title='اجاره خانه در تورنتو',
+            body='برای اجاره آپارتمان چه مدارکی لازم است؟',
+        )
+
+    def test_prepared_source_carries_keywords(self):
+        source = prepare_related_source(self.discussion)
+
+        self.assertIsNotNone(source.keywords)
+        self.assertIn('تورنتو', source.keywords)
+        self.assertEqual(source_keywords(source), list(source.keywords))
+        self.assertIs(prepare_related_source(source), source)
+
+    def test_compute_tokenises_source_once(self):
+        with mock.patch(
+            'codestar.related.text_matching.extract_search_keywords',
+            wraps=text_matching.extract_search_keywords,
+        ) as extract:
+            sidebar = compute_related_sidebar(self.discussion, limit=3)
+
+        self.assertEqual(extract.call_count, 1)
+        self.assertEqual(
+            set(sidebar),
+            {'related_ads', 'related_experts', 'related_useful_links'},
+        )
+
+    def test_cached_sidebar_served_without_queries(self):
+        get_related_sidebar(self.discussion)
+
+        with self.assertNumQueries(0):
+            get_related_sidebar(self.discussion)
+
+    def test_editing_discussion_changes_cache_key(self):
+        get_related_sidebar(self.discussion)
+        updated = update_discussion(
+            self.discussion,
+            title='کار در ونکوور',
+            body='بازار کار برنامه نویسی',
+        )
+
+        with mock.patch(
+            'community.selectors.related.compute_related_sidebar',
+            return_value={},
+        ) as compute:
+            get_related_sidebar(updated)
+
+        compute.assert_called_once()
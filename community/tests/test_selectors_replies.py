@@ -1,11 +1,14 @@
 from django.contrib.auth import get_user_model
 from django.test import TestCase
 
-from community.models import CommunityCategory
+from community.models import CommunityCategory, Reply
 from community.selectors.replies import (
     count_public_replies,
+    decode_reply_cursor,
+    encode_reply_cursor,
     list_pending_replies,
     list_public_replies,
+    list_public_replies_page,
     list_replies,
     list_replies_by_author,
 )
@@ -79,3 +82,75 @@ class ReplySelectorTests(TestCase):
             for reply in replies:
                 self.assertEqual(reply.discussion.title, self.discussion.title)
                 self.assertEqual(reply.author.username, self.other.username)
+
+
+class ReplyCursorPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(
+            username='cursorauthor',
+            password='password123',
+        )
+        cls.category = CommunityCategory.objects.create(
+            name='صفحه',
+            slug='cursor-category',
+        )
+        cls.discussion = create_discussion(
+            author=cls.author,
+            category=cls.category,
+            title='بحث طولانی',
+            body='متن',
+        )
+        cls.replies = [
+            Reply.objects.create(
+                discussion=cls.discussion,
+                author=cls.author,
+                body=f'پاسخ {index}',
+                approved=True,
+            )
+            for index in range(5)
+        ]
+        # Identical timestamps must still page deterministically by id.
+        Reply.objects.filter(pk__in=[r.pk for r in cls.replies[1:4]]).update(
+            created_on=cls.replies[1].created_on,
+        )
+        Reply.objects.create(
+            discussion=cls.discussion,
+            author=cls.author,
+            body='در انتظار',
+            approved=False,
+        )
+
+    def test_pages_cover_all_approved_replies_in_order(self):
+        seen = []
+        cursor = None
+        while True:
+            page = list_public_replies_page(self.discussion, cursor=cursor, limit=2)
+            seen.extend(reply.pk for reply in page.replies)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        self.assertEqual(seen, [reply.pk for reply in self.replies])
+
+    def test_last_page_has_no_cursor(self):
+        page = list_public_replies_page(self.discussion, limit=5)
+        self.assertEqual(len(page.replies), 5)
+        self.assertIsNone(page.next_cursor)
+
+    def test_page_attaches_parent_without_join(self):
+        with self.assertNumQueries(1):
+            page = list_public_replies_page(self.discussion, limit=3)
+            for reply in page.replies:
+                self.assertIs(reply.discussion, self.discussion)
+                self.assertEqual(reply.author.username, self.author.username)
+
+    def test_cursor_round_trip_and_rejects_garbage(self):
+        reply = self.replies[2]
+        reply.refresh_from_db()
+        self.assertEqual(
+            decode_reply_cursor(encode_reply_cursor(reply)),
+            (reply.created_on, reply.pk),
+        )
+        with self.assertRaises(ValueError):
+            decode_reply_cursor('not-a-cursor')
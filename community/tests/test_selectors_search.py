@@ -1,12 +1,16 @@
-from unittest.mock import MagicMock, patch
+from unittest import skipUnless
 
 from django.contrib.auth import get_user_model
-from django.db.models import QuerySet
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, override_settings
 
 from community.models import CommunityCategory
-from community.selectors.discussions import _public_discussions_queryset
-from community.selectors.search import search_discussions
+from community.selectors.discussions import list_discussions
+from community.selectors.search import (
+    _prefix_tsquery,
+    get_search_latency_stats,
+    search_discussions,
+)
 from community.services.discussions import create_discussion
 
 User = get_user_model()
@@ -37,82 +41,91 @@ class SearchSelectorTests(TestCase):
         )
 
     def test_icontains_search_finds_partial_match(self):
-        results = list(search_discussions('fallbackmatch'))
+        results = search_discussions('fallbackmatch')
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0].pk, self.matching.pk)
 
-    @patch('community.selectors.search.connection')
-    def test_postgresql_fts_returns_results_when_matches_exist(self, mock_connection):
-        mock_connection.vendor = 'postgresql'
-        fts_queryset = MagicMock()
-        fts_queryset.exists.return_value = True
-        fts_queryset.__iter__.return_value = iter([self.matching])
+    def test_search_runs_a_single_query(self):
+        with self.assertNumQueries(1):
+            results = search_discussions('fallback')
+            self.assertEqual([item.pk for item in results], [self.matching.pk])
 
-        base_queryset = _public_discussions_queryset()
+    def test_category_filter_applies(self):
+        other = CommunityCategory.objects.create(name='دیگر', slug='other-cat')
+        self.assertEqual(search_discussions('fallbackmatch', category=other), [])
 
-        def fake_annotate(*args, **kwargs):
-            annotated = MagicMock()
-            annotated.filter.return_value.order_by.return_value = fts_queryset
-            return annotated
+    @override_settings(COMMUNITY_SEARCH_MAX_RESULTS=1)
+    def test_results_are_capped(self):
+        self.assertEqual(len(search_discussions('بحث')), 1)
 
-        with patch.object(
-            QuerySet,
-            'annotate',
-            side_effect=fake_annotate,
-        ):
-            results = list(search_discussions('fallbackmatch'))
+    @override_settings(COMMUNITY_SEARCH_MAX_RESULTS=1)
+    def test_empty_query_is_not_capped(self):
+        self.assertEqual(search_discussions('').count(), 2)
 
-        self.assertEqual(len(results), 1)
-        self.assertEqual(results[0].pk, self.matching.pk)
-        fts_queryset.exists.assert_called_once()
+    def test_prefix_tsquery_normalizes_and_ands_words(self):
+        self.assertEqual(_prefix_tsquery('كار  Visa'), 'کار:* & visa:*')
+        self.assertEqual(_prefix_tsquery('!!'), '')
 
-    @patch('community.selectors.search.connection')
-    def test_postgresql_fallback_finds_low_rank_partial_match(self, mock_connection):
-        mock_connection.vendor = 'postgresql'
-        fts_queryset = MagicMock()
-        fts_queryset.exists.return_value = False
+    def test_search_latency_is_recorded(self):
+        before = get_search_latency_stats()['samples']
+        search_discussions('fallbackmatch')
+        stats = get_search_latency_stats()
+        self.assertGreaterEqual(stats['samples'], min(before + 1, 200))
+        self.assertIsNotNone(stats['p95_ms'])
 
-        def fake_annotate(self, *args, **kwargs):
-            annotated = MagicMock()
-            annotated.filter.return_value.order_by.return_value = fts_queryset
-            return annotated
 
-        with patch.object(QuerySet, 'annotate', fake_annotate):
-            results = list(search_discussions('fallbackmatch'))
+class SearchVectorLoadingTests(TestCase):
+    def test_listing_querysets_defer_search_vector(self):
+        author = User.objects.create_user(username='deferauthor', password='pw')
+        category = CommunityCategory.objects.create(name='تعویق', slug='defer-cat')
+        create_discussion(author=author, category=category, title='عنوان', body='متن')
+
+        discussion = list_discussions().get()
+
+        self.assertIn('search_vector', discussion.get_deferred_fields())
 
-        self.assertEqual(len(results), 1)
-        self.assertEqual(results[0].pk, self.matching.pk)
 
-    @patch('community.selectors.search.connection')
-    def test_postgresql_fts_does_not_duplicate_fallback_results(self, mock_connection):
-        mock_connection.vendor = 'postgresql'
-        fts_queryset = _public_discussions_queryset().filter(pk=self.matching.pk)
-        fts_queryset = fts_queryset.annotate(
-            rank=MagicMock(),
+@skipUnless(connection.vendor == 'postgresql', 'search_vector is PostgreSQL-only')
+class PostgresSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(
+            username='pgsearchauthor',
+            password='password123',
+        )
+        cls.category = CommunityCategory.objects.create(
+            name='پستگرس',
+            slug='pg-search-cat',
+        )
+        # Arabic kaf/yeh, a ZWNJ and an Arabic presentation-form yeh (U+FEF1).
+        cls.variant = create_discussion(
+            author=cls.author,
+            category=cls.category,
+            title='\u0643\u0627\u0631\u064A\u0627\u0628\u06CC \u0645\u06CC\u200C\u062E\u0648\u0627\u0647\u0645',
+            body='\u0633\u0648\u0626\uFEF1\u062F Visa',
+        )
+        cls.other = create_discussion(
+            author=cls.author,
+            category=cls.category,
+            title='موضوع دیگر',
+            body='بدون تطابق',
         )
-        # When FTS finds a match, return it directly without also running fallback.
-        with patch.object(
-            QuerySet,
-            'annotate',
-            return_value=MagicMock(
-                filter=MagicMock(
-                    return_value=MagicMock(
-                        order_by=MagicMock(
-                            return_value=_public_discussions_queryset().filter(
-                                pk=self.matching.pk,
-                            ),
-                        ),
-                    ),
-                ),
-            ),
-        ):
-            fts_results = _public_discussions_queryset().filter(pk=self.matching.pk)
-            with patch.object(QuerySet, 'annotate') as mock_annotate:
-                mock_annotate.return_value.filter.return_value.order_by.return_value = (
-                    fts_results
-                )
-                results = list(search_discussions('fallbackmatch'))
 
-        self.assertEqual(len(results), 1)
-        pks = [discussion.pk for discussion in results]
-        self.assertEqual(len(pks), len(set(pks)))
+    def _result_ids(self, query):
+        return [item.pk for item in search_discussions(query)]
+
+    def test_trigger_fills_vector_and_prefix_matches(self):
+        self.assertEqual(self._result_ids('کاریاب'), [self.variant.pk])
+        self.assertEqual(self._result_ids('VISA'), [self.variant.pk])
+
+    def test_query_and_document_normalise_the_same_way(self):
+        # Persian-form query against Arabic-form text, and the reverse.
+        self.assertEqual(self._result_ids('کاریابی'), [self.variant.pk])
+        self.assertEqual(self._result_ids('\u0643\u0627\u0631\u064A\u0627\u0628\u06CC'), [self.variant.pk])
+        # ZWNJ in the document splits into two words, as in the query.
+        self.assertEqual(self._result_ids('می\u200cخواهم'), [self.variant.pk])
+        # NFKC folds the presentation-form yeh.
+        self.assertEqual(self._result_ids('سوئید'), [self.variant.pk])
+
+    def test_unrelated_discussion_is_not_matched(self):
+        self.assertNotIn(self.other.pk, self._result_ids('کاریاب'))
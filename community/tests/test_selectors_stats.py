@@ -3,7 +3,11 @@ from django.test import TestCase
 
 from community.constants import DiscussionStatus
 from community.models import CommunityCategory, Discussion, Reply
-from community.selectors.stats import get_community_home_stats
+from community.selectors.stats import (
+    compute_community_home_stats,
+    get_community_home_stats,
+    invalidate_community_home_stats,
+)
 from community.services.discussions import create_discussion
 
 User = get_user_model()
@@ -36,6 +40,9 @@ class CommunityHomeStatsSelectorTests(TestCase):
             body='متن بحث',
         )
 
+    def setUp(self):
+        invalidate_community_home_stats()
+
     def test_counts_public_discussions_replies_categories_and_members(self):
         Reply.objects.create(
             discussion=self.discussion,
@@ -81,3 +88,44 @@ class CommunityHomeStatsSelectorTests(TestCase):
         self.assertEqual(stats['total_discussions'], 1)
         self.assertEqual(stats['total_replies'], 0)
         self.assertEqual(stats['active_members'], 1)
+
+    def test_member_with_discussion_and_reply_counted_once(self):
+        Reply.objects.create(
+            discussion=self.discussion,
+            author=self.author,
+            body='پاسخ نویسنده',
+            approved=True,
+        )
+
+        stats = compute_community_home_stats()
+
+        self.assertEqual(stats['active_members'], 1)
+
+    def test_cached_stats_served_without_queries(self):
+        get_community_home_stats()
+
+        with self.assertNumQueries(0):
+            stats = get_community_home_stats()
+
+        self.assertEqual(stats['total_discussions'], 1)
+
+    def test_reply_and_discussion_changes_refresh_cache(self):
+        self.assertEqual(get_community_home_stats()['total_replies'], 0)
+
+        reply = Reply.objects.create(
+            discussion=self.discussion,
+            author=self.replier,
+            body='پاسخ تازه',
+            approved=True,
+        )
+        stats = get_community_home_stats()
+        self.assertEqual(stats['total_replies'], 1)
+        self.assertEqual(stats['active_members'], 2)
+
+        reply.delete()
+        self.discussion.status = DiscussionStatus.HIDDEN
+        self.discussion.save(update_fields=['status'])
+        stats = get_community_home_stats()
+        self.assertEqual(stats['total_replies'], 0)
+        self.assertEqual(stats['total_discussions'], 0)
+        self.assertEqual(stats['active_members'], 0)
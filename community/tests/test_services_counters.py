@@ -1,9 +1,23 @@
+from io import StringIO
+from types import SimpleNamespace
+
+from django.contrib.admin.sites import AdminSite
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase
 from django.utils import timezone
 
+from community.admin import ReplyAdmin
 from community.models import CommunityCategory, Discussion, Reply
-from community.services.counters import recalculate_discussion_stats
+from community.services.counters import (
+    apply_reply_approved,
+    apply_reply_unapproved,
+    find_category_counter_drift,
+    find_discussion_counter_drift,
+    recalculate_discussion_stats,
+    repair_category_counters,
+    repair_discussion_counters,
+)
 from community.services.discussions import create_discussion
 
 User = get_user_model()
@@ -80,3 +94,215 @@ class CounterServiceTests(TestCase):
         updated = recalculate_discussion_stats(discussion)
         self.assertEqual(updated.reply_count, 2)
         self.assertEqual(updated.last_activity_at, latest.created_on)
+
+
+class IncrementalCounterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(
+            username='deltaauthor',
+            password='password123',
+        )
+        cls.category = CommunityCategory.objects.create(
+            name='زندگی',
+            slug='زندگی',
+        )
+
+    def _discussion(self, title='دلتا'):
+        return create_discussion(
+            author=self.author,
+            category=self.category,
+            title=title,
+            body='متن',
+        )
+
+    def _reply(self, discussion, *, approved, created_on=None):
+        reply = Reply.objects.create(
+            discussion=discussion,
+            author=self.author,
+            body='پاسخ',
+            approved=approved,
+        )
+        if created_on is not None:
+            Reply.objects.filter(pk=reply.pk).update(created_on=created_on)
+            reply.refresh_from_db()
+        return reply
+
+    def test_approve_increments_discussion_and_author_without_recount(self):
+        discussion = self._discussion()
+        reply = self._reply(discussion, approved=True)
+        # One UPDATE for the discussion row, one for the author's trust row.
+        with self.assertNumQueries(2):
+            apply_reply_approved(reply)
+        discussion.refresh_from_db()
+        self.assertEqual(discussion.reply_count, 1)
+        self.assertEqual(discussion.last_activity_at, reply.created_on)
+
+    def test_approve_older_reply_keeps_latest_activity(self):
+        discussion = self._discussion()
+        latest = self._reply(discussion, approved=True)
+        apply_reply_approved(latest)
+        older = self._reply(
+            discussion,
+            approved=True,
+            created_on=timezone.now() - timezone.timedelta(days=3),
+        )
+        apply_reply_approved(older)
+        discussion.refresh_from_db()
+        self.assertEqual(discussion.reply_count, 2)
+        self.assertEqual(discussion.last_activity_at, latest.created_on)
+
+    def test_unapprove_latest_falls_back_to_previous_reply(self):
+        discussion = self._discussion()
+        older = self._reply(
+            discussion,
+            approved=True,
+            created_on=timezone.now() - timezone.timedelta(days=1),
+        )
+        latest = self._reply(discussion, approved=True)
+        recalculate_discussion_stats(discussion)
+
+        Reply.objects.filter(pk=latest.pk).update(approved=False)
+        apply_reply_unapproved(latest)
+        discussion.refresh_from_db()
+        self.assertEqual(discussion.reply_count, 1)
+        self.assertEqual(discussion.last_activity_at, older.created_on)
+
+    def test_unapprove_last_reply_falls_back_to_created_on(self):
+        discussion = self._discussion()
+        reply = self._reply(discussion, approved=True)
+        recalculate_discussion_stats(discussion)
+
+        Reply.objects.filter(pk=reply.pk).update(approved=False)
+        apply_reply_unapproved(reply)
+        discussion.refresh_from_db()
+        self.assertEqual(discussion.reply_count, 0)
+        self.assertEqual(discussion.last_activity_at, discussion.created_on)
+
+    def test_decrement_never_goes_negative(self):
+        discussion = self._discussion()
+        reply = self._reply(discussion, approved=False)
+        apply_reply_unapproved(reply)
+        discussion.refresh_from_db()
+        self.assertEqual(discussion.reply_count, 0)
+
+    def _admin_save(self, reply, changed_data):
+        request = RequestFactory().post('/admin/community/reply/')
+        request.user = self.author
+        ReplyAdmin(Reply, AdminSite()).save_model(
+            request,
+            reply,
+            SimpleNamespace(changed_data=changed_data),
+            change=True,
+        )
+
+    def test_admin_approval_toggle_moves_counters(self):
+        discussion = self._discussion()
+        reply = self._reply(discussion, approved=False)
+
+        reply.approved = True
+        self._admin_save(reply, ['approved'])
+        discussion.refresh_from_db()
+        self.assertEqual(discussion.reply_count, 1)
+        self.assertEqual(reply.reviewed_by, self.author)
+
+        reply.approved = False
+        self._admin_save(reply, ['approved'])
+        discussion.refresh_from_db()
+        self.assertEqual(discussion.reply_count, 0)
+
+    def test_admin_approve_then_delete_leaves_no_drift(self):
+        discussion = self._discussion()
+        reply = self._reply(discussion, approved=False)
+        reply.approved = True
+        self._admin_save(reply, ['approved'])
+
+        reply.delete()
+        discussion.refresh_from_db()
+        self.assertEqual(discussion.reply_count, 0)
+        self.assertEqual(find_discussion_counter_drift(), [])
+
+    def test_admin_moving_approved_reply_updates_both_discussions(self):
+        source = self._discussion('مبدا')
+        target = self._discussion('مقصد')
+        reply = self._reply(source, approved=True)
+        apply_reply_approved(reply)
+
+        reply.discussion = target
+        self._admin_save(reply, ['discussion'])
+        source.refresh_from_db()
+        target.refresh_from_db()
+        self.assertEqual(source.reply_count, 0)
+        self.assertEqual(target.reply_count, 1)
+
+    def test_deleting_approved_reply_decrements(self):
+        discussion = self._discussion()
+        keep = self._reply(
+            discussion,
+            approved=True,
+            created_on=timezone.now() - timezone.timedelta(hours=2),
+        )
+        doomed = self._reply(discussion, approved=True)
+        recalculate_discussion_stats(discussion)
+
+        doomed.delete()
+        discussion.refresh_from_db()
+        self.assertEqual(discussion.reply_count, 1)
+        self.assertEqual(discussion.last_activity_at, keep.created_on)
+
+    def test_repair_reports_and_fixes_drift(self):
+        healthy = self._discussion('سالم')
+        drifted = self._discussion('ناسازگار')
+        self._reply(drifted, approved=True)
+        Discussion.objects.filter(pk=drifted.pk).update(reply_count=7)
+
+        report = repair_discussion_counters(dry_run=True)
+        self.assertEqual(report['drifted'], 1)
+        self.assertEqual(report['repaired'], 0)
+        self.assertEqual(report['drift'][0].discussion_id, drifted.pk)
+        self.assertEqual(report['drift'][0].stored_reply_count, 7)
+        self.assertEqual(report['drift'][0].actual_reply_count, 1)
+
+        summary = repair_discussion_counters()
+        self.assertEqual(summary['repaired'], 1)
+        drifted.refresh_from_db()
+        self.assertEqual(drifted.reply_count, 1)
+        self.assertEqual(find_discussion_counter_drift(), [])
+        healthy.refresh_from_db()
+        self.assertEqual(healthy.reply_count, 0)
+
+    def test_repair_command_dry_run_leaves_rows(self):
+        discussion = self._discussion()
+        Discussion.objects.filter(pk=discussion.pk).update(reply_count=3)
+        out = StringIO()
+        call_command('repair_discussion_counters', '--dry-run', stdout=out)
+        self.assertIn('1 drifted', out.getvalue())
+        discussion.refresh_from_db()
+        self.assertEqual(discussion.reply_count, 3)
+
+    def test_repair_category_counters_fixes_drift(self):
+        self._discussion()
+        CommunityCategory.objects.filter(pk=self.category.pk).update(
+            public_discussion_count=9,
+        )
+
+        report = repair_category_counters(dry_run=True)
+        self.assertEqual(report['drifted'], 1)
+        self.assertEqual(report['drift'][0].stored_discussion_count, 9)
+        self.assertEqual(report['drift'][0].actual_discussion_count, 1)
+
+        summary = repair_category_counters()
+        self.assertEqual(summary['repaired'], 1)
+        self.category.refresh_from_db()
+        self.assertEqual(self.category.public_discussion_count, 1)
+        self.assertEqual(find_category_counter_drift(), [])
+
+    def test_repair_category_command_dry_run_leaves_rows(self):
+        CommunityCategory.objects.filter(pk=self.category.pk).update(
+            public_discussion_count=4,
+        )
+        out = StringIO()
+        call_command('repair_category_counters', '--dry-run', stdout=out)
+        self.assertIn('1 drifted', out.getvalue())
+        self.category.refresh_from_db()
+        self.assertEqual(self.category.public_discussion_count, 4)
@@ -1,5 +1,10 @@
+from types import SimpleNamespace
+
+from django.contrib.admin.sites import AdminSite
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
 
 from community.constants import DiscussionStatus
 from community.exceptions import (
@@ -8,13 +13,16 @@ from community.exceptions import (
     InvalidDiscussionStateError,
     ValidationError,
 )
-from community.models import CommunityCategory
+from community.admin import DiscussionAdmin
+from community.models import CommunityCategory, Discussion
 from community.services.discussions import (
     close_discussion,
     create_discussion,
+    hide_discussion,
     reopen_discussion,
     restore_discussion,
     soft_delete_discussion,
+    unhide_discussion,
     update_discussion,
 )
 
@@ -205,3 +213,173 @@ class DiscussionServiceTests(TestCase):
         )
         with self.assertRaises(InvalidDiscussionStateError):
             restore_discussion(discussion)
+
+    def _category_count(self, category):
+        category.refresh_from_db()
+        return category.public_discussion_count
+
+    def test_public_discussion_count_follows_lifecycle(self):
+        discussion = create_discussion(
+            author=self.author,
+            category=self.category,
+            title='شمارش',
+            body='متن',
+        )
+        self.assertEqual(self._category_count(self.category), 1)
+
+        close_discussion(discussion, closed_by=self.staff)
+        self.assertEqual(self._category_count(self.category), 1)
+
+        hide_discussion(discussion)
+        self.assertEqual(self._category_count(self.category), 0)
+        unhide_discussion(discussion)
+        self.assertEqual(self._category_count(self.category), 1)
+
+        soft_delete_discussion(discussion, deleted_by=self.staff)
+        self.assertEqual(self._category_count(self.category), 0)
+        restore_discussion(discussion)
+        self.assertEqual(self._category_count(self.category), 1)
+
+        discussion.delete()
+        self.assertEqual(self._category_count(self.category), 0)
+
+    def test_moving_category_moves_public_count(self):
+        other = CommunityCategory.objects.create(name='کار', slug='کار')
+        discussion = create_discussion(
+            author=self.author,
+            category=self.category,
+            title='جابجایی',
+            body='متن',
+        )
+        update_discussion(discussion, category=other)
+        self.assertEqual(self._category_count(self.category), 0)
+        self.assertEqual(self._category_count(other), 1)
+
+    def test_stale_copies_count_a_hide_once(self):
+        discussion = create_discussion(
+            author=self.author,
+            category=self.category,
+            title='دوبار',
+            body='متن',
+        )
+        first = Discussion.objects.get(pk=discussion.pk)
+        second = Discussion.objects.get(pk=discussion.pk)
+        hide_discussion(first)
+        hide_discussion(second)
+        self.assertEqual(second.status, DiscussionStatus.HIDDEN)
+        self.assertEqual(self._category_count(self.category), 0)
+
+        unhide_discussion(first)
+        close_discussion(first, closed_by=self.staff)
+        # The stale copy still says "open"; the stored row is closed.
+        close_discussion(second, closed_by=self.staff)
+        self.assertEqual(self._category_count(self.category), 1)
+
+    def test_stale_copy_cannot_close_hidden_discussion(self):
+        discussion = create_discussion(
+            author=self.author,
+            category=self.category,
+            title='پنهان',
+            body='متن',
+        )
+        stale = Discussion.objects.get(pk=discussion.pk)
+        hide_discussion(discussion)
+        with self.assertRaises(InvalidDiscussionStateError):
+            close_discussion(stale, closed_by=self.staff)
+        self.assertEqual(self._category_count(self.category), 0)
+
+    def test_unhide_rejects_visible_discussion(self):
+        discussion = create_discussion(
+            author=self.author,
+            category=self.category,
+            title='نمایان',
+            body='متن',
+        )
+        with self.assertRaises(InvalidDiscussionStateError):
+            unhide_discussion(discussion)
+
+
+class DiscussionAdminCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create_user(
+            username='adminstaff',
+            password='password123',
+            is_staff=True,
+        )
+        cls.category = CommunityCategory.objects.create(
+            name='مسکن',
+            slug='مسکن',
+        )
+        cls.other = CommunityCategory.objects.create(
+            name='تحصیل',
+            slug='تحصیل',
+        )
+
+    def setUp(self):
+        self.admin = DiscussionAdmin(Discussion, AdminSite())
+        self.request = RequestFactory().post('/admin/community/discussion/')
+        self.request.user = self.staff
+        self.request.session = {}
+        self.request._messages = FallbackStorage(self.request)
+
+    def _count(self, category):
+        category.refresh_from_db()
+        return category.public_discussion_count
+
+    def _save(self, discussion, change=True):
+        self.admin.save_model(
+            self.request,
+            discussion,
+            SimpleNamespace(changed_data=[]),
+            change=change,
+        )
+
+    def test_admin_edits_move_category_counts(self):
+        discussion = Discussion(
+            author=self.staff,
+            category=self.category,
+            title='ادمین',
+            slug='admin-discussion',
+            body='متن',
+            last_activity_at=timezone.now(),
+        )
+        self._save(discussion, change=False)
+        self.assertEqual(self._count(self.category), 1)
+
+        discussion.status = DiscussionStatus.HIDDEN
+        self._save(discussion)
+        self.assertEqual(self._count(self.category), 0)
+
+        discussion.status = DiscussionStatus.OPEN
+        discussion.category = self.other
+        self._save(discussion)
+        self.assertEqual(self._count(self.category), 0)
+        self.assertEqual(self._count(self.other), 1)
+
+        discussion.is_deleted = True
+        self._save(discussion)
+        self.assertEqual(self._count(self.other), 0)
+
+    def test_admin_actions_and_bulk_delete_keep_counts(self):
+        discussions = [
+            create_discussion(
+                author=self.staff,
+                category=self.category,
+                title=f'گروهی {index}',
+                body='متن',
+            )
+            for index in range(3)
+        ]
+        queryset = Discussion.objects.filter(pk__in=[d.pk for d in discussions])
+        self.assertEqual(self._count(self.category), 3)
+
+        self.admin.hide_discussions(self.request, queryset)
+        self.admin.hide_discussions(self.request, queryset)
+        self.assertEqual(self._count(self.category), 0)
+
+        self.admin.unhide_discussions(self.request, queryset)
+        self.assertEqual(self._count(self.category), 3)
+
+        self.admin.delete_queryset(self.request, queryset.exclude(pk=discussions[0].pk))
+        self.assertEqual(self._count(self.category), 1)
@@ -0,0 +1,100 @@
+import math
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from community.models import CommunityCategory, Discussion, Reply
+from community.selectors.discussions import list_hot_discussions
+from community.services.discussions import create_discussion
+from community.services.hot import (
+    combine_hot_weights,
+    hot_event_weight,
+    recompute_hot_scores,
+)
+from community.services.replies import approve_reply, reject_reply
+
+User = get_user_model()
+
+
+class HotWeightTests(SimpleTestCase):
+    def test_weight_doubles_every_half_life(self):
+        now = timezone.now()
+        later = now + timezone.timedelta(hours=12)
+        self.assertAlmostEqual(
+            hot_event_weight(later) - hot_event_weight(now),
+            math.log(2),
+        )
+
+    def test_combine_is_log_sum_exp(self):
+        self.assertAlmostEqual(combine_hot_weights([0.0, 0.0]), math.log(2))
+        self.assertAlmostEqual(combine_hot_weights([900.0, 900.0]), 900 + math.log(2))
+
+
+class HotScoreServiceTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(
+            username='hotauthor',
+            password='password123',
+        )
+        cls.category = CommunityCategory.objects.create(
+            name='داغ',
+            slug='hot-cat',
+        )
+
+    def _discussion(self, title):
+        return create_discussion(
+            author=self.author,
+            category=self.category,
+            title=title,
+            body='متن',
+        )
+
+    def _pending_reply(self, discussion):
+        return Reply.objects.create(
+            discussion=discussion,
+            author=self.author,
+            body='پاسخ',
+            approved=False,
+        )
+
+    def test_replies_move_discussion_up_the_hot_list(self):
+        quiet = self._discussion('آرام')
+        busy = self._discussion('پرتحرک')
+        newest = self._discussion('تازه')
+        for _ in range(3):
+            approve_reply(reply=self._pending_reply(busy), reviewer=self.author)
+
+        slugs = [item.slug for item in list_hot_discussions()]
+        self.assertEqual(slugs[0], busy.slug)
+        self.assertEqual(slugs[1:], [newest.slug, quiet.slug])
+
+    def test_incremental_score_matches_recompute(self):
+        discussion = self._discussion('همسان')
+        first = self._pending_reply(discussion)
+        second = self._pending_reply(discussion)
+        approve_reply(reply=first, reviewer=self.author)
+        approve_reply(reply=second, reviewer=self.author)
+        reject_reply(reply=first, reviewer=self.author)
+        discussion.refresh_from_db()
+        incremental = discussion.hot_score
+
+        recompute_hot_scores()
+        discussion.refresh_from_db()
+        self.assertAlmostEqual(discussion.hot_score, incremental, places=6)
+
+    def test_recompute_command_repairs_scores(self):
+        discussion = self._discussion('تعمیر')
+        Discussion.objects.filter(pk=discussion.pk).update(hot_score=-1.0)
+        out = StringIO()
+        call_command('recompute_hot_scores', stdout=out)
+        self.assertIn('1 discussions recomputed', out.getvalue())
+        discussion.refresh_from_db()
+        self.assertAlmostEqual(
+            discussion.hot_score,
+            hot_event_weight(discussion.created_on),
+            places=6,
+        )
@@ -2,9 +2,11 @@ from django.contrib.auth import get_user_model
 from django.test import TestCase, override_settings
 from django.utils import timezone
 
+from blog.models import UserTrust
 from community.constants import ModerationReason
 from community.models import CommunityCategory, Discussion, Reply
 from community.services.moderation import should_auto_approve_reply
+from community.services.replies import approve_reply, reject_reply
 
 User = get_user_model()
 
@@ -68,3 +70,30 @@ class ModerationServiceTests(TestCase):
         approved, reason = should_auto_approve_reply(self.user, 'هنوز جدید')
         self.assertFalse(approved)
         self.assertEqual(reason, ModerationReason.NEW_USER)
+
+    @override_settings(COMMUNITY_TRUST_REPLY_COUNT=1)
+    def test_trust_lookup_does_not_recount_replies(self):
+        should_auto_approve_reply(self.user, 'پاسخ')
+        with self.assertNumQueries(1):
+            approved, reason = should_auto_approve_reply(self.user, 'پاسخ')
+        self.assertFalse(approved)
+        self.assertEqual(reason, ModerationReason.NEW_USER)
+
+    @override_settings(COMMUNITY_TRUST_REPLY_COUNT=1)
+    def test_approve_and_reject_maintain_trust_count(self):
+        should_auto_approve_reply(self.user, 'پاسخ')
+        reply = Reply.objects.create(
+            discussion=self.discussion,
+            author=self.user,
+            body='پاسخ',
+            approved=False,
+        )
+
+        approve_reply(reply=reply, reviewer=self.user)
+        trust = UserTrust.objects.get(user=self.user)
+        self.assertEqual(trust.approved_reply_count, 1)
+        self.assertEqual(should_auto_approve_reply(self.user, 'پاسخ'), (True, None))
+
+        reject_reply(reply=reply, reviewer=self.user)
+        trust.refresh_from_db()
+        self.assertEqual(trust.approved_reply_count, 0)
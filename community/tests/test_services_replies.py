@@ -10,7 +10,7 @@ from community.exceptions import (
     UnauthorizedAuthorError,
     ValidationError,
 )
-from community.models import CommunityCategory
+from community.models import CommunityCategory, Reply
 from community.services.discussions import (
     close_discussion,
     create_discussion,
@@ -221,3 +221,38 @@ class ReplyServiceTests(TestCase):
         discussion.refresh_from_db()
         self.assertEqual(discussion.reply_count, 1)
         self.assertTrue(second.approved)
+
+    @override_settings(COMMUNITY_TRUST_REPLY_COUNT=5)
+    def test_approving_a_stale_copy_counts_the_reply_once(self):
+        discussion = self._create_open_discussion()
+        reply = create_reply(
+            discussion=discussion,
+            author=self.other,
+            body='در انتظار',
+        )
+        stale_copy = Reply.objects.get(pk=reply.pk)
+
+        approve_reply(reply=reply, reviewer=self.reviewer)
+        approve_reply(reply=stale_copy, reviewer=self.other)
+
+        discussion.refresh_from_db()
+        self.assertEqual(discussion.reply_count, 1)
+        self.assertEqual(Reply.objects.get(pk=reply.pk).reviewed_by, self.reviewer)
+
+    @override_settings(COMMUNITY_TRUST_REPLY_COUNT=0)
+    def test_rejecting_a_stale_copy_decrements_once(self):
+        discussion = self._create_open_discussion()
+        reply = create_reply(
+            discussion=discussion,
+            author=self.other,
+            body='تایید شده',
+        )
+        stale_copy = Reply.objects.get(pk=reply.pk)
+
+        reject_reply(reply=reply, reviewer=self.reviewer)
+        approve_reply(reply=reply, reviewer=self.reviewer)
+        reject_reply(reply=stale_copy, reviewer=self.reviewer)
+        reject_reply(reply=stale_copy, reviewer=self.reviewer)
+
+        discussion.refresh_from_db()
+        self.assertEqual(discussion.reply_count, 0)
@@ -1,4 +1,5 @@
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase, override_settings
 from django.urls import reverse
 
@@ -45,6 +46,11 @@ class CommunityViewTests(TestCase):
             body='به دنبال مشاور مهاجرت هستم.',
         )
 
+    def setUp(self):
+        # The related sidebar is cached per discussion version; these tests
+        # add ads/experts/links to the same shared discussion.
+        cache.clear()
+
     def _align_discussion_for_migration_expert(self):
         self.category.slug = 'immigration-residency'
         self.category.save(update_fields=['slug'])
@@ -594,6 +600,21 @@ class CommunityViewTests(TestCase):
         self.assertContains(response, self.discussion.title)
         self.assertNotContains(response, 'community-search-guidance')
 
+    @override_settings(COMMUNITY_SEARCH_MAX_RESULTS=1)
+    def test_community_search_says_when_results_are_cut_off(self):
+        create_discussion(
+            author=self.author,
+            category=self.category,
+            title='تجربه مهاجرت کاری',
+            body='مراحل را توضیح دهید.',
+        )
+        response = self.client.get(reverse('community:search'), {'q': 'مهاجرت'})
+        self.assertTrue(response.context['results_truncated'])
+        self.assertContains(response, 'community-search-truncated')
+
+        response = self.client.get(reverse('community:search'))
+        self.assertFalse(response.context['results_truncated'])
+
     @override_settings(COMMUNITY_TRUST_REPLY_COUNT=0)
     def test_approved_reply_notifies_discussion_author(self):
         self.client.login(username='replier', password='password123')
@@ -687,3 +708,64 @@ class CommunityViewTests(TestCase):
             'برای ارسال سؤال یا پاسخ، ابتدا حساب کاربری خود را تکمیل و تأیید کنید.',
         )
         self.assertNotContains(response, 'ثبت پاسخ')
+
+
+@override_settings(COMMUNITY_REPLY_PAGE_SIZE=2)
+class DiscussionReplyPaginationViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(
+            username='pageauthor',
+            password='password123',
+        )
+        cls.category = CommunityCategory.objects.create(
+            name='صفحه‌بندی',
+            slug='paging',
+        )
+        cls.discussion = create_discussion(
+            author=cls.author,
+            category=cls.category,
+            title='بحث با پاسخ زیاد',
+            body='متن',
+        )
+        for index in range(3):
+            Reply.objects.create(
+                discussion=cls.discussion,
+                author=cls.author,
+                body=f'پاسخ شماره {index}',
+                approved=True,
+            )
+
+    def test_detail_renders_first_page_and_load_more_button(self):
+        response = self.client.get(
+            reverse('community:discussion_detail', args=[self.discussion.slug]),
+        )
+
+        self.assertEqual(len(response.context['replies']), 2)
+        self.assertContains(response, 'پاسخ شماره 1')
+        self.assertNotContains(response, 'پاسخ شماره 2')
+        self.assertContains(response, 'data-load-more-replies')
+
+    def test_replies_endpoint_returns_next_page_fragment(self):
+        detail = self.client.get(
+            reverse('community:discussion_detail', args=[self.discussion.slug]),
+        )
+        cursor = detail.context['replies_next_cursor']
+
+        response = self.client.get(
+            reverse('community:discussion_replies', args=[self.discussion.slug]),
+            {'cursor': cursor},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['count'], 1)
+        self.assertIsNone(data['next_cursor'])
+        self.assertIn('پاسخ شماره 2', data['html'])
+
+    def test_replies_endpoint_rejects_bad_cursor(self):
+        response = self.client.get(
+            reverse('community:discussion_replies', args=[self.discussion.slug]),
+            {'cursor': '@@@'},
+        )
+        self.assertEqual(response.status_code, 400)
@@ -6,6 +6,7 @@ from community.views.discussions import (
     discussion_create,
     discussion_detail,
     discussion_list,
+    discussion_replies,
     discussion_reply,
 )
 from community.views.health import health_check
@@ -18,6 +19,11 @@ urlpatterns = [
     path('discussions/', discussion_list, name='discussion_list'),
     path('discussions/create/', discussion_create, name='discussion_create'),
     path('discussions/<str:slug>/', discussion_detail, name='discussion_detail'),
+    path(
+        'discussions/<str:slug>/replies/',
+        discussion_replies,
+        name='discussion_replies',
+    ),
     path('discussions/<str:slug>/reply/', discussion_reply, name='discussion_reply'),
     path('discussions/<str:slug>/close/', discussion_close, name='discussion_close'),
     path('search/', community_search, name='search'),
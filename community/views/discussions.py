@@ -2,8 +2,9 @@ from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.paginator import Paginator
-from django.http import Http404
+from django.http import Http404, JsonResponse
 from django.shortcuts import redirect, render
+from django.template.loader import render_to_string
 from django.urls import reverse
 from urllib.parse import urlencode
 from django.views.decorators.http import require_http_methods, require_POST
@@ -25,15 +26,17 @@ from community.selectors.discussions import (
     list_discussions_by_category,
     list_open_discussions,
 )
-from community.selectors.replies import list_public_replies
+from community.selectors.related import get_related_sidebar
+from community.selectors.replies import list_public_replies_page
 from community.selectors.stats import get_community_home_stats
-from ads.selectors.related import get_related_ads
-from experts.selectors.related import get_related_experts
-from related_links.selectors.related import get_related_links
 from community.services.discussions import close_discussion, create_discussion
 from community.services.replies import create_reply
 
 
+def _reply_page_size() -> int:
+    return getattr(settings, 'COMMUNITY_REPLY_PAGE_SIZE', 50)
+
+
 def _paginate(request, queryset):
     page_size = getattr(settings, 'COMMUNITY_LIST_PAGE_SIZE', 12)
     paginator = Paginator(queryset, page_size)
@@ -89,6 +92,8 @@ def discussion_list(request):
 
     if sort == 'newest':
         queryset = queryset.order_by('-created_on')
+    elif sort == 'hot':
+        queryset = queryset.order_by('-hot_score')
 
     page_obj = _paginate(request, queryset)
     search_query = request.GET.get('q', '').strip()
@@ -116,19 +121,18 @@ def discussion_detail(request, slug):
     except Exception as exc:
         raise Http404('Discussion not found.') from exc
 
-    replies = list_public_replies(discussion)
-    related_ads = get_related_ads(discussion, limit=3)
-    related_experts = get_related_experts(discussion, limit=3)
-    related_useful_links = get_related_links(discussion, limit=3)
+    reply_page = list_public_replies_page(discussion, limit=_reply_page_size())
+    sidebar = get_related_sidebar(discussion, limit=3)
     return render(
         request,
         'community/discussion_detail.html',
         {
             'discussion': discussion,
-            'replies': replies,
-            'related_ads': related_ads,
-            'related_experts': related_experts,
-            'related_useful_links': related_useful_links,
+            'replies': reply_page.replies,
+            'replies_next_cursor': reply_page.next_cursor,
+            'related_ads': sidebar['related_ads'],
+            'related_experts': sidebar['related_experts'],
+            'related_useful_links': sidebar['related_useful_links'],
             'reply_form': ReplyCreateForm(),
             'can_reply': can_reply(request.user, discussion),
             'can_close': can_close(request.user, discussion),
@@ -141,6 +145,37 @@ def discussion_detail(request, slug):
     )
 
 
+@require_http_methods(['GET'])
+def discussion_replies(request, slug):
+    """JSON fragment with the next page of replies for "load more"."""
+    try:
+        discussion = get_discussion_by_slug(slug)
+    except Exception as exc:
+        raise Http404('Discussion not found.') from exc
+
+    try:
+        reply_page = list_public_replies_page(
+            discussion,
+            cursor=request.GET.get('cursor') or None,
+            limit=_reply_page_size(),
+        )
+    except ValueError:
+        return JsonResponse({'error': 'invalid cursor'}, status=400)
+
+    html = render_to_string(
+        'community/includes/reply_items.html',
+        {'replies': reply_page.replies},
+        request=request,
+    )
+    return JsonResponse(
+        {
+            'html': html,
+            'count': len(reply_page.replies),
+            'next_cursor': reply_page.next_cursor,
+        }
+    )
+
+
 @login_required
 @site_verified_required
 @ratelimit(
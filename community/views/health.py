@@ -1,6 +1,14 @@
 from django.http import JsonResponse
 
+from community.selectors.search import get_search_latency_stats
+
 
 def health_check(request):
-    """Placeholder endpoint to verify the Community URL namespace is mounted."""
-    return JsonResponse({'status': 'ok', 'app': 'community'})
+    """Verify the Community URL namespace is mounted and report search latency."""
+    return JsonResponse(
+        {
+            'status': 'ok',
+            'app': 'community',
+            'search_latency': get_search_latency_stats(),
+        }
+    )
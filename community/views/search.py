@@ -3,7 +3,7 @@ from django.views.decorators.http import require_http_methods
 from django.shortcuts import render
 
 from community.selectors.categories import get_category_by_slug, list_active_categories
-from community.selectors.search import search_discussions
+from community.selectors.search import search_discussions, search_result_limit
 from community.views.discussions import _paginate
 
 
@@ -19,8 +19,9 @@ def community_search(request):
         except Exception:
             selected_category = None
 
-    queryset = search_discussions(query, category=selected_category)
-    page_obj = _paginate(request, queryset)
+    results = search_discussions(query, category=selected_category)
+    page_obj = _paginate(request, results)
+    result_limit = search_result_limit()
 
     return render(
         request,
@@ -32,5 +33,7 @@ def community_search(request):
             'categories': list_active_categories(),
             'selected_category': selected_category,
             'total_count': page_obj.paginator.count,
+            'result_limit': result_limit,
+            'results_truncated': bool(query) and len(results) >= result_limit,
         },
     )
@@ -1,6 +1,8 @@
 from django.contrib import admin
 
+from content_ai.batch import admin as batch_admin  # noqa: F401
 from content_ai.evaluation import admin as evaluation_admin  # noqa: F401
+from content_ai.telemetry import admin as telemetry_admin  # noqa: F401
 from content_ai.models import AIJob
 
 
@@ -9,7 +11,9 @@ class AIJobAdmin(admin.ModelAdmin):
     list_display = (
         'id',
         'job_type',
+        'operation',
         'status',
+        'attempts',
         'provider',
         'model_name',
         'prompt_version',
@@ -21,6 +25,7 @@ class AIJobAdmin(admin.ModelAdmin):
     )
     list_filter = (
         'job_type',
+        'operation',
         'status',
         'provider',
         'created_at',
@@ -38,6 +43,9 @@ class AIJobAdmin(admin.ModelAdmin):
         'updated_at',
         'started_at',
         'completed_at',
+        'claimed_by',
+        'lease_expires_at',
+        'attempts',
     )
     raw_id_fields = ('created_by',)
     date_hierarchy = 'created_at'
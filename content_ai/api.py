@@ -6,9 +6,12 @@ import json
 import logging
 
 from django.http import JsonResponse
-from django.views.decorators.http import require_POST
+from django.views.decorators.http import require_GET, require_POST
 
+from content_ai.batch.service import batch_progress, submit_batch
+from content_ai.constants import AIJobOperation
 from content_ai.editorial.service import EditorialAIService
+from content_ai.models import AIJob
 from content_ai.providers.exceptions import (
     GenerationError,
     ProviderConfigurationError,
@@ -16,9 +19,12 @@ from content_ai.providers.exceptions import (
 )
 from content_ai.serializers import (
     SerializationError,
+    parse_batch_request,
     parse_editorial_draft_request,
+    serialize_batch_item,
     serialize_editorial_draft,
     serialize_error,
+    serialize_job,
     serialize_telemetry,
 )
 
@@ -94,3 +100,80 @@ def create_editorial_draft(request):
         )
 
     return JsonResponse(serialize_editorial_draft(draft), status=200)
+
+
+def _access_error(request):
+    """Return a 401/403 response for non-staff callers, else None."""
+    if not request.user.is_authenticated:
+        return JsonResponse(
+            serialize_error('unauthorized', 'Authentication required.'),
+            status=401,
+        )
+    if not _user_can_access_internal_api(request.user):
+        return JsonResponse(
+            serialize_error('forbidden', 'Staff access required.'),
+            status=403,
+        )
+    return None
+
+
+@require_POST
+def submit_generation_batch(request):
+    """
+    POST /api/internal/ai/batch/
+
+    Stage a list of ad or post generation requests as one batch job for the
+    ``run_ai_jobs`` worker. Results land in ``BatchGenerationItem`` rows for
+    review; live Ads and Posts are never modified.
+    """
+    denied = _access_error(request)
+    if denied is not None:
+        return denied
+    try:
+        payload = json.loads(request.body.decode('utf-8') or '{}')
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return JsonResponse(
+            serialize_error('invalid_json', 'Request body must be valid JSON.'),
+            status=400,
+        )
+    try:
+        kwargs = parse_batch_request(payload)
+        job = submit_batch(created_by=request.user, **kwargs)
+    except (SerializationError, ValueError) as exc:
+        return JsonResponse(
+            serialize_error('validation_error', str(exc)),
+            status=400,
+        )
+    return JsonResponse(
+        {'job': serialize_job(job), 'items': len(kwargs['requests'])},
+        status=202,
+    )
+
+
+@require_GET
+def generation_batch_status(request, job_id):
+    """
+    GET /api/internal/ai/batch/<job_id>/
+
+    Progress counts and the staged results of one batch job.
+    """
+    denied = _access_error(request)
+    if denied is not None:
+        return denied
+    job = AIJob.objects.filter(
+        pk=job_id,
+        operation=AIJobOperation.BATCH_GENERATION,
+    ).first()
+    if job is None:
+        return JsonResponse(
+            serialize_error('not_found', 'Batch job not found.'),
+            status=404,
+        )
+    return JsonResponse(
+        {
+            'job': serialize_job(job),
+            'progress': batch_progress(job),
+            'items': [serialize_batch_item(item) for item in job.batch_items.all()],
+        },
+        status=200,
+    )
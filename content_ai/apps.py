@@ -1,7 +1,24 @@
+import logging
+
 from django.apps import AppConfig
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
 
 
 class ContentAiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'content_ai'
     verbose_name = 'Content AI'
+
+    def ready(self):
+        from content_ai import checks  # noqa: F401 — registers system checks
+
+        if not getattr(settings, 'CONTENT_AI_PREWARM_PROMPTS', False):
+            return
+        from content_ai.prompts.cache import prewarm_prompt_cache
+
+        try:
+            prewarm_prompt_cache()
+        except Exception:  # noqa: BLE001 — builds load lazily instead
+            logger.exception('Could not prewarm the prompt cache')
@@ -0,0 +1,6 @@
+"""Batch generation of ad and post copy into a reviewable staging table.
+
+The API lives in ``content_ai.batch.service``. It is not re-exported here
+because ``content_ai.models`` imports ``content_ai.batch.models`` and the
+service imports the job queue.
+"""
@@ -0,0 +1,80 @@
+"""Admin review of batch-generated copy (staging rows only)."""
+
+from django.contrib import admin, messages
+
+from content_ai.batch.models import BatchGenerationItem
+from content_ai.batch.service import review_item
+from content_ai.constants import BatchItemStatus
+
+
+@admin.register(BatchGenerationItem)
+class BatchGenerationItemAdmin(admin.ModelAdmin):
+    list_display = (
+        'job',
+        'position',
+        'task',
+        'source_ref',
+        'status',
+        'review_status',
+        'attempts',
+        'provider',
+        'model_name',
+        'prompt_version',
+        'reviewed_by',
+        'updated_at',
+    )
+    list_filter = (
+        'task',
+        'status',
+        'review_status',
+        'provider',
+        'prompt_version',
+    )
+    search_fields = ('source_ref', 'error', 'job__id')
+    ordering = ('-job', 'position')
+    raw_id_fields = ('job', 'reviewed_by')
+    readonly_fields = (
+        'job',
+        'position',
+        'task',
+        'request',
+        'source_ref',
+        'status',
+        'attempts',
+        'content',
+        'error',
+        'provider',
+        'model_name',
+        'prompt_version',
+        'telemetry',
+        'review_status',
+        'reviewed_by',
+        'reviewed_at',
+        'created_at',
+        'updated_at',
+    )
+    actions = ('approve_items', 'reject_items')
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.action(description='Approve selected results')
+    def approve_items(self, request, queryset):
+        approved = 0
+        for item in queryset.filter(status=BatchItemStatus.COMPLETED):
+            review_item(item, approved=True, user=request.user)
+            approved += 1
+        skipped = queryset.count() - approved
+        self.message_user(request, f'Approved {approved} results.')
+        if skipped:
+            self.message_user(
+                request,
+                f'Skipped {skipped} items that have no completed result.',
+                level=messages.WARNING,
+            )
+
+    @admin.action(description='Reject selected results')
+    def reject_items(self, request, queryset):
+        for item in queryset:
+            review_item(item, approved=False, user=request.user)
+        self.message_user(request, f'Rejected {queryset.count()} results.')
@@ -0,0 +1,73 @@
+"""Staging rows for batch-generated copy awaiting editorial review."""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.db import models
+
+from content_ai.constants import BatchItemStatus, BatchReviewStatus
+
+
+class BatchGenerationItem(models.Model):
+    """
+    One request of a batch ``AIJob`` and its generated copy.
+
+    Results stay here until an editor reviews them; nothing is written to
+    live ``Ad`` or ``Post`` rows. ``source_ref`` (e.g. ``ads.Ad:42``) only
+    records which row the copy was generated for.
+    """
+
+    job = models.ForeignKey(
+        'content_ai.AIJob',
+        on_delete=models.CASCADE,
+        related_name='batch_items',
+    )
+    position = models.PositiveIntegerField()
+    task = models.CharField(max_length=64)
+    request = models.JSONField(default=dict, blank=True)
+    source_ref = models.CharField(max_length=100, blank=True)
+    status = models.CharField(
+        max_length=20,
+        choices=BatchItemStatus.choices,
+        default=BatchItemStatus.PENDING,
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    content = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    provider = models.CharField(max_length=100, blank=True)
+    model_name = models.CharField(max_length=100, blank=True)
+    prompt_version = models.CharField(max_length=50, blank=True)
+    telemetry = models.JSONField(null=True, blank=True)
+    review_status = models.CharField(
+        max_length=20,
+        choices=BatchReviewStatus.choices,
+        default=BatchReviewStatus.UNREVIEWED,
+    )
+    reviewed_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='content_ai_batch_reviews',
+    )
+    reviewed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['job', 'position']
+        verbose_name = 'AI batch item'
+        verbose_name_plural = 'AI batch items'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['job', 'position'],
+                name='content_ai_batch_item_position',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['job', 'status']),
+            models.Index(fields=['review_status', '-created_at']),
+        ]
+
+    def __str__(self):
+        return f'Batch item {self.job_id}#{self.position} ({self.status})'
@@ -0,0 +1,352 @@
+"""
+Batch generation of ad and post copy.
+
+``submit_batch`` stores one ``BatchGenerationItem`` per request and
+enqueues a ``batch_generation`` ``AIJob`` for the ``run_ai_jobs`` worker.
+``BatchRunner`` then generates the pending items in waves on a bounded
+thread pool. Worker threads only call the provider; all database writes
+happen on the runner's thread.
+
+Rate limits: provider calls run at batch priority, so the rate-limit
+scheduler sheds them before interactive editor calls. When a wave hits a
+rate limit (HTTP 429, ``RateLimitError`` or an open circuit breaker), the
+throttled items go back to the front of the queue, the wave size is halved
+and the runner backs off with jitter, or for the provider's retry-after
+hint when that is longer. Each clean wave grows the wave size by one again,
+up to the configured concurrency.
+
+After every wave the job's ``result`` is updated with progress counts and
+its lease is renewed, so a worker that dies mid-batch only loses the wave
+in flight; the next claim resumes with the items still pending.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import fields
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from content_ai.batch.models import BatchGenerationItem
+from content_ai.constants import (
+    AIGenerationTask,
+    AIJobOperation,
+    AIJobType,
+    BatchItemStatus,
+    BatchReviewStatus,
+)
+from content_ai.jobs.queue import DEFAULT_LEASE_SECONDS, checkpoint_job, enqueue_job
+from content_ai.jobs.runners import JobOutcome
+from content_ai.providers.resilience import RetryPolicy, is_rate_limited
+from content_ai.providers.scheduler import (
+    PRIORITY_BATCH,
+    provider_priority,
+    retry_after_hint,
+)
+from content_ai.schemas.requests import AdGenerationRequest, PostGenerationRequest
+from content_ai.serializers import serialize_telemetry
+
+logger = logging.getLogger(__name__)
+
+BATCH_TASKS = {
+    AIGenerationTask.POST_GENERATION: (PostGenerationRequest, AIJobType.POST),
+    AIGenerationTask.AD_GENERATION: (AdGenerationRequest, AIJobType.AD),
+}
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_MAX_ITEMS = 1000
+DEFAULT_MAX_ITEM_ATTEMPTS = 3
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def request_from_data(task, data):
+    """Return the canonical request schema for ``task`` built from ``data``."""
+    if task not in BATCH_TASKS:
+        raise ValueError(f'Batch generation does not support task {task!r}.')
+    request_class = BATCH_TASKS[task][0]
+    if isinstance(data, request_class):
+        return data
+    if not isinstance(data, dict):
+        raise ValueError(f'{request_class.__name__} data must be an object.')
+    names = {field.name for field in fields(request_class)}
+    unknown = set(data) - names
+    if unknown:
+        raise ValueError(
+            f"Unknown {request_class.__name__} fields: {', '.join(sorted(unknown))}."
+        )
+    return request_class(
+        **{
+            name: '' if value is None else str(value)
+            for name, value in data.items()
+        }
+    )
+
+
+def _request_to_data(request) -> dict:
+    return {field.name: getattr(request, field.name) for field in fields(request)}
+
+
+def submit_batch(
+    task,
+    requests,
+    *,
+    source_refs=None,
+    created_by=None,
+    provider_name=None,
+    use_cache=True,
+    concurrency=None,
+):
+    """
+    Stage ``requests`` as one batch job and enqueue it.
+
+    ``requests`` are ``AdGenerationRequest`` / ``PostGenerationRequest``
+    objects (or dicts of their fields) matching ``task``. ``source_refs``
+    optionally labels each request with the row it was generated for.
+    Returns the pending ``AIJob``.
+    """
+    requests = [request_from_data(task, request) for request in requests]
+    if not requests:
+        raise ValueError('A batch needs at least one request.')
+    max_items = int(_setting('CONTENT_AI_BATCH_MAX_ITEMS', DEFAULT_MAX_ITEMS))
+    if len(requests) > max_items:
+        raise ValueError(f'A batch holds at most {max_items} requests.')
+    source_refs = list(source_refs or [])
+    if source_refs and len(source_refs) != len(requests):
+        raise ValueError('source_refs must match the number of requests.')
+
+    with transaction.atomic():
+        job = enqueue_job(
+            AIJobOperation.BATCH_GENERATION,
+            payload={
+                'task': str(task),
+                'provider_name': provider_name or '',
+                'use_cache': bool(use_cache),
+                'concurrency': concurrency,
+            },
+            job_type=BATCH_TASKS[task][1],
+            created_by=created_by,
+        )
+        BatchGenerationItem.objects.bulk_create(
+            [
+                BatchGenerationItem(
+                    job=job,
+                    position=position,
+                    task=str(task),
+                    request=_request_to_data(request),
+                    source_ref=str(source_refs[position] if source_refs else '')[
+                        :100
+                    ],
+                )
+                for position, request in enumerate(requests)
+            ]
+        )
+    return job
+
+
+def batch_progress(job) -> dict:
+    """Item counts for ``job`` by status, plus ``total``."""
+    counts = {status: 0 for status in BatchItemStatus.values}
+    for row in job.batch_items.values('status').annotate(count=Count('id')):
+        counts[row['status']] = row['count']
+    counts['total'] = sum(counts.values())
+    return counts
+
+
+def review_item(item, *, approved: bool, user=None):
+    """Approve or reject a staged result. Live Ad/Post rows are not touched."""
+    if approved and item.status != BatchItemStatus.COMPLETED:
+        raise ValueError('Only completed batch items can be approved.')
+    item.review_status = (
+        BatchReviewStatus.APPROVED if approved else BatchReviewStatus.REJECTED
+    )
+    item.reviewed_by = user
+    item.reviewed_at = timezone.now()
+    item.save(update_fields=['review_status', 'reviewed_by', 'reviewed_at', 'updated_at'])
+    return item
+
+
+def _json_content(content):
+    if content is None or isinstance(content, (str, dict, list)):
+        return content
+    return str(content)
+
+
+class BatchRunner:
+    """Generate the pending items of one claimed batch ``AIJob``."""
+
+    def __init__(
+        self,
+        job,
+        *,
+        service=None,
+        concurrency: int | None = None,
+        max_item_attempts: int | None = None,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS,
+        backoff: RetryPolicy | None = None,
+        sleep=time.sleep,
+    ):
+        from content_ai.services.generation import ContentGenerationService
+
+        payload = job.payload or {}
+        self.job = job
+        self.task = payload.get('task') or ''
+        self.provider_name = payload.get('provider_name') or None
+        self.use_cache = payload.get('use_cache', True)
+        self.concurrency = max(
+            1,
+            int(
+                concurrency
+                or payload.get('concurrency')
+                or _setting('CONTENT_AI_BATCH_CONCURRENCY', DEFAULT_CONCURRENCY)
+            ),
+        )
+        self.max_item_attempts = max(
+            1,
+            int(
+                max_item_attempts
+                or _setting(
+                    'CONTENT_AI_BATCH_MAX_ITEM_ATTEMPTS',
+                    DEFAULT_MAX_ITEM_ATTEMPTS,
+                )
+            ),
+        )
+        self.lease_seconds = lease_seconds
+        self.backoff = backoff or RetryPolicy(base_delay=1.0, max_delay=60.0)
+        self.sleep = sleep
+        self.service = service or ContentGenerationService()
+        self.window = self.concurrency
+        self._last_completed = None
+
+    def run(self) -> JobOutcome:
+        if self.task not in BATCH_TASKS:
+            raise ValueError(f'Batch job has unsupported task {self.task!r}.')
+        pending = list(
+            self.job.batch_items.filter(status=BatchItemStatus.PENDING).order_by(
+                'position'
+            )
+        )
+        throttled_waves = 0
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency,
+            thread_name_prefix='content-ai-batch',
+        ) as pool:
+            while pending:
+                wave, pending = pending[: self.window], pending[self.window :]
+                throttled, retry_after = self._run_wave(pool, wave)
+                if throttled:
+                    pending = throttled + pending
+                    throttled_waves += 1
+                    self.window = max(1, self.window // 2)
+                else:
+                    throttled_waves = 0
+                    self.window = min(self.concurrency, self.window + 1)
+                if not checkpoint_job(
+                    self.job,
+                    batch_progress(self.job),
+                    lease_seconds=self.lease_seconds,
+                ):
+                    logger.warning(
+                        'Batch job %s lost its claim; stopping with %s items pending.',
+                        self.job.pk,
+                        len(pending),
+                    )
+                    break
+                if throttled:
+                    self.sleep(
+                        max(self.backoff.delay(throttled_waves), retry_after)
+                    )
+        return self._outcome()
+
+    def _generate(self, item):
+        with provider_priority(PRIORITY_BATCH):
+            return self.service.generate(
+                self.task,
+                request_from_data(self.task, item.request),
+                provider_name=self.provider_name,
+                use_cache=self.use_cache,
+            )
+
+    def _run_wave(self, pool, wave) -> tuple[list, float]:
+        """
+        Run ``wave`` concurrently.
+
+        Returns the items to retry after backoff and the longest
+        retry-after hint among them (0 when there is none).
+        """
+        futures = {
+            pool.submit(contextvars.copy_context().run, self._generate, item): item
+            for item in wave
+        }
+        throttled = []
+        retry_after = 0.0
+        for future in as_completed(futures):
+            item = futures[future]
+            item.attempts += 1
+            try:
+                result = future.result()
+            except Exception as exc:  # noqa: BLE001 — recorded on the item row
+                if is_rate_limited(exc) and item.attempts < self.max_item_attempts:
+                    item.save(update_fields=['attempts', 'updated_at'])
+                    throttled.append(item)
+                    retry_after = max(retry_after, retry_after_hint(exc) or 0.0)
+                else:
+                    self._fail(item, exc)
+            else:
+                self._complete(item, result)
+        return sorted(throttled, key=lambda item: item.position), retry_after
+
+    def _complete(self, item, result) -> None:
+        telemetry = serialize_telemetry(result.telemetry)
+        item.status = BatchItemStatus.COMPLETED
+        item.content = _json_content(result.content)
+        item.error = ''
+        item.provider = (result.provider or '')[:100]
+        item.model_name = ((telemetry or {}).get('model') or '')[:100]
+        item.prompt_version = ((result.metadata or {}).get('prompt_version') or '')[
+            :50
+        ]
+        item.telemetry = telemetry
+        item.save(
+            update_fields=[
+                'status',
+                'attempts',
+                'content',
+                'error',
+                'provider',
+                'model_name',
+                'prompt_version',
+                'telemetry',
+                'updated_at',
+            ]
+        )
+        self._last_completed = item
+
+    def _fail(self, item, exc) -> None:
+        logger.warning(
+            'Batch job %s item %s failed: %s',
+            self.job.pk,
+            item.position,
+            exc,
+        )
+        item.status = BatchItemStatus.FAILED
+        item.error = str(exc) or type(exc).__name__
+        item.telemetry = serialize_telemetry(getattr(exc, 'telemetry', None))
+        item.save(update_fields=['status', 'attempts', 'error', 'telemetry', 'updated_at'])
+
+    def _outcome(self) -> JobOutcome:
+        last = self._last_completed
+        return JobOutcome(
+            result=batch_progress(self.job),
+            provider=last.provider if last else '',
+            model_name=last.model_name if last else '',
+            prompt_version=last.prompt_version if last else '',
+        )
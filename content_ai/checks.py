@@ -0,0 +1,38 @@
+"""System checks for Content AI settings."""
+
+from django.core.checks import Error, register
+
+from content_ai.providers.resilience import breakers_enabled
+from content_ai.providers.scheduler import rate_limits_enabled
+from content_ai.providers.shared_cache import unshared_cache_reason
+
+
+@register()
+def check_provider_state_cache(app_configs, **kwargs):
+    """Refuse breaker or rate-limit state on a cache that workers do not share."""
+    features = (
+        (
+            breakers_enabled(),
+            'CONTENT_AI_CIRCUIT_BREAKER_CACHE',
+            'CONTENT_AI_CIRCUIT_BREAKER_ENABLED',
+            'content_ai.E001',
+        ),
+        (
+            rate_limits_enabled(),
+            'CONTENT_AI_RATE_LIMIT_CACHE',
+            'CONTENT_AI_RATE_LIMIT_ENABLED',
+            'content_ai.E002',
+        ),
+    )
+    errors = []
+    for enabled, cache_setting, flag, error_id in features:
+        reason = unshared_cache_reason(cache_setting) if enabled else None
+        if reason:
+            errors.append(
+                Error(
+                    reason,
+                    hint=f'Set REDIS_URL, or turn off {flag}.',
+                    id=error_id,
+                )
+            )
+    return errors
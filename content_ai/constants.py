@@ -13,6 +13,26 @@ class AIJobStatus(models.TextChoices):
     FAILED = 'failed', 'Failed'
 
 
+class AIJobOperation(models.TextChoices):
+    """Background runners the ``run_ai_jobs`` worker knows how to execute."""
+
+    WORKSPACE_DRAFT = 'workspace_draft', 'Workspace draft'
+    FEATURED_IMAGE = 'featured_image', 'Featured image'
+    BATCH_GENERATION = 'batch_generation', 'Batch generation'
+
+
+class BatchItemStatus(models.TextChoices):
+    PENDING = 'pending', 'Pending'
+    COMPLETED = 'completed', 'Completed'
+    FAILED = 'failed', 'Failed'
+
+
+class BatchReviewStatus(models.TextChoices):
+    UNREVIEWED = 'unreviewed', 'Unreviewed'
+    APPROVED = 'approved', 'Approved'
+    REJECTED = 'rejected', 'Rejected'
+
+
 class AIGenerationTask(models.TextChoices):
     """Extendable task identifiers for ContentGenerationService."""
 
@@ -49,7 +49,16 @@ class EditorialAIService:
         goal: str | None = None,
         style: str | None = None,
         article_length: str | None = None,
+        on_delta=None,
+        use_cache: bool = True,
     ) -> EditorialDraft:
+        """
+        Generate a two-pass draft.
+
+        ``on_delta(pass_name, text)`` optionally receives streamed text for
+        the ``headline_lead`` and ``body`` passes as it is produced.
+        ``use_cache=False`` forces fresh provider calls.
+        """
         source_title = (title or '').strip()
         language = (language or '').strip() or 'fa'
         resolved_type = resolve_content_type(content_type)
@@ -85,6 +94,8 @@ class EditorialAIService:
                 ),
             ),
             provider_name=provider_name,
+            on_delta=self._pass_delta(on_delta, 'headline_lead'),
+            use_cache=use_cache,
         )
         head = parse_structured_draft(head_result.content, fallback_title='')
         persian_title = (head.get('title') or '').strip()
@@ -110,6 +121,8 @@ class EditorialAIService:
                 ),
             ),
             provider_name=provider_name,
+            on_delta=self._pass_delta(on_delta, 'body'),
+            use_cache=use_cache,
         )
         return self._to_draft(
             source_title=source_title,
@@ -126,6 +139,12 @@ class EditorialAIService:
             template_id=profile.resolved_template_id(),
         )
 
+    @staticmethod
+    def _pass_delta(on_delta, pass_name):
+        if on_delta is None:
+            return None
+        return lambda delta: on_delta(pass_name, delta)
+
     def _pass_instructions(
         self,
         pass_rules: str,
@@ -0,0 +1,24 @@
+"""Background execution of queued ``AIJob`` rows."""
+
+from content_ai.jobs.queue import (
+    checkpoint_job,
+    claim_next_job,
+    complete_job,
+    enqueue_job,
+    fail_job,
+    renew_lease,
+    run_job,
+)
+from content_ai.jobs.runners import JOB_RUNNERS, JobOutcome
+
+__all__ = [
+    'JOB_RUNNERS',
+    'JobOutcome',
+    'checkpoint_job',
+    'claim_next_job',
+    'complete_job',
+    'enqueue_job',
+    'fail_job',
+    'renew_lease',
+    'run_job',
+]
@@ -0,0 +1,211 @@
+"""
+Database-backed queue for ``AIJob`` rows.
+
+Views enqueue a job and return its id; the ``run_ai_jobs`` worker claims
+pending rows with ``SELECT ... FOR UPDATE SKIP LOCKED`` (PostgreSQL) and
+holds them under a lease. A worker that dies mid-job leaves a ``running``
+row whose lease expires; the next claim picks it up again until
+``AI_JOB_MAX_ATTEMPTS`` is reached.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from content_ai.constants import AIJobStatus, AIJobType
+from content_ai.jobs.runners import JOB_RUNNERS
+from content_ai.models import AIJob
+from content_ai.telemetry.generation_metrics import metrics_user
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_SECONDS = 300
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+def _max_attempts() -> int:
+    return int(getattr(settings, 'AI_JOB_MAX_ATTEMPTS', DEFAULT_MAX_ATTEMPTS))
+
+
+def enqueue_job(
+    operation: str,
+    *,
+    payload: dict,
+    job_type: str = AIJobType.POST,
+    created_by=None,
+) -> AIJob:
+    if operation not in JOB_RUNNERS:
+        raise ValueError(f'Unknown AI job operation: {operation!r}')
+    return AIJob.objects.create(
+        job_type=job_type,
+        operation=operation,
+        payload=payload,
+        created_by=created_by,
+    )
+
+
+def claim_next_job(
+    worker_id: str,
+    *,
+    lease_seconds: int = DEFAULT_LEASE_SECONDS,
+    job_id: int | None = None,
+) -> AIJob | None:
+    """
+    Claim the oldest runnable job for ``worker_id``, or return None.
+
+    Runnable means pending, or running with an expired lease. Jobs whose
+    lease expired too often are marked failed instead of being retried.
+    ``job_id`` restricts the claim to that one job.
+    """
+    while True:
+        now = timezone.now()
+        with transaction.atomic():
+            queryset = AIJob.objects.select_for_update(skip_locked=True)
+            if job_id is not None:
+                queryset = queryset.filter(pk=job_id)
+            job = (
+                queryset.exclude(operation='')
+                .filter(
+                    Q(status=AIJobStatus.PENDING)
+                    | Q(status=AIJobStatus.RUNNING, lease_expires_at__lt=now)
+                )
+                .order_by('created_at', 'pk')
+                .first()
+            )
+            if job is None:
+                return None
+            if job.attempts >= _max_attempts():
+                job.status = AIJobStatus.FAILED
+                job.error = f'Abandoned after {job.attempts} expired leases.'
+                job.completed_at = now
+                job.lease_expires_at = None
+                job.save(
+                    update_fields=[
+                        'status',
+                        'error',
+                        'completed_at',
+                        'lease_expires_at',
+                        'updated_at',
+                    ]
+                )
+                continue
+            job.status = AIJobStatus.RUNNING
+            job.claimed_by = worker_id
+            job.lease_expires_at = now + timedelta(seconds=lease_seconds)
+            job.attempts += 1
+            job.started_at = job.started_at or now
+            job.save(
+                update_fields=[
+                    'status',
+                    'claimed_by',
+                    'lease_expires_at',
+                    'attempts',
+                    'started_at',
+                    'updated_at',
+                ]
+            )
+            return job
+
+
+def checkpoint_job(
+    job: AIJob,
+    result: dict,
+    *,
+    lease_seconds: int = DEFAULT_LEASE_SECONDS,
+) -> bool:
+    """
+    Store partial progress on a running job and renew its lease.
+
+    Returns False when ``job`` lost its claim; the caller should stop.
+    """
+    now = timezone.now()
+    return bool(
+        AIJob.objects.filter(
+            pk=job.pk,
+            status=AIJobStatus.RUNNING,
+            claimed_by=job.claimed_by,
+        ).update(
+            result=result,
+            lease_expires_at=now + timedelta(seconds=lease_seconds),
+            updated_at=now,
+        )
+    )
+
+
+def renew_lease(
+    job: AIJob,
+    *,
+    lease_seconds: int = DEFAULT_LEASE_SECONDS,
+) -> bool:
+    """Extend a running job's lease; False when ``job`` lost its claim."""
+    now = timezone.now()
+    return bool(
+        AIJob.objects.filter(
+            pk=job.pk,
+            status=AIJobStatus.RUNNING,
+            claimed_by=job.claimed_by,
+        ).update(
+            lease_expires_at=now + timedelta(seconds=lease_seconds),
+            updated_at=now,
+        )
+    )
+
+
+def _finish(job: AIJob, **fields) -> bool:
+    """Write final fields only if ``job`` still holds its claim."""
+    updated = AIJob.objects.filter(
+        pk=job.pk,
+        status=AIJobStatus.RUNNING,
+        claimed_by=job.claimed_by,
+    ).update(
+        completed_at=timezone.now(),
+        lease_expires_at=None,
+        updated_at=timezone.now(),
+        **fields,
+    )
+    if not updated:
+        logger.warning(
+            'AIJob %s finished after losing its claim (worker=%s); result dropped.',
+            job.pk,
+            job.claimed_by,
+        )
+    return bool(updated)
+
+
+def complete_job(job: AIJob, outcome) -> bool:
+    return _finish(
+        job,
+        status=AIJobStatus.COMPLETED,
+        result=outcome.result,
+        telemetry=outcome.telemetry,
+        provider=outcome.provider[:100],
+        model_name=outcome.model_name[:100],
+        prompt_version=outcome.prompt_version[:50],
+        error='',
+    )
+
+
+def fail_job(job: AIJob, error: str) -> bool:
+    return _finish(job, status=AIJobStatus.FAILED, error=error)
+
+
+def run_job(job: AIJob) -> bool:
+    """Execute a claimed job and store its outcome; returns True on success."""
+    runner = JOB_RUNNERS.get(job.operation)
+    if runner is None:
+        fail_job(job, f'No runner for operation {job.operation!r}.')
+        return False
+    try:
+        with metrics_user(job.created_by):
+            outcome = runner(job)
+    except Exception as exc:  # noqa: BLE001 — recorded on the job row
+        logger.exception('AIJob %s (%s) failed', job.pk, job.operation)
+        fail_job(job, str(exc) or type(exc).__name__)
+        return False
+    return complete_job(job, outcome)
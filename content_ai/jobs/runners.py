@@ -0,0 +1,133 @@
+"""Runners executed by the ``run_ai_jobs`` worker, keyed by job operation."""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+
+from content_ai.constants import AIJobOperation
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between lease renewals while a workspace draft streams.
+LEASE_RENEW_SECONDS = 60
+
+
+@dataclass
+class JobOutcome:
+    """JSON-safe result of one runner call, stored on the ``AIJob`` row."""
+
+    result: dict
+    telemetry: dict | None = None
+    provider: str = ''
+    model_name: str = ''
+    prompt_version: str = ''
+
+
+def _load_workspace_session(job):
+    from content_ai.workspace.store import session_from_dict
+
+    return session_from_dict(job.payload.get('session') or {})
+
+
+def _workspace_result(job, session, **extra) -> dict:
+    # base_fingerprint lets the poll view refuse a result whose editor
+    # session changed after the job was queued.
+    return {
+        'session': session.to_dict(),
+        'base_fingerprint': job.payload.get('base_fingerprint') or '',
+        **extra,
+    }
+
+
+def _lease_renewer(job):
+    """
+    ``on_delta`` callback renewing ``job``'s lease while provider output streams.
+
+    A slow two-pass draft can outlive the claim lease. Renewing from the
+    runner's own thread, as ``BatchRunner`` does after each wave, keeps
+    another worker from reclaiming and re-running it. Providers that cannot
+    stream do not call it, so their drafts rely on the lease alone.
+    """
+    from content_ai.jobs.queue import renew_lease
+
+    last_renewed = time.monotonic()
+
+    def on_delta(pass_name, text):
+        nonlocal last_renewed
+        if time.monotonic() - last_renewed < LEASE_RENEW_SECONDS:
+            return
+        last_renewed = time.monotonic()
+        if not renew_lease(job):
+            logger.warning('AIJob %s lost its claim while drafting.', job.pk)
+
+    return on_delta
+
+
+def run_workspace_draft(job) -> JobOutcome:
+    """Generate a full workspace draft from the session snapshot in the payload."""
+    from content_ai.workspace.services import WorkspaceService
+
+    session = _load_workspace_session(job)
+    options = job.payload.get('options') or {}
+    WorkspaceService().generate_draft(
+        session,
+        title=options.get('title') or '',
+        category=options.get('category') or '',
+        instructions=options.get('instructions') or '',
+        provider_name=options.get('provider_name') or None,
+        article_length=options.get('article_length'),
+        use_cache=options.get('use_cache', True),
+        on_delta=_lease_renewer(job),
+    )
+    telemetry = session.metadata.get('last_telemetry') or None
+    generation = session.metadata.get('generation') or {}
+    return JobOutcome(
+        result=_workspace_result(job, session),
+        telemetry=telemetry,
+        provider=(telemetry or {}).get('provider') or '',
+        model_name=(telemetry or {}).get('model') or '',
+        prompt_version=generation.get('prompt_version') or '',
+    )
+
+
+def run_featured_image(job) -> JobOutcome:
+    """Generate (or regenerate) the featured image for the session snapshot."""
+    from content_ai.workspace.services import WorkspaceService
+
+    service = WorkspaceService()
+    session = _load_workspace_session(job)
+    options = job.payload.get('options') or {}
+    report = service.generate_featured_image(
+        session,
+        prompt=options.get('prompt'),
+        image_style=options.get('image_style'),
+        provider_name=options.get('provider_name') or None,
+        regenerate=bool(options.get('regenerate')),
+    )
+    report = report or {}
+    return JobOutcome(
+        result=_workspace_result(job, session, featured_image=report),
+        telemetry={
+            'provider': report.get('provider') or '',
+            'model': report.get('model') or '',
+            'status': report.get('status') or '',
+        },
+        provider=report.get('provider') or '',
+        model_name=report.get('model') or '',
+    )
+
+
+def run_batch_generation(job) -> JobOutcome:
+    """Generate the pending items of a batch job into its staging rows."""
+    from content_ai.batch.service import BatchRunner
+
+    return BatchRunner(job).run()
+
+
+JOB_RUNNERS = {
+    AIJobOperation.WORKSPACE_DRAFT: run_workspace_draft,
+    AIJobOperation.FEATURED_IMAGE: run_featured_image,
+    AIJobOperation.BATCH_GENERATION: run_batch_generation,
+}
@@ -0,0 +1,50 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from content_ai.config.ai_engine import DEFAULT_PROMPT_VERSION, DEFAULT_STYLE
+from content_ai.prompts.builders import PromptBuilder
+from content_ai.prompts.cache import load_bundle
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare prompt assembly that reads and validates modules on every '
+        'call with cached PromptBuilder builds.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--prompt-version', default=DEFAULT_PROMPT_VERSION)
+        parser.add_argument('--style', default=DEFAULT_STYLE)
+        parser.add_argument('--iterations', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        version = options['prompt_version']
+        style = options['style']
+        iterations = max(1, options['iterations'])
+        builder = PromptBuilder()
+        user_prompt = 'Write a short housing update.'
+
+        started = time.perf_counter()
+        for _ in range(iterations):
+            prompt = load_bundle(builder.validator, version, style).assemble(
+                user_prompt
+            )
+            builder.validator.validate_assembled_prompt(prompt)
+        fresh_seconds = time.perf_counter() - started
+
+        builder.build(version=version, style=style, user_prompt=user_prompt)
+        started = time.perf_counter()
+        for _ in range(iterations):
+            builder.build(version=version, style=style, user_prompt=user_prompt)
+        cached_seconds = time.perf_counter() - started
+
+        fresh_us = fresh_seconds / iterations * 1_000_000
+        cached_us = cached_seconds / iterations * 1_000_000
+        self.stdout.write(
+            self.style.NOTICE(
+                f'Prompt {version}/{style}, {iterations} builds: '
+                f'uncached {fresh_us:.2f}us/build, cached {cached_us:.2f}us/build '
+                f'({iterations / cached_seconds:,.0f} builds/s).'
+            )
+        )
@@ -0,0 +1,43 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from content_ai.providers.pool import ProviderPool
+from content_ai.providers.registry import get_registry
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare per-call provider setup (construct + health_check) with '
+        'pooled instances and cached health status.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--provider', default='mock')
+        parser.add_argument('--iterations', type=int, default=10000)
+
+    def handle(self, *args, **options):
+        name = options['provider']
+        iterations = max(1, options['iterations'])
+        provider_cls = get_registry().get_class(name)
+
+        started = time.perf_counter()
+        for _ in range(iterations):
+            provider_cls().health_check()
+        fresh_seconds = time.perf_counter() - started
+
+        pool = ProviderPool()
+        started = time.perf_counter()
+        for _ in range(iterations):
+            pool.is_healthy(pool.get(name, provider_cls))
+        pooled_seconds = time.perf_counter() - started
+
+        fresh_us = fresh_seconds / iterations * 1_000_000
+        pooled_us = pooled_seconds / iterations * 1_000_000
+        self.stdout.write(
+            self.style.NOTICE(
+                f'Provider {name!r}, {iterations} calls: '
+                f'fresh {fresh_us:.2f}us/call, pooled {pooled_us:.2f}us/call, '
+                f'saved {fresh_us - pooled_us:.2f}us/call.'
+            )
+        )
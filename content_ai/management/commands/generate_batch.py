@@ -0,0 +1,112 @@
+import json
+import os
+import socket
+import sys
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from content_ai.batch.service import batch_progress, submit_batch
+from content_ai.constants import AIGenerationTask
+from content_ai.jobs.queue import claim_next_job, run_job
+from content_ai.telemetry.generation_metrics import get_sink
+
+TASK_ALIASES = {
+    'post': AIGenerationTask.POST_GENERATION,
+    'ad': AIGenerationTask.AD_GENERATION,
+}
+
+
+def _read_entries(path: str) -> list:
+    """Read a JSON array or JSON Lines file of request objects."""
+    if path == '-':
+        text = sys.stdin.read()
+    else:
+        try:
+            with open(path, encoding='utf-8') as handle:
+                text = handle.read()
+        except OSError as exc:
+            raise CommandError(f'Cannot read {path}: {exc}') from exc
+    text = text.strip()
+    try:
+        if text.startswith('['):
+            return json.loads(text)
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+    except json.JSONDecodeError as exc:
+        raise CommandError(f'Invalid JSON in {path}: {exc}') from exc
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate ad or post copy for a list of requests into the batch '
+        'staging table (live Ads and Posts are not modified).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('task', choices=sorted(TASK_ALIASES))
+        parser.add_argument(
+            'input',
+            help=(
+                'JSON array or JSON Lines file of request objects ("-" for '
+                'stdin). Each object may carry a "source_ref".'
+            ),
+        )
+        parser.add_argument('--provider', default='')
+        parser.add_argument('--concurrency', type=int, default=None)
+        parser.add_argument('--no-cache', action='store_true')
+        parser.add_argument('--user', default='', help='Username recorded as creator.')
+        parser.add_argument(
+            '--enqueue',
+            action='store_true',
+            help='Only enqueue the job for the run_ai_jobs worker.',
+        )
+
+    def handle(self, *args, **options):
+        created_by = None
+        if options['user']:
+            created_by = (
+                get_user_model()
+                .objects.filter(username=options['user'])
+                .first()
+            )
+            if created_by is None:
+                raise CommandError(f"Unknown user {options['user']!r}.")
+
+        requests = []
+        source_refs = []
+        for entry in _read_entries(options['input']):
+            if not isinstance(entry, dict):
+                raise CommandError('Each request must be a JSON object.')
+            entry = dict(entry)
+            source_refs.append(str(entry.pop('source_ref', '') or ''))
+            requests.append(entry)
+
+        try:
+            job = submit_batch(
+                TASK_ALIASES[options['task']],
+                requests,
+                source_refs=source_refs if any(source_refs) else None,
+                created_by=created_by,
+                provider_name=options['provider'] or None,
+                use_cache=not options['no_cache'],
+                concurrency=options['concurrency'],
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+
+        if not options['enqueue']:
+            worker_id = f'{socket.gethostname()}:{os.getpid()}'
+            claimed = claim_next_job(worker_id, job_id=job.pk)
+            if claimed is not None:
+                run_job(claimed)
+            get_sink().flush()
+            job.refresh_from_db()
+
+        progress = batch_progress(job)
+        self.stdout.write(
+            self.style.NOTICE(
+                f'Batch job {job.pk} ({job.status}): {progress["completed"]} '
+                f'completed, {progress["failed"]} failed, {progress["pending"]} '
+                f'pending of {progress["total"]}.'
+            )
+        )
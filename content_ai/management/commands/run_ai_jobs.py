@@ -0,0 +1,56 @@
+import os
+import socket
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from content_ai.jobs.queue import DEFAULT_LEASE_SECONDS, claim_next_job, run_job
+from content_ai.telemetry.generation_metrics import get_sink
+
+
+class Command(BaseCommand):
+    help = (
+        'Run queued Content AI jobs (workspace drafts, featured images, '
+        'batch generation).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Drain runnable jobs, then exit instead of polling.',
+        )
+        parser.add_argument('--poll-interval', type=float, default=2.0)
+        parser.add_argument('--lease-seconds', type=int, default=DEFAULT_LEASE_SECONDS)
+        parser.add_argument('--max-jobs', type=int, default=0)
+
+    def handle(self, *args, **options):
+        worker_id = f'{socket.gethostname()}:{os.getpid()}'
+        processed = 0
+        failed = 0
+        while True:
+            close_old_connections()
+            job = claim_next_job(worker_id, lease_seconds=options['lease_seconds'])
+            if job is None:
+                if options['once']:
+                    break
+                get_sink().flush_if_due()
+                time.sleep(options['poll_interval'])
+                continue
+            if not run_job(job):
+                failed += 1
+            processed += 1
+            # A job may leave a broken connection behind; drop it before
+            # writing metrics rows.
+            close_old_connections()
+            get_sink().flush_if_due()
+            if options['max_jobs'] and processed >= options['max_jobs']:
+                break
+        close_old_connections()
+        get_sink().flush()
+        self.stdout.write(
+            self.style.NOTICE(
+                f'AI jobs: {processed} processed, {failed} failed (worker {worker_id}).'
+            )
+        )
@@ -0,0 +1,21 @@
+"""Request middleware for Content AI."""
+
+from content_ai.telemetry.generation_metrics import get_sink, metrics_user
+
+
+class GenerationMetricsMiddleware:
+    """
+    Attribute generation metrics to ``request.user`` and flush due batches.
+
+    Must come after ``AuthenticationMiddleware``. The user is only resolved
+    when a generation is actually recorded.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with metrics_user(getattr(request, 'user', None)):
+            response = self.get_response(request)
+        get_sink().flush_if_due()
+        return response
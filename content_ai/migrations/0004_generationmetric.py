@@ -0,0 +1,43 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('content_ai', '0003_aijob_queue_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GenerationMetric',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(db_index=True)),
+                ('provider', models.CharField(blank=True, max_length=100)),
+                ('model_name', models.CharField(blank=True, max_length=100)),
+                ('task', models.CharField(blank=True, max_length=64)),
+                ('prompt_version', models.CharField(blank=True, max_length=50)),
+                ('success', models.BooleanField(default=True)),
+                ('cache_status', models.CharField(blank=True, max_length=16)),
+                ('latency_ms', models.FloatField(blank=True, null=True)),
+                ('input_tokens', models.PositiveIntegerField(blank=True, null=True)),
+                ('output_tokens', models.PositiveIntegerField(blank=True, null=True)),
+                ('total_tokens', models.PositiveIntegerField(blank=True, null=True)),
+                ('estimated_cost', models.FloatField(blank=True, null=True)),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='content_ai_generation_metrics', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'AI generation metric',
+                'verbose_name_plural': 'AI generation metrics',
+                'ordering': ['-created_at'],
+                'indexes': [
+                    models.Index(fields=['task', '-created_at'], name='content_ai__task_078d7b_idx'),
+                    models.Index(fields=['prompt_version', '-created_at'], name='content_ai__prompt__74f2f4_idx'),
+                    models.Index(fields=['user', '-created_at'], name='content_ai__user_id_a84f8c_idx'),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,55 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('content_ai', '0004_generationmetric'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='aijob',
+            name='operation',
+            field=models.CharField(blank=True, choices=[('workspace_draft', 'Workspace draft'), ('featured_image', 'Featured image'), ('batch_generation', 'Batch generation')], max_length=50),
+        ),
+        migrations.CreateModel(
+            name='BatchGenerationItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField()),
+                ('task', models.CharField(max_length=64)),
+                ('request', models.JSONField(blank=True, default=dict)),
+                ('source_ref', models.CharField(blank=True, max_length=100)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('content', models.JSONField(blank=True, null=True)),
+                ('error', models.TextField(blank=True)),
+                ('provider', models.CharField(blank=True, max_length=100)),
+                ('model_name', models.CharField(blank=True, max_length=100)),
+                ('prompt_version', models.CharField(blank=True, max_length=50)),
+                ('telemetry', models.JSONField(blank=True, null=True)),
+                ('review_status', models.CharField(choices=[('unreviewed', 'Unreviewed'), ('approved', 'Approved'), ('rejected', 'Rejected')], default='unreviewed', max_length=20)),
+                ('reviewed_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='batch_items', to='content_ai.aijob')),
+                ('reviewed_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='content_ai_batch_reviews', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'AI batch item',
+                'verbose_name_plural': 'AI batch items',
+                'ordering': ['job', 'position'],
+                'indexes': [
+                    models.Index(fields=['job', 'status'], name='content_ai__job_id_4713f0_idx'),
+                    models.Index(fields=['review_status', '-created_at'], name='content_ai__review__474e2c_idx'),
+                ],
+                'constraints': [
+                    models.UniqueConstraint(fields=('job', 'position'), name='content_ai_batch_item_position'),
+                ],
+            },
+        ),
+    ]
@@ -1,14 +1,20 @@
 from django.conf import settings
 from django.db import models
 
-from content_ai.constants import AIJobStatus, AIJobType
+from content_ai.batch.models import BatchGenerationItem  # noqa: F401
+from content_ai.constants import AIJobOperation, AIJobStatus, AIJobType
 from content_ai.evaluation.models import AIGenerationFeedback  # noqa: F401
+from content_ai.telemetry.models import GenerationMetric  # noqa: F401
 
 
 class AIJob(models.Model):
     """
     Tracks a Content AI execution.
 
+    Jobs with an ``operation`` are also a database queue: the
+    ``run_ai_jobs`` worker claims pending rows under a lease and stores the
+    result and telemetry back on the row.
+
     This is not a content model. Generated Blog Posts and Advertisements
     remain owned by the Blog and Ads applications.
     """
@@ -25,6 +31,18 @@ class AIJob(models.Model):
     provider = models.CharField(max_length=100, blank=True)
     model_name = models.CharField(max_length=100, blank=True)
     prompt_version = models.CharField(max_length=50, blank=True)
+    operation = models.CharField(
+        max_length=50,
+        choices=AIJobOperation.choices,
+        blank=True,
+    )
+    payload = models.JSONField(default=dict, blank=True)
+    result = models.JSONField(null=True, blank=True)
+    telemetry = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    claimed_by = models.CharField(max_length=100, blank=True)
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.SET_NULL,
@@ -1,6 +1,8 @@
 """Assemble versioned AI Engine prompts from modular markdown assets.
 
 Production generation obtains prompts through PromptBuilder (RFC-001).
+Validated modules are cached per ``(version, style)``; see
+``content_ai.prompts.cache``.
 """
 
 from __future__ import annotations
@@ -11,19 +13,7 @@ from content_ai.config.ai_engine import (
     DEFAULT_PROMPT_VERSION,
     DEFAULT_STYLE,
 )
-from content_ai.prompts.validators.prompt_validator import (
-    SECTION_AUDIENCE,
-    SECTION_IDENTITY,
-    SECTION_OUTPUT_SCHEMA,
-    SECTION_STYLE,
-    SECTION_USER_PROMPT,
-    SECTION_WRITING,
-    PromptValidator,
-)
-
-
-def _section(header: str, body: str) -> str:
-    return f'{header}\n\n{body.strip()}\n'
+from content_ai.prompts.validators.prompt_validator import PromptValidator
 
 
 class PromptBuilder:
@@ -37,11 +27,16 @@ class PromptBuilder:
         self,
         prompts_root: Path | None = None,
         validator: PromptValidator | None = None,
+        cache=None,
     ):
+        # Imported here: the cache module imports this package.
+        from content_ai.prompts.cache import get_prompt_cache
+
         self.prompts_root = prompts_root or Path(__file__).resolve().parents[1]
         self.validator = validator or PromptValidator(
             prompts_root=self.prompts_root,
         )
+        self.cache = cache if cache is not None else get_prompt_cache()
 
     def build(
         self,
@@ -56,41 +51,7 @@ class PromptBuilder:
         Order:
         Identity → Audience → Writing Rules → Style → Output Schema → User Prompt
         """
-        self.validator.validate_required_files(version, style)
-
-        identity = self.validator.validate_module_non_empty(
-            self.validator.system_path(version, 'identity'),
-            'identity',
-        )
-        audience = self.validator.validate_module_non_empty(
-            self.validator.system_path(version, 'audience'),
-            'audience',
-        )
-        writing = self.validator.validate_module_non_empty(
-            self.validator.system_path(version, 'writing'),
-            'writing',
-        )
-        style_body = self.validator.validate_module_non_empty(
-            self.validator.style_path(version, style),
-            f'style:{style}',
-        )
-        output_schema = self.validator.validate_module_non_empty(
-            self.validator.system_path(version, 'output_schema'),
-            'output_schema',
-        )
-
-        user_body = (user_prompt or '').strip()
-        if not user_body:
-            user_body = '(empty user prompt)'
-
-        parts = [
-            _section(SECTION_IDENTITY, identity),
-            _section(SECTION_AUDIENCE, audience),
-            _section(SECTION_WRITING, writing),
-            _section(SECTION_STYLE, style_body),
-            _section(SECTION_OUTPUT_SCHEMA, output_schema),
-            _section(SECTION_USER_PROMPT, user_body),
-        ]
-        prompt = '\n'.join(parts).strip() + '\n'
+        bundle = self.cache.bundle(self.validator, version, style)
+        prompt = bundle.assemble(user_prompt)
         self.validator.validate_assembled_prompt(prompt)
         return prompt
@@ -0,0 +1,169 @@
+"""In-memory cache of prompt assets (RFC-001).
+
+Prompt markdown only changes on deploy, so each process reads it once.
+``PromptBuilder`` gets an immutable ``PromptBundle`` per
+``(prompts_root, version, style)``, validated and with every section before
+the user prompt already assembled. ``PromptLoader`` gets task templates by
+path. With ``DEBUG`` on, every hit re-checks file mtimes, so edits show up
+without a restart. In production a hit costs one dict lookup.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from django.conf import settings
+
+from content_ai.config.ai_engine import SUPPORTED_PROMPT_VERSIONS, SUPPORTED_STYLES
+from content_ai.prompts.builders.exceptions import AIEnginePromptError
+from content_ai.prompts.validators.prompt_validator import (
+    SECTION_AUDIENCE,
+    SECTION_IDENTITY,
+    SECTION_OUTPUT_SCHEMA,
+    SECTION_STYLE,
+    SECTION_USER_PROMPT,
+    SECTION_WRITING,
+    PromptValidator,
+)
+
+
+def _section(header: str, body: str) -> str:
+    return f'{header}\n\n{body.strip()}\n'
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class PromptBundle:
+    """Validated system and style modules for one ``(version, style)``."""
+
+    version: str
+    style: str
+    prefix: str
+    sources: tuple[tuple[Path, int | None], ...]
+
+    def assemble(self, user_prompt: str) -> str:
+        """Return the full prompt; identical to PromptBuilder's output."""
+        user_body = (user_prompt or '').strip() or '(empty user prompt)'
+        prompt = self.prefix + '\n' + _section(SECTION_USER_PROMPT, user_body)
+        return prompt.strip() + '\n'
+
+    def is_stale(self) -> bool:
+        return any(_mtime_ns(path) != mtime for path, mtime in self.sources)
+
+
+def load_bundle(validator: PromptValidator, version: str, style: str) -> PromptBundle:
+    """Validate and read the modules for ``(version, style)`` from disk."""
+    validator.validate_required_files(version, style)
+    modules = (
+        (SECTION_IDENTITY, validator.system_path(version, 'identity'), 'identity'),
+        (SECTION_AUDIENCE, validator.system_path(version, 'audience'), 'audience'),
+        (SECTION_WRITING, validator.system_path(version, 'writing'), 'writing'),
+        (SECTION_STYLE, validator.style_path(version, style), f'style:{style}'),
+        (
+            SECTION_OUTPUT_SCHEMA,
+            validator.system_path(version, 'output_schema'),
+            'output_schema',
+        ),
+    )
+    sections = []
+    sources = []
+    for header, path, label in modules:
+        mtime = _mtime_ns(path)
+        body = validator.validate_module_non_empty(path, label)
+        sections.append(_section(header, body))
+        sources.append((path, mtime))
+    return PromptBundle(
+        version=version,
+        style=style,
+        prefix='\n'.join(sections),
+        sources=tuple(sources),
+    )
+
+
+class PromptAssetCache:
+    """Thread-safe cache of prompt bundles and template texts."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bundles: dict[tuple[Path, str, str], PromptBundle] = {}
+        self._texts: dict[Path, tuple[int | None, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._bundles) + len(self._texts)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bundles = {}
+            self._texts = {}
+
+    @staticmethod
+    def _check_mtimes() -> bool:
+        return bool(getattr(settings, 'DEBUG', False))
+
+    def bundle(
+        self,
+        validator: PromptValidator,
+        version: str,
+        style: str,
+    ) -> PromptBundle:
+        key = (Path(validator.prompts_root), version, style)
+        with self._lock:
+            cached = self._bundles.get(key)
+        if cached is not None and not (self._check_mtimes() and cached.is_stale()):
+            return cached
+        bundle = load_bundle(validator, version, style)
+        with self._lock:
+            self._bundles[key] = bundle
+        return bundle
+
+    def text(self, path: Path) -> str | None:
+        """Return the file's text, or None when it does not exist."""
+        with self._lock:
+            cached = self._texts.get(path)
+        if cached is not None and not (
+            self._check_mtimes() and _mtime_ns(path) != cached[0]
+        ):
+            return cached[1]
+        if not path.is_file():
+            return None
+        mtime = _mtime_ns(path)
+        text = path.read_text(encoding='utf-8')
+        with self._lock:
+            self._texts[path] = (mtime, text)
+        return text
+
+
+_DEFAULT_CACHE = PromptAssetCache()
+
+
+def get_prompt_cache() -> PromptAssetCache:
+    return _DEFAULT_CACHE
+
+
+def prewarm_prompt_cache(prompts_root: Path | None = None) -> int:
+    """
+    Load every supported ``(version, style)`` bundle and task template.
+
+    Returns the number of cached entries. Missing versions or styles are
+    skipped; they raise when a request actually asks for them.
+    """
+    from content_ai.prompts.loader import PROMPTS_ROOT
+
+    validator = PromptValidator(prompts_root=prompts_root)
+    for version in SUPPORTED_PROMPT_VERSIONS:
+        for style in SUPPORTED_STYLES:
+            try:
+                _DEFAULT_CACHE.bundle(validator, version, style)
+            except AIEnginePromptError:
+                continue
+    for path in sorted(PROMPTS_ROOT.glob('*/*.md')):
+        _DEFAULT_CACHE.text(path)
+    return len(_DEFAULT_CACHE)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from content_ai.prompts.cache import get_prompt_cache
 from content_ai.prompts.exceptions import PromptTemplateNotFound
 
 DEFAULT_PROMPT_VERSION = 'v1'
@@ -27,12 +28,13 @@ class PromptLoader:
 
     def load(self, kind: str, version: str = DEFAULT_PROMPT_VERSION) -> str:
         path = self.path_for(kind, version)
-        if not path.is_file():
+        text = get_prompt_cache().text(path)
+        if text is None:
             raise PromptTemplateNotFound(
                 f"Prompt template not found: kind={kind!r} version={version!r} "
                 f"(expected {path})."
             )
-        return path.read_text(encoding='utf-8')
+        return text
 
     def exists(self, kind: str, version: str = DEFAULT_PROMPT_VERSION) -> bool:
         return self.path_for(kind, version).is_file()
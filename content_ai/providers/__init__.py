@@ -5,6 +5,7 @@ from content_ai.providers.capabilities import ProviderCapabilities
 from content_ai.providers.exceptions import (
     AuthenticationError,
     CapabilityError,
+    CircuitOpenError,
     ConfigurationError,
     GenerationError,
     InvalidResponseError,
@@ -20,6 +21,7 @@ from content_ai.providers.manager import ProviderManager
 from content_ai.providers.mock import MockProvider
 from content_ai.providers.models import ImageGenerationResult, ModelMetadata, UsageReport
 from content_ai.providers.openai import OpenAIProvider
+from content_ai.providers.pool import ProviderPool, get_pool
 from content_ai.providers.registry import (
     ProviderRegistry,
     get_provider,
@@ -27,13 +29,19 @@ from content_ai.providers.registry import (
     list_providers,
     register_provider,
 )
+from content_ai.providers.resilience import CircuitBreaker, RetryPolicy
+from content_ai.providers.scheduler import RateLimitScheduler, provider_priority
+from content_ai.providers.streaming import GenerationStream
 
 __all__ = [
     'AuthenticationError',
     'BaseAIProvider',
     'CapabilityError',
+    'CircuitBreaker',
+    'CircuitOpenError',
     'ConfigurationError',
     'GenerationError',
+    'GenerationStream',
     'ImageGenerationResult',
     'InvalidResponseError',
     'MockProvider',
@@ -45,13 +53,18 @@ __all__ = [
     'ProviderFactory',
     'ProviderManager',
     'ProviderNotFound',
+    'ProviderPool',
     'ProviderRegistry',
     'ProviderUnavailableError',
     'RateLimitError',
+    'RateLimitScheduler',
+    'RetryPolicy',
     'TimeoutError',
     'UsageReport',
+    'get_pool',
     'get_provider',
     'get_registry',
     'list_providers',
+    'provider_priority',
     'register_provider',
 ]
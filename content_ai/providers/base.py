@@ -23,6 +23,8 @@ class BaseAIProvider:
     """
 
     name = 'base'
+    # Settings read in __init__; pooled instances are rebuilt when they change.
+    pool_settings: tuple[str, ...] = ()
 
     def generate_post(self, prompt=''):
         raise NotImplementedError(
@@ -72,7 +74,12 @@ class BaseAIProvider:
             return self.translate(prompt)
         return self.generate_post(prompt)
 
-    def stream(self, prompt='', **kwargs):
+    def stream(self, prompt='', *, task='post_generation'):
+        """
+        Return a ``GenerationStream`` of text deltas for ``prompt``.
+
+        Only called when ``capabilities().streaming`` is True.
+        """
         raise NotImplementedError(
             f'{type(self).__name__} does not implement stream()'
         )
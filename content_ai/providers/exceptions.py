@@ -33,7 +33,15 @@ class AuthenticationError(ProviderError):
 
 
 class RateLimitError(ProviderError):
-    """Raised when a provider rate limit is hit."""
+    """Raised when a provider rate limit is hit.
+
+    ``retry_after`` is the number of seconds to wait, when known.
+    """
+
+    def __init__(self, message='', retry_after=None, telemetry=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.telemetry = telemetry
 
 
 class TimeoutError(ProviderError):
@@ -50,3 +58,15 @@ class CapabilityError(ProviderError):
 
 class ConfigurationError(ProviderConfigurationError):
     """Alias for configuration problems (RFC-005 naming)."""
+
+
+class CircuitOpenError(ProviderUnavailableError):
+    """Raised when a provider's circuit breaker is rejecting calls.
+
+    ``retry_after`` is the number of seconds until the breaker lets a probe
+    call through, when known.
+    """
+
+    def __init__(self, message='', retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
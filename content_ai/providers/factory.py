@@ -10,6 +10,7 @@ from content_ai.providers.exceptions import (
     ProviderConfigurationError,
     ProviderNotFound,
 )
+from content_ai.providers.pool import get_pool
 from content_ai.providers.registry import get_registry
 
 
@@ -17,11 +18,15 @@ class ProviderFactory:
     """
     Create provider instances from configuration.
 
+    Instances are shared through a ``ProviderPool`` keyed by provider name
+    and settings fingerprint.
+
     Future: feature flags, priorities, fallbacks (not implemented here).
     """
 
-    def __init__(self, registry=None):
+    def __init__(self, registry=None, pool=None):
         self.registry = registry or get_registry()
+        self.pool = pool or get_pool()
 
     def create(
         self,
@@ -40,7 +45,7 @@ class ProviderFactory:
             provider_cls = self.registry.get_class(resolved)
         except ProviderNotFound:
             raise
-        provider = provider_cls()
+        provider = self.pool.get(resolved, provider_cls)
         if require_credentials:
             self._validate_credentials(provider)
         return provider
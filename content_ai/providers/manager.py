@@ -1,4 +1,4 @@
-"""Provider manager — selection, logging, and policy hooks (RFC-005)."""
+"""Provider manager — selection, retries, circuit breaking and failover (RFC-005)."""
 
 from __future__ import annotations
 
@@ -6,6 +6,8 @@ import logging
 import time
 from typing import Any
 
+from django.conf import settings
+
 from content_ai.providers.base import BaseAIProvider
 from content_ai.providers.capabilities import ProviderCapabilities
 from content_ai.providers.exceptions import (
@@ -15,15 +17,29 @@ from content_ai.providers.exceptions import (
 )
 from content_ai.providers.factory import ProviderFactory
 from content_ai.providers.models import UsageReport, utc_now
+from content_ai.providers.resilience import (
+    CircuitBreaker,
+    RetryPolicy,
+    breakers_enabled,
+    is_retryable,
+)
+from content_ai.providers.scheduler import retry_after_hint, schedule_provider_call
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_DEADLINE_SECONDS = 27
+
 
 class ProviderManager:
     """
     Select and invoke providers without leaking vendor-specific logic.
 
-    Retries / circuit breakers / failover are hooks only — not implemented.
+    ``invoke()`` (and ``generate()`` on top of it) tries the selected
+    provider, then each name in ``fallback_providers`` in order. Transient
+    errors are retried with jittered exponential backoff while
+    ``deadline_seconds`` allows; a provider whose circuit breaker is open is
+    skipped without a call. Load balancing and automatic selection remain
+    hooks only.
     """
 
     def __init__(
@@ -31,25 +47,59 @@ class ProviderManager:
         factory: ProviderFactory | None = None,
         *,
         default_provider: str | None = None,
-        max_retries: int = 0,
+        max_retries: int | None = None,
         timeout_seconds: float | None = None,
+        fallback_providers: list[str] | tuple[str, ...] | None = None,
+        deadline_seconds: float | None = None,
+        retry_policy: RetryPolicy | None = None,
+        use_circuit_breaker: bool | None = None,
+        sleep=time.sleep,
+        clock=time.monotonic,
     ):
         self.factory = factory or ProviderFactory()
         self.default_provider = default_provider
+        if max_retries is None:
+            max_retries = getattr(settings, 'CONTENT_AI_PROVIDER_MAX_RETRIES', 0)
         self.max_retries = max(0, int(max_retries))
         self.timeout_seconds = timeout_seconds
+        if fallback_providers is None:
+            fallback_providers = getattr(
+                settings,
+                'CONTENT_AI_PROVIDER_FALLBACKS',
+                (),
+            )
+        self.fallback_providers = tuple(fallback_providers or ())
+        if deadline_seconds is None:
+            deadline_seconds = getattr(settings, 'CONTENT_AI_PROVIDER_DEADLINE', None)
+        if deadline_seconds is None:
+            # Keep retries inside the web request: OPENAI_TEXT_TIMEOUT is
+            # already set below the router's 30s limit.
+            deadline_seconds = timeout_seconds or getattr(
+                settings,
+                'OPENAI_TEXT_TIMEOUT',
+                DEFAULT_DEADLINE_SECONDS,
+            )
+        self.deadline_seconds = deadline_seconds
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=self.max_retries)
+        self.use_circuit_breaker = (
+            breakers_enabled()
+            if use_circuit_breaker is None
+            else bool(use_circuit_breaker)
+        )
+        self._sleep = sleep
+        self._clock = clock
         self._last_usage: UsageReport | None = None
-        # Future: circuit breaker state, fallback chain, selection policy.
+        self._last_attempts: list[dict] = []
         self.extension_hooks: dict[str, Any] = {
-            'circuit_breaker': 'pending',
-            'failover': 'pending',
+            'circuit_breaker': 'enabled' if self.use_circuit_breaker else 'disabled',
+            'failover': list(self.fallback_providers),
             'load_balancing': 'pending',
             'automatic_selection': 'pending',
         }
 
     def select_provider(self, name: str | None = None) -> BaseAIProvider:
         provider = self.factory.create(name or self.default_provider)
-        if not provider.health_check():
+        if not self.factory.pool.is_healthy(provider):
             raise ProviderUnavailableError(
                 f"Provider '{provider.name}' failed health_check()."
             )
@@ -67,6 +117,19 @@ class ProviderManager:
             )
         return caps
 
+    def provider_chain(self, name: str | None = None) -> list[str | None]:
+        """Provider names to try in order: the primary, then fallbacks."""
+        chain: list[str | None] = [name or self.default_provider]
+        for fallback in self.fallback_providers:
+            if fallback not in chain:
+                chain.append(fallback)
+        return chain
+
+    def breaker_for(self, provider_name: str) -> CircuitBreaker | None:
+        if not self.use_circuit_breaker:
+            return None
+        return CircuitBreaker(provider_name)
+
     def generate(
         self,
         prompt: str = '',
@@ -76,50 +139,153 @@ class ProviderManager:
         require_capability: str | None = None,
     ):
         """
-        Run generation via the selected provider.
+        Run generation with retries, circuit breaking and failover.
 
-        Retries are counted but default ``max_retries=0`` preserves fail-fast
-        production OpenAI behaviour when callers use OpenAIProvider directly.
+        Default ``max_retries=0`` and no fallbacks preserve fail-fast
+        production behaviour. Raises the last provider error when every
+        provider in the chain failed or was skipped.
         """
-        provider = self.select_provider(provider_name)
-        if require_capability:
-            self.require_capability(provider, require_capability)
+        return self.invoke(
+            lambda provider: provider.generate(prompt, task=task),
+            provider_name=provider_name,
+            prompt=prompt,
+            task=task,
+            require_capability=require_capability,
+        )
 
-        attempts = self.max_retries + 1
+    def invoke(
+        self,
+        call,
+        *,
+        provider_name: str | None = None,
+        provider: BaseAIProvider | None = None,
+        prompt: str = '',
+        task: str = '',
+        require_capability: str | None = None,
+        can_retry=None,
+    ):
+        """
+        Run ``call(provider)`` along the provider chain.
+
+        ``provider`` is an already resolved primary provider; fallbacks come
+        from the factory. Once ``can_retry()`` returns False (e.g. streamed
+        text already reached the caller) the current error is raised without
+        further retries or failover.
+        """
+        started = self._clock()
+        deadline = (
+            started + float(self.deadline_seconds)
+            if self.deadline_seconds
+            else None
+        )
+        self._last_attempts = []
         last_error: Exception | None = None
-        started = time.perf_counter()
-        for attempt in range(attempts):
+
+        primary_name = provider_name or (provider.name if provider else None)
+        for name in self.provider_chain(primary_name):
             try:
-                logger.info(
-                    'ProviderManager generate: provider=%s task=%s attempt=%s',
-                    provider.name,
-                    task,
-                    attempt + 1,
+                if provider is not None and name == primary_name:
+                    current = provider
+                else:
+                    current = self.select_provider(name)
+                if require_capability:
+                    self.require_capability(current, require_capability)
+            except ProviderError as exc:
+                self._record_attempt(name, 0, exc)
+                last_error = exc
+                continue
+            try:
+                return self._invoke_with_retries(
+                    current,
+                    call,
+                    prompt=prompt,
+                    task=task,
+                    started=started,
+                    deadline=deadline,
+                    can_retry=can_retry,
                 )
-                result = provider.generate(prompt, task=task)
-                latency_ms = round((time.perf_counter() - started) * 1000, 3)
-                usage = provider.last_usage()
-                if usage is None:
-                    usage = UsageReport(
-                        provider=provider.name,
-                        model=getattr(provider, 'model', '') or '',
-                        latency_ms=latency_ms,
-                        timestamp=utc_now(),
-                    )
-                self._last_usage = usage
-                return result
             except ProviderError as exc:
                 last_error = exc
+                if can_retry is not None and not can_retry():
+                    raise
+                if deadline is not None and self._clock() >= deadline:
+                    break
+        assert last_error is not None
+        raise last_error
+
+    def _invoke_with_retries(
+        self,
+        provider: BaseAIProvider,
+        invoke,
+        *,
+        prompt: str,
+        task: str,
+        started: float,
+        deadline: float | None,
+        can_retry,
+    ):
+        breaker = self.breaker_for(provider.name)
+
+        def call():
+            if breaker is not None:
+                return breaker.call(lambda: invoke(provider))
+            return invoke(provider)
+
+        attempts = self.retry_policy.max_retries + 1
+        for attempt in range(1, attempts + 1):
+            logger.info(
+                'ProviderManager generate: provider=%s task=%s attempt=%s',
+                provider.name,
+                task,
+                attempt,
+            )
+            try:
+                result = schedule_provider_call(provider.name, call, prompt=prompt)
+            except ProviderError as exc:
+                self._record_attempt(provider.name, attempt, exc)
                 logger.warning(
                     'ProviderManager attempt failed: provider=%s error=%s',
                     provider.name,
                     exc,
                 )
-                if attempt + 1 >= attempts:
-                    break
-                # Future: backoff / circuit breaker.
-        assert last_error is not None
-        raise last_error
+                if attempt >= attempts or not is_retryable(exc):
+                    raise
+                if can_retry is not None and not can_retry():
+                    raise
+                delay = max(
+                    self.retry_policy.delay(attempt),
+                    retry_after_hint(exc) or 0.0,
+                )
+                if deadline is not None and self._clock() + delay >= deadline:
+                    raise
+                self._sleep(delay)
+                continue
+
+            self._record_attempt(provider.name, attempt, None)
+            latency_ms = round((self._clock() - started) * 1000, 3)
+            usage = provider.last_usage()
+            if usage is None:
+                usage = UsageReport(
+                    provider=provider.name,
+                    model=getattr(provider, 'model', '') or '',
+                    latency_ms=latency_ms,
+                    timestamp=utc_now(),
+                )
+            self._last_usage = usage
+            return result
+
+    def _record_attempt(self, provider_name, attempt: int, error) -> None:
+        self._last_attempts.append(
+            {
+                'provider': provider_name or '',
+                'attempt': attempt,
+                'error': type(error).__name__ if error is not None else '',
+            }
+        )
 
     def last_usage(self) -> UsageReport | None:
         return self._last_usage
+
+    def last_attempts(self) -> list[dict]:
+        """Provider attempts made by the latest ``invoke()`` call."""
+        return list(self._last_attempts)
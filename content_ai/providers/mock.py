@@ -3,6 +3,7 @@
 from content_ai.providers.base import BaseAIProvider
 from content_ai.providers.capabilities import ProviderCapabilities
 from content_ai.providers.models import ImageGenerationResult, ModelMetadata
+from content_ai.providers.streaming import GenerationStream
 from content_ai.schemas.responses import GenerationResult
 from content_ai.telemetry import AIExecutionTelemetry
 
@@ -31,7 +32,7 @@ class MockProvider(BaseAIProvider):
         return ProviderCapabilities(
             text_generation=True,
             json_output=True,
-            streaming=False,
+            streaming=True,
             image_generation=True,
         )
 
@@ -41,6 +42,7 @@ class MockProvider(BaseAIProvider):
                 provider=self.name,
                 model=MOCK_MODEL,
                 supports_json=True,
+                supports_streaming=True,
                 status='available',
             )
         ]
@@ -84,6 +86,18 @@ class MockProvider(BaseAIProvider):
     def translate(self, prompt=''):
         return self._result(prompt=prompt, metadata={'task': 'translation'})
 
+    def stream(self, prompt='', *, task='post_generation'):
+        """Yield ``MOCK_RESPONSE`` word by word, then the usual result."""
+        words = MOCK_RESPONSE.split(' ')
+        deltas = [words[0]] + [f' {word}' for word in words[1:]]
+        return GenerationStream(
+            deltas,
+            finalize=lambda text: self._result(
+                prompt=prompt,
+                metadata={'task': task, 'streamed': True},
+            ),
+        )
+
     def generate_image(self, prompt='', *, aspect_ratio='16:9', **kwargs):
         return ImageGenerationResult(
             success=True,
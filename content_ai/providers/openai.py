@@ -17,8 +17,10 @@ from content_ai.providers.exceptions import (
     ProviderConfigurationError,
 )
 from content_ai.providers.models import ModelMetadata
+from content_ai.providers.streaming import GenerationStream
 from content_ai.schemas.responses import GenerationResult
 from content_ai.telemetry import AIExecutionTelemetry
+from content_ai.telemetry.pricing import estimate_cost
 
 logger = logging.getLogger(__name__)
 
@@ -83,6 +85,52 @@ def _extract_token_usage(response):
     }
 
 
+class OpenAIStreamError(Exception):
+    """A Responses stream that reported failure instead of completing."""
+
+    def __init__(self, message, *, code=None):
+        super().__init__(message)
+        self.code = code
+
+
+def _stream_event_error(event) -> OpenAIStreamError:
+    """Build the error for an ``error`` / ``response.failed`` / ``response.incomplete`` event."""
+    event_type = getattr(event, 'type', '')
+    if event_type == 'error':
+        return OpenAIStreamError(
+            f"OpenAI stream error: {getattr(event, 'message', '') or 'unknown error'}",
+            code=getattr(event, 'code', None),
+        )
+    response = getattr(event, 'response', None)
+    if event_type == 'response.incomplete':
+        details = getattr(response, 'incomplete_details', None)
+        reason = getattr(details, 'reason', None) or 'unknown reason'
+        return OpenAIStreamError(
+            f'OpenAI stream incomplete: {reason}',
+            code='incomplete',
+        )
+    error = getattr(response, 'error', None)
+    return OpenAIStreamError(
+        f"OpenAI stream failed: {getattr(error, 'message', '') or 'unknown error'}",
+        code=getattr(error, 'code', None),
+    )
+
+
+def _retry_after_seconds(headers) -> float | None:
+    """Parse ``retry-after-ms`` / ``retry-after`` (seconds) response headers."""
+    if not headers:
+        return None
+    for name, scale in (('retry-after-ms', 0.001), ('retry-after', 1.0)):
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return max(0.0, float(value) * scale)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
 def _openai_error_details(exc):
     """
     Collect OpenAI / httpx exception fields for diagnostics.
@@ -127,6 +175,9 @@ def _openai_error_details(exc):
         text = getattr(response, 'text', None)
         if text:
             details['response_text'] = text
+        retry_after = _retry_after_seconds(getattr(response, 'headers', None))
+        if retry_after is not None:
+            details['retry_after'] = retry_after
         if status_code is None:
             response_status = getattr(response, 'status_code', None)
             if response_status is not None:
@@ -160,6 +211,13 @@ class OpenAIProvider(BaseAIProvider):
     """
 
     name = 'openai'
+    pool_settings = (
+        'OPENAI_API_KEY',
+        'OPENAI_MODEL',
+        'OPENAI_IMAGE_MODEL',
+        'OPENAI_IMAGE_SIZE',
+        'OPENAI_TEXT_TIMEOUT',
+    )
 
     def __init__(self, client=None):
         self.api_key = getattr(settings, 'OPENAI_API_KEY', '') or ''
@@ -205,7 +263,7 @@ class OpenAIProvider(BaseAIProvider):
         return ProviderCapabilities(
             text_generation=True,
             json_output=False,
-            streaming=False,
+            streaming=True,
             structured_output=False,
             long_context=True,
             image_generation=True,
@@ -368,11 +426,77 @@ class OpenAIProvider(BaseAIProvider):
                 provider=self.name,
                 model=self.model,
                 supports_json=False,
-                supports_streaming=False,
+                supports_streaming=True,
                 status='available',
             )
         ]
 
+    def stream(self, prompt='', *, task='post_generation'):
+        """
+        Stream the Responses API output as text deltas.
+
+        The client timeout applies per read, so long drafts keep going as
+        long as tokens keep arriving instead of hitting one overall limit.
+        ``error``, ``response.failed`` and ``response.incomplete`` events,
+        or a stream that ends without ``response.completed``, raise
+        ``GenerationError`` so truncated text is never finalized as a
+        success.
+        """
+        prompt_text = prompt or ''
+        logger.info(
+            'OpenAI text stream starting: model=%s timeout=%s prompt_chars=%d',
+            self.model,
+            self.timeout,
+            len(prompt_text),
+        )
+        started = time.monotonic()
+        completed = {}
+
+        def deltas():
+            try:
+                events = self._client.responses.create(
+                    model=self.model,
+                    input=prompt,
+                    stream=True,
+                )
+                for event in events:
+                    event_type = getattr(event, 'type', '')
+                    if event_type == 'response.output_text.delta':
+                        yield getattr(event, 'delta', '') or ''
+                    elif event_type == 'response.completed':
+                        completed['response'] = getattr(event, 'response', None)
+                    elif event_type in (
+                        'error',
+                        'response.failed',
+                        'response.incomplete',
+                    ):
+                        raise _stream_event_error(event)
+                if 'response' not in completed:
+                    raise OpenAIStreamError(
+                        'OpenAI stream ended before response.completed.',
+                        code='truncated',
+                    )
+            except Exception as exc:
+                raise self._generation_error(exc, started, prompt_text) from exc
+
+        def finalize(text):
+            elapsed = time.monotonic() - started
+            logger.info(
+                'OpenAI text stream: timeout=%s elapsed=%.1fs status=success',
+                self.timeout,
+                elapsed,
+            )
+            return self._text_result(
+                text,
+                completed.get('response'),
+                task=task,
+                elapsed=elapsed,
+                prompt_text=prompt_text,
+                streamed=True,
+            )
+
+        return GenerationStream(deltas(), finalize=finalize)
+
     def _generate(self, prompt, task):
         prompt_text = prompt or ''
         configured_timeout = self.timeout
@@ -389,48 +513,7 @@ class OpenAIProvider(BaseAIProvider):
                 input=prompt,
             )
         except Exception as exc:
-            elapsed = time.monotonic() - started
-            details = _openai_error_details(exc)
-            exception_type = details.get('exception_type') or type(exc).__name__
-            is_timeout = exception_type == 'APITimeoutError' or exception_type.endswith(
-                'TimeoutError'
-            )
-            status = 'timeout' if is_timeout else 'error'
-            logger.exception(
-                'OpenAI text request: timeout=%s elapsed=%.1fs status=%s '
-                'exception_type=%s message=%s status_code=%s error_code=%s '
-                'error_message=%s request_id=%s',
-                configured_timeout,
-                elapsed,
-                status,
-                exception_type,
-                details.get('message'),
-                details.get('status_code'),
-                details.get('error_code'),
-                details.get('error_message'),
-                details.get('request_id'),
-            )
-            telemetry = AIExecutionTelemetry(
-                provider=self.name,
-                model=self.model,
-                success=False,
-                error_type=exception_type,
-                prompt_length=len(prompt_text),
-                response_length=0,
-                duration_ms=round(elapsed * 1000, 3),
-                metadata={
-                    'openai_text_timeout': configured_timeout,
-                    'status': status,
-                    'openai_status_code': details.get('status_code'),
-                    'openai_error_code': details.get('error_code'),
-                    'openai_error_message': details.get('error_message'),
-                    'openai_request_id': details.get('request_id'),
-                },
-            )
-            raise GenerationError(
-                f'OpenAI generation failed: {exc}',
-                telemetry=telemetry,
-            ) from exc
+            raise self._generation_error(exc, started, prompt_text) from exc
 
         elapsed = time.monotonic() - started
         logger.info(
@@ -442,8 +525,74 @@ class OpenAIProvider(BaseAIProvider):
         content = getattr(response, 'output_text', None)
         if content is None:
             content = ''
-        content_text = str(content)
+        return self._text_result(
+            content,
+            response,
+            task=task,
+            elapsed=elapsed,
+            prompt_text=prompt_text,
+        )
 
+    def _generation_error(self, exc, started, prompt_text) -> GenerationError:
+        """Log a failed text request and wrap it with telemetry."""
+        configured_timeout = self.timeout
+        elapsed = time.monotonic() - started
+        details = _openai_error_details(exc)
+        exception_type = details.get('exception_type') or type(exc).__name__
+        is_timeout = exception_type == 'APITimeoutError' or exception_type.endswith(
+            'TimeoutError'
+        )
+        status = 'timeout' if is_timeout else 'error'
+        logger.exception(
+            'OpenAI text request: timeout=%s elapsed=%.1fs status=%s '
+            'exception_type=%s message=%s status_code=%s error_code=%s '
+            'error_message=%s request_id=%s',
+            configured_timeout,
+            elapsed,
+            status,
+            exception_type,
+            details.get('message'),
+            details.get('status_code'),
+            details.get('error_code'),
+            details.get('error_message'),
+            details.get('request_id'),
+        )
+        telemetry = AIExecutionTelemetry(
+            provider=self.name,
+            model=self.model,
+            success=False,
+            error_type=exception_type,
+            prompt_length=len(prompt_text),
+            response_length=0,
+            duration_ms=round(elapsed * 1000, 3),
+            metadata={
+                'openai_text_timeout': configured_timeout,
+                'status': status,
+                'openai_status_code': details.get('status_code'),
+                'openai_error_code': details.get('error_code'),
+                'openai_error_message': details.get('error_message'),
+                'openai_request_id': details.get('request_id'),
+                'retry_after': details.get('retry_after'),
+            },
+        )
+        return GenerationError(
+            f'OpenAI generation failed: {exc}',
+            telemetry=telemetry,
+        )
+
+    def _text_result(
+        self,
+        content,
+        response,
+        *,
+        task,
+        elapsed,
+        prompt_text,
+        streamed=False,
+    ) -> GenerationResult:
+        content_text = str(content)
+        response_id = getattr(response, 'id', None)
+        token_usage = _extract_token_usage(response)
         telemetry = AIExecutionTelemetry(
             provider=self.name,
             model=self.model,
@@ -451,18 +600,21 @@ class OpenAIProvider(BaseAIProvider):
             prompt_length=len(prompt_text),
             response_length=len(content_text),
             duration_ms=round(elapsed * 1000, 3),
-            token_usage=_extract_token_usage(response),
-            estimated_cost=None,
-            metadata={'response_id': getattr(response, 'id', None)},
+            token_usage=token_usage,
+            estimated_cost=estimate_cost(self.model, token_usage),
+            metadata={'response_id': response_id},
         )
+        metadata = {
+            'task': task,
+            'model': self.model,
+            'response_id': response_id,
+        }
+        if streamed:
+            metadata['streamed'] = True
         return GenerationResult(
             success=True,
             content=content,
-            metadata={
-                'task': task,
-                'model': self.model,
-                'response_id': getattr(response, 'id', None),
-            },
+            metadata=metadata,
             provider=self.name,
             telemetry=telemetry,
         )
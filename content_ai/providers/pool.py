@@ -0,0 +1,102 @@
+"""Process-wide provider instance pool (RFC-005).
+
+Building a provider can be expensive: ``OpenAIProvider`` creates an SDK
+client, and with it an httpx connection pool and TLS session. The pool keeps
+one instance per provider class and settings fingerprint, so requests served
+by the same worker reuse keep-alive connections. ``health_check()`` results
+are cached for ``CONTENT_AI_PROVIDER_HEALTH_TTL`` seconds.
+
+Providers must therefore not keep per-call state on ``self``. Any Django
+setting change (including ``override_settings``) empties the pool.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+
+from django.conf import settings
+from django.core.signals import setting_changed
+
+from content_ai.providers.base import BaseAIProvider
+
+DEFAULT_HEALTH_TTL_SECONDS = 30.0
+
+
+def settings_fingerprint(provider_cls: type[BaseAIProvider]) -> str:
+    """Hash the settings a provider class reads when it is constructed."""
+    values = [
+        (setting, repr(getattr(settings, setting, None)))
+        for setting in getattr(provider_cls, 'pool_settings', ())
+    ]
+    return hashlib.sha256(repr(values).encode('utf-8')).hexdigest()
+
+
+class ProviderPool:
+    """Thread-safe cache of provider instances and their health status."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._instances: dict[tuple, BaseAIProvider] = {}
+        # id(provider) -> (provider, healthy, checked_at)
+        self._health: dict[int, tuple[BaseAIProvider, bool, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._instances = {}
+            self._health = {}
+
+    def get(self, name: str, provider_cls: type[BaseAIProvider]) -> BaseAIProvider:
+        """
+        Return the pooled instance for ``name``, building it on first use.
+
+        Construction errors (e.g. missing credentials) are not cached.
+        """
+        key = (name, provider_cls, settings_fingerprint(provider_cls))
+        with self._lock:
+            provider = self._instances.get(key)
+        if provider is not None:
+            return provider
+
+        provider = provider_cls()
+        with self._lock:
+            # Another thread may have won the race; keep the first instance.
+            return self._instances.setdefault(key, provider)
+
+    def is_healthy(self, provider: BaseAIProvider) -> bool:
+        """Return ``provider.health_check()``, cached for the health TTL."""
+        ttl = float(
+            getattr(
+                settings,
+                'CONTENT_AI_PROVIDER_HEALTH_TTL',
+                DEFAULT_HEALTH_TTL_SECONDS,
+            )
+        )
+        now = time.monotonic()
+        with self._lock:
+            cached = self._health.get(id(provider))
+        if cached is not None and cached[0] is provider and now - cached[2] < ttl:
+            return cached[1]
+
+        healthy = bool(provider.health_check())
+        with self._lock:
+            self._health[id(provider)] = (provider, healthy, now)
+        return healthy
+
+
+_DEFAULT_POOL = ProviderPool()
+
+
+def get_pool() -> ProviderPool:
+    return _DEFAULT_POOL
+
+
+def _clear_pool_on_setting_change(**kwargs) -> None:
+    _DEFAULT_POOL.clear()
+
+
+setting_changed.connect(_clear_pool_on_setting_change)
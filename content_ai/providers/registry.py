@@ -15,6 +15,7 @@ from content_ai.providers.exceptions import (
 )
 from content_ai.providers.mock import MockProvider
 from content_ai.providers.openai import OpenAIProvider
+from content_ai.providers.pool import get_pool
 
 # Shared production registry map (default ProviderRegistry uses this dict).
 _PROVIDERS: dict[str, type[BaseAIProvider]] = {
@@ -80,7 +81,8 @@ def get_provider(name=None) -> BaseAIProvider:
     Resolve a provider by name.
 
     If ``name`` is omitted, uses ``settings.CONTENT_AI_PROVIDER``.
-    Unknown names raise ``ProviderNotFound``.
+    Unknown names raise ``ProviderNotFound``. Instances come from the
+    process-wide pool, so repeated calls share one SDK client.
     """
     resolved = name if name is not None else getattr(
         settings,
@@ -92,7 +94,7 @@ def get_provider(name=None) -> BaseAIProvider:
             'CONTENT_AI_PROVIDER is not configured.'
         )
     provider_cls = get_registry().get_class(resolved)
-    return provider_cls()
+    return get_pool().get(resolved, provider_cls)
 
 
 def list_providers():
@@ -0,0 +1,256 @@
+"""Circuit breaker and retry backoff for provider calls (RFC-005).
+
+Breaker state lives in the Django cache named by
+``CONTENT_AI_CIRCUIT_BREAKER_CACHE``, which must be a shared backend with an
+atomic ``incr`` (see ``content_ai.providers.shared_cache``). Every worker
+sees the same state, so once one worker trips a provider the others fail
+fast without waiting for a timeout. ``ProviderManager`` applies the breaker
+to each attempt.
+
+Each provider keeps success and failure counters in time buckets across
+``CONTENT_AI_CIRCUIT_BREAKER_WINDOW`` seconds. When at least
+``CONTENT_AI_CIRCUIT_BREAKER_MIN_CALLS`` calls fall in the window and the
+failure share reaches ``CONTENT_AI_CIRCUIT_BREAKER_FAILURE_RATE``, the
+breaker opens for ``CONTENT_AI_CIRCUIT_BREAKER_OPEN_SECONDS``. Once that
+time has passed the breaker is half-open: a single worker wins the probe
+slot (``cache.add``), and its result either closes or re-opens the breaker.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+
+from content_ai.providers.exceptions import (
+    AuthenticationError,
+    CapabilityError,
+    CircuitOpenError,
+    ProviderConfigurationError,
+    ProviderError,
+    ProviderNotFound,
+    RateLimitError,
+)
+from content_ai.providers.shared_cache import shared_cache
+
+STATE_CLOSED = 'closed'
+STATE_OPEN = 'open'
+STATE_HALF_OPEN = 'half_open'
+
+WINDOW_BUCKETS = 6
+CACHE_PREFIX = 'content_ai:breaker'
+
+# Provider error details carrying these HTTP statuses are the caller's fault;
+# retrying or counting them against the provider would not help.
+NON_RETRYABLE_STATUS_CODES = frozenset({400, 401, 403, 404, 409, 422})
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def breakers_enabled() -> bool:
+    return bool(_setting('CONTENT_AI_CIRCUIT_BREAKER_ENABLED', False))
+
+
+def is_retryable(exc: Exception) -> bool:
+    """Whether ``exc`` is a transient provider failure worth retrying."""
+    if isinstance(exc, CircuitOpenError):
+        return False
+    if isinstance(
+        exc,
+        (
+            AuthenticationError,
+            CapabilityError,
+            ProviderConfigurationError,
+            ProviderNotFound,
+        ),
+    ):
+        return False
+    if not isinstance(exc, ProviderError):
+        return False
+    telemetry = getattr(exc, 'telemetry', None)
+    metadata = getattr(telemetry, 'metadata', None) or {}
+    status_code = metadata.get('openai_status_code')
+    return status_code not in NON_RETRYABLE_STATUS_CODES
+
+
+def is_rate_limited(exc: Exception) -> bool:
+    """Whether ``exc`` means the provider asked callers to slow down."""
+    if isinstance(exc, (RateLimitError, CircuitOpenError)):
+        return True
+    telemetry = getattr(exc, 'telemetry', None)
+    metadata = getattr(telemetry, 'metadata', None) or {}
+    return metadata.get('openai_status_code') == 429
+
+
+class CircuitBreaker:
+    """Failure-rate circuit breaker for one provider, stored in the cache."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        cache=None,
+        window_seconds: float | None = None,
+        failure_rate: float | None = None,
+        min_calls: int | None = None,
+        open_seconds: float | None = None,
+        clock=time.time,
+    ):
+        self.name = name
+        self.cache = cache or shared_cache('CONTENT_AI_CIRCUIT_BREAKER_CACHE')
+        self.window_seconds = float(
+            window_seconds
+            if window_seconds is not None
+            else _setting('CONTENT_AI_CIRCUIT_BREAKER_WINDOW', 60)
+        )
+        self.failure_rate = float(
+            failure_rate
+            if failure_rate is not None
+            else _setting('CONTENT_AI_CIRCUIT_BREAKER_FAILURE_RATE', 0.5)
+        )
+        self.min_calls = int(
+            min_calls
+            if min_calls is not None
+            else _setting('CONTENT_AI_CIRCUIT_BREAKER_MIN_CALLS', 5)
+        )
+        self.open_seconds = float(
+            open_seconds
+            if open_seconds is not None
+            else _setting('CONTENT_AI_CIRCUIT_BREAKER_OPEN_SECONDS', 30)
+        )
+        self.clock = clock
+
+    def _key(self, suffix: str) -> str:
+        return f'{CACHE_PREFIX}:{self.name}:{suffix}'
+
+    @property
+    def _bucket_seconds(self) -> float:
+        return max(self.window_seconds / WINDOW_BUCKETS, 1.0)
+
+    def _bucket_keys(self, outcome: str) -> list[str]:
+        current = int(self.clock() // self._bucket_seconds)
+        return [
+            self._key(f'{outcome}:{bucket}')
+            for bucket in range(current - WINDOW_BUCKETS + 1, current + 1)
+        ]
+
+    def _increment(self, outcome: str) -> None:
+        key = self._bucket_keys(outcome)[-1]
+        ttl = int(self.window_seconds + self._bucket_seconds) + 1
+        self.cache.add(key, 0, timeout=ttl)
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            # Expired between add() and incr(); start the bucket again.
+            self.cache.set(key, 1, timeout=ttl)
+
+    def window_counts(self) -> tuple[int, int]:
+        """Return ``(successes, failures)`` in the current window."""
+        success_keys = self._bucket_keys('ok')
+        failure_keys = self._bucket_keys('fail')
+        values = self.cache.get_many(success_keys + failure_keys)
+        successes = sum(values.get(key, 0) for key in success_keys)
+        failures = sum(values.get(key, 0) for key in failure_keys)
+        return successes, failures
+
+    def state(self) -> str:
+        open_until = self.cache.get(self._key('open_until'))
+        if open_until is None:
+            return STATE_CLOSED
+        if self.clock() < open_until:
+            return STATE_OPEN
+        return STATE_HALF_OPEN
+
+    def remaining_open_seconds(self) -> float | None:
+        """Seconds until an open breaker lets a probe through, if it is open."""
+        open_until = self.cache.get(self._key('open_until'))
+        if open_until is None:
+            return None
+        remaining = open_until - self.clock()
+        return remaining if remaining > 0 else None
+
+    def before_call(self) -> None:
+        """Raise ``CircuitOpenError`` unless this call may go to the provider."""
+        state = self.state()
+        if state == STATE_CLOSED:
+            return
+        if state == STATE_HALF_OPEN and self.cache.add(
+            self._key('probe'),
+            1,
+            timeout=int(self.open_seconds) + 1,
+        ):
+            return
+        # The batch runner backs off this long, so queued items are not
+        # refused again (and charged an attempt) while the breaker is open.
+        raise CircuitOpenError(
+            f"Provider '{self.name}' circuit breaker is open.",
+            retry_after=self.remaining_open_seconds(),
+        )
+
+    def record_success(self) -> None:
+        state = self.state()
+        if state == STATE_HALF_OPEN:
+            self.reset()
+        elif state == STATE_CLOSED:
+            self._increment('ok')
+
+    def record_failure(self) -> None:
+        state = self.state()
+        if state == STATE_HALF_OPEN:
+            # A failed probe re-opens the breaker for another period.
+            self.trip()
+            return
+        if state == STATE_OPEN:
+            return
+        self._increment('fail')
+        successes, failures = self.window_counts()
+        total = successes + failures
+        if total >= self.min_calls and failures / total >= self.failure_rate:
+            self.trip()
+
+    def trip(self) -> None:
+        self.cache.set(
+            self._key('open_until'),
+            self.clock() + self.open_seconds,
+            timeout=None,
+        )
+        self.cache.delete(self._key('probe'))
+
+    def reset(self) -> None:
+        self.cache.delete_many(
+            [self._key('open_until'), self._key('probe')]
+            + self._bucket_keys('ok')
+            + self._bucket_keys('fail')
+        )
+
+    def call(self, func):
+        """Run ``func()`` through the breaker, recording its outcome."""
+        self.before_call()
+        try:
+            result = func()
+        except Exception as exc:
+            if is_retryable(exc):
+                self.record_failure()
+            else:
+                self.record_success()
+            raise
+        self.record_success()
+        return result
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Jittered exponential backoff ("full jitter")."""
+
+    max_retries: int = 0
+    base_delay: float = 0.25
+    max_delay: float = 4.0
+
+    def delay(self, retry_number: int) -> float:
+        """Seconds to wait before retry ``retry_number`` (1-based)."""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (retry_number - 1)))
+        return random.uniform(0, ceiling)
@@ -0,0 +1,290 @@
+"""Shared request and token budgets in front of provider calls (RFC-005).
+
+With ``CONTENT_AI_RATE_LIMIT_ENABLED``, every provider call first reserves
+one request and an estimated token count against the provider's
+per-minute budget in ``CONTENT_AI_PROVIDER_RATE_LIMITS``::
+
+    CONTENT_AI_PROVIDER_RATE_LIMITS = {
+        'openai': {'rpm': 500, 'tpm': 200_000},
+    }
+
+Budgets live in the Django cache named by ``CONTENT_AI_RATE_LIMIT_CACHE``
+so every worker draws from the same allowance. It must be a shared backend
+with an atomic ``incr`` such as Redis; per-process and database caches are
+refused (see ``content_ai.providers.shared_cache``). Usage is a
+sliding window over two per-minute counters: the previous minute's count,
+weighted by how much of it still overlaps the last 60 seconds, plus the
+current minute's count. Reservations are made with ``cache.incr`` and rolled
+back when they overshoot, so concurrent workers cannot both take the last
+slot. After the call, the estimate is corrected to the provider's reported
+token usage.
+
+Calls have a priority (``provider_priority()``). Interactive calls (the
+default) may use the whole budget and queue for up to
+``CONTENT_AI_RATE_LIMIT_MAX_WAIT`` seconds before they are shed. Batch calls
+may only use ``CONTENT_AI_RATE_LIMIT_BATCH_SHARE`` of it, which keeps
+headroom for editors, and are shed at once. A shed call raises
+``RateLimitError`` with ``retry_after`` set.
+
+When a provider error carries a retry-after hint, the provider is blocked
+for every worker until the hint expires.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import math
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+
+from content_ai.providers.exceptions import ProviderError, RateLimitError
+from content_ai.providers.shared_cache import shared_cache
+
+PRIORITY_INTERACTIVE = 'interactive'
+PRIORITY_BATCH = 'batch'
+
+WINDOW_SECONDS = 60
+CACHE_PREFIX = 'content_ai:ratelimit'
+# Rough prompt size in tokens when only the character count is known.
+CHARS_PER_TOKEN = 4
+POLL_SECONDS = 0.25
+
+DEFAULT_BATCH_SHARE = 0.5
+DEFAULT_MAX_WAIT = 5.0
+DEFAULT_OUTPUT_TOKENS = 1000
+
+_priority: contextvars.ContextVar = contextvars.ContextVar(
+    'content_ai_provider_priority',
+    default=PRIORITY_INTERACTIVE,
+)
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def rate_limits_enabled() -> bool:
+    return bool(_setting('CONTENT_AI_RATE_LIMIT_ENABLED', False))
+
+
+@contextmanager
+def provider_priority(priority: str):
+    """Schedule provider calls made inside the block at ``priority``."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> str:
+    return _priority.get()
+
+
+def estimate_tokens(
+    prompt: str,
+    *,
+    output_tokens: int = DEFAULT_OUTPUT_TOKENS,
+) -> int:
+    """Prompt tokens (from its length) plus the expected completion size."""
+    return len(prompt or '') // CHARS_PER_TOKEN + max(0, int(output_tokens))
+
+
+def retry_after_hint(exc: Exception) -> float | None:
+    """Seconds the provider asked callers to wait, if ``exc`` says so."""
+    value = getattr(exc, 'retry_after', None)
+    if value is None:
+        telemetry = getattr(exc, 'telemetry', None)
+        metadata = getattr(telemetry, 'metadata', None) or {}
+        value = metadata.get('retry_after')
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return None
+    return seconds if seconds > 0 else None
+
+
+class RateLimitScheduler:
+    """Per-minute request/token budget for one provider, stored in the cache."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        rpm: int | None = None,
+        tpm: int | None = None,
+        cache=None,
+        batch_share: float | None = None,
+        max_wait: float | None = None,
+        output_tokens: int | None = None,
+        clock=time.time,
+        sleep=time.sleep,
+    ):
+        budget = (_setting('CONTENT_AI_PROVIDER_RATE_LIMITS', None) or {}).get(
+            name
+        ) or {}
+        self.name = name
+        self.rpm = int(rpm if rpm is not None else budget.get('rpm') or 0)
+        self.tpm = int(tpm if tpm is not None else budget.get('tpm') or 0)
+        self.cache = cache or shared_cache('CONTENT_AI_RATE_LIMIT_CACHE')
+        self.batch_share = float(
+            batch_share
+            if batch_share is not None
+            else _setting('CONTENT_AI_RATE_LIMIT_BATCH_SHARE', DEFAULT_BATCH_SHARE)
+        )
+        self.max_wait = float(
+            max_wait
+            if max_wait is not None
+            else _setting('CONTENT_AI_RATE_LIMIT_MAX_WAIT', DEFAULT_MAX_WAIT)
+        )
+        self.output_tokens = int(
+            output_tokens
+            if output_tokens is not None
+            else _setting(
+                'CONTENT_AI_RATE_LIMIT_OUTPUT_TOKENS',
+                DEFAULT_OUTPUT_TOKENS,
+            )
+        )
+        self._clock = clock
+        self._sleep = sleep
+
+    def _key(self, suffix: str) -> str:
+        return f'{CACHE_PREFIX}:{self.name}:{suffix}'
+
+    def _incr(self, key: str, delta: int) -> int:
+        self.cache.add(key, 0, timeout=WINDOW_SECONDS * 2 + 5)
+        try:
+            if delta >= 0:
+                return self.cache.incr(key, delta)
+            return self.cache.decr(key, -delta)
+        except ValueError:
+            # Evicted between add() and incr(); start the counter over.
+            value = max(0, delta)
+            self.cache.set(key, value, timeout=WINDOW_SECONDS * 2 + 5)
+            return value
+
+    def blocked_for(self) -> float:
+        """Seconds left on a provider-requested pause, or 0."""
+        until = self.cache.get(self._key('blocked_until')) or 0
+        return max(0.0, float(until) - self._clock())
+
+    def block(self, seconds: float) -> None:
+        """Pause the provider for every worker for ``seconds``."""
+        if seconds <= self.blocked_for():
+            return
+        self.cache.set(
+            self._key('blocked_until'),
+            self._clock() + seconds,
+            timeout=math.ceil(seconds) + 1,
+        )
+
+    def usage(self) -> dict:
+        """Sliding-window requests and tokens over the last minute."""
+        now = self._clock()
+        window = int(now // WINDOW_SECONDS)
+        overlap = 1 - (now % WINDOW_SECONDS) / WINDOW_SECONDS
+        counts = self.cache.get_many(
+            [
+                self._key(f'req:{window}'),
+                self._key(f'tok:{window}'),
+                self._key(f'req:{window - 1}'),
+                self._key(f'tok:{window - 1}'),
+            ]
+        )
+        return {
+            'requests': counts.get(self._key(f'req:{window}'), 0)
+            + counts.get(self._key(f'req:{window - 1}'), 0) * overlap,
+            'tokens': counts.get(self._key(f'tok:{window}'), 0)
+            + counts.get(self._key(f'tok:{window - 1}'), 0) * overlap,
+        }
+
+    def _limits(self, priority: str) -> tuple[float, float]:
+        share = 1.0 if priority != PRIORITY_BATCH else self.batch_share
+        return self.rpm * share, self.tpm * share
+
+    def _try_reserve(self, tokens: int, priority: str) -> tuple[int, float]:
+        """
+        Reserve one request and ``tokens``; return ``(window, 0)`` on success.
+
+        On failure nothing stays reserved and the second value is a
+        suggested wait in seconds.
+        """
+        blocked = self.blocked_for()
+        if blocked > 0:
+            return -1, blocked
+        now = self._clock()
+        window = int(now // WINDOW_SECONDS)
+        rpm_limit, tpm_limit = self._limits(priority)
+        if not rpm_limit and not tpm_limit:
+            return window, 0.0
+        request_key = self._key(f'req:{window}')
+        token_key = self._key(f'tok:{window}')
+        self._incr(request_key, 1)
+        self._incr(token_key, tokens)
+        usage = self.usage()
+        over = (rpm_limit and usage['requests'] > rpm_limit) or (
+            tpm_limit and usage['tokens'] > tpm_limit
+        )
+        if not over:
+            return window, 0.0
+        self._incr(request_key, -1)
+        self._incr(token_key, -tokens)
+        return -1, max(POLL_SECONDS, WINDOW_SECONDS - now % WINDOW_SECONDS)
+
+    def acquire(self, tokens: int, priority: str | None = None) -> int:
+        """
+        Reserve budget for one call; return the window it was charged to.
+
+        Interactive calls wait up to ``max_wait``; batch calls do not wait.
+        Raises ``RateLimitError`` when the call is shed.
+        """
+        priority = priority or current_priority()
+        max_wait = self.max_wait if priority != PRIORITY_BATCH else 0.0
+        deadline = self._clock() + max_wait
+        while True:
+            window, wait = self._try_reserve(tokens, priority)
+            if wait <= 0:
+                return window
+            remaining = deadline - self._clock()
+            if remaining <= 0:
+                raise RateLimitError(
+                    f"Provider '{self.name}' is over its rate limit "
+                    f'({priority} call shed).',
+                    retry_after=round(wait, 3),
+                )
+            self._sleep(min(wait, POLL_SECONDS, remaining))
+
+    def settle(self, window: int, reserved: int, actual: int) -> None:
+        """Replace the token estimate charged to ``window`` with ``actual``."""
+        delta = int(actual) - int(reserved)
+        if delta and (self.rpm or self.tpm):
+            self._incr(self._key(f'tok:{window}'), delta)
+
+    def observe_error(self, exc: Exception) -> None:
+        hint = retry_after_hint(exc)
+        if hint:
+            self.block(hint)
+
+    def call(self, func, *, prompt: str = '', priority: str | None = None):
+        """Run ``func()`` once budget is available."""
+        tokens = estimate_tokens(prompt, output_tokens=self.output_tokens)
+        window = self.acquire(tokens, priority)
+        try:
+            result = func()
+        except ProviderError as exc:
+            self.observe_error(exc)
+            raise
+        telemetry = getattr(result, 'telemetry', None)
+        total = (getattr(telemetry, 'token_usage', None) or {}).get('total_tokens')
+        if total is not None:
+            self.settle(window, tokens, total)
+        return result
+
+
+def schedule_provider_call(provider_name: str, func, *, prompt: str = ''):
+    """Run ``func()`` under ``provider_name``'s rate-limit budget when enabled."""
+    if not rate_limits_enabled():
+        return func()
+    return RateLimitScheduler(provider_name).call(func, prompt=prompt)
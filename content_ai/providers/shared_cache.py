@@ -0,0 +1,49 @@
+"""Cache lookup for provider state shared by every worker (RFC-005).
+
+Circuit breaker and rate-limit state only work when every web and
+``run_ai_jobs`` process reads the same counters and bumps them with an
+atomic ``incr``. Redis and memcached qualify. LocMem and dummy caches are
+per process, and the database and file caches implement ``incr`` as
+read-modify-write, so two workers can both take the last slot.
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.db import DatabaseCache
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import ImproperlyConfigured
+
+UNSHARED_BACKENDS = (LocMemCache, DummyCache, DatabaseCache, FileBasedCache)
+
+
+def unshared_cache_reason(setting_name: str) -> str | None:
+    """Why the cache named by ``setting_name`` cannot hold shared state, if so."""
+    if getattr(settings, 'CONTENT_AI_ALLOW_PROCESS_LOCAL_CACHE', False):
+        return None
+    alias = getattr(settings, setting_name, 'default')
+    cache = caches[alias]
+    if isinstance(cache, UNSHARED_BACKENDS):
+        return (
+            f'{setting_name} ({alias!r}) uses {type(cache).__name__}, which '
+            'is not shared between workers with an atomic incr. Point it at '
+            'a Redis or memcached cache.'
+        )
+    return None
+
+
+def shared_cache(setting_name: str):
+    """
+    Return the cache named by ``setting_name`` (default ``'default'``).
+
+    Raises ``ImproperlyConfigured`` for per-process or non-atomic backends
+    unless ``CONTENT_AI_ALLOW_PROCESS_LOCAL_CACHE`` is set, which is only
+    meant for single-process development and tests.
+    """
+    reason = unshared_cache_reason(setting_name)
+    if reason:
+        raise ImproperlyConfigured(reason)
+    return caches[getattr(settings, setting_name, 'default')]
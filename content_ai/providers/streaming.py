@@ -0,0 +1,47 @@
+"""Streaming text generation result wrapper (RFC-005)."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+
+from content_ai.schemas.responses import GenerationResult
+
+
+class GenerationStream:
+    """
+    Iterator of text deltas returned by ``BaseAIProvider.stream()``.
+
+    Iterate to receive deltas as the provider produces them. Once the
+    iterator is exhausted, ``result`` holds the final ``GenerationResult``
+    (full text, metadata, telemetry) built by ``finalize``.
+    """
+
+    def __init__(
+        self,
+        deltas: Iterable[str],
+        *,
+        finalize: Callable[[str], GenerationResult],
+    ):
+        self._deltas = deltas
+        self._finalize = finalize
+        self._parts: list[str] = []
+        self.result: GenerationResult | None = None
+
+    def __iter__(self) -> Iterator[str]:
+        for delta in self._deltas:
+            if not delta:
+                continue
+            self._parts.append(delta)
+            yield delta
+        self.result = self._finalize(self.text)
+
+    @property
+    def text(self) -> str:
+        return ''.join(self._parts)
+
+    def consume(self) -> GenerationResult:
+        """Drain remaining deltas and return the final result."""
+        if self.result is None:
+            for _ in self:
+                pass
+        return self.result
@@ -128,3 +128,87 @@ def serialize_error(code, message, details=None):
     if details is not None:
         payload['error']['details'] = details
     return payload
+
+
+def serialize_job(job):
+    """Serialize the status fields of an ``AIJob`` (not payload or result)."""
+    return {
+        'id': job.pk,
+        'operation': job.operation,
+        'status': job.status,
+        'attempts': job.attempts,
+        'error': job.error,
+        'started_at': job.started_at.isoformat() if job.started_at else None,
+        'completed_at': (
+            job.completed_at.isoformat() if job.completed_at else None
+        ),
+    }
+
+
+def parse_batch_request(data):
+    """
+    Normalize JSON into kwargs for ``content_ai.batch.service.submit_batch``.
+
+    Required: ``task`` and ``requests`` (a list of request objects, each
+    optionally carrying ``source_ref``). Optional: provider_name,
+    use_cache, concurrency.
+    """
+    if not isinstance(data, dict):
+        raise SerializationError('Request body must be a JSON object.')
+    allowed = {'task', 'requests', 'provider_name', 'use_cache', 'concurrency'}
+    unknown = set(data.keys()) - allowed
+    if unknown:
+        raise SerializationError(
+            f"Unknown fields: {', '.join(sorted(unknown))}."
+        )
+    task = data.get('task')
+    if not isinstance(task, str) or not task:
+        raise SerializationError("Field 'task' must be a non-empty string.")
+    entries = data.get('requests')
+    if not isinstance(entries, list) or not entries:
+        raise SerializationError("Field 'requests' must be a non-empty list.")
+
+    requests = []
+    source_refs = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            raise SerializationError('Each batch request must be a JSON object.')
+        entry = dict(entry)
+        source_refs.append(str(entry.pop('source_ref', '') or ''))
+        requests.append(entry)
+
+    kwargs = {
+        'task': task,
+        'requests': requests,
+        'source_refs': source_refs if any(source_refs) else None,
+        'use_cache': bool(data.get('use_cache', True)),
+    }
+    provider_name = data.get('provider_name')
+    if provider_name:
+        if not isinstance(provider_name, str):
+            raise SerializationError("Field 'provider_name' must be a string.")
+        kwargs['provider_name'] = provider_name
+    concurrency = data.get('concurrency')
+    if concurrency is not None:
+        if not isinstance(concurrency, int) or isinstance(concurrency, bool):
+            raise SerializationError("Field 'concurrency' must be an integer.")
+        if concurrency < 1:
+            raise SerializationError("Field 'concurrency' must be at least 1.")
+        kwargs['concurrency'] = concurrency
+    return kwargs
+
+
+def serialize_batch_item(item):
+    """Serialize one staged batch result."""
+    return {
+        'position': item.position,
+        'source_ref': item.source_ref,
+        'status': item.status,
+        'review_status': item.review_status,
+        'attempts': item.attempts,
+        'content': item.content,
+        'error': item.error,
+        'provider': item.provider,
+        'model': item.model_name,
+        'prompt_version': item.prompt_version,
+    }
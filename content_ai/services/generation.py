@@ -14,6 +14,7 @@ from content_ai.telemetry import (
     merge_telemetry,
     utc_now,
 )
+from content_ai.telemetry.generation_metrics import record_generation
 from content_ai.workflow import (
     StageExecutionError,
     WorkflowOrchestrator,
@@ -70,13 +71,23 @@ class ContentGenerationService:
     def __init__(self, workflow: WorkflowOrchestrator | None = None):
         self.workflow = workflow or WorkflowOrchestrator()
 
-    def generate(self, task, request=None, provider_name=None):
+    def generate(
+        self,
+        task,
+        request=None,
+        provider_name=None,
+        on_delta=None,
+        use_cache=True,
+    ):
         """
         Run ``task`` through WorkflowOrchestrator against the configured provider.
 
         ``request`` should be a canonical request schema (e.g.
         ``PostGenerationRequest`` / ``AdGenerationRequest``) when applicable.
         ``provider_name`` optionally overrides ``settings.CONTENT_AI_PROVIDER``.
+        ``on_delta`` is called with each text delta when the provider can
+        stream; the returned result is the same either way.
+        ``use_cache=False`` skips the opt-in generation cache for this call.
         """
         method_name = _TASK_METHODS.get(task)
         if method_name is None:
@@ -97,6 +108,8 @@ class ContentGenerationService:
             'request': request,
             'provider_name': provider_name,
             'method_name': method_name,
+            'on_delta': on_delta,
+            'use_cache': use_cache,
         }
 
         started_at = utc_now()
@@ -119,6 +132,11 @@ class ContentGenerationService:
                     error_type=type(cause).__name__,
                     prompt_length=prompt_length,
                 )
+                record_generation(
+                    telemetry,
+                    task=str(task),
+                    prompt_version=context.prompt_version or '',
+                )
                 raise GenerationError(str(cause), telemetry=telemetry) from cause
             if isinstance(cause, ProviderError):
                 raise cause from exc
@@ -199,4 +217,9 @@ class ContentGenerationService:
             provider=result.provider,
             telemetry=None,
         )
+        record_generation(
+            telemetry,
+            task=str(task),
+            prompt_version=prompt_version or '',
+        )
         return attach_telemetry(result, telemetry)
@@ -0,0 +1,191 @@
+"""
+Opt-in, content-addressed cache of provider generation results.
+
+Entries are keyed by ``(provider, model, prompt_version, sha256(prompt),
+task)``, so any change to the assembled prompt, prompt version or model
+misses. The cache is per process, bounded to
+``CONTENT_AI_GENERATION_CACHE_MAX_ENTRIES`` with least-recently-used
+eviction, and each task has its own TTL. Only successful results from
+the keyed provider itself are stored, never a failover answer. Cache
+status and hit/miss counters are added to the result telemetry under
+``metadata['cache']``.
+
+Settings:
+
+- ``CONTENT_AI_GENERATION_CACHE_ENABLED`` (default False)
+- ``CONTENT_AI_GENERATION_CACHE_MAX_ENTRIES`` (default 256)
+- ``CONTENT_AI_GENERATION_CACHE_TTLS``: task -> seconds; 0 disables a task
+- ``CONTENT_AI_GENERATION_CACHE_DEFAULT_TTL`` (default 900)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+from django.conf import settings
+
+from content_ai.schemas.responses import GenerationResult
+from content_ai.telemetry import AIExecutionTelemetry, attach_telemetry, merge_telemetry
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL_SECONDS = 900
+
+CACHE_HIT = 'hit'
+CACHE_MISS = 'miss'
+CACHE_BYPASS = 'bypass'
+
+
+class GenerationCacheKey(NamedTuple):
+    provider: str
+    model: str
+    prompt_version: str
+    prompt_sha256: str
+    task: str
+
+
+def make_cache_key(provider, prompt: str, *, task: str, prompt_version: str = '') -> GenerationCacheKey:
+    return GenerationCacheKey(
+        provider=getattr(provider, 'name', '') or '',
+        model=getattr(provider, 'model', '') or '',
+        prompt_version=prompt_version or '',
+        prompt_sha256=hashlib.sha256((prompt or '').encode('utf-8')).hexdigest(),
+        task=str(task),
+    )
+
+
+class GenerationCache:
+    """Thread-safe LRU of ``GenerationResult`` values with per-entry expiry."""
+
+    def __init__(self, max_entries: int | None = None):
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[GenerationCacheKey, tuple[float, GenerationResult]] = (
+            OrderedDict()
+        )
+        self._max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is not None:
+            return self._max_entries
+        return int(
+            getattr(
+                settings,
+                'CONTENT_AI_GENERATION_CACHE_MAX_ENTRIES',
+                DEFAULT_MAX_ENTRIES,
+            )
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get(self, key: GenerationCacheKey) -> GenerationResult | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= now:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: GenerationCacheKey, result: GenerationResult, ttl: float) -> None:
+        expires_at = time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (expires_at, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max(0, self.max_entries):
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+
+generation_cache = GenerationCache()
+
+
+def cache_enabled() -> bool:
+    return bool(getattr(settings, 'CONTENT_AI_GENERATION_CACHE_ENABLED', False))
+
+
+def task_ttl(task) -> float:
+    ttls = getattr(settings, 'CONTENT_AI_GENERATION_CACHE_TTLS', None) or {}
+    default = getattr(
+        settings,
+        'CONTENT_AI_GENERATION_CACHE_DEFAULT_TTL',
+        DEFAULT_TTL_SECONDS,
+    )
+    return float(ttls.get(str(task), default))
+
+
+def _annotate(result: GenerationResult, status: str, key=None) -> GenerationResult:
+    stats = generation_cache.stats()
+    cache_info = {
+        'status': status,
+        'hits': stats['hits'],
+        'misses': stats['misses'],
+    }
+    if key is not None:
+        cache_info['key'] = key.prompt_sha256[:16]
+    telemetry = result.telemetry or AIExecutionTelemetry(provider=result.provider)
+    metadata = dict(telemetry.metadata or {})
+    metadata['cache'] = cache_info
+    return attach_telemetry(result, merge_telemetry(telemetry, metadata=metadata))
+
+
+def generate_with_cache(
+    provider,
+    prompt: str,
+    *,
+    task,
+    generate,
+    prompt_version: str = '',
+    use_cache: bool = True,
+) -> GenerationResult:
+    """
+    Return a cached result for this prompt or call ``generate()``.
+
+    ``use_cache=False`` always calls the provider (and reports ``bypass``)
+    but still stores the fresh result for later callers.
+    """
+    ttl = task_ttl(task)
+    if not cache_enabled() or ttl <= 0:
+        return generate()
+    key = make_cache_key(provider, prompt, task=task, prompt_version=prompt_version)
+    if use_cache:
+        cached = generation_cache.get(key)
+        if cached is not None:
+            return _annotate(cached, CACHE_HIT, key)
+    result = generate()
+    # After failover the answer came from another provider; keep it out of
+    # this provider's entry so later hits report who really answered.
+    if result.success and result.provider == key.provider:
+        generation_cache.set(key, result, ttl)
+    return _annotate(result, CACHE_MISS if use_cache else CACHE_BYPASS, key)
+
+
+def is_cache_hit(result: GenerationResult) -> bool:
+    telemetry = result.telemetry
+    if telemetry is None:
+        return False
+    return (telemetry.metadata or {}).get('cache', {}).get('status') == CACHE_HIT
@@ -5,6 +5,9 @@
   if (!root) return;
 
   var apiBase = root.getAttribute('data-api-base') || '/content-ai/workspace/api';
+  var streamDraftUrl = root.getAttribute('data-stream-draft-url') || '';
+  var backgroundJobs = root.getAttribute('data-background-jobs') === '1';
+  var JOB_POLL_INTERVAL_MS = 2000;
   var csrfInput = document.querySelector('input[name="csrfmiddlewaretoken"]');
   var csrf = csrfInput ? csrfInput.value : '';
   var applyingClassification = false;
@@ -224,7 +227,7 @@
       aspect_ratio: '16:9',
       endpoint: apiBase.replace(/\/$/, '') + '/' + action + '/',
     });
-    return post(action, payload)
+    return postBackgroundable(action, payload)
       .then(function (data) {
         if (data && data.ok) {
           try {
@@ -634,6 +637,44 @@
     });
   }
 
+  // With background jobs enabled the server queues long generations and
+  // answers 202 + poll_url; poll until the worker finishes the AIJob.
+  function pollJob(pollUrl) {
+    return new Promise(function (resolve) {
+      function tick() {
+        fetch(pollUrl, { credentials: 'same-origin' })
+          .then(function (res) { return res.json(); })
+          .then(function (data) {
+            var status = data.job && data.job.status;
+            if (status === 'completed' || status === 'failed' || !data.job) {
+              if (!data.ok) {
+                window.alert(
+                  (data.error && data.error.message) || 'Background job failed'
+                );
+              }
+              resolve(data);
+              return;
+            }
+            window.setTimeout(tick, JOB_POLL_INTERVAL_MS);
+          })
+          .catch(function (err) {
+            console.error('[ai-ws] JOB POLL FAIL', { url: pollUrl, err: err });
+            window.setTimeout(tick, JOB_POLL_INTERVAL_MS);
+          });
+      }
+      tick();
+    });
+  }
+
+  function postBackgroundable(action, payload) {
+    if (!backgroundJobs) return post(action, payload);
+    var body = Object.assign({}, payload || {}, { background: true });
+    return post(action, body).then(function (data) {
+      if (data && data.ok && data.poll_url) return pollJob(data.poll_url);
+      return data;
+    });
+  }
+
   function confidencePct(value) {
     var n = Number(value || 0);
     if (n <= 1) n = Math.round(n * 100);
@@ -798,8 +839,91 @@
     lengthSelect.addEventListener('change', onClassificationChange);
   }
 
+  // Streams draft text into the lead/body fields as it arrives (SSE over
+  // fetch), then applies the saved session. Uses the job queue when
+  // background jobs are enabled, and the JSON API when the browser cannot
+  // read response streams.
+  function streamDraft(payload) {
+    if (backgroundJobs || !streamDraftUrl || !window.ReadableStream || !window.TextDecoder) {
+      return postBackgroundable('generate_draft', payload);
+    }
+    var fields = {
+      headline_lead: document.getElementById('ai-ws-lead'),
+      body: document.getElementById('ai-ws-body'),
+    };
+    var cleared = {};
+    var finalData = null;
+
+    function handleEvent(block) {
+      var event = 'message';
+      var dataLines = [];
+      block.split('\n').forEach(function (line) {
+        if (line.indexOf('event:') === 0) event = line.slice(6).trim();
+        else if (line.indexOf('data:') === 0) dataLines.push(line.slice(5).trim());
+      });
+      if (!dataLines.length) return;
+      var data = JSON.parse(dataLines.join('\n'));
+      if (event === 'delta') {
+        var field = fields[data.pass];
+        if (!field) return;
+        if (!cleared[data.pass]) {
+          field.value = '';
+          cleared[data.pass] = true;
+        }
+        field.value += data.text;
+      } else if (event === 'done' || event === 'error') {
+        finalData = data;
+      }
+    }
+
+    return fetch(streamDraftUrl, {
+      method: 'POST',
+      credentials: 'same-origin',
+      headers: {
+        'Content-Type': 'application/json',
+        'X-CSRFToken': csrf,
+      },
+      body: JSON.stringify(payload),
+    }).then(function (res) {
+      var contentType = res.headers.get('content-type') || '';
+      if (contentType.indexOf('text/event-stream') === -1 || !res.body) {
+        return res.json().then(function (data) {
+          var msg = (data.error && data.error.message) || 'Request failed';
+          throw new Error(msg);
+        });
+      }
+      var reader = res.body.getReader();
+      var decoder = new TextDecoder();
+      var buffer = '';
+      function pump() {
+        return reader.read().then(function (chunk) {
+          if (chunk.done) return finalData || { ok: false };
+          buffer += decoder.decode(chunk.value, { stream: true });
+          var parts = buffer.split('\n\n');
+          buffer = parts.pop();
+          parts.forEach(handleEvent);
+          return pump();
+        });
+      }
+      return pump();
+    }).then(function (data) {
+      if (!data.ok) {
+        throw new Error((data.error && data.error.message) || 'Draft generation failed');
+      }
+      return data;
+    }).catch(function (err) {
+      console.error('[ai-ws] STREAM FAIL', {
+        url: streamDraftUrl,
+        message: err && err.message,
+        stack: err && err.stack,
+      });
+      window.alert((err && err.message ? err.message : String(err)).slice(0, 4000));
+      return { ok: false, error: err && err.message };
+    });
+  }
+
   document.getElementById('ai-ws-generate').addEventListener('click', function () {
-    post('generate_draft', {
+    streamDraft({
       source_text: document.getElementById('ai-ws-source-text').value,
       source_url: document.getElementById('ai-ws-source-url').value,
       title: document.getElementById('ai-ws-source-title').value,
@@ -0,0 +1,245 @@
+"""Concurrent fan-out for Studio comparison generations (APF-002).
+
+Each comparison branch (a prompt variant or provider) runs on a bounded
+thread pool, so a comparison takes about as long as its slowest branch
+rather than the sum of all of them. Branches are plain callables; they must
+not touch the Studio session, which is only updated by the caller as
+results arrive.
+
+Python threads cannot be interrupted. A branch that passes its own timeout
+or the global deadline, or that is cancelled while running, is reported and
+abandoned: its eventual result is discarded. Branches that have not started
+yet are cancelled outright.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from django.conf import settings
+
+BRANCH_COMPLETED = 'completed'
+BRANCH_FAILED = 'failed'
+BRANCH_TIMED_OUT = 'timed_out'
+BRANCH_CANCELLED = 'cancelled'
+
+DEFAULT_MAX_WORKERS = 4
+# Below Heroku's 30s router limit, like OPENAI_TEXT_TIMEOUT.
+DEFAULT_DEADLINE_SECONDS = 27.0
+
+
+@dataclass
+class BranchResult:
+    """Outcome of one fan-out branch."""
+
+    key: str
+    status: str
+    value: Any = None
+    error: str = ''
+    elapsed_ms: float | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'key': self.key,
+            'status': self.status,
+            'error': self.error,
+            'elapsed_ms': self.elapsed_ms,
+        }
+
+
+@dataclass
+class _Branch:
+    key: str
+    func: Callable[[], Any]
+    started_at: float | None = None
+    future: Any = None
+    done: bool = False
+
+
+class FanOut:
+    """
+    Run named callables concurrently under a global deadline.
+
+    ``run()`` returns ``BranchResult`` objects in completion order and calls
+    ``on_result`` as each one arrives. ``cancel(key)`` may be called from
+    ``on_result`` or another thread to drop a branch.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        deadline_seconds: float | None = None,
+        branch_timeout: float | None = None,
+        clock=time.monotonic,
+    ):
+        self.max_workers = max(
+            1,
+            int(
+                max_workers
+                or getattr(
+                    settings,
+                    'CONTENT_AI_STUDIO_FANOUT_WORKERS',
+                    DEFAULT_MAX_WORKERS,
+                )
+            ),
+        )
+        self.deadline_seconds = float(
+            deadline_seconds
+            or getattr(
+                settings,
+                'CONTENT_AI_STUDIO_FANOUT_DEADLINE',
+                DEFAULT_DEADLINE_SECONDS,
+            )
+        )
+        self.branch_timeout = branch_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._cancelled: set[str] = set()
+
+    def cancel(self, key: str) -> None:
+        with self._lock:
+            self._cancelled.add(key)
+
+    def _is_cancelled(self, key: str) -> bool:
+        with self._lock:
+            return key in self._cancelled
+
+    def _wrap(self, branch: _Branch):
+        def run_branch():
+            branch.started_at = self._clock()
+            return branch.func()
+
+        return run_branch
+
+    def _elapsed_ms(self, branch: _Branch, now: float) -> float | None:
+        if branch.started_at is None:
+            return None
+        return round((now - branch.started_at) * 1000, 3)
+
+    def run(
+        self,
+        branches: dict[str, Callable[[], Any]],
+        *,
+        on_result: Callable[[BranchResult], None] | None = None,
+    ) -> list[BranchResult]:
+        if not branches:
+            return []
+        deadline = self._clock() + self.deadline_seconds
+        pending = {key: _Branch(key, func) for key, func in branches.items()}
+        results: list[BranchResult] = []
+
+        def finish(branch: _Branch, result: BranchResult) -> None:
+            branch.done = True
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(pending)),
+            thread_name_prefix='studio-fanout',
+        )
+        try:
+            by_future = {}
+            for branch in pending.values():
+                branch.future = executor.submit(self._wrap(branch))
+                by_future[branch.future] = branch
+
+            while True:
+                open_branches = [b for b in pending.values() if not b.done]
+                if not open_branches:
+                    break
+                now = self._clock()
+
+                for branch in open_branches:
+                    if self._is_cancelled(branch.key):
+                        branch.future.cancel()
+                        finish(
+                            branch,
+                            BranchResult(
+                                branch.key,
+                                BRANCH_CANCELLED,
+                                elapsed_ms=self._elapsed_ms(branch, now),
+                            ),
+                        )
+                    elif branch.future.done():
+                        # Finished in time; collected by wait() below.
+                        continue
+                    elif (
+                        self.branch_timeout is not None
+                        and branch.started_at is not None
+                        and now - branch.started_at >= self.branch_timeout
+                    ):
+                        finish(
+                            branch,
+                            BranchResult(
+                                branch.key,
+                                BRANCH_TIMED_OUT,
+                                error='Branch timeout exceeded.',
+                                elapsed_ms=self._elapsed_ms(branch, now),
+                            ),
+                        )
+                    elif now >= deadline:
+                        started = branch.started_at is not None
+                        branch.future.cancel()
+                        finish(
+                            branch,
+                            BranchResult(
+                                branch.key,
+                                BRANCH_TIMED_OUT if started else BRANCH_CANCELLED,
+                                error='Comparison deadline exceeded.',
+                                elapsed_ms=self._elapsed_ms(branch, now),
+                            ),
+                        )
+
+                waiting = [b.future for b in pending.values() if not b.done]
+                if not waiting:
+                    break
+                timeout = deadline - now
+                if self.branch_timeout is not None:
+                    for branch in pending.values():
+                        if not branch.done and branch.started_at is not None:
+                            timeout = min(
+                                timeout,
+                                branch.started_at + self.branch_timeout - now,
+                            )
+                # Wake up periodically so cancel() is noticed promptly.
+                completed, _ = wait(
+                    waiting,
+                    timeout=max(0.0, min(timeout, 0.25)),
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in completed:
+                    branch = by_future[future]
+                    if branch.done or future.cancelled():
+                        continue
+                    now = self._clock()
+                    error = future.exception()
+                    if error is not None:
+                        finish(
+                            branch,
+                            BranchResult(
+                                branch.key,
+                                BRANCH_FAILED,
+                                error=str(error),
+                                elapsed_ms=self._elapsed_ms(branch, now),
+                            ),
+                        )
+                    else:
+                        finish(
+                            branch,
+                            BranchResult(
+                                branch.key,
+                                BRANCH_COMPLETED,
+                                value=future.result(),
+                                elapsed_ms=self._elapsed_ms(branch, now),
+                            ),
+                        )
+        finally:
+            # Do not wait for abandoned branches; drop any not yet started.
+            executor.shutdown(wait=False, cancel_futures=True)
+        return results
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import asdict
+from functools import partial
 from pathlib import Path
 from uuid import uuid4
 
@@ -23,7 +25,11 @@ from content_ai.knowledge import (
 from content_ai.knowledge.utils import DEFAULT_KNOWLEDGE_ROOT, MANIFEST_FILENAME
 from content_ai.prompts.builders import PromptBuilder
 from content_ai.providers import get_provider, list_providers
+from content_ai.providers.manager import ProviderManager
+from content_ai.services.generation_cache import generate_with_cache
+from content_ai.studio.fanout import BRANCH_COMPLETED, FanOut
 from content_ai.studio.session import GenerationRecord, StudioSession, utc_now
+from content_ai.telemetry.generation_metrics import record_generation
 from content_ai.workflow import (
     ALLOWED_TRANSITIONS,
     WorkflowOrchestrator,
@@ -32,6 +38,8 @@ from content_ai.workflow import (
     create_initial_context,
 )
 
+MAX_COMPARE_VARIANTS = 8
+
 
 class StudioService:
     """
@@ -141,6 +149,9 @@ class StudioService:
         version_b: str,
         style_b: str,
         user_prompt: str = '',
+        generate: bool = False,
+        provider_name: str = 'mock',
+        use_cache: bool = True,
     ) -> dict:
         left = self.preview_prompt(
             session, version=version_a, style=style_a, user_prompt=user_prompt
@@ -155,6 +166,16 @@ class StudioService:
             'automatic_winner': None,
             'note': 'Editors decide — no automatic winner selection.',
         }
+        if generate:
+            result['generations'] = self.compare_variants(
+                session,
+                variants=[
+                    {'version': version_a, 'style': style_a, 'provider': provider_name},
+                    {'version': version_b, 'style': style_b, 'provider': provider_name},
+                ],
+                user_prompt=user_prompt,
+                use_cache=use_cache,
+            )
         session.last_comparison = {
             'dimension': 'prompt',
             'a_label': f'{version_a}/{style_a}',
@@ -412,16 +433,76 @@ class StudioService:
         provider_name: str = 'mock',
         knowledge_version: str = '',
         workflow_stage: str = 'studio',
+        use_cache: bool = True,
     ) -> dict:
+        assembled, result = self._generate_test_output(
+            user_prompt=user_prompt,
+            version=version,
+            style=style,
+            provider_name=provider_name,
+            use_cache=use_cache,
+        )
+        return self._record_test_generation(
+            session,
+            assembled=assembled,
+            result=result,
+            user_prompt=user_prompt,
+            version=version,
+            style=style,
+            provider_name=provider_name,
+            knowledge_version=knowledge_version,
+            workflow_stage=workflow_stage,
+        )
+
+    def _generate_test_output(
+        self,
+        *,
+        user_prompt: str,
+        version: str,
+        style: str,
+        provider_name: str,
+        use_cache: bool,
+    ):
+        """Assemble the prompt and call the provider; safe to run in a thread."""
         assembled = self.prompt_builder.build(
             version=version,
             style=style,
             user_prompt=user_prompt,
         )
         provider = get_provider(provider_name or 'mock')
-        result = provider.generate(assembled, task='post_generation')
+        result = generate_with_cache(
+            provider,
+            assembled,
+            task='post_generation',
+            prompt_version=version,
+            use_cache=use_cache,
+            # No failover: a test run must come from the provider the
+            # editor picked, or comparisons mix providers.
+            generate=lambda: ProviderManager(fallback_providers=()).invoke(
+                lambda current: current.generate(assembled, task='post_generation'),
+                provider=provider,
+                prompt=assembled,
+                task='post_generation',
+            ),
+        )
+        return assembled, result
+
+    def _record_test_generation(
+        self,
+        session: StudioSession,
+        *,
+        assembled: str,
+        result,
+        user_prompt: str,
+        version: str,
+        style: str,
+        provider_name: str,
+        knowledge_version: str,
+        workflow_stage: str,
+    ) -> dict:
         output = '' if result.content is None else str(result.content)
         telemetry = result.telemetry
+        record_generation(telemetry, task='studio_test', prompt_version=version)
         latency = telemetry.duration_ms if telemetry else None
         token_usage = telemetry.token_usage if telemetry else None
         estimated_cost = telemetry.estimated_cost if telemetry else None
@@ -477,6 +558,113 @@ class StudioService:
         ]
         return record.to_dict()
 
+    def compare_variants(
+        self,
+        session: StudioSession,
+        *,
+        variants: list[dict],
+        user_prompt: str = '',
+        knowledge_version: str = '',
+        use_cache: bool = True,
+        deadline_seconds: float | None = None,
+        branch_timeout: float | None = None,
+        max_workers: int | None = None,
+    ) -> dict:
+        """
+        Generate every prompt/provider variant concurrently.
+
+        Completed branches are evaluated and added to history in completion
+        order. Branches that fail, time out or miss the deadline are
+        reported without a generation, so editors still get partial results.
+        """
+        if not isinstance(variants, list) or not (
+            2 <= len(variants) <= MAX_COMPARE_VARIANTS
+        ):
+            raise ValueError(
+                f'Provide between 2 and {MAX_COMPARE_VARIANTS} variants to compare.'
+            )
+        specs = {}
+        for index, variant in enumerate(variants):
+            if not isinstance(variant, dict):
+                raise ValueError('Each variant must be an object.')
+            version = variant.get('version') or DEFAULT_PROMPT_VERSION
+            style = variant.get('style') or DEFAULT_STYLE
+            provider_name = variant.get('provider') or 'mock'
+            specs[str(index)] = {
+                'version': version,
+                'style': style,
+                'provider': provider_name,
+                'label': f'{version}/{style}@{provider_name}',
+            }
+
+        fan_out = FanOut(
+            max_workers=max_workers,
+            deadline_seconds=deadline_seconds,
+            branch_timeout=branch_timeout,
+        )
+        branches = {
+            key: partial(
+                self._generate_test_output,
+                user_prompt=user_prompt,
+                version=spec['version'],
+                style=spec['style'],
+                provider_name=spec['provider'],
+                use_cache=use_cache,
+            )
+            for key, spec in specs.items()
+        }
+        started = time.perf_counter()
+        outcomes = fan_out.run(branches)
+        wall_ms = round((time.perf_counter() - started) * 1000, 3)
+
+        rows = []
+        for outcome in outcomes:
+            spec = specs[outcome.key]
+            generation = None
+            if outcome.status == BRANCH_COMPLETED:
+                assembled, result = outcome.value
+                generation = self._record_test_generation(
+                    session,
+                    assembled=assembled,
+                    result=result,
+                    user_prompt=user_prompt,
+                    version=spec['version'],
+                    style=spec['style'],
+                    provider_name=spec['provider'],
+                    knowledge_version=knowledge_version,
+                    workflow_stage='studio_compare',
+                )
+            rows.append(
+                {
+                    **outcome.to_dict(),
+                    'label': spec['label'],
+                    'variant': {
+                        key: spec[key] for key in ('version', 'style', 'provider')
+                    },
+                    'generation': generation,
+                }
+            )
+        completed = sum(1 for row in rows if row['status'] == BRANCH_COMPLETED)
+        session.last_comparison = {
+            'dimension': 'variants',
+            'labels': [spec['label'] for spec in specs.values()],
+        }
+        session.last_explanations = [
+            f'{completed} of {len(specs)} variants generated concurrently '
+            f'in {wall_ms:.0f} ms.',
+            'No automatic winner — editorial judgment required.',
+        ]
+        session.touch()
+        return {
+            'dimension': 'variants',
+            'branches': rows,
+            'completed': completed,
+            'partial': completed < len(specs),
+            'wall_ms': wall_ms,
+            'automatic_winner': None,
+            'note': 'Editors decide — no automatic winner selection.',
+        }
+
     def generation_history(self, session: StudioSession) -> dict:
         return {
             'count': len(session.history),
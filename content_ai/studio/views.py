@@ -126,6 +126,22 @@ def studio_api(request, action: str):
                 version_b=payload.get('version_b') or 'v1',
                 style_b=payload.get('style_b') or 'analysis',
                 user_prompt=payload.get('user_prompt') or '',
+                generate=bool(payload.get('generate')),
+                provider_name=payload.get('provider') or 'mock',
+                use_cache=not payload.get('fresh'),
+            )
+            save_session(request, session)
+            return JsonResponse(
+                {'ok': True, 'result': result, 'session': session.to_dict()}
+            )
+
+        if action == 'compare_variants':
+            result = service.compare_variants(
+                session,
+                variants=payload.get('variants') or [],
+                user_prompt=payload.get('user_prompt') or '',
+                knowledge_version=payload.get('knowledge_version') or '',
+                use_cache=not payload.get('fresh'),
             )
             save_session(request, session)
             return JsonResponse(
@@ -190,6 +206,7 @@ def studio_api(request, action: str):
                 style=payload.get('style') or 'news',
                 provider_name=payload.get('provider') or 'mock',
                 knowledge_version=payload.get('knowledge_version') or '',
+                use_cache=not payload.get('fresh'),
             )
             save_session(request, session)
             return JsonResponse(
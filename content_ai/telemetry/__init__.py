@@ -1,4 +1,4 @@
-"""In-memory AI execution telemetry. No persistence or analytics backends."""
+"""AI execution telemetry. Persistence and rollups live in ``generation_metrics``."""
 
 from __future__ import annotations
 
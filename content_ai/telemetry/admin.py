@@ -0,0 +1,43 @@
+"""Admin for generation metrics (read-only, append-only rows)."""
+
+from django.contrib import admin
+
+from content_ai.telemetry.models import GenerationMetric
+
+
+@admin.register(GenerationMetric)
+class GenerationMetricAdmin(admin.ModelAdmin):
+    list_display = (
+        'created_at',
+        'provider',
+        'model_name',
+        'task',
+        'prompt_version',
+        'user',
+        'success',
+        'cache_status',
+        'latency_ms',
+        'total_tokens',
+        'estimated_cost',
+    )
+    list_filter = (
+        'provider',
+        'model_name',
+        'task',
+        'prompt_version',
+        'success',
+        'cache_status',
+    )
+    search_fields = ('model_name', 'task', 'prompt_version', 'user__username')
+    ordering = ('-created_at',)
+    date_hierarchy = 'created_at'
+    raw_id_fields = ('user',)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return request.user.is_superuser
@@ -1,18 +1,51 @@
-"""Future generation-metrics placeholders.
+"""Per-call generation metrics and their batched sink.
 
-Inactive: no production callers. Safe to import.
-Existing runtime telemetry remains in ``content_ai.telemetry``
-(``AIExecutionTelemetry``).
+With ``CONTENT_AI_METRICS_ENABLED``, every generation records a
+``GenerationMetrics`` row (tokens, latency, model, estimated cost, task,
+prompt version and user). Rows are buffered per process; recording never
+touches the database, so generation threads do not open connections of
+their own. Web processes write the buffer with one ``bulk_create`` when a
+request finishes. ``run_ai_jobs`` writes it once
+``CONTENT_AI_METRICS_BATCH_SIZE`` rows are waiting or the oldest waited
+``CONTENT_AI_METRICS_FLUSH_SECONDS``, checking after each job and while
+idle. Recording never raises into the generation path; a failed write is
+logged and dropped.
+
+The requesting user is taken from a context variable set by
+``GenerationMetricsMiddleware`` (or ``metrics_user()`` in workers).
 """
 
 from __future__ import annotations
 
+import atexit
+import contextvars
+import logging
+import threading
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.signals import request_finished
+from django.dispatch import receiver
+
+from content_ai.telemetry.pricing import estimate_cost
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 20
+DEFAULT_FLUSH_SECONDS = 5.0
+
+_metrics_user: contextvars.ContextVar = contextvars.ContextVar(
+    'content_ai_metrics_user',
+    default=None,
+)
 
 
 @dataclass(frozen=True, slots=True)
-class GenerationMetricsPlaceholder:
-    """Reserved shape for future analytics backends."""
+class GenerationMetrics:
+    """One provider call, as recorded by the metrics sink."""
 
     latency_ms: float | None = None
     token_usage: dict | None = None
@@ -20,12 +53,209 @@ class GenerationMetricsPlaceholder:
     model: str = ''
     success: bool | None = None
     metadata: dict = field(default_factory=dict)
+    provider: str = ''
+    task: str = ''
+    prompt_version: str = ''
+    user_id: int | None = None
+    cache_status: str = ''
+    created_at: datetime | None = None
+
+
+# Earlier name, kept for existing imports.
+GenerationMetricsPlaceholder = GenerationMetrics
+
+
+def build_generation_metrics(**fields) -> GenerationMetrics:
+    """Construct a metrics record; does not persist it."""
+    return GenerationMetrics(**fields)
+
+
+def metrics_enabled() -> bool:
+    return bool(getattr(settings, 'CONTENT_AI_METRICS_ENABLED', False))
+
+
+@contextmanager
+def metrics_user(user):
+    """Attribute generations recorded inside the block to ``user``."""
+    token = _metrics_user.set(user)
+    try:
+        yield
+    finally:
+        _metrics_user.reset(token)
+
+
+def _current_user_id() -> int | None:
+    user = _metrics_user.get()
+    if user is None or not getattr(user, 'is_authenticated', False):
+        return None
+    return getattr(user, 'pk', None)
+
+
+def metrics_from_telemetry(
+    telemetry,
+    *,
+    task: str = '',
+    prompt_version: str = '',
+) -> GenerationMetrics:
+    """Build a metrics record from an ``AIExecutionTelemetry``."""
+    metadata = dict(telemetry.metadata or {})
+    cache_status = (metadata.get('cache') or {}).get('status') or ''
+    token_usage = dict(telemetry.token_usage) if telemetry.token_usage else None
+    estimated_cost = telemetry.estimated_cost
+    if cache_status == 'hit':
+        # Served from the generation cache: no tokens were billed.
+        token_usage = None
+        estimated_cost = 0.0
+    elif estimated_cost is None:
+        estimated_cost = estimate_cost(telemetry.model or '', token_usage)
+    return GenerationMetrics(
+        latency_ms=telemetry.duration_ms,
+        token_usage=token_usage,
+        estimated_cost=estimated_cost,
+        model=telemetry.model or '',
+        success=telemetry.success,
+        provider=telemetry.provider or '',
+        task=str(task or ''),
+        prompt_version=prompt_version or '',
+        user_id=_current_user_id(),
+        cache_status=cache_status,
+        created_at=telemetry.finished_at or datetime.now(timezone.utc),
+    )
+
+
+class GenerationMetricsSink:
+    """Process-wide buffer that writes metrics rows in batches."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buffer: list[GenerationMetrics] = []
+        self._oldest_at: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def batch_size(self) -> int:
+        return max(
+            1,
+            int(
+                getattr(
+                    settings,
+                    'CONTENT_AI_METRICS_BATCH_SIZE',
+                    DEFAULT_BATCH_SIZE,
+                )
+            ),
+        )
+
+    @property
+    def flush_seconds(self) -> float:
+        return float(
+            getattr(
+                settings,
+                'CONTENT_AI_METRICS_FLUSH_SECONDS',
+                DEFAULT_FLUSH_SECONDS,
+            )
+        )
+
+    def record(self, metrics: GenerationMetrics) -> None:
+        with self._lock:
+            if not self._buffer:
+                self._oldest_at = time.monotonic()
+            self._buffer.append(metrics)
+            # Bound memory if the database stays unavailable.
+            overflow = len(self._buffer) - self.batch_size * 10
+            if overflow > 0:
+                del self._buffer[:overflow]
+
+    def flush_if_due(self) -> int:
+        with self._lock:
+            due = bool(self._buffer) and (
+                len(self._buffer) >= self.batch_size
+                or time.monotonic() - (self._oldest_at or 0) >= self.flush_seconds
+            )
+        return self.flush() if due else 0
+
+    def flush(self) -> int:
+        """Write all buffered rows now; returns the number written."""
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+            self._oldest_at = None
+        if not batch:
+            return 0
+        try:
+            from content_ai.telemetry.models import GenerationMetric
+
+            GenerationMetric.objects.bulk_create(
+                [_to_row(GenerationMetric, item) for item in batch],
+                batch_size=self.batch_size,
+            )
+        except Exception:  # noqa: BLE001 — metrics must not break generation
+            logger.exception('Dropping %s generation metrics rows', len(batch))
+            return 0
+        return len(batch)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buffer = []
+            self._oldest_at = None
+
+
+def _to_row(model_cls, metrics: GenerationMetrics):
+    usage = metrics.token_usage or {}
+    return model_cls(
+        created_at=metrics.created_at or datetime.now(timezone.utc),
+        provider=metrics.provider[:100],
+        model_name=metrics.model[:100],
+        task=metrics.task[:64],
+        prompt_version=metrics.prompt_version[:50],
+        user_id=metrics.user_id,
+        success=bool(metrics.success),
+        cache_status=metrics.cache_status[:16],
+        latency_ms=metrics.latency_ms,
+        input_tokens=usage.get('input_tokens'),
+        output_tokens=usage.get('output_tokens'),
+        total_tokens=usage.get('total_tokens'),
+        estimated_cost=metrics.estimated_cost,
+    )
+
+
+_DEFAULT_SINK = GenerationMetricsSink()
+
+
+def get_sink() -> GenerationMetricsSink:
+    return _DEFAULT_SINK
+
+
+@receiver(request_finished, dispatch_uid='content_ai_flush_generation_metrics')
+def flush_on_request_finished(sender, **kwargs) -> None:
+    """Write rows recorded while serving the request."""
+    if _DEFAULT_SINK._buffer:
+        _DEFAULT_SINK.flush()
+
 
+def record_generation(
+    telemetry,
+    *,
+    task: str = '',
+    prompt_version: str = '',
+) -> GenerationMetrics | None:
+    """Record one generation's telemetry when metrics are enabled."""
+    if telemetry is None or not metrics_enabled():
+        return None
+    try:
+        metrics = metrics_from_telemetry(
+            telemetry,
+            task=task,
+            prompt_version=prompt_version,
+        )
+        _DEFAULT_SINK.record(metrics)
+    except Exception:  # noqa: BLE001 — metrics must not break generation
+        logger.exception('Could not record generation metrics')
+        return None
+    return metrics
 
-def build_generation_metrics(**fields) -> GenerationMetricsPlaceholder:
-    """
-    Construct a metrics placeholder.
 
-    Does not persist, aggregate, or export. Reserved for future monitoring.
-    """
-    return GenerationMetricsPlaceholder(**fields)
+@atexit.register
+def _flush_on_exit() -> None:
+    if _DEFAULT_SINK._buffer:
+        _DEFAULT_SINK.flush()
@@ -0,0 +1,53 @@
+"""Append-only per-call generation metrics."""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.db import models
+
+
+class GenerationMetric(models.Model):
+    """
+    One provider call: tokens, latency, model and estimated cost.
+
+    Rows are written in batches by ``GenerationMetricsSink`` and never
+    updated; rollups read them with aggregate queries.
+    """
+
+    created_at = models.DateTimeField(db_index=True)
+    provider = models.CharField(max_length=100, blank=True)
+    model_name = models.CharField(max_length=100, blank=True)
+    task = models.CharField(max_length=64, blank=True)
+    prompt_version = models.CharField(max_length=50, blank=True)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='content_ai_generation_metrics',
+    )
+    success = models.BooleanField(default=True)
+    cache_status = models.CharField(max_length=16, blank=True)
+    latency_ms = models.FloatField(null=True, blank=True)
+    input_tokens = models.PositiveIntegerField(null=True, blank=True)
+    output_tokens = models.PositiveIntegerField(null=True, blank=True)
+    total_tokens = models.PositiveIntegerField(null=True, blank=True)
+    estimated_cost = models.FloatField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'AI generation metric'
+        verbose_name_plural = 'AI generation metrics'
+        indexes = [
+            models.Index(fields=['task', '-created_at']),
+            models.Index(fields=['prompt_version', '-created_at']),
+            models.Index(fields=['user', '-created_at']),
+        ]
+
+    def __str__(self):
+        return f'{self.provider}/{self.model_name} {self.task} @ {self.created_at}'
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError('GenerationMetric rows are append-only.')
+        super().save(*args, **kwargs)
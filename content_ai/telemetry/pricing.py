@@ -0,0 +1,47 @@
+"""Estimated provider cost from a configurable price table.
+
+``CONTENT_AI_MODEL_PRICES`` maps a model name (or name prefix, so dated
+snapshots such as ``gpt-4o-mini-2024-07-18`` match ``gpt-4o-mini``) to USD
+per million tokens::
+
+    CONTENT_AI_MODEL_PRICES = {
+        'gpt-4o-mini': {'input': 0.15, 'output': 0.60},
+    }
+
+Models missing from the table have no estimate (``None``), never zero.
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+
+TOKENS_PER_PRICE_UNIT = 1_000_000
+
+
+def model_price(model: str) -> dict | None:
+    """Return the price entry for ``model``, preferring the longest prefix."""
+    prices = getattr(settings, 'CONTENT_AI_MODEL_PRICES', None) or {}
+    if not model:
+        return None
+    if model in prices:
+        return prices[model]
+    matches = [name for name in prices if model.startswith(name)]
+    if not matches:
+        return None
+    return prices[max(matches, key=len)]
+
+
+def estimate_cost(model: str, token_usage: dict | None) -> float | None:
+    """USD cost of one call from its token usage, or None when unknown."""
+    price = model_price(model)
+    if price is None or not token_usage:
+        return None
+    input_tokens = token_usage.get('input_tokens')
+    output_tokens = token_usage.get('output_tokens')
+    if input_tokens is None and output_tokens is None:
+        return None
+    cost = (
+        (input_tokens or 0) * float(price.get('input', 0))
+        + (output_tokens or 0) * float(price.get('output', 0))
+    ) / TOKENS_PER_PRICE_UNIT
+    return round(cost, 8)
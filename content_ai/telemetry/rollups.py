@@ -0,0 +1,129 @@
+"""Rollup queries over ``GenerationMetric`` rows.
+
+Totals (calls, failures, cache hits, tokens, spend) are aggregated in SQL.
+Latency percentiles use ``PERCENTILE_CONT`` on PostgreSQL; other databases
+(SQLite in tests) compute them in Python from the group's latencies.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.db import connection
+from django.db.models import Aggregate, Count, F, FloatField, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from content_ai.telemetry.models import GenerationMetric
+
+ROLLUP_DIMENSIONS = {
+    'day': 'day',
+    'task': 'task',
+    'prompt_version': 'prompt_version',
+    'user': 'user__username',
+}
+
+
+class Percentile(Aggregate):
+    """PostgreSQL ``percentile_cont(fraction) WITHIN GROUP (ORDER BY expr)``."""
+
+    function = 'PERCENTILE_CONT'
+    template = '%(function)s(%(fraction)s) WITHIN GROUP (ORDER BY %(expressions)s)'
+    output_field = FloatField()
+
+    def __init__(self, expression, fraction: float, **extra):
+        super().__init__(expression, fraction=float(fraction), **extra)
+
+
+def metrics_since(days: int = 7):
+    """Metrics rows from the last ``days`` days."""
+    since = timezone.now() - timedelta(days=max(1, int(days)))
+    return GenerationMetric.objects.filter(created_at__gte=since)
+
+
+def _python_percentile(samples: list[float], fraction: float) -> float | None:
+    if not samples:
+        return None
+    samples = sorted(samples)
+    position = (len(samples) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(samples) - 1)
+    weight = position - lower
+    return samples[lower] + (samples[upper] - samples[lower]) * weight
+
+
+def _totals():
+    return {
+        'calls': Count('id'),
+        'failures': Count('id', filter=Q(success=False)),
+        'cache_hits': Count('id', filter=Q(cache_status='hit')),
+        'input_tokens': Sum('input_tokens'),
+        'output_tokens': Sum('output_tokens'),
+        'total_tokens': Sum('total_tokens'),
+        'spend': Sum('estimated_cost'),
+    }
+
+
+def _round_row(row: dict) -> dict:
+    for key in ('p50_latency_ms', 'p95_latency_ms'):
+        if row.get(key) is not None:
+            row[key] = round(row[key], 1)
+    if row.get('spend') is not None:
+        row['spend'] = round(row['spend'], 6)
+    return row
+
+
+def summarize(queryset) -> dict:
+    """Totals and p50/p95 latency for ``queryset``."""
+    aggregates = _totals()
+    if connection.vendor == 'postgresql':
+        aggregates['p50_latency_ms'] = Percentile('latency_ms', 0.5)
+        aggregates['p95_latency_ms'] = Percentile('latency_ms', 0.95)
+        return _round_row(queryset.aggregate(**aggregates))
+    row = queryset.aggregate(**aggregates)
+    latencies = list(
+        queryset.exclude(latency_ms=None).values_list('latency_ms', flat=True)
+    )
+    row['p50_latency_ms'] = _python_percentile(latencies, 0.5)
+    row['p95_latency_ms'] = _python_percentile(latencies, 0.95)
+    return _round_row(row)
+
+
+def rollup(queryset, dimension: str) -> list[dict]:
+    """
+    Group ``queryset`` by ``day``, ``task``, ``prompt_version`` or ``user``.
+
+    Each row carries ``key`` plus the ``summarize`` fields, newest day or
+    highest spend first.
+    """
+    if dimension not in ROLLUP_DIMENSIONS:
+        raise ValueError(f'Unknown rollup dimension: {dimension!r}')
+    if dimension == 'day':
+        queryset = queryset.annotate(day=TruncDate('created_at'))
+    field_name = ROLLUP_DIMENSIONS[dimension]
+    grouped = queryset.values(key=F(field_name))
+    aggregates = _totals()
+    postgres = connection.vendor == 'postgresql'
+    if postgres:
+        aggregates['p50_latency_ms'] = Percentile('latency_ms', 0.5)
+        aggregates['p95_latency_ms'] = Percentile('latency_ms', 0.95)
+    rows = [dict(row) for row in grouped.annotate(**aggregates).order_by()]
+
+    if not postgres:
+        latencies: dict = {}
+        for key, latency in (
+            queryset.exclude(latency_ms=None)
+            .values_list(field_name, 'latency_ms')
+            .iterator(chunk_size=2000)
+        ):
+            latencies.setdefault(key, []).append(latency)
+        for row in rows:
+            samples = latencies.get(row['key'], [])
+            row['p50_latency_ms'] = _python_percentile(samples, 0.5)
+            row['p95_latency_ms'] = _python_percentile(samples, 0.95)
+
+    if dimension == 'day':
+        rows.sort(key=lambda row: row['key'], reverse=True)
+    else:
+        rows.sort(key=lambda row: (row['spend'] or 0, row['calls']), reverse=True)
+    return [_round_row(row) for row in rows]
@@ -0,0 +1,44 @@
+"""Staff dashboard for generation latency and spend."""
+
+from __future__ import annotations
+
+from django.contrib.admin.views.decorators import staff_member_required
+from django.shortcuts import render
+from django.views.decorators.http import require_GET
+
+from content_ai.telemetry.generation_metrics import get_sink, metrics_enabled
+from content_ai.telemetry.rollups import metrics_since, rollup, summarize
+
+DASHBOARD_DAY_CHOICES = (1, 7, 30, 90)
+
+
+@staff_member_required
+@require_GET
+def generation_metrics_dashboard(request):
+    """p50/p95 latency, tokens and spend, rolled up by day/task/version/user."""
+    try:
+        days = int(request.GET.get('days') or 7)
+    except ValueError:
+        days = 7
+    if days not in DASHBOARD_DAY_CHOICES:
+        days = 7
+    # Show this worker's buffered rows too.
+    get_sink().flush()
+    queryset = metrics_since(days)
+    return render(
+        request,
+        'admin/content_ai/generation_metrics.html',
+        {
+            'title': 'AI generation metrics',
+            'days': days,
+            'day_choices': DASHBOARD_DAY_CHOICES,
+            'metrics_enabled': metrics_enabled(),
+            'summary': summarize(queryset),
+            'rollups': [
+                ('Day', rollup(queryset, 'day')),
+                ('Task', rollup(queryset, 'task')),
+                ('Prompt version', rollup(queryset, 'prompt_version')),
+                ('User', rollup(queryset, 'user')),
+            ],
+        },
+    )
@@ -7,8 +7,12 @@ from __future__ import annotations
 
 import shutil
 import tempfile
+import os
 import unittest
 from pathlib import Path
+from unittest import mock
+
+from django.test import override_settings
 
 from content_ai.config.ai_engine import (
     DEFAULT_PROMPT_VERSION,
@@ -24,6 +28,12 @@ from content_ai.prompts.builders import (
     UnknownPromptVersionError,
     UnknownStyleError,
 )
+from content_ai.prompts.cache import (
+    PromptAssetCache,
+    load_bundle,
+    prewarm_prompt_cache,
+)
+from content_ai.prompts.loader import PromptLoader
 from content_ai.prompts.validators import (
     REQUIRED_SECTION_ORDER,
     SECTION_AUDIENCE,
@@ -210,6 +220,61 @@ class PromptBuilderTests(unittest.TestCase):
         self.assertIn('Educational', prompt)
 
 
+class PromptCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.cache = PromptAssetCache()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(self.tmp.name)
+        shutil.copytree(_repo_prompts_root() / 'v1', self.root / 'v1')
+        self.builder = PromptBuilder(prompts_root=self.root, cache=self.cache)
+
+    def _touch_identity(self, text: str) -> None:
+        path = self.root / 'v1' / 'system' / 'identity.md'
+        before = path.stat().st_mtime_ns
+        path.write_text(text, encoding='utf-8')
+        os.utime(path, ns=(before + 10**9, before + 10**9))
+
+    def test_cached_build_matches_disk_assembly(self):
+        for style in SUPPORTED_STYLES:
+            expected = load_bundle(self.builder.validator, 'v1', style).assemble(
+                'Explain the topic.'
+            )
+            self.assertEqual(
+                self.builder.build(style=style, user_prompt='Explain the topic.'),
+                expected,
+            )
+
+    def test_second_build_does_not_read_modules(self):
+        self.builder.build(user_prompt='first')
+        with mock.patch.object(Path, 'read_text') as read_text:
+            prompt = self.builder.build(user_prompt='second')
+        read_text.assert_not_called()
+        self.assertTrue(prompt.rstrip().endswith('second'))
+
+    @override_settings(DEBUG=False)
+    def test_edits_ignored_without_debug(self):
+        self.builder.build(user_prompt='x')
+        self._touch_identity('# Identity\n\nEdited identity.\n')
+        self.assertNotIn('Edited identity.', self.builder.build(user_prompt='x'))
+
+    @override_settings(DEBUG=True)
+    def test_edits_picked_up_in_debug(self):
+        self.builder.build(user_prompt='x')
+        self._touch_identity('# Identity\n\nEdited identity.\n')
+        self.assertIn('Edited identity.', self.builder.build(user_prompt='x'))
+
+    def test_loader_caches_template_text(self):
+        PromptLoader().load('post', 'v1')
+        with mock.patch.object(Path, 'read_text') as read_text:
+            text = PromptLoader().load('post', 'v1')
+        read_text.assert_not_called()
+        self.assertIn('POST_GENERATION', text)
+
+    def test_prewarm_loads_supported_styles(self):
+        self.assertGreaterEqual(prewarm_prompt_cache(), len(SUPPORTED_STYLES))
+
+
 class ExistingTelemetryImportSmokeTests(unittest.TestCase):
     """Ensure package conversion did not break production telemetry imports."""
 
@@ -0,0 +1,316 @@
+import json
+import os
+import threading
+from io import StringIO
+from tempfile import NamedTemporaryFile
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import Client, TestCase
+from django.urls import reverse
+
+from content_ai.batch.service import (
+    BatchRunner,
+    batch_progress,
+    request_from_data,
+    review_item,
+    submit_batch,
+)
+from content_ai.constants import (
+    AIGenerationTask,
+    AIJobOperation,
+    AIJobStatus,
+    AIJobType,
+    BatchItemStatus,
+    BatchReviewStatus,
+)
+from content_ai.jobs import claim_next_job, run_job
+from content_ai.models import AIJob
+from content_ai.providers.exceptions import (
+    CircuitOpenError,
+    GenerationError,
+    RateLimitError,
+)
+from content_ai.providers.scheduler import PRIORITY_BATCH, current_priority
+from content_ai.schemas import AdGenerationRequest
+from content_ai.schemas.responses import GenerationResult
+
+User = get_user_model()
+
+AD = AIGenerationTask.AD_GENERATION
+
+
+def _ads(count):
+    return [{'business_name': f'Shop {n}', 'city': 'Malmö'} for n in range(count)]
+
+
+class FakeService:
+    """Stands in for ContentGenerationService; fails on demand per business."""
+
+    def __init__(self, failures=None):
+        self.failures = dict(failures or {})
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def generate(self, task, request, provider_name=None, use_cache=True):
+        with self._lock:
+            self.calls.append(request.business_name)
+            queued = self.failures.get(request.business_name) or []
+            exc = queued.pop(0) if queued else None
+        if exc is not None:
+            raise exc
+        return GenerationResult(
+            success=True,
+            content=f'Copy for {request.business_name}',
+            metadata={'prompt_version': 'v1'},
+            provider='fake',
+        )
+
+
+class SubmitBatchTests(TestCase):
+    def test_submit_stages_items_and_enqueues_job(self):
+        job = submit_batch(AD, _ads(3), source_refs=['ads.Ad:1', 'ads.Ad:2', ''])
+
+        self.assertEqual(job.operation, AIJobOperation.BATCH_GENERATION)
+        self.assertEqual(job.job_type, AIJobType.AD)
+        self.assertEqual(job.status, AIJobStatus.PENDING)
+        items = list(job.batch_items.all())
+        self.assertEqual([item.position for item in items], [0, 1, 2])
+        self.assertEqual(items[0].source_ref, 'ads.Ad:1')
+        self.assertEqual(items[1].request['business_name'], 'Shop 1')
+        self.assertEqual(batch_progress(job)['pending'], 3)
+
+    def test_accepts_schema_objects(self):
+        job = submit_batch(AD, [AdGenerationRequest(business_name='Bakery')])
+        self.assertEqual(job.batch_items.get().request['business_name'], 'Bakery')
+
+    def test_rejects_unknown_fields_and_tasks(self):
+        with self.assertRaises(ValueError):
+            request_from_data(AD, {'title': 'posts only'})
+        with self.assertRaises(ValueError):
+            submit_batch(AIGenerationTask.REWRITE, [{}])
+        with self.assertRaises(ValueError):
+            submit_batch(AD, [])
+        self.assertFalse(AIJob.objects.exists())
+
+
+class BatchRunnerTests(TestCase):
+    def _claimed(self, count=4, **kwargs):
+        job = submit_batch(AD, _ads(count), **kwargs)
+        return claim_next_job('worker-a', job_id=job.pk)
+
+    def test_run_job_generates_into_staging_rows(self):
+        job = self._claimed(count=3, provider_name='mock')
+
+        self.assertTrue(run_job(job))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, AIJobStatus.COMPLETED)
+        self.assertEqual(job.result['completed'], 3)
+        self.assertEqual(job.provider, 'mock')
+        for item in job.batch_items.all():
+            self.assertEqual(item.status, BatchItemStatus.COMPLETED)
+            self.assertEqual(item.review_status, BatchReviewStatus.UNREVIEWED)
+            self.assertTrue(item.content)
+            self.assertEqual(item.attempts, 1)
+
+    def test_rate_limit_requeues_and_shrinks_wave(self):
+        job = self._claimed(count=4)
+        service = FakeService({'Shop 1': [RateLimitError('slow down')]})
+        sleeps = []
+        runner = BatchRunner(job, service=service, concurrency=4, sleep=sleeps.append)
+
+        outcome = runner.run()
+
+        self.assertEqual(outcome.result['completed'], 4)
+        self.assertEqual(len(sleeps), 1)
+        self.assertEqual(service.calls.count('Shop 1'), 2)
+        self.assertEqual(job.batch_items.get(position=1).attempts, 2)
+
+    def test_backoff_honours_retry_after_hint(self):
+        job = self._claimed(count=2)
+        service = FakeService({'Shop 0': [RateLimitError('429', retry_after=7)]})
+        sleeps = []
+
+        BatchRunner(job, service=service, sleep=sleeps.append).run()
+
+        self.assertEqual(len(sleeps), 1)
+        self.assertGreaterEqual(sleeps[0], 7)
+
+    def test_open_breaker_backoff_waits_until_probe(self):
+        job = self._claimed(count=1)
+        refused = CircuitOpenError('open', retry_after=25)
+        service = FakeService({'Shop 0': [refused]})
+        sleeps = []
+
+        outcome = BatchRunner(
+            job, service=service, max_item_attempts=2, sleep=sleeps.append
+        ).run()
+
+        self.assertEqual(outcome.result['completed'], 1)
+        self.assertEqual(len(sleeps), 1)
+        self.assertGreaterEqual(sleeps[0], 25)
+
+    def test_calls_run_at_batch_priority(self):
+        job = self._claimed(count=1)
+        seen = []
+
+        class PriorityService(FakeService):
+            def generate(self, *args, **kwargs):
+                seen.append(current_priority())
+                return super().generate(*args, **kwargs)
+
+        BatchRunner(job, service=PriorityService()).run()
+
+        self.assertEqual(seen, [PRIORITY_BATCH])
+
+    def test_rate_limit_exhausts_item_attempts(self):
+        job = self._claimed(count=1)
+        limited = [RateLimitError('slow down') for _ in range(5)]
+        service = FakeService({'Shop 0': limited})
+        runner = BatchRunner(
+            job,
+            service=service,
+            max_item_attempts=2,
+            sleep=lambda seconds: None,
+        )
+
+        with self.assertLogs('content_ai.batch.service', level='WARNING'):
+            outcome = runner.run()
+
+        self.assertEqual(outcome.result['failed'], 1)
+        self.assertEqual(len(service.calls), 2)
+
+    def test_failed_item_does_not_stop_the_batch(self):
+        job = self._claimed(count=3)
+        service = FakeService({'Shop 2': [GenerationError('bad output')]})
+
+        with self.assertLogs('content_ai.batch.service', level='WARNING'):
+            outcome = BatchRunner(job, service=service).run()
+
+        self.assertEqual(outcome.result['completed'], 2)
+        self.assertEqual(outcome.result['failed'], 1)
+        self.assertEqual(job.batch_items.get(position=2).error, 'bad output')
+
+    def test_resume_skips_items_already_done(self):
+        job = self._claimed(count=3)
+        job.batch_items.filter(position=0).update(
+            status=BatchItemStatus.COMPLETED,
+            content='earlier run',
+        )
+        service = FakeService()
+
+        BatchRunner(job, service=service).run()
+
+        self.assertEqual(sorted(service.calls), ['Shop 1', 'Shop 2'])
+        self.assertEqual(job.batch_items.get(position=0).content, 'earlier run')
+
+    def test_checkpoint_records_progress_and_stops_after_lost_claim(self):
+        job = self._claimed(count=4)
+        AIJob.objects.filter(pk=job.pk).update(claimed_by='worker-b')
+        service = FakeService()
+
+        with self.assertLogs('content_ai.batch.service', level='WARNING'):
+            BatchRunner(job, service=service, concurrency=2).run()
+
+        self.assertEqual(len(service.calls), 2)
+        self.assertEqual(batch_progress(job)['pending'], 2)
+
+
+class BatchReviewTests(TestCase):
+    def test_review_only_touches_staging_row(self):
+        user = User.objects.create_user(username='reviewer', password='pw')
+        job = submit_batch(AD, _ads(2))
+        done, failed = job.batch_items.all()
+        done.status = BatchItemStatus.COMPLETED
+        done.save()
+        failed.status = BatchItemStatus.FAILED
+        failed.save()
+
+        review_item(done, approved=True, user=user)
+        with self.assertRaises(ValueError):
+            review_item(failed, approved=True, user=user)
+        review_item(failed, approved=False, user=user)
+
+        done.refresh_from_db()
+        self.assertEqual(done.review_status, BatchReviewStatus.APPROVED)
+        self.assertEqual(done.reviewed_by, user)
+        self.assertEqual(failed.review_status, BatchReviewStatus.REJECTED)
+
+
+class BatchAPITests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.staff = User.objects.create_user(
+            username='batchstaff', password='password123', is_staff=True
+        )
+
+    def _submit(self, payload):
+        return self.client.post(
+            reverse('content_ai_api:batch_submit'),
+            data=json.dumps(payload),
+            content_type='application/json',
+        )
+
+    def test_non_staff_forbidden(self):
+        User.objects.create_user(username='plain', password='password123')
+        self.client.login(username='plain', password='password123')
+        response = self._submit({'task': AD, 'requests': _ads(1)})
+        self.assertEqual(response.status_code, 403)
+
+    def test_submit_then_poll(self):
+        self.client.login(username='batchstaff', password='password123')
+        requests = _ads(2)
+        requests[0]['source_ref'] = 'ads.Ad:7'
+        response = self._submit(
+            {'task': AD, 'requests': requests, 'provider_name': 'mock'}
+        )
+        self.assertEqual(response.status_code, 202)
+        job_id = response.json()['job']['id']
+        self.assertEqual(response.json()['items'], 2)
+
+        run_job(claim_next_job('worker-a'))
+
+        data = self.client.get(
+            reverse('content_ai_api:batch_status', kwargs={'job_id': job_id})
+        ).json()
+        self.assertEqual(data['job']['status'], AIJobStatus.COMPLETED)
+        self.assertEqual(data['progress']['completed'], 2)
+        self.assertEqual(data['items'][0]['source_ref'], 'ads.Ad:7')
+        self.assertEqual(data['items'][0]['status'], BatchItemStatus.COMPLETED)
+
+    def test_validation_errors(self):
+        self.client.login(username='batchstaff', password='password123')
+        self.assertEqual(self._submit({'task': AD, 'requests': []}).status_code, 400)
+        self.assertEqual(
+            self._submit({'task': AD, 'requests': [{'nope': 1}]}).status_code,
+            400,
+        )
+
+
+class GenerateBatchCommandTests(TestCase):
+    def _input_file(self, suffix, text):
+        with NamedTemporaryFile('w', suffix=suffix, delete=False) as handle:
+            handle.write(text)
+        self.addCleanup(os.unlink, handle.name)
+        return handle.name
+
+    def test_command_runs_batch_inline(self):
+        path = self._input_file(
+            '.jsonl',
+            ''.join(json.dumps(entry) + '\n' for entry in _ads(2)),
+        )
+        out = StringIO()
+
+        call_command('generate_batch', 'ad', path, '--provider', 'mock', stdout=out)
+
+        job = AIJob.objects.get(operation=AIJobOperation.BATCH_GENERATION)
+        self.assertEqual(job.status, AIJobStatus.COMPLETED)
+        self.assertIn('2 completed', out.getvalue())
+
+    def test_enqueue_only(self):
+        path = self._input_file('.json', json.dumps(_ads(1)))
+
+        call_command('generate_batch', 'ad', path, '--enqueue', stdout=StringIO())
+
+        self.assertEqual(AIJob.objects.get().status, AIJobStatus.PENDING)
@@ -0,0 +1,161 @@
+from django.test import SimpleTestCase, override_settings
+
+from content_ai.constants import AIGenerationTask
+from content_ai.providers.mock import MOCK_RESPONSE, MockProvider
+from content_ai.schemas import GenerationResult, PostGenerationRequest
+from content_ai.services.generation import ContentGenerationService
+from content_ai.services.generation_cache import (
+    GenerationCache,
+    generate_with_cache,
+    generation_cache,
+    make_cache_key,
+)
+
+
+def cache_status(result):
+    return result.telemetry.metadata['cache']['status']
+
+
+class CountingGenerate:
+    def __init__(self, success=True, provider='mock'):
+        self.calls = 0
+        self.success = success
+        self.provider = provider
+
+    def __call__(self):
+        self.calls += 1
+        return GenerationResult(
+            success=self.success,
+            content=f'call {self.calls}',
+            provider=self.provider,
+        )
+
+
+class GenerationCacheTests(SimpleTestCase):
+    def setUp(self):
+        generation_cache.clear()
+        self.addCleanup(generation_cache.clear)
+        self.provider = MockProvider()
+
+    def test_disabled_by_default(self):
+        generate = CountingGenerate()
+        first = generate_with_cache(self.provider, 'prompt', task='post_generation', generate=generate)
+        generate_with_cache(self.provider, 'prompt', task='post_generation', generate=generate)
+        self.assertEqual(generate.calls, 2)
+        self.assertIsNone(first.telemetry)
+        self.assertEqual(len(generation_cache), 0)
+
+    @override_settings(CONTENT_AI_GENERATION_CACHE_ENABLED=True)
+    def test_second_identical_call_is_a_hit(self):
+        generate = CountingGenerate()
+        first = generate_with_cache(self.provider, 'prompt', task='post_generation', generate=generate)
+        second = generate_with_cache(self.provider, 'prompt', task='post_generation', generate=generate)
+        self.assertEqual(generate.calls, 1)
+        self.assertEqual(cache_status(first), 'miss')
+        self.assertEqual(cache_status(second), 'hit')
+        self.assertEqual(second.content, 'call 1')
+        self.assertEqual(second.telemetry.metadata['cache']['hits'], 1)
+
+    @override_settings(CONTENT_AI_GENERATION_CACHE_ENABLED=True)
+    def test_prompt_version_and_prompt_change_the_key(self):
+        generate = CountingGenerate()
+        generate_with_cache(self.provider, 'prompt', task='post_generation', prompt_version='v1', generate=generate)
+        generate_with_cache(self.provider, 'prompt', task='post_generation', prompt_version='v2', generate=generate)
+        generate_with_cache(self.provider, 'prompt!', task='post_generation', prompt_version='v1', generate=generate)
+        self.assertEqual(generate.calls, 3)
+        self.assertNotEqual(
+            make_cache_key(self.provider, 'a', task='post_generation'),
+            make_cache_key(self.provider, 'a', task='ad_generation'),
+        )
+
+    @override_settings(CONTENT_AI_GENERATION_CACHE_ENABLED=True)
+    def test_bypass_calls_provider_and_refreshes_entry(self):
+        generate = CountingGenerate()
+        generate_with_cache(self.provider, 'prompt', task='post_generation', generate=generate)
+        fresh = generate_with_cache(
+            self.provider, 'prompt', task='post_generation', generate=generate, use_cache=False
+        )
+        cached = generate_with_cache(self.provider, 'prompt', task='post_generation', generate=generate)
+        self.assertEqual(generate.calls, 2)
+        self.assertEqual(cache_status(fresh), 'bypass')
+        self.assertEqual(cached.content, 'call 2')
+
+    @override_settings(
+        CONTENT_AI_GENERATION_CACHE_ENABLED=True,
+        CONTENT_AI_GENERATION_CACHE_TTLS={'post_generation': 0},
+    )
+    def test_zero_ttl_disables_task(self):
+        generate = CountingGenerate()
+        generate_with_cache(self.provider, 'prompt', task='post_generation', generate=generate)
+        generate_with_cache(self.provider, 'prompt', task='post_generation', generate=generate)
+        self.assertEqual(generate.calls, 2)
+
+    @override_settings(CONTENT_AI_GENERATION_CACHE_ENABLED=True)
+    def test_failed_results_are_not_stored(self):
+        generate = CountingGenerate(success=False)
+        generate_with_cache(self.provider, 'prompt', task='post_generation', generate=generate)
+        generate_with_cache(self.provider, 'prompt', task='post_generation', generate=generate)
+        self.assertEqual(generate.calls, 2)
+
+    @override_settings(CONTENT_AI_GENERATION_CACHE_ENABLED=True)
+    def test_failover_results_are_not_stored_under_primary(self):
+        generate = CountingGenerate(provider='openai')
+        generate_with_cache(self.provider, 'prompt', task='post_generation', generate=generate)
+        generate_with_cache(self.provider, 'prompt', task='post_generation', generate=generate)
+        self.assertEqual(generate.calls, 2)
+        self.assertEqual(len(generation_cache), 0)
+
+    def test_lru_eviction(self):
+        cache = GenerationCache(max_entries=2)
+        keys = [make_cache_key(self.provider, str(i), task='post_generation') for i in range(3)]
+        for key in keys[:2]:
+            cache.set(key, GenerationResult(success=True, content='x'), ttl=60)
+        cache.get(keys[0])
+        cache.set(keys[2], GenerationResult(success=True, content='x'), ttl=60)
+        self.assertIsNotNone(cache.get(keys[0]))
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertEqual(len(cache), 2)
+
+    def test_expired_entries_miss(self):
+        cache = GenerationCache(max_entries=2)
+        key = make_cache_key(self.provider, 'p', task='post_generation')
+        cache.set(key, GenerationResult(success=True, content='x'), ttl=-1)
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(cache.stats()['misses'], 1)
+
+
+@override_settings(CONTENT_AI_PROVIDER='mock', CONTENT_AI_GENERATION_CACHE_ENABLED=True)
+class GenerationServiceCacheTests(SimpleTestCase):
+    def setUp(self):
+        generation_cache.clear()
+        self.addCleanup(generation_cache.clear)
+        self.service = ContentGenerationService()
+
+    def test_repeated_generation_hits_cache(self):
+        request = PostGenerationRequest(title='cached')
+        first = self.service.generate(AIGenerationTask.POST_GENERATION, request)
+        second = self.service.generate(AIGenerationTask.POST_GENERATION, request)
+        self.assertEqual(cache_status(first), 'miss')
+        self.assertEqual(cache_status(second), 'hit')
+        self.assertEqual(second.content, MOCK_RESPONSE)
+
+    def test_use_cache_false_bypasses(self):
+        request = PostGenerationRequest(title='cached')
+        self.service.generate(AIGenerationTask.POST_GENERATION, request)
+        fresh = self.service.generate(
+            AIGenerationTask.POST_GENERATION,
+            request,
+            use_cache=False,
+        )
+        self.assertEqual(cache_status(fresh), 'bypass')
+
+    def test_cache_hit_replays_content_to_on_delta(self):
+        request = PostGenerationRequest(title='cached')
+        self.service.generate(AIGenerationTask.POST_GENERATION, request)
+        deltas = []
+        self.service.generate(
+            AIGenerationTask.POST_GENERATION,
+            request,
+            on_delta=deltas.append,
+        )
+        self.assertEqual(deltas, [MOCK_RESPONSE])
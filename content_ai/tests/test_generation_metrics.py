@@ -0,0 +1,191 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.signals import request_finished
+from django.test import Client, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from content_ai.constants import AIGenerationTask
+from content_ai.schemas import PostGenerationRequest
+from content_ai.services.generation import ContentGenerationService
+from content_ai.telemetry import AIExecutionTelemetry
+from content_ai.telemetry.generation_metrics import (
+    get_sink,
+    metrics_user,
+    record_generation,
+)
+from content_ai.telemetry.models import GenerationMetric
+from content_ai.telemetry.pricing import estimate_cost
+from content_ai.telemetry.rollups import rollup, summarize
+
+User = get_user_model()
+
+PRICES = {
+    'gpt-4o': {'input': 2.0, 'output': 8.0},
+    'gpt-4o-mini': {'input': 0.2, 'output': 0.8},
+}
+
+
+def telemetry(**fields):
+    fields.setdefault('provider', 'openai')
+    fields.setdefault('model', 'gpt-4o-mini')
+    fields.setdefault('duration_ms', 100.0)
+    fields.setdefault(
+        'token_usage',
+        {'input_tokens': 1000, 'output_tokens': 500, 'total_tokens': 1500},
+    )
+    return AIExecutionTelemetry(**fields)
+
+
+@override_settings(CONTENT_AI_MODEL_PRICES=PRICES)
+class PricingTests(SimpleTestCase):
+    def test_longest_prefix_wins(self):
+        usage = {'input_tokens': 1_000_000, 'output_tokens': 1_000_000}
+        self.assertAlmostEqual(estimate_cost('gpt-4o-mini-2024-07-18', usage), 1.0)
+        self.assertAlmostEqual(estimate_cost('gpt-4o-2024-08-06', usage), 10.0)
+
+    def test_unknown_model_or_usage_has_no_estimate(self):
+        self.assertIsNone(estimate_cost('other-model', {'input_tokens': 10}))
+        self.assertIsNone(estimate_cost('gpt-4o', None))
+
+
+@override_settings(
+    CONTENT_AI_METRICS_ENABLED=True,
+    CONTENT_AI_METRICS_BATCH_SIZE=2,
+    CONTENT_AI_METRICS_FLUSH_SECONDS=3600,
+    CONTENT_AI_MODEL_PRICES=PRICES,
+)
+class GenerationMetricsSinkTests(TestCase):
+    def setUp(self):
+        get_sink().clear()
+        self.addCleanup(get_sink().clear)
+        self.user = User.objects.create_user(username='metrics_editor', password='x')
+
+    @override_settings(CONTENT_AI_METRICS_ENABLED=False)
+    def test_disabled_records_nothing(self):
+        self.assertIsNone(record_generation(telemetry(), task='post_generation'))
+        self.assertEqual(len(get_sink()), 0)
+
+    def test_rows_are_written_in_batches(self):
+        with metrics_user(self.user):
+            record_generation(telemetry(), task='post_generation', prompt_version='v1')
+            self.assertEqual(get_sink().flush_if_due(), 0)
+            record_generation(telemetry(), task='post_generation', prompt_version='v1')
+        # Recording alone never writes, even with a full batch.
+        self.assertEqual(GenerationMetric.objects.count(), 0)
+        self.assertEqual(get_sink().flush_if_due(), 2)
+        self.assertEqual(GenerationMetric.objects.count(), 2)
+        row = GenerationMetric.objects.first()
+        self.assertEqual(row.user, self.user)
+        self.assertEqual(row.task, 'post_generation')
+        self.assertEqual(row.total_tokens, 1500)
+        self.assertAlmostEqual(row.estimated_cost, (1000 * 0.2 + 500 * 0.8) / 1_000_000)
+
+    def test_cache_hits_cost_nothing(self):
+        metrics = record_generation(
+            telemetry(metadata={'cache': {'status': 'hit'}}),
+            task='post_generation',
+        )
+        self.assertEqual(metrics.estimated_cost, 0.0)
+        self.assertIsNone(metrics.token_usage)
+        self.assertEqual(metrics.cache_status, 'hit')
+
+    def test_rows_are_append_only(self):
+        record_generation(telemetry(), task='post_generation')
+        get_sink().flush()
+        row = GenerationMetric.objects.get()
+        row.task = 'changed'
+        with self.assertRaises(ValueError):
+            row.save()
+
+    def test_request_finished_flushes_buffer(self):
+        record_generation(telemetry(), task='post_generation')
+        request_finished.send(sender=self.__class__)
+        self.assertEqual(len(get_sink()), 0)
+        self.assertEqual(GenerationMetric.objects.count(), 1)
+
+    @override_settings(CONTENT_AI_METRICS_FLUSH_SECONDS=0)
+    def test_worker_loop_flushes_due_rows(self):
+        record_generation(telemetry(), task='post_generation')
+        # close_old_connections() would drop the test transaction.
+        with patch('content_ai.management.commands.run_ai_jobs.close_old_connections'):
+            call_command('run_ai_jobs', '--once', stdout=StringIO())
+        self.assertEqual(GenerationMetric.objects.count(), 1)
+
+    @override_settings(CONTENT_AI_PROVIDER='mock')
+    def test_generation_service_records_call(self):
+        with metrics_user(self.user):
+            ContentGenerationService().generate(
+                AIGenerationTask.POST_GENERATION,
+                PostGenerationRequest(title='metrics'),
+            )
+        get_sink().flush()
+        row = GenerationMetric.objects.get()
+        self.assertEqual(row.provider, 'mock')
+        self.assertEqual(row.task, str(AIGenerationTask.POST_GENERATION))
+        self.assertEqual(row.user, self.user)
+        self.assertTrue(row.success)
+        self.assertIsNotNone(row.latency_ms)
+
+
+class GenerationMetricsRollupTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='rollup_editor', password='x')
+        now = timezone.now()
+        for index, latency in enumerate([100, 200, 300, 400, 1000]):
+            GenerationMetric.objects.create(
+                created_at=now - timedelta(days=index % 2),
+                provider='openai',
+                model_name='gpt-4o-mini',
+                task='post_generation' if index < 3 else 'ad_generation',
+                prompt_version='v1',
+                user=self.user if index < 2 else None,
+                latency_ms=latency,
+                total_tokens=100,
+                estimated_cost=0.01,
+                success=index != 4,
+            )
+
+    def test_summary_percentiles_and_spend(self):
+        summary = summarize(GenerationMetric.objects.all())
+        self.assertEqual(summary['calls'], 5)
+        self.assertEqual(summary['failures'], 1)
+        self.assertEqual(summary['total_tokens'], 500)
+        self.assertAlmostEqual(summary['spend'], 0.05)
+        self.assertEqual(summary['p50_latency_ms'], 300)
+        self.assertEqual(summary['p95_latency_ms'], 880)
+
+    def test_rollup_by_task_and_user(self):
+        by_task = {row['key']: row for row in rollup(GenerationMetric.objects.all(), 'task')}
+        self.assertEqual(by_task['post_generation']['calls'], 3)
+        self.assertEqual(by_task['post_generation']['p50_latency_ms'], 200)
+        self.assertEqual(by_task['ad_generation']['calls'], 2)
+
+        by_user = {row['key']: row for row in rollup(GenerationMetric.objects.all(), 'user')}
+        self.assertEqual(by_user['rollup_editor']['calls'], 2)
+        self.assertEqual(by_user[None]['calls'], 3)
+
+    def test_rollup_by_day(self):
+        days = rollup(GenerationMetric.objects.all(), 'day')
+        self.assertEqual(sum(row['calls'] for row in days), 5)
+        self.assertGreater(days[0]['key'], days[-1]['key'])
+
+    def test_unknown_dimension(self):
+        with self.assertRaises(ValueError):
+            rollup(GenerationMetric.objects.all(), 'colour')
+
+    def test_dashboard_is_staff_only(self):
+        url = reverse('content_ai:generation_metrics')
+        client = Client()
+        self.assertEqual(client.get(url).status_code, 302)
+
+        User.objects.create_user(username='metrics_staff', password='x', is_staff=True)
+        client.login(username='metrics_staff', password='x')
+        response = client.get(url, {'days': 30})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'p95 latency')
+        self.assertEqual(response.context['summary']['calls'], 5)
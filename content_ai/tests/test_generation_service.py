@@ -36,6 +36,20 @@ class ContentGenerationServiceTests(SimpleTestCase):
         self.assertIsInstance(result, GenerationResult)
         self.assertEqual(result.content, MOCK_RESPONSE)
 
+    @override_settings(CONTENT_AI_PROVIDER='mock')
+    def test_on_delta_streams_provider_output(self):
+        deltas = []
+        result = self.service.generate(
+            AIGenerationTask.POST_GENERATION,
+            PostGenerationRequest(title='streamed'),
+            on_delta=deltas.append,
+        )
+        self.assertGreater(len(deltas), 1)
+        self.assertEqual(''.join(deltas), MOCK_RESPONSE)
+        self.assertEqual(result.content, MOCK_RESPONSE)
+        self.assertTrue(result.metadata['streamed'])
+        self.assertIsNotNone(result.telemetry)
+
     @override_settings(CONTENT_AI_PROVIDER='mock')
     def test_uses_workflow_prompt_builder_and_passes_prompt_string(self):
         request = PostGenerationRequest(title='housing')
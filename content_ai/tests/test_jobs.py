@@ -0,0 +1,270 @@
+import json
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from content_ai.constants import AIJobOperation, AIJobStatus
+from content_ai.jobs import claim_next_job, complete_job, enqueue_job, run_job
+from content_ai.jobs import runners
+from content_ai.jobs.runners import JobOutcome
+from content_ai.models import AIJob
+from content_ai.workspace.services import WorkspaceService
+
+User = get_user_model()
+
+
+def _draft_payload():
+    service = WorkspaceService()
+    session = service.new_session()
+    service.ingest_source(session, text='Context about housing in Sweden.', title='Housing')
+    return {
+        'session': session.to_dict(),
+        'options': {'title': 'Housing', 'provider_name': 'mock'},
+    }
+
+
+class AIJobQueueTests(TestCase):
+    def test_claim_marks_job_running_under_lease(self):
+        job = enqueue_job(AIJobOperation.WORKSPACE_DRAFT, payload={})
+
+        claimed = claim_next_job('worker-a', lease_seconds=60)
+
+        self.assertEqual(claimed.pk, job.pk)
+        self.assertEqual(claimed.status, AIJobStatus.RUNNING)
+        self.assertEqual(claimed.claimed_by, 'worker-a')
+        self.assertEqual(claimed.attempts, 1)
+        self.assertIsNotNone(claimed.started_at)
+        self.assertGreater(claimed.lease_expires_at, timezone.now())
+        self.assertIsNone(claim_next_job('worker-b'))
+
+    def test_plain_tracking_rows_are_not_claimed(self):
+        AIJob.objects.create(job_type='post')
+        self.assertIsNone(claim_next_job('worker-a'))
+
+    def test_expired_lease_is_reclaimed(self):
+        job = enqueue_job(AIJobOperation.WORKSPACE_DRAFT, payload={})
+        claim_next_job('worker-a')
+        AIJob.objects.filter(pk=job.pk).update(
+            lease_expires_at=timezone.now() - timedelta(seconds=1)
+        )
+
+        reclaimed = claim_next_job('worker-b')
+
+        self.assertEqual(reclaimed.pk, job.pk)
+        self.assertEqual(reclaimed.claimed_by, 'worker-b')
+        self.assertEqual(reclaimed.attempts, 2)
+
+    @override_settings(AI_JOB_MAX_ATTEMPTS=1)
+    def test_job_fails_after_max_expired_leases(self):
+        job = enqueue_job(AIJobOperation.WORKSPACE_DRAFT, payload={})
+        claim_next_job('worker-a')
+        AIJob.objects.filter(pk=job.pk).update(
+            lease_expires_at=timezone.now() - timedelta(seconds=1)
+        )
+
+        self.assertIsNone(claim_next_job('worker-b'))
+        job.refresh_from_db()
+        self.assertEqual(job.status, AIJobStatus.FAILED)
+        self.assertIn('expired leases', job.error)
+
+    def test_unknown_operation_rejected(self):
+        with self.assertRaises(ValueError):
+            enqueue_job('not-a-runner', payload={})
+
+    def test_run_draft_job_stores_result_and_telemetry(self):
+        enqueue_job(AIJobOperation.WORKSPACE_DRAFT, payload=_draft_payload())
+        job = claim_next_job('worker-a')
+
+        self.assertTrue(run_job(job))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, AIJobStatus.COMPLETED)
+        self.assertIsNone(job.lease_expires_at)
+        self.assertIsNotNone(job.completed_at)
+        self.assertEqual(job.provider, 'mock')
+        self.assertTrue(job.prompt_version)
+        self.assertEqual(job.telemetry['provider'], 'mock')
+        self.assertTrue(job.result['session']['sections']['body'])
+
+    def test_streaming_draft_renews_its_lease(self):
+        enqueue_job(AIJobOperation.WORKSPACE_DRAFT, payload=_draft_payload())
+        job = claim_next_job('worker-a', lease_seconds=60)
+
+        with patch.object(runners, 'LEASE_RENEW_SECONDS', 0), patch(
+            'content_ai.jobs.queue.renew_lease',
+            return_value=True,
+        ) as renew:
+            self.assertTrue(run_job(job))
+
+        self.assertTrue(renew.called)
+        self.assertEqual(renew.call_args.args[0].pk, job.pk)
+
+    def test_renew_lease_requires_the_claim(self):
+        from content_ai.jobs import renew_lease
+
+        enqueue_job(AIJobOperation.WORKSPACE_DRAFT, payload={})
+        job = claim_next_job('worker-a', lease_seconds=1)
+        lease = job.lease_expires_at
+
+        self.assertTrue(renew_lease(job, lease_seconds=600))
+        job.refresh_from_db()
+        self.assertGreater(job.lease_expires_at, lease)
+
+        AIJob.objects.filter(pk=job.pk).update(claimed_by='worker-b')
+        self.assertFalse(renew_lease(job))
+
+    def test_runner_error_marks_job_failed(self):
+        enqueue_job(AIJobOperation.WORKSPACE_DRAFT, payload={'session': {}})
+        job = claim_next_job('worker-a')
+
+        with self.assertLogs('content_ai.jobs.queue', level='ERROR'):
+            self.assertFalse(run_job(job))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, AIJobStatus.FAILED)
+        self.assertTrue(job.error)
+
+    def test_result_dropped_after_losing_claim(self):
+        enqueue_job(AIJobOperation.WORKSPACE_DRAFT, payload={})
+        job = claim_next_job('worker-a')
+        AIJob.objects.filter(pk=job.pk).update(claimed_by='worker-b')
+
+        with self.assertLogs('content_ai.jobs.queue', level='WARNING'):
+            self.assertFalse(complete_job(job, JobOutcome(result={'ok': True})))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, AIJobStatus.RUNNING)
+        self.assertIsNone(job.result)
+
+
+@override_settings(CONTENT_AI_BACKGROUND_JOBS=True)
+class WorkspaceBackgroundJobTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.staff = User.objects.create_user(
+            username='wsjobstaff', password='password123', is_staff=True
+        )
+        self.client.login(username='wsjobstaff', password='password123')
+
+    def _post(self, action, payload):
+        return self.client.post(
+            reverse('content_ai:workspace_api', kwargs={'action': action}),
+            data=json.dumps(payload),
+            content_type='application/json',
+        )
+
+    def test_generate_draft_enqueues_and_poll_applies_result(self):
+        response = self._post(
+            'generate_draft',
+            {
+                'source_text': 'Context about housing in Sweden.',
+                'title': 'Housing',
+                'background': True,
+            },
+        )
+        self.assertEqual(response.status_code, 202)
+        data = response.json()
+        self.assertEqual(data['job']['status'], AIJobStatus.PENDING)
+        poll_url = data['poll_url']
+
+        pending = self.client.get(poll_url).json()
+        self.assertEqual(pending['job']['status'], AIJobStatus.PENDING)
+        self.assertNotIn('session', pending)
+
+        run_job(claim_next_job('worker-a'))
+
+        done = self.client.get(poll_url).json()
+        self.assertTrue(done['ok'])
+        self.assertEqual(done['job']['status'], AIJobStatus.COMPLETED)
+        self.assertTrue(done['session']['sections']['body'])
+
+        # Later edits are not overwritten by another poll of the same job.
+        self._post('update_sections', {'sections': {'body': 'Edited by hand'}})
+        again = self.client.get(poll_url).json()
+        self.assertEqual(again['session']['sections']['body'], 'Edited by hand')
+
+    def _enqueue_draft(self):
+        response = self._post(
+            'generate_draft',
+            {
+                'source_text': 'Context about housing in Sweden.',
+                'title': 'Housing',
+                'background': True,
+            },
+        )
+        self.assertEqual(response.status_code, 202)
+        return response.json()['poll_url']
+
+    def test_edits_made_while_job_runs_are_not_overwritten(self):
+        poll_url = self._enqueue_draft()
+        self._post('update_sections', {'sections': {'body': 'Edited meanwhile'}})
+
+        run_job(claim_next_job('worker-a'))
+
+        done = self.client.get(poll_url).json()
+        self.assertFalse(done['ok'])
+        self.assertEqual(done['error']['code'], 'session_changed')
+        self.assertEqual(done['session']['sections']['body'], 'Edited meanwhile')
+
+    def test_older_job_is_not_reapplied_after_a_newer_one(self):
+        older_url = self._enqueue_draft()
+        newer_url = self._enqueue_draft()
+        run_job(claim_next_job('worker-a'))
+        run_job(claim_next_job('worker-a'))
+
+        self.assertTrue(self.client.get(newer_url).json()['ok'])
+        applied = self.client.get(newer_url).json()['session']
+
+        stale = self.client.get(older_url).json()
+        self.assertEqual(stale['error']['code'], 'session_changed')
+        self.assertEqual(stale['session']['sections'], applied['sections'])
+
+    def test_background_flag_ignored_when_jobs_disabled(self):
+        with self.settings(CONTENT_AI_BACKGROUND_JOBS=False):
+            response = self._post(
+                'generate_draft',
+                {
+                    'source_text': 'Context about housing in Sweden.',
+                    'title': 'Housing',
+                    'background': True,
+                },
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(AIJob.objects.exists())
+
+    def test_failed_job_reports_error(self):
+        job = enqueue_job(
+            AIJobOperation.FEATURED_IMAGE,
+            payload={},
+            created_by=self.staff,
+        )
+        claimed = claim_next_job('worker-a')
+
+        def broken_runner(job):
+            raise RuntimeError('image provider down')
+
+        with patch.dict(
+            'content_ai.jobs.runners.JOB_RUNNERS',
+            {AIJobOperation.FEATURED_IMAGE: broken_runner},
+        ):
+            with self.assertLogs('content_ai.jobs.queue', level='ERROR'):
+                run_job(claimed)
+
+        data = self.client.get(
+            reverse('content_ai:workspace_job_status', kwargs={'job_id': job.pk})
+        ).json()
+        self.assertFalse(data['ok'])
+        self.assertEqual(data['error']['code'], 'generation_failed')
+        self.assertEqual(data['error']['message'], 'image provider down')
+
+    def test_other_users_jobs_are_hidden(self):
+        other = User.objects.create_user(username='otherstaff', is_staff=True)
+        job = enqueue_job(AIJobOperation.WORKSPACE_DRAFT, payload={}, created_by=other)
+        response = self.client.get(
+            reverse('content_ai:workspace_job_status', kwargs={'job_id': job.pk})
+        )
+        self.assertEqual(response.status_code, 404)
@@ -1,3 +1,4 @@
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from django.test import SimpleTestCase, override_settings
@@ -166,6 +167,23 @@ class OpenAIProviderGenerationTests(SimpleTestCase):
             },
         )
 
+    @override_settings(
+        CONTENT_AI_MODEL_PRICES={'gpt-test': {'input': 1.0, 'output': 2.0}},
+    )
+    def test_estimated_cost_from_price_table(self):
+        response = MagicMock()
+        response.output_text = 'body'
+        response.usage = MagicMock(
+            input_tokens=11,
+            output_tokens=7,
+            total_tokens=18,
+        )
+        self.client.responses.create.return_value = response
+
+        result = self.provider.generate_post('prompt')
+
+        self.assertAlmostEqual(result.telemetry.estimated_cost, 25 / 1_000_000)
+
     def test_missing_output_text_returns_empty_content(self):
         class _Response:
             id = 'resp_empty'
@@ -188,6 +206,99 @@ class OpenAIProviderGenerationTests(SimpleTestCase):
         self.client.responses.create.assert_called_once()
         self.client.chat.completions.create.assert_not_called()
 
+    def test_stream_yields_text_deltas_and_final_result(self):
+        completed = MagicMock()
+        completed.id = 'resp_stream'
+        completed.usage = MagicMock(input_tokens=3, output_tokens=2, total_tokens=5)
+        self.client.responses.create.return_value = iter([
+            SimpleNamespace(type='response.created'),
+            SimpleNamespace(type='response.output_text.delta', delta='Hello'),
+            SimpleNamespace(type='response.output_text.delta', delta=' world'),
+            SimpleNamespace(type='response.completed', response=completed),
+        ])
+
+        stream = self.provider.stream('prompt', task='post_generation')
+
+        self.assertEqual(list(stream), ['Hello', ' world'])
+        self.client.responses.create.assert_called_once_with(
+            model='gpt-test-model',
+            input='prompt',
+            stream=True,
+        )
+        result = stream.result
+        self.assertEqual(result.content, 'Hello world')
+        self.assertEqual(result.metadata['response_id'], 'resp_stream')
+        self.assertTrue(result.metadata['streamed'])
+        self.assertEqual(result.telemetry.token_usage['total_tokens'], 5)
+        self.assertEqual(result.telemetry.response_length, len('Hello world'))
+
+    def test_stream_errors_raise_generation_error(self):
+        class APITimeoutError(Exception):
+            pass
+
+        self.client.responses.create.side_effect = APITimeoutError('timed out')
+
+        stream = self.provider.stream('prompt')
+        with self.assertLogs('content_ai.providers.openai', level='ERROR'):
+            with self.assertRaises(GenerationError) as ctx:
+                list(stream)
+        self.assertEqual(ctx.exception.telemetry.metadata['status'], 'timeout')
+        self.assertIsNone(stream.result)
+
+    def _failed_stream(self, events):
+        self.client.responses.create.return_value = iter(events)
+        stream = self.provider.stream('prompt')
+        received = []
+        with self.assertLogs('content_ai.providers.openai', level='ERROR'):
+            with self.assertRaises(GenerationError) as ctx:
+                for delta in stream:
+                    received.append(delta)
+        self.assertIsNone(stream.result)
+        self.assertFalse(ctx.exception.telemetry.success)
+        return ctx.exception, received
+
+    def test_stream_failed_event_raises_after_partial_text(self):
+        failed = SimpleNamespace(
+            error=SimpleNamespace(code='server_error', message='boom'),
+        )
+        exc, received = self._failed_stream([
+            SimpleNamespace(type='response.output_text.delta', delta='Half a'),
+            SimpleNamespace(type='response.failed', response=failed),
+        ])
+        self.assertEqual(received, ['Half a'])
+        self.assertIn('boom', str(exc))
+        self.assertEqual(exc.telemetry.metadata['openai_error_code'], 'server_error')
+
+    def test_stream_error_event_raises(self):
+        exc, _ = self._failed_stream([
+            SimpleNamespace(type='error', code='rate_limit_exceeded', message='slow'),
+        ])
+        self.assertIn('slow', str(exc))
+        self.assertEqual(
+            exc.telemetry.metadata['openai_error_code'],
+            'rate_limit_exceeded',
+        )
+
+    def test_stream_incomplete_event_is_not_a_success(self):
+        incomplete = SimpleNamespace(
+            incomplete_details=SimpleNamespace(reason='max_output_tokens'),
+        )
+        exc, received = self._failed_stream([
+            SimpleNamespace(type='response.output_text.delta', delta='Cut'),
+            SimpleNamespace(type='response.incomplete', response=incomplete),
+        ])
+        self.assertEqual(received, ['Cut'])
+        self.assertIn('max_output_tokens', str(exc))
+
+    def test_stream_without_completed_event_is_not_a_success(self):
+        exc, _ = self._failed_stream([
+            SimpleNamespace(type='response.output_text.delta', delta='Cut'),
+        ])
+        self.assertIn('response.completed', str(exc))
+
+    def test_declares_streaming_capability(self):
+        self.assertTrue(self.provider.capabilities().streaming)
+
 
 class OpenAITextTimeoutTests(SimpleTestCase):
     @override_settings(
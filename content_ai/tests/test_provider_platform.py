@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
 from django.test import SimpleTestCase, override_settings
 
 from content_ai.config.ai_engine import (
@@ -11,13 +17,21 @@ from content_ai.config.ai_engine import (
 from content_ai.providers import (
     BaseAIProvider,
     CapabilityError,
+    CircuitBreaker,
+    CircuitOpenError,
+    GenerationError,
     MockProvider,
     ProviderConfigurationError,
     ProviderFactory,
     ProviderManager,
     ProviderNotFound,
+    ProviderPool,
     ProviderRegistry,
     ProviderUnavailableError,
+    RateLimitError,
+    RateLimitScheduler,
+    RetryPolicy,
+    get_pool,
     get_provider,
     list_providers,
     register_provider,
@@ -25,6 +39,13 @@ from content_ai.providers import (
 from content_ai.providers.adapters.claude import ClaudeProvider
 from content_ai.providers.capabilities import ProviderCapabilities
 from content_ai.providers.models import ModelMetadata, UsageReport
+from content_ai.providers.openai import _retry_after_seconds
+from content_ai.providers.scheduler import (
+    PRIORITY_BATCH,
+    provider_priority,
+    retry_after_hint,
+)
+from content_ai.telemetry import AIExecutionTelemetry
 
 
 class ProviderPlatformFlagTests(SimpleTestCase):
@@ -114,3 +135,455 @@ class RegisterProviderTests(SimpleTestCase):
         registry = ProviderRegistry(initial={'mock': MockProvider})
         registry.register('temp_rfc005', TempProvider)
         self.assertIn('temp_rfc005', registry.list_providers())
+
+
+class CountingProvider(MockProvider):
+    name = 'counting'
+    pool_settings = ('CONTENT_AI_TEST_POOL_MODEL',)
+    instances = 0
+    health_checks = 0
+
+    def __init__(self):
+        type(self).instances += 1
+
+    def health_check(self) -> bool:
+        type(self).health_checks += 1
+        return True
+
+
+class ProviderPoolTests(SimpleTestCase):
+    def setUp(self):
+        CountingProvider.instances = 0
+        CountingProvider.health_checks = 0
+        get_pool().clear()
+        self.addCleanup(get_pool().clear)
+
+    def test_get_provider_reuses_instance(self):
+        self.assertIs(get_provider('mock'), get_provider('mock'))
+
+    def test_factory_shares_pool_with_get_provider(self):
+        self.assertIs(ProviderFactory().create('mock'), get_provider('mock'))
+
+    def test_pool_builds_once_per_settings_fingerprint(self):
+        pool = ProviderPool()
+        with self.settings(CONTENT_AI_TEST_POOL_MODEL='a'):
+            first = pool.get('counting', CountingProvider)
+            self.assertIs(pool.get('counting', CountingProvider), first)
+        with self.settings(CONTENT_AI_TEST_POOL_MODEL='b'):
+            second = pool.get('counting', CountingProvider)
+        self.assertIsNot(first, second)
+        self.assertEqual(CountingProvider.instances, 2)
+
+    def test_setting_change_clears_default_pool(self):
+        provider = get_provider('mock')
+        with self.settings(CONTENT_AI_TEST_POOL_MODEL='changed'):
+            self.assertIsNot(get_provider('mock'), provider)
+
+    def test_construction_errors_are_not_cached(self):
+        pool = ProviderPool()
+        with patch.object(
+            CountingProvider,
+            '__init__',
+            side_effect=ProviderConfigurationError('missing key'),
+        ):
+            with self.assertRaises(ProviderConfigurationError):
+                pool.get('counting', CountingProvider)
+        self.assertEqual(len(pool), 0)
+        pool.get('counting', CountingProvider)
+        self.assertEqual(len(pool), 1)
+
+    @override_settings(CONTENT_AI_PROVIDER_HEALTH_TTL=60)
+    def test_health_status_cached_within_ttl(self):
+        pool = ProviderPool()
+        provider = pool.get('counting', CountingProvider)
+        self.assertTrue(pool.is_healthy(provider))
+        self.assertTrue(pool.is_healthy(provider))
+        self.assertEqual(CountingProvider.health_checks, 1)
+
+    @override_settings(CONTENT_AI_PROVIDER_HEALTH_TTL=0)
+    def test_health_rechecked_after_ttl(self):
+        pool = ProviderPool()
+        provider = pool.get('counting', CountingProvider)
+        pool.is_healthy(provider)
+        pool.is_healthy(provider)
+        self.assertEqual(CountingProvider.health_checks, 2)
+
+    def test_manager_uses_cached_health(self):
+        registry = ProviderRegistry(initial={'counting': CountingProvider})
+        manager = ProviderManager(
+            ProviderFactory(registry=registry, pool=ProviderPool()),
+            default_provider='counting',
+        )
+        manager.select_provider()
+        manager.select_provider()
+        self.assertEqual(CountingProvider.instances, 1)
+        self.assertEqual(CountingProvider.health_checks, 1)
+
+
+class FlakyProvider(MockProvider):
+    name = 'flaky'
+    failures_left = 0
+    calls = 0
+
+    def generate(self, prompt='', *, task='post_generation'):
+        type(self).calls += 1
+        if type(self).failures_left:
+            type(self).failures_left -= 1
+            raise GenerationError('provider brownout')
+        return super().generate(prompt, task=task)
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@override_settings(CONTENT_AI_ALLOW_PROCESS_LOCAL_CACHE=True)
+class ResilienceTests(SimpleTestCase):
+    def setUp(self):
+        FlakyProvider.failures_left = 0
+        FlakyProvider.calls = 0
+        caches['default'].clear()
+        self.addCleanup(caches['default'].clear)
+        self.registry = ProviderRegistry(
+            initial={'mock': MockProvider, 'flaky': FlakyProvider}
+        )
+        self.sleeps = []
+
+    def manager(self, **kwargs):
+        kwargs.setdefault('default_provider', 'flaky')
+        kwargs.setdefault('sleep', self.sleeps.append)
+        return ProviderManager(
+            ProviderFactory(registry=self.registry, pool=ProviderPool()),
+            **kwargs,
+        )
+
+    def test_retries_transient_errors_with_backoff(self):
+        FlakyProvider.failures_left = 2
+        manager = self.manager(max_retries=2)
+        result = manager.generate('hello')
+        self.assertTrue(result.success)
+        self.assertEqual(FlakyProvider.calls, 3)
+        self.assertEqual(len(self.sleeps), 2)
+        self.assertTrue(all(0 <= delay <= 0.5 for delay in self.sleeps))
+
+    def test_backoff_stops_at_deadline(self):
+        FlakyProvider.failures_left = 5
+        clock = FakeClock()
+        manager = self.manager(
+            max_retries=5,
+            deadline_seconds=1.0,
+            retry_policy=RetryPolicy(max_retries=5, base_delay=2.0, max_delay=2.0),
+            clock=clock,
+        )
+        with patch('content_ai.providers.resilience.random.uniform', return_value=2.0):
+            with self.assertRaises(GenerationError):
+                manager.generate('hello')
+        self.assertEqual(FlakyProvider.calls, 1)
+        self.assertEqual(self.sleeps, [])
+
+    def test_deadline_defaults_below_router_limit(self):
+        with self.settings(OPENAI_TEXT_TIMEOUT=27):
+            del settings.CONTENT_AI_PROVIDER_DEADLINE
+            self.assertEqual(self.manager().deadline_seconds, 27)
+        with self.settings(CONTENT_AI_PROVIDER_DEADLINE=10):
+            self.assertEqual(self.manager().deadline_seconds, 10)
+
+    def test_fails_over_to_secondary_provider(self):
+        FlakyProvider.failures_left = 1
+        manager = self.manager(fallback_providers=['mock'])
+        result = manager.generate('hello')
+        self.assertEqual(result.provider, 'mock')
+        self.assertEqual(
+            [(a['provider'], a['error']) for a in manager.last_attempts()],
+            [('flaky', 'GenerationError'), ('mock', '')],
+        )
+
+    def test_non_retryable_error_is_not_retried(self):
+        manager = self.manager(max_retries=3)
+        with patch.object(
+            FlakyProvider,
+            'generate',
+            side_effect=ProviderConfigurationError('bad key'),
+        ) as generate:
+            with self.assertRaises(ProviderConfigurationError):
+                manager.generate('hello')
+        self.assertEqual(generate.call_count, 1)
+
+    def test_open_breaker_skips_provider_without_calling_it(self):
+        CircuitBreaker('flaky').trip()
+        manager = self.manager(
+            use_circuit_breaker=True,
+            fallback_providers=['mock'],
+        )
+        result = manager.generate('hello')
+        self.assertEqual(result.provider, 'mock')
+        self.assertEqual(FlakyProvider.calls, 0)
+
+    def test_breaker_opens_on_failure_rate_then_probes(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            'flaky',
+            min_calls=4,
+            failure_rate=0.5,
+            open_seconds=30,
+            clock=clock,
+        )
+        breaker.record_success()
+        breaker.record_success()
+        breaker.record_failure()
+        self.assertEqual(breaker.state(), 'closed')
+        breaker.record_failure()
+        self.assertEqual(breaker.state(), 'open')
+        clock.now += 10
+        with self.assertRaises(CircuitOpenError) as refused:
+            breaker.before_call()
+        self.assertEqual(refused.exception.retry_after, 20)
+
+        clock.now += 21
+        self.assertEqual(breaker.state(), 'half_open')
+        breaker.before_call()
+        # Only one probe is let through while half-open.
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_failure()
+        self.assertEqual(breaker.state(), 'open')
+
+        clock.now += 31
+        breaker.before_call()
+        breaker.record_success()
+        self.assertEqual(breaker.state(), 'closed')
+        self.assertEqual(breaker.window_counts(), (0, 0))
+
+    def test_breaker_state_is_shared_through_cache(self):
+        CircuitBreaker('flaky').trip()
+        self.assertEqual(CircuitBreaker('flaky').state(), 'open')
+        self.assertEqual(CircuitBreaker('mock').state(), 'closed')
+
+    def test_old_failures_leave_the_window(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker('flaky', min_calls=2, window_seconds=60, clock=clock)
+        breaker.record_failure()
+        clock.now += 120
+        breaker.record_failure()
+        self.assertEqual(breaker.state(), 'closed')
+        self.assertEqual(breaker.window_counts(), (0, 1))
+
+    @override_settings(CONTENT_AI_PROVIDER='mock', CONTENT_AI_CIRCUIT_BREAKER_ENABLED=True)
+    def test_generation_service_fails_fast_when_breaker_open(self):
+        from content_ai.constants import AIGenerationTask
+        from content_ai.schemas import PostGenerationRequest
+        from content_ai.services.generation import ContentGenerationService
+
+        CircuitBreaker('mock').trip()
+        with patch.object(MockProvider, 'generate_post') as generate_post:
+            with self.assertRaises(CircuitOpenError):
+                ContentGenerationService().generate(
+                    AIGenerationTask.POST_GENERATION,
+                    PostGenerationRequest(title='x'),
+                )
+        generate_post.assert_not_called()
+
+
+    def _generate_post(self, flaky, **kwargs):
+        from content_ai.constants import AIGenerationTask
+        from content_ai.schemas import PostGenerationRequest
+        from content_ai.services.generation import ContentGenerationService
+
+        with patch('content_ai.providers.registry.get_provider', return_value=flaky):
+            return ContentGenerationService().generate(
+                AIGenerationTask.POST_GENERATION,
+                PostGenerationRequest(title='x'),
+                **kwargs,
+            )
+
+    @override_settings(CONTENT_AI_PROVIDER_FALLBACKS=['mock'])
+    def test_generation_service_fails_over_to_secondary_provider(self):
+        flaky = FlakyProvider()
+        with patch.object(
+            flaky, 'generate_post', side_effect=GenerationError('provider brownout')
+        ):
+            result = self._generate_post(flaky)
+        self.assertEqual(result.provider, 'mock')
+
+    @override_settings(CONTENT_AI_PROVIDER_MAX_RETRIES=1)
+    def test_generation_service_retries_transient_errors(self):
+        flaky = FlakyProvider()
+        with patch.object(
+            flaky,
+            'generate_post',
+            side_effect=[GenerationError('provider brownout'), flaky._result('x')],
+        ) as generate_post:
+            with patch('content_ai.providers.resilience.random.uniform', return_value=0):
+                result = self._generate_post(flaky)
+        self.assertTrue(result.success)
+        self.assertEqual(generate_post.call_count, 2)
+
+    @override_settings(
+        CONTENT_AI_PROVIDER_FALLBACKS=['mock'],
+        CONTENT_AI_PROVIDER_MAX_RETRIES=2,
+    )
+    def test_streamed_text_is_not_repeated_by_failover(self):
+        def broken_stream(prompt='', *, task='post_generation'):
+            yield 'partial'
+            raise GenerationError('stream cut off')
+
+        flaky = FlakyProvider()
+        deltas = []
+        with patch.object(flaky, 'stream', side_effect=broken_stream) as stream:
+            with self.assertRaises(GenerationError):
+                self._generate_post(flaky, on_delta=deltas.append)
+        self.assertEqual(deltas, ['partial'])
+        self.assertEqual(stream.call_count, 1)
+
+    @override_settings(CONTENT_AI_ALLOW_PROCESS_LOCAL_CACHE=False)
+    def test_breaker_refuses_process_local_cache(self):
+        with self.assertRaises(ImproperlyConfigured):
+            CircuitBreaker('flaky')
+
+    @override_settings(
+        CONTENT_AI_ALLOW_PROCESS_LOCAL_CACHE=False,
+        CONTENT_AI_CIRCUIT_BREAKER_ENABLED=True,
+    )
+    def test_system_check_flags_process_local_breaker_cache(self):
+        from content_ai.checks import check_provider_state_cache
+
+        errors = check_provider_state_cache(None)
+        self.assertEqual([error.id for error in errors], ['content_ai.E001'])
+
+@override_settings(CONTENT_AI_ALLOW_PROCESS_LOCAL_CACHE=True)
+class RateLimitSchedulerTests(SimpleTestCase):
+    def setUp(self):
+        caches['default'].clear()
+        self.addCleanup(caches['default'].clear)
+        self.clock = FakeClock(now=6000.0)
+        self.sleeps = []
+
+    def _sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.clock.now += seconds
+
+    def scheduler(self, **kwargs):
+        kwargs.setdefault('max_wait', 0.0)
+        return RateLimitScheduler(
+            'flaky',
+            clock=self.clock,
+            sleep=self._sleep,
+            **kwargs,
+        )
+
+    def test_batch_calls_are_shed_before_interactive_ones(self):
+        scheduler = self.scheduler(rpm=4, batch_share=0.5)
+        for _ in range(2):
+            scheduler.acquire(1, PRIORITY_BATCH)
+        with self.assertRaises(RateLimitError) as ctx:
+            scheduler.acquire(1, PRIORITY_BATCH)
+        self.assertGreater(ctx.exception.retry_after, 0)
+
+        scheduler.acquire(1)
+        scheduler.acquire(1)
+        with self.assertRaises(RateLimitError):
+            scheduler.acquire(1)
+        self.assertEqual(scheduler.usage()['requests'], 4)
+
+    def test_priority_comes_from_context(self):
+        scheduler = self.scheduler(rpm=2, batch_share=0.5)
+        with provider_priority(PRIORITY_BATCH):
+            scheduler.call(lambda: 'ok')
+            with self.assertRaises(RateLimitError):
+                scheduler.call(lambda: 'ok')
+        self.assertEqual(scheduler.call(lambda: 'ok'), 'ok')
+
+    def test_previous_minute_counts_toward_sliding_window(self):
+        scheduler = self.scheduler(rpm=2)
+        scheduler.acquire(1)
+        scheduler.acquire(1)
+        self.clock.now += 60
+        with self.assertRaises(RateLimitError):
+            scheduler.acquire(1)
+        self.clock.now += 45
+        scheduler.acquire(1)
+
+    def test_token_budget_is_settled_to_reported_usage(self):
+        scheduler = self.scheduler(tpm=1000, output_tokens=500)
+        result = SimpleNamespace(
+            telemetry=SimpleNamespace(token_usage={'total_tokens': 40})
+        )
+        scheduler.call(lambda: result, prompt='x' * 400)
+        self.assertEqual(scheduler.usage()['tokens'], 40)
+
+    def test_retry_after_hint_blocks_every_worker(self):
+        def rate_limited():
+            raise RateLimitError('429', retry_after=3)
+
+        with self.assertRaises(RateLimitError):
+            self.scheduler(rpm=100).call(rate_limited)
+
+        other_worker = self.scheduler(rpm=100)
+        self.assertAlmostEqual(other_worker.blocked_for(), 3.0)
+        with self.assertRaises(RateLimitError) as ctx:
+            other_worker.acquire(1, PRIORITY_BATCH)
+        self.assertAlmostEqual(ctx.exception.retry_after, 3.0)
+
+    def test_interactive_call_waits_out_a_short_block(self):
+        scheduler = self.scheduler(rpm=100, max_wait=5.0)
+        scheduler.block(1.0)
+        self.assertEqual(scheduler.call(lambda: 'ok'), 'ok')
+        self.assertAlmostEqual(sum(self.sleeps), 1.0)
+
+    def test_retry_after_hints(self):
+        telemetry = AIExecutionTelemetry(metadata={'retry_after': 2.5})
+        self.assertEqual(
+            retry_after_hint(GenerationError('429', telemetry=telemetry)),
+            2.5,
+        )
+        self.assertIsNone(retry_after_hint(GenerationError('boom')))
+        self.assertEqual(_retry_after_seconds({'retry-after-ms': '1500'}), 1.5)
+        self.assertEqual(_retry_after_seconds({'retry-after': '7'}), 7.0)
+        self.assertIsNone(_retry_after_seconds({}))
+
+    @override_settings(CONTENT_AI_ALLOW_PROCESS_LOCAL_CACHE=False)
+    def test_scheduler_refuses_process_local_cache(self):
+        with self.assertRaises(ImproperlyConfigured):
+            RateLimitScheduler('flaky', rpm=1)
+
+    @override_settings(
+        CONTENT_AI_ALLOW_PROCESS_LOCAL_CACHE=False,
+        CONTENT_AI_RATE_LIMIT_ENABLED=True,
+        CACHES={
+            'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+            'database': {
+                'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+                'LOCATION': 'content_ai_rate_limits',
+            },
+        },
+        CONTENT_AI_RATE_LIMIT_CACHE='database',
+    )
+    def test_system_check_flags_non_atomic_rate_limit_cache(self):
+        from content_ai.checks import check_provider_state_cache
+
+        errors = check_provider_state_cache(None)
+        self.assertEqual([error.id for error in errors], ['content_ai.E002'])
+        self.assertIn('DatabaseCache', errors[0].msg)
+
+    @override_settings(
+        CONTENT_AI_RATE_LIMIT_ENABLED=True,
+        CONTENT_AI_RATE_LIMIT_MAX_WAIT=0,
+        CONTENT_AI_PROVIDER_RATE_LIMITS={'flaky': {'rpm': 1}},
+    )
+    def test_manager_calls_go_through_scheduler(self):
+        manager = ProviderManager(
+            ProviderFactory(
+                registry=ProviderRegistry(initial={'flaky': FlakyProvider}),
+                pool=ProviderPool(),
+            ),
+            default_provider='flaky',
+        )
+        FlakyProvider.calls = 0
+        manager.generate('hello')
+        with self.assertRaises(RateLimitError):
+            manager.generate('hello')
+        self.assertEqual(FlakyProvider.calls, 1)
@@ -67,6 +67,15 @@ class MockProviderTests(SimpleTestCase):
     def test_mock_provider_is_base_ai_provider(self):
         self.assertIsInstance(self.provider, BaseAIProvider)
 
+    def test_stream_yields_mock_response_in_chunks(self):
+        stream = self.provider.stream('prompt text', task='summary')
+        deltas = list(stream)
+        self.assertGreater(len(deltas), 1)
+        self.assertEqual(''.join(deltas), MOCK_RESPONSE)
+        self.assertEqual(stream.result.content, MOCK_RESPONSE)
+        self.assertEqual(stream.result.metadata['task'], 'summary')
+        self.assertTrue(self.provider.capabilities().streaming)
+
 
 class BaseAIProviderTests(SimpleTestCase):
     def test_base_methods_raise_not_implemented(self):
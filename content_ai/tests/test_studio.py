@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import json
+import threading
 
 from django.contrib.auth import get_user_model
 from django.test import Client, SimpleTestCase, TestCase, override_settings
 from django.urls import reverse
 
 from content_ai.config.ai_engine import ENABLE_AI_STUDIO, FEATURE_FLAGS
+from content_ai.studio.fanout import FanOut
 from content_ai.studio.modules import list_modules_for_ui
 from content_ai.studio.services import StudioService
 
@@ -132,6 +134,86 @@ class StudioServiceTests(SimpleTestCase):
 
 
 @override_settings(CONTENT_AI_PROVIDER='mock')
+class StudioFanOutTests(SimpleTestCase):
+    def test_branches_run_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def branch(value):
+            return lambda: (barrier.wait(), value)[1]
+
+        results = FanOut(max_workers=3, deadline_seconds=5).run(
+            {key: branch(key) for key in ('a', 'b', 'c')}
+        )
+        self.assertEqual(
+            {r.key: r.value for r in results},
+            {'a': 'a', 'b': 'b', 'c': 'c'},
+        )
+        self.assertTrue(all(r.status == 'completed' for r in results))
+
+    def test_deadline_returns_partial_results(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+        results = FanOut(max_workers=2, deadline_seconds=0.2).run(
+            {'fast': lambda: 'done', 'slow': lambda: release.wait(5)}
+        )
+        statuses = {r.key: r.status for r in results}
+        self.assertEqual(statuses, {'fast': 'completed', 'slow': 'timed_out'})
+        self.assertEqual(results[0].key, 'fast')
+
+    def test_failed_branch_does_not_fail_others(self):
+        def broken():
+            raise RuntimeError('provider down')
+
+        results = FanOut(deadline_seconds=5).run({'ok': lambda: 1, 'bad': broken})
+        by_key = {r.key: r for r in results}
+        self.assertEqual(by_key['ok'].status, 'completed')
+        self.assertEqual(by_key['bad'].status, 'failed')
+        self.assertEqual(by_key['bad'].error, 'provider down')
+
+    def test_cancel_branch_from_callback(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+        fan_out = FanOut(max_workers=2, deadline_seconds=5)
+
+        def on_result(result):
+            if result.key == 'first':
+                fan_out.cancel('second')
+
+        results = fan_out.run(
+            {'first': lambda: 1, 'second': lambda: release.wait(5)},
+            on_result=on_result,
+        )
+        self.assertEqual(
+            [(r.key, r.status) for r in results],
+            [('first', 'completed'), ('second', 'cancelled')],
+        )
+
+    def test_compare_variants_records_completed_generations(self):
+        service = StudioService()
+        session = service.new_session(environment='testing')
+        result = service.compare_variants(
+            session,
+            variants=[
+                {'version': 'v1', 'style': 'news', 'provider': 'mock'},
+                {'version': 'v1', 'style': 'analysis', 'provider': 'mock'},
+                {'version': 'v1', 'style': 'news', 'provider': 'not-real'},
+            ],
+            user_prompt='Fan-out compare',
+        )
+        statuses = sorted(row['status'] for row in result['branches'])
+        self.assertEqual(statuses, ['completed', 'completed', 'failed'])
+        self.assertEqual(result['completed'], 2)
+        self.assertTrue(result['partial'])
+        self.assertEqual(len(session.history), 2)
+        self.assertIsNone(result['automatic_winner'])
+
+    def test_compare_variants_validates_count(self):
+        service = StudioService()
+        session = service.new_session(environment='testing')
+        with self.assertRaises(ValueError):
+            service.compare_variants(session, variants=[{'version': 'v1'}])
+
+
 class StudioPermissionTests(TestCase):
     def setUp(self):
         self.client = Client()
@@ -203,6 +285,23 @@ class StudioAPIIntegrationTests(TestCase):
         self.assertTrue(data['ok'])
         self.assertIsNone(data['result']['automatic_winner'])
 
+    def test_prompt_compare_api_can_generate(self):
+        response = self._post(
+            'prompt_compare',
+            {
+                'version_a': 'v1',
+                'style_a': 'news',
+                'version_b': 'v1',
+                'style_b': 'friendly',
+                'user_prompt': 'API compare',
+                'generate': True,
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        generations = response.json()['result']['generations']
+        self.assertEqual(generations['completed'], 2)
+        self.assertEqual(len(response.json()['session']['history']), 2)
+
     def test_knowledge_and_provider_api(self):
         kb = self._post('knowledge_browse', {})
         self.assertEqual(kb.status_code, 200)
@@ -14,6 +14,8 @@ from content_ai.config.ai_engine import (
     FEATURE_FLAGS,
 )
 from content_ai.editorial.drafts import EditorialDraft
+from content_ai.providers.mock import MockProvider
+from content_ai.services.generation_cache import generation_cache
 from content_ai.source.extract import ArticleExtractionError, ExtractedArticle
 from content_ai.source.inspector import SourceInspector
 from content_ai.workflow.states import WorkflowState
@@ -441,6 +443,39 @@ class WorkspaceAPIIntegrationTests(TestCase):
             len('Context about housing in Sweden.'),
         )
 
+    @override_settings(CONTENT_AI_GENERATION_CACHE_ENABLED=True)
+    def test_regenerate_section_bypasses_generation_cache(self):
+        generation_cache.clear()
+        self.addCleanup(generation_cache.clear)
+        self._post(
+            'generate_draft',
+            {'source_text': 'Context about housing in Sweden.', 'title': 'Housing'},
+        )
+        with patch.object(
+            MockProvider, '_result', autospec=True, side_effect=MockProvider._result
+        ) as provider_result:
+            response = self._post('regenerate_section', {'section': 'headline'})
+            self.assertTrue(response.json()['ok'])
+            first_calls = provider_result.call_count
+            response = self._post('regenerate_section', {'section': 'headline'})
+            self.assertTrue(response.json()['ok'])
+        self.assertGreater(first_calls, 0)
+        self.assertEqual(provider_result.call_count, 2 * first_calls)
+
+    @override_settings(CONTENT_AI_GENERATION_CACHE_ENABLED=True)
+    def test_generating_over_existing_draft_bypasses_generation_cache(self):
+        generation_cache.clear()
+        self.addCleanup(generation_cache.clear)
+        payload = {'source_text': 'Context about housing in Sweden.', 'title': 'Housing'}
+        with patch.object(
+            MockProvider, '_result', autospec=True, side_effect=MockProvider._result
+        ) as provider_result:
+            self._post('generate_draft', payload)
+            first_calls = provider_result.call_count
+            self._post('generate_draft', payload)
+        self.assertGreater(first_calls, 0)
+        self.assertEqual(provider_result.call_count, 2 * first_calls)
+
     def test_generate_draft_url_only_returns_source_not_ready(self):
         # Seed previous article into the session.
         self._post(
@@ -662,3 +697,85 @@ class WorkspaceAPIIntegrationTests(TestCase):
         self.assertEqual(session.get('publish_success') or {}, {})
         self.assertEqual(session.get('last_explanations') or [], [])
         self.assertEqual(session.get('history') or [], [])
+
+
+class WorkspaceStreamDraftTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.staff = User.objects.create_user(
+            username='wsstreamstaff', password='password123', is_staff=True
+        )
+        self.client.login(username='wsstreamstaff', password='password123')
+        self.url = reverse('content_ai:workspace_stream_draft')
+
+    def _events(self, response):
+        body = b''.join(response.streaming_content).decode('utf-8')
+        events = []
+        for block in body.split('\n\n'):
+            lines = block.split('\n')
+            name = next(
+                (line[len('event: '):] for line in lines if line.startswith('event: ')),
+                None,
+            )
+            data = next(
+                (line[len('data: '):] for line in lines if line.startswith('data: ')),
+                None,
+            )
+            if name and data:
+                events.append((name, json.loads(data)))
+        return events
+
+    def test_streams_deltas_then_saved_session(self):
+        def fake_generate(service, session, **kwargs):
+            kwargs['on_delta']('headline_lead', 'Title ')
+            kwargs['on_delta']('body', 'Body text')
+            session.sections = ArticleSections(headline='Title', body='Body text')
+            return session
+
+        with patch.object(WorkspaceService, 'generate_draft', autospec=True, side_effect=fake_generate):
+            response = self.client.post(
+                self.url,
+                data=json.dumps({'source_text': 'Source for streaming', 'title': 'T'}),
+                content_type='application/json',
+            )
+            self.assertEqual(response['Content-Type'], 'text/event-stream')
+            events = self._events(response)
+
+        self.assertEqual([name for name, _ in events], ['start', 'delta', 'delta', 'done'])
+        self.assertEqual(events[1][1], {'pass': 'headline_lead', 'text': 'Title '})
+        self.assertEqual(events[-1][1]['session']['sections']['body'], 'Body text')
+
+        saved = self.client.post(
+            reverse('content_ai:workspace_api', kwargs={'action': 'update_sections'}),
+            data=json.dumps({}),
+            content_type='application/json',
+        ).json()
+        self.assertEqual(saved['session']['sections']['headline'], 'Title')
+
+    def test_generation_error_becomes_error_event(self):
+        from content_ai.providers.exceptions import GenerationError
+
+        with patch.object(
+            WorkspaceService,
+            'generate_draft',
+            side_effect=GenerationError('provider down'),
+        ):
+            response = self.client.post(
+                self.url,
+                data=json.dumps({'source_text': 'Source for streaming'}),
+                content_type='application/json',
+            )
+            with self.assertLogs('content_ai.workspace.views', level='ERROR'):
+                events = self._events(response)
+
+        self.assertEqual(events[-1][0], 'error')
+        self.assertEqual(events[-1][1]['error']['code'], 'generation_failed')
+
+    def test_missing_source_returns_json_error(self):
+        response = self.client.post(
+            self.url,
+            data=json.dumps({'source_text': ''}),
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error']['code'], 'source_not_ready')
@@ -5,14 +5,30 @@ from content_ai.editorial_studio.views import (
     editorial_studio_import,
 )
 from content_ai.studio.views import ai_studio, studio_api
+from content_ai.telemetry.views import generation_metrics_dashboard
 from content_ai.views import sandbox
-from content_ai.workspace.views import editorial_workspace, workspace_api
+from content_ai.workspace.views import (
+    editorial_workspace,
+    workspace_api,
+    workspace_job_status,
+    workspace_stream_draft,
+)
 
 app_name = 'content_ai'
 
 urlpatterns = [
     path('sandbox/', sandbox, name='sandbox'),
     path('workspace/', editorial_workspace, name='editorial_workspace'),
+    path(
+        'workspace/stream/draft/',
+        workspace_stream_draft,
+        name='workspace_stream_draft',
+    ),
+    path(
+        'workspace/jobs/<int:job_id>/',
+        workspace_job_status,
+        name='workspace_job_status',
+    ),
     path(
         'workspace/api/<slug:action>/',
         workspace_api,
@@ -24,6 +40,11 @@ urlpatterns = [
         studio_api,
         name='studio_api',
     ),
+    path(
+        'metrics/',
+        generation_metrics_dashboard,
+        name='generation_metrics',
+    ),
     path(
         'editorial-studio/',
         editorial_studio,
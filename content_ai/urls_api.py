@@ -1,6 +1,10 @@
 from django.urls import path
 
-from content_ai.api import create_editorial_draft
+from content_ai.api import (
+    create_editorial_draft,
+    generation_batch_status,
+    submit_generation_batch,
+)
 
 app_name = 'content_ai_api'
 
@@ -10,4 +14,14 @@ urlpatterns = [
         create_editorial_draft,
         name='editorial_draft',
     ),
+    path(
+        'batch/',
+        submit_generation_batch,
+        name='batch_submit',
+    ),
+    path(
+        'batch/<int:job_id>/',
+        generation_batch_status,
+        name='batch_status',
+    ),
 ]
@@ -1,13 +1,15 @@
 """Drafting stage service (RFC-003).
 
 When ``context.extension_data['generation']`` is set, runs production
-prompt assembly (PromptBuilder) and provider generation once.
+prompt assembly (PromptBuilder) and provider generation once. An optional
+``on_delta`` callable in that payload receives text deltas when the
+provider supports streaming.
 Otherwise remains an architecture stub for inactive workflow demos.
 """
 
 from __future__ import annotations
 
-from content_ai.providers.exceptions import GenerationError
+from content_ai.providers.exceptions import CapabilityError, GenerationError
 from content_ai.workflow.context import WorkflowContext
 from content_ai.workflow.services.base import WorkflowStageService
 from content_ai.workflow.states import WorkflowState
@@ -53,8 +55,13 @@ class DraftService(WorkflowStageService):
     ) -> WorkflowContext:
         # Lazy imports avoid circular imports and keep provider resolution
         # patchable via content_ai.providers.registry.get_provider.
+        from content_ai.providers.manager import ProviderManager
         from content_ai.providers.registry import get_provider
         from content_ai.services.generation import build_generation_prompt
+        from content_ai.services.generation_cache import (
+            generate_with_cache,
+            is_cache_hit,
+        )
 
         task = generation['task']
         request = generation.get('request')
@@ -101,13 +108,47 @@ class DraftService(WorkflowStageService):
         context.extension_data['prompt_length'] = len(prompt or '')
 
         provider = get_provider(provider_name or None)
-        method = getattr(provider, method_name, None)
-        if method is None:
+        if getattr(provider, method_name, None) is None:
             raise GenerationError(
                 f"Provider '{provider.name}' does not support task '{task}'."
             )
 
-        result = method(prompt)
+        on_delta = generation.get('on_delta')
+        streamed = []
+
+        def call_provider(current):
+            # Fallback providers may not implement every task method.
+            current_method = getattr(current, method_name, None)
+            if current_method is None:
+                raise CapabilityError(
+                    f"Provider '{current.name}' does not support task '{task}'."
+                )
+            if on_delta is not None and current.capabilities().streaming:
+                stream = current.stream(prompt, task=str(task))
+                for delta in stream:
+                    streamed.append(delta)
+                    on_delta(delta)
+                return stream.result
+            return current_method(prompt)
+
+        result = generate_with_cache(
+            provider,
+            prompt,
+            task=task,
+            prompt_version=context.prompt_version or '',
+            use_cache=generation.get('use_cache', True),
+            # Retries and failover stop once deltas reached the caller, so
+            # streamed text is never repeated.
+            generate=lambda: ProviderManager().invoke(
+                call_provider,
+                provider=provider,
+                prompt=prompt,
+                task=str(task),
+                can_retry=lambda: not streamed,
+            ),
+        )
+        if on_delta is not None and is_cache_hit(result) and result.content:
+            on_delta(str(result.content))
         content = '' if result.content is None else str(result.content)
         context.generated_draft = content
         context.provider = result.provider or provider.name
@@ -450,7 +450,15 @@ class WorkspaceService:
         instructions: str = '',
         provider_name: str | None = None,
         article_length: str | None = None,
+        on_delta=None,
+        use_cache: bool = True,
     ) -> WorkspaceSession:
+        """
+        Generate a full draft into ``session``.
+
+        ``on_delta(pass_name, text)`` receives streamed provider output;
+        ``use_cache=False`` bypasses the generation cache.
+        """
         assert_generation_integrity(session)
         if article_length is not None:
             session.article_length = resolve_article_length(article_length)
@@ -484,6 +492,8 @@ class WorkspaceService:
             goal=goal,
             style=writing_style,
             article_length=length,
+            on_delta=on_delta,
+            use_cache=use_cache,
         )
         lead = (draft.lead or '').strip()
         body = (draft.body or '').strip()
@@ -587,6 +597,7 @@ class WorkspaceService:
         *,
         instructions: str = '',
         provider_name: str | None = None,
+        use_cache: bool = True,
     ) -> WorkspaceSession:
         allowed = {
             'headline', 'lead', 'body', 'summary', 'excerpt', 'category', 'tags',
@@ -606,6 +617,7 @@ class WorkspaceService:
             goal=session.resolved_goal(),
             style=session.resolved_writing_style(),
             article_length=session.resolved_article_length(),
+            use_cache=use_cache,
         )
         explanation = f'{section} regenerated independently.'
         if section == 'headline':
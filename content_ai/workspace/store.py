@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 from datetime import datetime
 
 from content_ai.workflow.states import WorkflowState
@@ -21,10 +23,27 @@ def save_session(request, session: WorkspaceSession) -> None:
     request.session.modified = True
 
 
+def session_fingerprint(raw: dict | None) -> str:
+    """Digest of a stored session dict; ``updated_at`` is not round-tripped, so it is ignored."""
+    data = {key: value for key, value in (raw or {}).items() if key != 'updated_at'}
+    encoded = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def stored_session_fingerprint(request) -> str:
+    """Fingerprint of the workspace session as currently stored for ``request``."""
+    return session_fingerprint(request.session.get(SESSION_KEY))
+
+
 def load_session(request) -> WorkspaceSession | None:
     raw = request.session.get(SESSION_KEY)
     if not raw:
         return None
+    return session_from_dict(raw)
+
+
+def session_from_dict(raw: dict) -> WorkspaceSession:
+    """Rebuild a session from ``WorkspaceSession.to_dict()`` output."""
     try:
         state = WorkflowState(raw.get('workflow_state') or 'idea')
     except ValueError:
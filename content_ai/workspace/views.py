@@ -4,10 +4,14 @@ from __future__ import annotations
 
 import json
 import logging
+import queue
+import threading
 import traceback
 
+from django.conf import settings
 from django.contrib.admin.views.decorators import staff_member_required
-from django.http import JsonResponse
+from django.db import close_old_connections
+from django.http import JsonResponse, StreamingHttpResponse
 from django.shortcuts import render
 from django.urls import reverse
 from django.views.decorators.http import require_GET, require_POST
@@ -15,6 +19,7 @@ from django.views.decorators.http import require_GET, require_POST
 logger = logging.getLogger(__name__)
 
 from content_ai.config.ai_engine import ENABLE_AI_EDITORIAL_WORKSPACE
+from content_ai.constants import AIJobOperation, AIJobStatus
 from content_ai.editorial.article_length import list_article_lengths_for_ui
 from content_ai.editorial.category_recommender import list_blog_categories_for_ui
 from content_ai.editorial.image.style import list_image_styles_for_ui
@@ -30,14 +35,25 @@ from content_ai.providers.exceptions import (
     ProviderConfigurationError,
     ProviderNotFound,
 )
-from content_ai.serializers import serialize_error
+from content_ai.jobs.queue import enqueue_job
+from content_ai.models import AIJob
+from content_ai.serializers import serialize_error, serialize_job
+from content_ai.telemetry.generation_metrics import metrics_user
 from content_ai.workflow.states import WorkflowState
 from content_ai.source.extract import ArticleExtractionError
 from content_ai.workspace.actions import list_actions_for_ui
-from content_ai.workspace.integrity import SourceIntegrityError
+from content_ai.workspace.integrity import (
+    SourceIntegrityError,
+    assert_generation_integrity,
+)
 from content_ai.workspace.services import WorkspaceService
 from content_ai.workspace.session import ArticleSections
-from content_ai.workspace.store import load_session, save_session
+from content_ai.workspace.store import (
+    load_session,
+    save_session,
+    session_from_dict,
+    stored_session_fingerprint,
+)
 
 
 def _session_payload(service: WorkspaceService, session) -> dict:
@@ -83,6 +99,97 @@ def _apply_sections_payload(session, payload: dict) -> None:
     session.touch()
 
 
+def _prepare_draft_generation(service: WorkspaceService, session, payload: dict) -> None:
+    """Apply section, classification and source fields sent with a draft request."""
+    _apply_sections_payload(session, payload)
+    if payload.get('content_type') or payload.get('goal') or payload.get(
+        'writing_style'
+    ) or payload.get('style') or payload.get('article_length'):
+        service.set_classification(
+            session,
+            content_type=payload.get('content_type'),
+            goal=payload.get('goal'),
+            writing_style=payload.get('writing_style')
+            or payload.get('style'),
+            article_length=payload.get('article_length'),
+        )
+    # Never silently reuse previous session text for a new URL.
+    # Use exactly what the client sent for URL/text; empty stays empty.
+    if 'source_text' in payload or 'source_url' in payload:
+        incoming_url = (
+            payload['source_url']
+            if 'source_url' in payload
+            else (session.source_url or '')
+        )
+        if 'source_text' in payload:
+            incoming_text = payload.get('source_text') or ''
+        elif (incoming_url or '').strip() != (session.source_url or '').strip():
+            # URL changed without a text field — do not keep old article body.
+            incoming_text = ''
+        else:
+            incoming_text = session.source_material or ''
+        service.ingest_source(
+            session,
+            url=incoming_url or '',
+            text=incoming_text,
+            title=payload.get('title') or '',
+            publisher=payload.get('publisher') or '',
+        )
+
+
+def _draft_use_cache(session, payload: dict) -> bool:
+    """
+    Whether a draft request may be answered from the generation cache.
+
+    Only a first draft is cacheable; generating over an existing draft is a
+    regenerate and must reach the provider, as must ``fresh`` requests.
+    """
+    sections = session.sections
+    has_draft = bool((sections.lead or '').strip() or (sections.body or '').strip())
+    return not (has_draft or payload.get('fresh'))
+
+
+def _background_requested(payload: dict) -> bool:
+    return bool(payload.get('background')) and getattr(
+        settings, 'CONTENT_AI_BACKGROUND_JOBS', False
+    )
+
+
+def _enqueue_workspace_job(request, service, session, operation, options: dict):
+    """Queue a generation for the ``run_ai_jobs`` worker and answer 202."""
+    save_session(request, session)
+    job = enqueue_job(
+        operation,
+        payload={
+            'session': session.to_dict(),
+            'options': options,
+            # Compared on completion so a stale result never overwrites edits.
+            'base_fingerprint': stored_session_fingerprint(request),
+        },
+        created_by=request.user,
+    )
+    return JsonResponse(
+        {
+            'ok': True,
+            'job': serialize_job(job),
+            'poll_url': reverse(
+                'content_ai:workspace_job_status', kwargs={'job_id': job.pk}
+            ),
+            'session': _session_payload(service, session),
+        },
+        status=202,
+    )
+
+
+def _image_job_options(payload: dict, *, regenerate: bool) -> dict:
+    return {
+        'prompt': payload.get('prompt'),
+        'image_style': payload.get('image_style'),
+        'provider_name': payload.get('provider') or None,
+        'regenerate': regenerate,
+    }
+
+
 @staff_member_required
 @require_GET
 def editorial_workspace(request):
@@ -107,6 +214,7 @@ def editorial_workspace(request):
             'article_lengths': list_article_lengths_for_ui(),
             'image_styles': list_image_styles_for_ui(),
             'blog_categories': list_blog_categories_for_ui(),
+            'background_jobs': getattr(settings, 'CONTENT_AI_BACKGROUND_JOBS', False),
             'workflow_states': [
                 {'id': s.value, 'label': s.value.replace('_', ' ').title()}
                 for s in (
@@ -191,6 +299,7 @@ def workspace_api(request, action: str):
                     instructions=payload.get('instructions') or '',
                     provider_name=payload.get('provider') or None,
                     article_length=payload.get('article_length'),
+                    use_cache=False,
                 )
             save_session(request, session)
             return JsonResponse(
@@ -198,39 +307,23 @@ def workspace_api(request, action: str):
             )
 
         if action in ('generate_draft', 'generate'):
-            _apply_sections_payload(session, payload)
-            if payload.get('content_type') or payload.get('goal') or payload.get(
-                'writing_style'
-            ) or payload.get('style') or payload.get('article_length'):
-                service.set_classification(
+            use_cache = _draft_use_cache(session, payload)
+            _prepare_draft_generation(service, session, payload)
+            if _background_requested(payload):
+                assert_generation_integrity(session)
+                return _enqueue_workspace_job(
+                    request,
+                    service,
                     session,
-                    content_type=payload.get('content_type'),
-                    goal=payload.get('goal'),
-                    writing_style=payload.get('writing_style')
-                    or payload.get('style'),
-                    article_length=payload.get('article_length'),
-                )
-            # Never silently reuse previous session text for a new URL.
-            # Use exactly what the client sent for URL/text; empty stays empty.
-            if 'source_text' in payload or 'source_url' in payload:
-                incoming_url = (
-                    payload['source_url']
-                    if 'source_url' in payload
-                    else (session.source_url or '')
-                )
-                if 'source_text' in payload:
-                    incoming_text = payload.get('source_text') or ''
-                elif (incoming_url or '').strip() != (session.source_url or '').strip():
-                    # URL changed without a text field — do not keep old article body.
-                    incoming_text = ''
-                else:
-                    incoming_text = session.source_material or ''
-                service.ingest_source(
-                    session,
-                    url=incoming_url or '',
-                    text=incoming_text,
-                    title=payload.get('title') or '',
-                    publisher=payload.get('publisher') or '',
+                    AIJobOperation.WORKSPACE_DRAFT,
+                    {
+                        'title': payload.get('title') or '',
+                        'category': payload.get('category') or '',
+                        'instructions': payload.get('instructions') or '',
+                        'provider_name': payload.get('provider') or None,
+                        'article_length': payload.get('article_length'),
+                        'use_cache': use_cache,
+                    },
                 )
             service.generate_draft(
                 session,
@@ -239,6 +332,7 @@ def workspace_api(request, action: str):
                 instructions=payload.get('instructions') or '',
                 provider_name=payload.get('provider') or None,
                 article_length=payload.get('article_length'),
+                use_cache=use_cache,
             )
             save_session(request, session)
             return JsonResponse(
@@ -252,6 +346,7 @@ def workspace_api(request, action: str):
                 payload.get('section') or 'body',
                 instructions=payload.get('instructions') or '',
                 provider_name=payload.get('provider') or None,
+                use_cache=False,
             )
             save_session(request, session)
             return JsonResponse({'ok': True, 'session': _session_payload(service, session)})
@@ -323,6 +418,14 @@ def workspace_api(request, action: str):
 
         if action in ('generate_image', 'generate_featured_image'):
             _apply_sections_payload(session, payload)
+            if _background_requested(payload):
+                return _enqueue_workspace_job(
+                    request,
+                    service,
+                    session,
+                    AIJobOperation.FEATURED_IMAGE,
+                    _image_job_options(payload, regenerate=False),
+                )
             logger.info(
                 'workspace generate_image request: session=%s provider=%s '
                 'image_style=%s prompt_chars=%d prompt_preview=%r '
@@ -401,6 +504,14 @@ def workspace_api(request, action: str):
 
         if action in ('regenerate_image', 'regenerate_featured_image'):
             _apply_sections_payload(session, payload)
+            if _background_requested(payload):
+                return _enqueue_workspace_job(
+                    request,
+                    service,
+                    session,
+                    AIJobOperation.FEATURED_IMAGE,
+                    _image_job_options(payload, regenerate=True),
+                )
             logger.info(
                 'workspace regenerate_image request: session=%s provider=%s '
                 'image_style=%s prompt_chars=%d',
@@ -632,3 +743,175 @@ def workspace_api(request, action: str):
             serialize_error('internal_error', str(exc)),
             status=500,
         )
+
+
+@staff_member_required
+@require_GET
+def workspace_job_status(request, job_id: int):
+    """
+    Poll a queued workspace job.
+
+    Cheap while the job is pending or running (payload and result are not
+    loaded). The first poll after completion copies the finished session
+    into the editor's workspace, but only if the workspace is still exactly
+    as it was when the job was queued. If it was reset, edited or updated by
+    another job in the meantime, the result is not applied and the poll
+    answers ``session_changed``.
+    """
+    job = (
+        AIJob.objects.filter(pk=job_id, created_by=request.user)
+        .defer('payload', 'result', 'telemetry')
+        .first()
+    )
+    if job is None:
+        return JsonResponse(
+            serialize_error('job_not_found', f'AI job {job_id} was not found.'),
+            status=404,
+        )
+    data = {'ok': job.status != AIJobStatus.FAILED, 'job': serialize_job(job)}
+    if job.status == AIJobStatus.FAILED:
+        data.update(serialize_error('generation_failed', job.error or 'AI job failed.'))
+    elif job.status == AIJobStatus.COMPLETED:
+        result = job.result or {}
+        service, session = _ensure_session(request)
+        finished = session_from_dict(result.get('session') or {})
+        already_applied = session.metadata.get('background_job_id') == job.pk
+        if not already_applied:
+            unchanged = (
+                finished.session_id == session.session_id
+                and result.get('base_fingerprint')
+                == stored_session_fingerprint(request)
+            )
+            if unchanged:
+                finished.metadata['background_job_id'] = job.pk
+                save_session(request, finished)
+                session = finished
+            else:
+                data.update(
+                    serialize_error(
+                        'session_changed',
+                        'The workspace changed while this job ran; its result '
+                        'was not applied.',
+                    )
+                )
+                data['ok'] = False
+        data['session'] = _session_payload(service, session)
+        if 'featured_image' in result:
+            data['featured_image'] = result['featured_image']
+    return JsonResponse(data)
+
+
+# Seconds between SSE comments while the provider is silent; keeps proxies
+# (Heroku's 55s rolling window) from closing an idle stream.
+STREAM_HEARTBEAT_SECONDS = 15
+
+
+def _sse_event(event: str, data: dict) -> str:
+    return f'event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n'
+
+
+def _stream_error_payload(exc: Exception) -> dict:
+    if isinstance(exc, SourceIntegrityError):
+        return serialize_error('source_not_ready', str(exc))
+    if isinstance(
+        exc,
+        (ProviderNotFound, ProviderConfigurationError, GenerationError, CapabilityError),
+    ):
+        return serialize_error('generation_failed', str(exc))
+    if isinstance(exc, ValueError):
+        return serialize_error('validation_error', str(exc))
+    return serialize_error('internal_error', str(exc))
+
+
+def _run_streamed_draft(service, session, payload, events, user=None, use_cache=True) -> None:
+    """Worker thread: generate the draft, pushing deltas onto ``events``."""
+    try:
+        with metrics_user(user):
+            service.generate_draft(
+                session,
+                title=payload.get('title') or '',
+                category=payload.get('category') or '',
+                instructions=payload.get('instructions') or '',
+                provider_name=payload.get('provider') or None,
+                article_length=payload.get('article_length'),
+                use_cache=use_cache,
+                on_delta=lambda pass_name, text: events.put(
+                    ('delta', {'pass': pass_name, 'text': text})
+                ),
+            )
+        events.put(('done', None))
+    except Exception as exc:  # noqa: BLE001 — reported to the client as an SSE error
+        logger.exception('workspace stream generation_failed')
+        events.put(('error', exc))
+    finally:
+        close_old_connections()
+
+
+def _draft_event_stream(request, service, session, payload, use_cache=True):
+    events = queue.Queue()
+    worker = threading.Thread(
+        target=_run_streamed_draft,
+        args=(service, session, payload, events, request.user, use_cache),
+        daemon=True,
+    )
+    # First byte goes out before the provider answers.
+    yield _sse_event('start', {'session_id': session.session_id})
+    worker.start()
+    while True:
+        try:
+            kind, value = events.get(timeout=STREAM_HEARTBEAT_SECONDS)
+        except queue.Empty:
+            yield ': keep-alive\n\n'
+            continue
+        if kind == 'delta':
+            yield _sse_event('delta', value)
+        elif kind == 'error':
+            yield _sse_event('error', _stream_error_payload(value))
+            return
+        else:
+            break
+    # SessionMiddleware saved before the body started streaming.
+    save_session(request, session)
+    request.session.save()
+    yield _sse_event('done', {'ok': True, 'session': _session_payload(service, session)})
+
+
+@staff_member_required
+@require_POST
+def workspace_stream_draft(request):
+    """
+    Stream draft generation as Server-Sent Events.
+
+    Events: ``start``, ``delta`` (``pass`` + ``text``) per provider chunk,
+    then ``done`` with the saved session or ``error``.
+    """
+    if not ENABLE_AI_EDITORIAL_WORKSPACE:
+        return JsonResponse(
+            serialize_error(
+                'workspace_disabled',
+                'AI Editorial Workspace is disabled.',
+            ),
+            status=403,
+        )
+    service, session = _ensure_session(request)
+    payload = _json_body(request)
+    use_cache = _draft_use_cache(session, payload)
+    try:
+        _prepare_draft_generation(service, session, payload)
+        assert_generation_integrity(session)
+    except SourceIntegrityError as exc:
+        return JsonResponse(serialize_error('source_not_ready', str(exc)), status=400)
+    except ArticleExtractionError as exc:
+        return JsonResponse(serialize_error('extraction_failed', str(exc)), status=400)
+    except ValueError as exc:
+        return JsonResponse(serialize_error('validation_error', str(exc)), status=400)
+    save_session(request, session)
+
+    response = StreamingHttpResponse(
+        _draft_event_stream(request, service, session, payload, use_cache),
+        content_type='text/event-stream',
+    )
+    response['Cache-Control'] = 'no-cache'
+    # Disable proxy buffering (nginx) so deltas reach the browser immediately.
+    response['X-Accel-Buffering'] = 'no'
+    return response
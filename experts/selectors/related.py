@@ -8,9 +8,12 @@ from django.db.models import Q, QuerySet
 
 from askme.models import Moderator
 from codestar.related.category_mapping import mapped_values_for_source
-from codestar.related.sources import RelatedContentSource, related_content_source
+from codestar.related.sources import (
+    RelatedContentSource,
+    related_content_source,
+    source_keywords,
+)
 from codestar.related.text_matching import (
-    extract_search_keywords,
     keyword_search_variants,
     normalize_persian_text,
     score_token_overlap,
@@ -51,7 +54,7 @@ def get_related_experts(content: Any, *, limit: int = 3) -> list[Moderator]:
 
     source = related_content_source(content)
     base_qs = list_publicly_visible_experts()
-    keywords = extract_search_keywords(source.title, source.body)
+    keywords = source_keywords(source)
     if not keywords:
         return _experts_for_specific_category_fallback(source, base_qs, limit=limit)
 
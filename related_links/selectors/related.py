@@ -7,9 +7,8 @@ from typing import Any
 from django.db.models import Q, QuerySet
 
 from codestar.related.category_mapping import mapped_values_for_source
-from codestar.related.sources import related_content_source
+from codestar.related.sources import related_content_source, source_keywords
 from codestar.related.text_matching import (
-    extract_search_keywords,
     keyword_search_variants,
     score_token_overlap,
     tokenize_persian_text,
@@ -62,7 +61,7 @@ def get_related_links(content: Any, *, limit: int = 3) -> list[RelatedLink]:
     if len(results) >= limit:
         return results[:limit]
 
-    keywords = extract_search_keywords(source.title, source.body)
+    keywords = source_keywords(source)
     if not keywords:
         return results[:limit]
 